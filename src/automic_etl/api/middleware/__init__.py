@@ -19,6 +19,8 @@ from automic_etl.api.middleware.security import (
     apply_rls_filters,
     check_resource_access,
     filter_by_company,
+    company_scope,
+    accessible_tiers,
     # Schemes
     security_scheme,
 )
@@ -42,6 +44,8 @@ __all__ = [
     "apply_rls_filters",
     "check_resource_access",
     "filter_by_company",
+    "company_scope",
+    "accessible_tiers",
     # Schemes
     "security_scheme",
 ]
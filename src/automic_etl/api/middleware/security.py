@@ -601,3 +601,26 @@ def filter_by_company(
         item for item in items
         if item.get(company_id_field) == company_id
     ]
+
+
+def company_scope(context: SecurityContext) -> str | None:
+    """
+    Company ID that list queries must be restricted to.
+
+    The database-side counterpart of ``filter_by_company``; None means no
+    restriction (superadmins).
+    """
+    if context.is_superadmin:
+        return None
+    return context.tenant.company_id
+
+
+def accessible_tiers(context: SecurityContext) -> list[str] | None:
+    """
+    Data tiers the context can read, for filtering list queries.
+
+    Returns None if every tier is accessible.
+    """
+    tiers = ["bronze", "silver", "gold"]
+    allowed = [tier for tier in tiers if context.can_access_tier(tier)]
+    return None if allowed == tiers else allowed
@@ -59,6 +59,8 @@ class PaginatedResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    # Pass as ``cursor`` to fetch the next page with keyset pagination
+    next_cursor: str | None = None
 
 
 class ErrorResponse(BaseModel):
@@ -368,6 +370,7 @@ class HealthResponse(BaseModel):
     version: str
     uptime_seconds: float
     services: list[ServiceHealth]
+    caches: dict[str, dict[str, Any]] = Field(default_factory=dict)
 
 
 # ========================
@@ -0,0 +1,316 @@
+"""Bounded, snapshot-aware cache of query results for the API."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Default limits of the process-wide cache
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_TENANT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 300.0
+
+_QUOTED_PATTERN = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*"|`(?:[^`]|``)*`)""")
+
+_TABLE_PATTERN = re.compile(r"\b(?:from|join)\s+([a-z_][\w]*(?:\.[a-z_][\w]*)?)", re.IGNORECASE)
+
+# Resolves a table name to an opaque version string (None if unknown)
+VersionResolver = Callable[[str], "str | None"]
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Normalize a query for use in a cache key.
+
+    Whitespace runs outside quotes collapse to one space, text outside
+    quotes is lower-cased and a trailing semicolon is dropped, so formatting
+    differences do not produce separate cache entries. String literals and
+    quoted identifiers (``"Name"``, ```Name```) are kept as written, since
+    case is significant inside them.
+    """
+    parts = _QUOTED_PATTERN.split(sql.strip().rstrip(";").strip())
+    return "".join(
+        part if part[:1] in ("'", '"', "`") else re.sub(r"\s+", " ", part).lower()
+        for part in parts
+    )
+
+
+def referenced_tables(sql: str) -> list[str]:
+    """List the tables named in FROM and JOIN clauses, in order of appearance."""
+    tables: list[str] = []
+    for match in _TABLE_PATTERN.finditer(sql):
+        table = match.group(1).lower()
+        if table not in tables:
+            tables.append(table)
+    return tables
+
+
+def lakehouse_table_version(table: str) -> str | None:
+    """
+    Resolve a ``layer.table`` name to its current Iceberg snapshot ID.
+
+    Unqualified names are looked up in the silver layer, like the query
+    service does. Returns None if the table cannot be resolved.
+    """
+    from automic_etl.core.config import get_settings
+    from automic_etl.storage.iceberg import get_catalog
+
+    namespace, _, name = table.rpartition(".")
+    try:
+        catalog = get_catalog(get_settings())
+        if not catalog.table_exists(namespace or "silver", name):
+            return None
+        snapshot = catalog.load_table(namespace or "silver", name).current_snapshot()
+    except Exception as e:
+        logger.debug("Table version unavailable", table=table, error=str(e))
+        return None
+
+    return f"iceberg:{snapshot.snapshot_id}" if snapshot else "iceberg:empty"
+
+
+@dataclass
+class QueryCacheStats:
+    """Hit/miss counters for the query result cache."""
+
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    rejected: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "rejected": self.rejected,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+@dataclass
+class _CacheEntry:
+    """A cached result with the table versions it was computed from."""
+
+    tenant: str
+    value: dict[str, Any]
+    size_bytes: int
+    stored_at: float
+    table_versions: dict[str, str | None] = field(default_factory=dict)
+
+
+class QueryResultCache:
+    """
+    Thread-safe LRU cache of query results bounded by size, age and tenant.
+
+    Each entry records the version (Iceberg snapshot ID) of every table the
+    query read. A lookup re-resolves those versions and drops the entry if
+    any table has been committed to since. Versions are resolved through the
+    shared Iceberg table cache, so a commit made by another process is only
+    noticed once that cache's entry expires (``table_cache_ttl_seconds``);
+    until then a cached result can be that much out of date. Tables whose
+    version cannot be resolved are covered by this cache's TTL only.
+
+    ``get`` and ``resolve_versions`` may call the catalog; call them from a worker thread
+    in async code.
+
+    Memory is bounded by ``max_bytes`` overall and ``tenant_max_bytes`` per
+    tenant; a tenant over its quota evicts its own least recently used
+    entries rather than other tenants'.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        tenant_max_bytes: int = DEFAULT_TENANT_MAX_BYTES,
+        version_resolver: VersionResolver = lakehouse_table_version,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.tenant_max_bytes = min(tenant_max_bytes, max_bytes)
+        self.version_resolver = version_resolver
+        self.stats = QueryCacheStats()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._tenant_bytes: dict[str, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(tenant: str, query: str, *parts: Any) -> str:
+        """Build a cache key from the tenant, normalized query and extra parts."""
+        payload = json.dumps(
+            [tenant, normalize_sql(query), *parts], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get a cached result, or None on a miss, expired or stale entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if time.monotonic() - entry.stored_at > self.ttl_seconds:
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            table_versions = dict(entry.table_versions)
+
+        # Resolve versions outside the lock; it may hit the catalog
+        current = {table: self.version_resolver(table) for table in table_versions}
+
+        with self._lock:
+            if key not in self._entries:
+                self.stats.misses += 1
+                return None
+            if current != table_versions:
+                self._remove(key)
+                self.stats.stale += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+    def resolve_versions(self, tables: list[str]) -> dict[str, str | None]:
+        """
+        Resolve the current version of each table.
+
+        Call this before running the query and pass the result to ``put``,
+        so a commit made while the query runs leaves the entry stale rather
+        than labelling the old result with the new version.
+        """
+        return {table: self.version_resolver(table) for table in tables}
+
+    def put(
+        self,
+        key: str,
+        tenant: str,
+        value: dict[str, Any],
+        table_versions: dict[str, str | None] | None = None,
+    ) -> bool:
+        """
+        Cache a query result.
+
+        Args:
+            key: Key from ``make_key``
+            tenant: Tenant the result belongs to
+            value: JSON-serializable result
+            table_versions: Versions of the tables the query read, from
+                ``resolve_versions`` before the query ran
+
+        Returns:
+            True if cached, False if the result exceeds the tenant quota
+        """
+        size = len(json.dumps(value, default=str).encode())
+        if size > self.tenant_max_bytes:
+            with self._lock:
+                self.stats.rejected += 1
+            return False
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _CacheEntry(
+                tenant=tenant,
+                value=value,
+                size_bytes=size,
+                stored_at=time.monotonic(),
+                table_versions=dict(table_versions or {}),
+            )
+            self._tenant_bytes[tenant] = self._tenant_bytes.get(tenant, 0) + size
+            self._total_bytes += size
+
+            self._evict_tenant(tenant)
+            while self._total_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+        return True
+
+    def invalidate_tenant(self, tenant: str) -> int:
+        """Drop every entry of a tenant; returns the number removed."""
+        with self._lock:
+            keys = [k for k, e in self._entries.items() if e.tenant == tenant]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._tenant_bytes.clear()
+            self._total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Cache size, limits and counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "tenant_max_bytes": self.tenant_max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "tenants": len(self._tenant_bytes),
+                **self.stats.to_dict(),
+            }
+
+    def _evict_tenant(self, tenant: str) -> None:
+        """Evict a tenant's least recently used entries until within quota."""
+        if self._tenant_bytes.get(tenant, 0) <= self.tenant_max_bytes:
+            return
+        for key in [k for k, e in self._entries.items() if e.tenant == tenant]:
+            if self._tenant_bytes.get(tenant, 0) <= self.tenant_max_bytes:
+                break
+            self._remove(key)
+            self.stats.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its bytes (lock must be held)."""
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size_bytes
+        remaining = self._tenant_bytes[entry.tenant] - entry.size_bytes
+        if remaining > 0:
+            self._tenant_bytes[entry.tenant] = remaining
+        else:
+            del self._tenant_bytes[entry.tenant]
+
+
+_query_cache: QueryResultCache | None = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> QueryResultCache:
+    """Get the process-wide query result cache."""
+    global _query_cache
+    with _query_cache_lock:
+        if _query_cache is None:
+            _query_cache = QueryResultCache()
+        return _query_cache
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 
 from automic_etl.api.models import (
     ConnectorConfig,
@@ -18,7 +18,7 @@ from automic_etl.api.models import (
 from automic_etl.api.middleware import (
     get_security_context,
     require_permission,
-    filter_by_company,
+    company_scope,
     check_resource_access,
 )
 from automic_etl.auth.models import PermissionType
@@ -95,8 +95,9 @@ async def list_connector_types():
 
 @router.get("", response_model=PaginatedResponse)
 async def list_connectors(
-    page: int = 1,
-    page_size: int = 20,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     type: ConnectorType | None = None,
     enabled: bool | None = None,
     ctx: SecurityContext = Depends(require_permission(PermissionType.CONNECTOR_READ)),
@@ -107,37 +108,31 @@ async def list_connectors(
     Args:
         page: Page number
         page_size: Items per page
+        cursor: ``next_cursor`` of the previous page (takes precedence over page)
         type: Filter by connector type
         enabled: Filter by enabled status
     """
     service = get_connector_service()
 
-    # Get connectors from database
-    db_connectors = service.list_connectors(
-        category=type.value if type else None,
-    )
-
-    # Convert to response format
-    connectors = [_connector_to_dict(c) for c in db_connectors]
-
-    # Filter by company (multi-tenant isolation)
-    connectors = filter_by_company(ctx, connectors)
-
-    # Apply enabled filter
-    if enabled is not None:
-        connectors = [c for c in connectors if c["enabled"] == enabled]
-
-    # Paginate
-    total = len(connectors)
-    start = (page - 1) * page_size
-    end = start + page_size
+    try:
+        result = service.list_connectors_page(
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            created_by=company_scope(ctx),
+            category=type.value if type else None,
+            enabled=enabled,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     return PaginatedResponse(
-        items=connectors[start:end],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=(total + page_size - 1) // page_size,
+        items=[_connector_to_dict(c) for c in result.items],
+        total=result.total,
+        page=result.page,
+        page_size=result.page_size,
+        pages=result.pages,
+        next_cursor=result.next_cursor,
     )
 
 
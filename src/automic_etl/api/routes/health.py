@@ -8,6 +8,7 @@ from datetime import datetime
 from fastapi import APIRouter
 
 from automic_etl.api.models import HealthResponse, ServiceHealth, LakehouseMetrics
+from automic_etl.api.query_cache import get_query_cache
 
 router = APIRouter()
 
@@ -20,7 +21,8 @@ async def health_check():
     """
     Check API and service health.
 
-    Returns overall system status and individual service health.
+    Returns overall system status, individual service health and cache
+    hit/miss/eviction metrics.
     """
     services = []
 
@@ -70,6 +72,7 @@ async def health_check():
         version="1.0.0",
         uptime_seconds=time.time() - _startup_time,
         services=services,
+        caches={"query_results": get_query_cache().to_dict()},
     )
 
 
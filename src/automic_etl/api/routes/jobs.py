@@ -65,6 +65,7 @@ from automic_etl.db.models import JobScheduleModel, JobRunModel
 async def list_jobs(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     status: JobStatus | None = None,
     pipeline_id: str | None = None,
     enabled: bool | None = None,
@@ -75,36 +76,41 @@ async def list_jobs(
     Args:
         page: Page number
         page_size: Items per page
+        cursor: ``next_cursor`` of the previous page (takes precedence over page)
         status: Filter by status
         pipeline_id: Filter by pipeline
         enabled: Filter by enabled status
     """
-    service = get_job_service()
-    schedules = service.list_schedules(
-        job_type="pipeline",
-        enabled=enabled,
-    )
-
-    # Convert to response format
-    jobs = [_schedule_to_db(s) for s in schedules]
-
-    # Apply additional filters
+    # Jobs are scheduled while enabled and paused while disabled, so a
+    # status filter is an enabled filter
     if status:
-        jobs = [j for j in jobs if j["status"] == status]
-    if pipeline_id:
-        jobs = [j for j in jobs if j["pipeline_id"] == pipeline_id]
+        if status not in (JobStatus.SCHEDULED, JobStatus.PAUSED):
+            return PaginatedResponse(items=[], total=0, page=page, page_size=page_size, pages=0)
+        status_enabled = status == JobStatus.SCHEDULED
+        if enabled is not None and enabled != status_enabled:
+            return PaginatedResponse(items=[], total=0, page=page, page_size=page_size, pages=0)
+        enabled = status_enabled
 
-    # Paginate
-    total = len(jobs)
-    start = (page - 1) * page_size
-    end = start + page_size
+    service = get_job_service()
+    try:
+        result = service.list_schedules_page(
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            job_type="pipeline",
+            enabled=enabled,
+            target_id=pipeline_id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     return PaginatedResponse(
-        items=jobs[start:end],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=(total + page_size - 1) // page_size,
+        items=[_schedule_to_db(s) for s in result.items],
+        total=result.total,
+        page=result.page,
+        page_size=result.page_size,
+        pages=result.pages,
+        next_cursor=result.next_cursor,
     )
 
 
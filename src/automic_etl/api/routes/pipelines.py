@@ -21,7 +21,7 @@ from automic_etl.api.middleware import (
     get_security_context,
     require_permission,
     require_resource_access,
-    filter_by_company,
+    company_scope,
     check_resource_access,
 )
 from automic_etl.auth.models import PermissionType
@@ -77,6 +77,7 @@ def _run_to_dict(run: PipelineRunModel, pipeline_name: str = "") -> dict:
 async def list_pipelines(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     status: PipelineStatus | None = None,
     tag: str | None = None,
     search: str | None = None,
@@ -88,45 +89,36 @@ async def list_pipelines(
     Args:
         page: Page number
         page_size: Items per page
+        cursor: ``next_cursor`` of the previous page (takes precedence over page)
         status: Filter by last run status
         tag: Filter by tag
         search: Search in name and description
     """
     service = get_pipeline_service()
 
-    # Get pipelines from database
-    db_pipelines = service.list_pipelines(
-        status=status.value if status else None,
-    )
-
-    # Convert to response format
-    pipelines = [_pipeline_to_dict(p) for p in db_pipelines]
-
-    # Filter by company (multi-tenant isolation)
-    pipelines = filter_by_company(ctx, pipelines)
-
-    # Apply filters
+    # Pipelines have no tag storage, so no pipeline matches a tag filter
     if tag:
-        pipelines = [p for p in pipelines if tag in p.get("tags", [])]
-    if search:
-        search_lower = search.lower()
-        pipelines = [
-            p for p in pipelines
-            if search_lower in p["name"].lower() or search_lower in p.get("description", "").lower()
-        ]
-
-    # Paginate
-    total = len(pipelines)
-    start = (page - 1) * page_size
-    end = start + page_size
-    items = pipelines[start:end]
+        return PaginatedResponse(items=[], total=0, page=page, page_size=page_size, pages=0)
+
+    try:
+        result = service.list_pipelines_page(
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            owner_id=company_scope(ctx),
+            status=status.value if status else None,
+            search=search,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     return PaginatedResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=(total + page_size - 1) // page_size,
+        items=[_pipeline_to_dict(p) for p in result.items],
+        total=result.total,
+        page=result.page,
+        page_size=result.page_size,
+        pages=result.pages,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -8,6 +8,7 @@ from datetime import timedelta
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query as QueryParam, Depends
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
 from automic_etl.api.models import (
@@ -21,6 +22,7 @@ from automic_etl.api.middleware import (
     require_permission,
     filter_by_company,
 )
+from automic_etl.api.query_cache import get_query_cache, referenced_tables
 from automic_etl.auth.models import PermissionType
 from automic_etl.auth.security import SecurityContext
 from automic_etl.core.utils import utc_now
@@ -29,7 +31,6 @@ router = APIRouter()
 
 # Query history storage (per company in production)
 _query_history: dict[str, list[dict]] = {}  # company_id -> queries
-_query_cache: dict[str, dict] = {}
 _conversations: dict[str, dict] = {}  # conversation_id -> context
 
 # Per-company LLM rate limiters
@@ -909,10 +910,13 @@ async def execute_query(
     query_id = str(uuid.uuid4())
     company_id = ctx.tenant.company_id
 
-    # Check cache
-    cache_key = f"{company_id}:{request.query}:{request.query_type}:{hash(str(request.parameters))}"
-    if cache_key in _query_cache:
-        cached = _query_cache[cache_key]
+    # Check cache; entries are dropped once a table they read is committed to
+    cache = get_query_cache()
+    cache_key = cache.make_key(
+        company_id, request.query, request.query_type, request.parameters, request.limit
+    )
+    cached = await run_in_threadpool(cache.get, cache_key)
+    if cached is not None:
         return QueryResponse(
             query_id=query_id,
             original_query=request.query,
@@ -933,6 +937,12 @@ async def execute_query(
             raise HTTPException(status_code=403, detail=conversion.get("error"))
         executed_sql = conversion["sql"]
 
+    # Versions are read before executing, so a commit during execution
+    # makes the cached result stale instead of current
+    table_versions = await run_in_threadpool(
+        cache.resolve_versions, referenced_tables(executed_sql)
+    )
+
     # Execute the query
     try:
         result = _execute_sql_secure(executed_sql, ctx, request.limit)
@@ -951,12 +961,19 @@ async def execute_query(
 
     execution_time_ms = (time.time() - start_time) * 1000
 
-    # Cache result
-    _query_cache[cache_key] = {
-        "executed_sql": executed_sql,
-        "columns": result["columns"],
-        "data": result["data"],
-    }
+    # Cache result (failed executions are not cached)
+    if "error" not in result:
+        await run_in_threadpool(
+            cache.put,
+            cache_key,
+            company_id,
+            {
+                "executed_sql": executed_sql,
+                "columns": result["columns"],
+                "data": result["data"],
+            },
+            table_versions=table_versions,
+        )
 
     # Log to history
     history = _get_company_history(company_id)
@@ -1075,11 +1092,6 @@ async def clear_query_cache(
     ctx: SecurityContext = Depends(require_permission(PermissionType.ADMIN)),
 ):
     """Clear the query cache (admin only)."""
-    global _query_cache
-    company_id = ctx.tenant.company_id
-
-    keys_to_remove = [k for k in _query_cache if k.startswith(f"{company_id}:")]
-    for key in keys_to_remove:
-        del _query_cache[key]
+    removed = get_query_cache().invalidate_tenant(ctx.tenant.company_id)
 
-    return {"success": True, "message": f"Cleared {len(keys_to_remove)} cached queries"}
+    return {"success": True, "message": f"Cleared {removed} cached queries"}
@@ -21,7 +21,8 @@ from automic_etl.api.middleware import (
     get_security_context,
     require_permission,
     require_data_tier,
-    filter_by_company,
+    company_scope,
+    accessible_tiers,
     check_resource_access,
     apply_rls_filters,
 )
@@ -71,6 +72,7 @@ def _table_to_dict(table: DataTableModel) -> dict:
 async def list_tables(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     tier: DataTier | None = None,
     tag: str | None = None,
     search: str | None = None,
@@ -79,42 +81,44 @@ async def list_tables(
     """
     List all tables with pagination and filtering.
 
+    Tenant, tier and the other filters run in the database, and only the
+    requested page is loaded.
+
     Args:
         page: Page number
         page_size: Items per page
+        cursor: ``next_cursor`` of the previous page (takes precedence over page)
         tier: Filter by data tier (bronze, silver, gold)
         tag: Filter by tag
         search: Search in name and description
     """
     service = get_table_service()
 
-    # Get tables from database
-    db_tables = service.list_tables(
-        layer=tier.value if tier else None,
-        tag=tag,
-        search=search,
-    )
-
-    # Convert to response format
-    tables = [_table_to_dict(t) for t in db_tables]
-
-    # Filter by company (multi-tenant isolation)
-    tables = filter_by_company(ctx, tables)
+    # Only tiers that are both requested and accessible
+    layers = accessible_tiers(ctx)
+    if tier:
+        layers = [tier.value] if layers is None or tier.value in layers else []
 
-    # Filter by accessible data tiers
-    tables = [t for t in tables if ctx.can_access_tier(t.get("tier", "bronze"))]
-
-    # Paginate
-    total = len(tables)
-    start = (page - 1) * page_size
-    end = start + page_size
+    try:
+        result = service.list_tables_page(
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            company_id=company_scope(ctx),
+            layers=layers,
+            tag=tag,
+            search=search,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     return PaginatedResponse(
-        items=tables[start:end],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=(total + page_size - 1) // page_size,
+        items=[_table_to_dict(t) for t in result.items],
+        total=result.total,
+        page=result.page,
+        page_size=result.page_size,
+        pages=result.pages,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -550,6 +550,99 @@ def natural_language_query(
         raise typer.Exit(1)
 
 
+# ============================================================================
+# Maintenance Commands
+# ============================================================================
+
+maintenance_app = typer.Typer(help="Table maintenance commands")
+app.add_typer(maintenance_app, name="maintenance")
+
+
+@maintenance_app.command("compact")
+def compact(
+    table: str = typer.Argument(None, help="Table to compact (all tables if omitted)"),
+    layer: str = typer.Option(None, "--layer", "-l", help="Layer to compact (bronze, silver, gold)"),
+    partition_filter: str = typer.Option(None, "--where", "-w", help="Only compact files matching this filter"),
+    rewrite_all: bool = typer.Option(False, "--all", help="Rewrite all files, not only small ones"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report what would be rewritten"),
+    config: str = typer.Option(None, "--config", "-c", help="Config file path"),
+) -> None:
+    """Compact small files into larger, optionally sorted files."""
+    from automic_etl.core.config import get_settings
+    from automic_etl.medallion import Lakehouse
+
+    try:
+        settings = get_settings(config)
+        lakehouse = Lakehouse(settings)
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            progress.add_task("Planning compaction..." if dry_run else "Compacting...", total=None)
+
+            results = lakehouse.compact(
+                layer=layer,
+                table=table,
+                partition_filter=partition_filter,
+                rewrite_all=rewrite_all,
+                dry_run=dry_run,
+            )
+
+        rich_table = Table(show_header=True, header_style="bold")
+        for col in ["Table", "Partitions", "Files", "Bytes", "Files Added"]:
+            rich_table.add_column(col)
+        for result in results:
+            rich_table.add_row(
+                result.table,
+                str(result.partitions),
+                str(result.files_rewritten),
+                str(result.bytes_rewritten),
+                "-" if result.dry_run else str(result.files_added),
+            )
+        console.print(rich_table)
+
+        files = sum(r.files_rewritten for r in results)
+        if dry_run:
+            console.print(f"[dim]Dry run: {files} files would be rewritten[/dim]")
+        else:
+            console.print(f"[green]✓[/green] Compacted {files} files")
+
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {str(e)}")
+        raise typer.Exit(1)
+
+
+@maintenance_app.command("cleanup")
+def cleanup(
+    retention_days: int = typer.Option(None, "--retention-days", "-r", help="Snapshot retention in days"),
+    compact_files: bool = typer.Option(True, "--compact/--no-compact", help="Compact small files"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report what compaction would rewrite"),
+    config: str = typer.Option(None, "--config", "-c", help="Config file path"),
+) -> None:
+    """Compact small files and expire old snapshots."""
+    from automic_etl.core.config import get_settings
+    from automic_etl.medallion import Lakehouse
+
+    try:
+        settings = get_settings(config)
+        lakehouse = Lakehouse(settings)
+
+        stats = lakehouse.cleanup(
+            bronze_retention_days=retention_days,
+            compact=compact_files,
+            dry_run=dry_run,
+        )
+
+        for key, value in stats.items():
+            console.print(f"  {key}: {value}")
+
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {str(e)}")
+        raise typer.Exit(1)
+
+
 # ============================================================================
 # UI Commands
 # ============================================================================
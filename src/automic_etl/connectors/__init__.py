@@ -11,6 +11,8 @@ from automic_etl.connectors.streaming import (
     KinesisConfig,
     PubSubConnector,
     PubSubConfig,
+    MessageBatch,
+    SchemaRegistryDecoder,
 )
 
 __all__ = [
@@ -26,4 +28,6 @@ __all__ = [
     "KinesisConfig",
     "PubSubConnector",
     "PubSubConfig",
+    "MessageBatch",
+    "SchemaRegistryDecoder",
 ]
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from enum import Enum
+from importlib.util import find_spec
 from typing import Any, Iterator
 
 import polars as pl
 import structlog
+from sqlalchemy.engine import Engine
 
 from automic_etl.core.exceptions import ConnectionError, ExtractionError
 
@@ -50,6 +53,44 @@ class ExtractionResult:
     extraction_time: datetime = field(default_factory=datetime.utcnow)
 
 
+@dataclass
+class KeyRange:
+    """
+    A half-open range of key values, ``lower <= key < upper``.
+
+    The last range of a table includes its upper bound. A bound of None
+    leaves that side of the range open.
+    """
+
+    lower: Any | None = None
+    upper: Any | None = None
+    upper_inclusive: bool = False
+
+    def to_sql(self, key_column: str) -> str | None:
+        """Render the range as a SQL predicate (None if unbounded)."""
+        conditions = []
+        if self.lower is not None:
+            conditions.append(f"{key_column} >= {sql_literal(self.lower)}")
+        if self.upper is not None:
+            operator = "<=" if self.upper_inclusive else "<"
+            conditions.append(f"{key_column} {operator} {sql_literal(self.upper)}")
+        return " AND ".join(conditions) if conditions else None
+
+
+def sql_literal(value: Any) -> str:
+    """Render a Python value as a SQL literal."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return f"'{value.isoformat()}'"
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
+
 class BaseConnector(ABC):
     """Abstract base class for all data connectors."""
 
@@ -166,6 +207,15 @@ class DatabaseConnector(BaseConnector):
         """Get row count for a table."""
         pass
 
+    # Whether tables can be read with keyset pagination and key ranges
+    supports_keyset: bool = True
+
+    # Pooled SQLAlchemy engine, set by ``connect()`` in SQL connectors
+    _engine: Engine | None = None
+
+    # How query results are fetched: "auto", "connectorx", "adbc" or "sqlalchemy"
+    fetch_engine: str = "sqlalchemy"
+
     def extract_table(
         self,
         table: str,
@@ -174,7 +224,12 @@ class DatabaseConnector(BaseConnector):
         limit: int | None = None,
         offset: int | None = None,
     ) -> ExtractionResult:
-        """Extract data from a specific table."""
+        """
+        Extract data from a specific table.
+
+        For reading a whole table page by page use ``extract_keyset``;
+        OFFSET pagination rescans every skipped row on each page.
+        """
         # Build query
         cols = ", ".join(columns) if columns else "*"
         query = f"SELECT {cols} FROM {table}"
@@ -190,6 +245,325 @@ class DatabaseConnector(BaseConnector):
 
         return self.extract(query=query)
 
+    def extract_batch(
+        self,
+        query: str | None = None,
+        batch_size: int | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ExtractionResult]:
+        """
+        Extract data in batches.
+
+        When a ``table`` and a unique ``key_column`` are given, pages are
+        read with keyset pagination; otherwise LIMIT/OFFSET is used.
+        """
+        table = kwargs.get("table")
+        key_column = kwargs.pop("key_column", None)
+        if query is None and table and key_column and self.supports_keyset:
+            kwargs.pop("table")
+            yield from self.extract_keyset(
+                table,
+                key_column,
+                batch_size=batch_size,
+                columns=kwargs.get("columns"),
+                filter_expr=kwargs.get("filter_expr"),
+            )
+            return
+
+        if query is not None and self._engine is not None:
+            batch_size = batch_size or self.config.batch_size
+            for df in self.iter_sql(query, batch_size):
+                yield ExtractionResult(
+                    data=df,
+                    row_count=len(df),
+                    metadata={"query": query[:500], "fetch_engine": "server_cursor"},
+                )
+            return
+
+        yield from super().extract_batch(query=query, batch_size=batch_size, **kwargs)
+
+    def read_sql(self, query: str) -> pl.DataFrame:
+        """
+        Run a query and return the result as a DataFrame.
+
+        With ConnectorX or ADBC selected (or installed, for ``"auto"``) the
+        result is transferred as Arrow columns without building Python row
+        objects. Otherwise a connection is borrowed from the pooled engine
+        instead of opening a new one per query.
+
+        Args:
+            query: SQL query to run
+
+        Returns:
+            Query result
+        """
+        fetch_engine = self._resolve_fetch_engine()
+        if fetch_engine in ("connectorx", "adbc"):
+            return pl.read_database_uri(query, self._arrow_uri(), engine=fetch_engine)
+
+        self._validate_connection()
+        with self._engine.connect() as conn:
+            return pl.read_database(query, conn)
+
+    def iter_sql(self, query: str, batch_size: int) -> Iterator[pl.DataFrame]:
+        """
+        Stream a query result in batches through a server-side cursor.
+
+        The query runs once; rows are fetched ``batch_size`` at a time on a
+        pooled connection, so memory stays bounded and, unlike LIMIT/OFFSET
+        paging, no rows are rescanned.
+
+        Args:
+            query: SQL query to run
+            batch_size: Rows per batch
+
+        Yields:
+            DataFrame per batch
+        """
+        self._validate_connection()
+        try:
+            with self._engine.connect() as conn:
+                conn = conn.execution_options(stream_results=True, max_row_buffer=batch_size)
+                for df in pl.read_database(
+                    query, conn, iter_batches=True, batch_size=batch_size
+                ):
+                    if not df.is_empty():
+                        yield df
+        except Exception as e:
+            raise ExtractionError(
+                f"Failed to stream query results: {str(e)}",
+                source=self.config.name,
+                details={"query": query[:200]},
+            ) from e
+
+    def extract_keyset(
+        self,
+        table: str,
+        key_column: str,
+        batch_size: int | None = None,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        key_range: KeyRange | None = None,
+    ) -> Iterator[ExtractionResult]:
+        """
+        Read a table in pages using keyset (seek) pagination.
+
+        Each page is ``WHERE key > <last key> ORDER BY key LIMIT n``, so
+        every page is an index range scan and a full read is linear in the
+        table size, unlike OFFSET pagination.
+
+        Args:
+            table: Table to read
+            key_column: Unique, non-null, indexed column to page on
+            batch_size: Rows per page
+            columns: Columns to select (the key is always read)
+            filter_expr: Optional SQL filter
+            key_range: Optional key range to restrict the read to
+
+        Yields:
+            ExtractionResult per page
+        """
+        self._ensure_keyset_support()
+        batch_size = batch_size or self.config.batch_size
+        select_columns = list(columns) if columns else None
+        if select_columns and key_column not in select_columns:
+            select_columns.append(key_column)
+        cols = ", ".join(select_columns) if select_columns else "*"
+
+        base_conditions = [f"({filter_expr})"] if filter_expr else []
+        range_condition = key_range.to_sql(key_column) if key_range else None
+        if range_condition:
+            base_conditions.append(range_condition)
+
+        last_key: Any | None = None
+        while True:
+            conditions = list(base_conditions)
+            if last_key is not None:
+                conditions.append(f"{key_column} > {sql_literal(last_key)}")
+
+            query = f"SELECT {cols} FROM {self._qualified_table(table)}"
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += f" ORDER BY {key_column} LIMIT {batch_size}"
+
+            result = self.extract(query=query)
+            if result.row_count == 0:
+                break
+
+            last_key = result.data[key_column][-1]
+            if columns and key_column not in columns:
+                result.data = result.data.drop(key_column)
+            result.watermark = last_key
+            yield result
+
+            if result.row_count < batch_size:
+                break
+
+    def get_key_bounds(
+        self,
+        table: str,
+        key_column: str,
+        filter_expr: str | None = None,
+    ) -> tuple[Any, Any] | None:
+        """Get the minimum and maximum key values (None if no rows)."""
+        query = (
+            f"SELECT MIN({key_column}) AS min_key, MAX({key_column}) AS max_key "
+            f"FROM {self._qualified_table(table)}"
+        )
+        if filter_expr:
+            query += f" WHERE {filter_expr}"
+
+        min_key, max_key = self.extract(query=query).data.row(0)
+        if min_key is None or max_key is None:
+            return None
+        return min_key, max_key
+
+    def plan_key_ranges(
+        self,
+        table: str,
+        key_column: str,
+        num_partitions: int,
+        filter_expr: str | None = None,
+    ) -> list[KeyRange]:
+        """
+        Split a table into key ranges that can be read concurrently.
+
+        Split points come from the database's column histogram when one is
+        available (equal-frequency ranges), and otherwise from evenly spaced
+        values between the minimum and maximum key. Keys that cannot be
+        interpolated (e.g. strings without a histogram) yield one range.
+
+        Histogram bounds are kept in the order the database reports them, so
+        text keys split by the database's collation rather than Python's
+        string order. Splits outside the current key bounds only produce
+        empty ranges.
+
+        Args:
+            table: Table to split
+            key_column: Column to split on
+            num_partitions: Desired number of ranges
+            filter_expr: Optional SQL filter applied to the bounds
+
+        Returns:
+            Contiguous key ranges covering all non-null keys
+        """
+        self._ensure_keyset_support()
+        bounds = self.get_key_bounds(table, key_column, filter_expr)
+        if bounds is None:
+            return []
+
+        min_key, max_key = bounds
+        splits: list[Any] = []
+        split_source = "min_max"
+        if num_partitions > 1 and min_key != max_key:
+            histogram = _coerce_like(self._histogram_bounds(table, key_column), min_key)
+            if histogram and len(histogram) > 2:
+                splits = _dedupe_adjacent(_quantile_splits(histogram, num_partitions))
+                split_source = "histogram"
+            else:
+                splits = _interpolate_splits(min_key, max_key, num_partitions)
+            if not isinstance(min_key, str):
+                # Python and database order agree for numbers and dates
+                splits = [s for s in splits if min_key < s < max_key]
+
+        points = [min_key, *splits, max_key]
+        ranges = [
+            KeyRange(lower=points[i], upper=points[i + 1])
+            for i in range(len(points) - 1)
+        ] or [KeyRange(lower=min_key, upper=max_key)]
+        ranges[-1].upper_inclusive = True
+
+        self.logger.info(
+            "Planned key ranges",
+            table=table,
+            key_column=key_column,
+            ranges=len(ranges),
+            split_source=split_source,
+        )
+        return ranges
+
+    def _qualified_table(self, table: str) -> str:
+        """Qualify a table name for use in generated queries."""
+        return table
+
+    def _histogram_bounds(self, table: str, key_column: str) -> list[Any] | None:
+        """Equal-frequency histogram bounds for a column, if the database keeps them."""
+        return None
+
+    def _arrow_uri(self) -> str | None:
+        """Connection URI for Arrow-native readers (None if unsupported)."""
+        return None
+
+    def _resolve_fetch_engine(self) -> str:
+        """Pick the reader for ``fetch_engine``, falling back to SQLAlchemy."""
+        if self.fetch_engine != "auto":
+            return self.fetch_engine
+        if self._arrow_uri() is not None and find_spec("connectorx") is not None:
+            return "connectorx"
+        return "sqlalchemy"
+
+    def _ensure_keyset_support(self) -> None:
+        """Raise if the connector cannot generate keyset queries."""
+        if not self.supports_keyset:
+            raise ExtractionError(
+                f"{self.__class__.__name__} does not support keyset extraction",
+                source=self.config.name,
+            )
+
+
+def _interpolate_splits(min_key: Any, max_key: Any, num_partitions: int) -> list[Any]:
+    """Evenly spaced split points between two keys of an interpolable type."""
+    if isinstance(min_key, bool):
+        return []
+    if isinstance(min_key, int) and isinstance(max_key, int):
+        step = (max_key - min_key) / num_partitions
+        return [min_key + int(step * i) for i in range(1, num_partitions)]
+    if isinstance(min_key, (float, Decimal)):
+        step = (max_key - min_key) / num_partitions
+        return [min_key + step * i for i in range(1, num_partitions)]
+    if isinstance(min_key, datetime):
+        step = (max_key - min_key) / num_partitions
+        return [min_key + step * i for i in range(1, num_partitions)]
+    if isinstance(min_key, date):
+        step = (max_key - min_key) / num_partitions
+        return [min_key + timedelta(days=(step * i).days) for i in range(1, num_partitions)]
+    return []
+
+
+def _coerce_like(values: list[Any] | None, example: Any) -> list[Any] | None:
+    """Convert histogram values reported as text to the key's Python type."""
+    if not values:
+        return None
+    if isinstance(example, str) or not isinstance(values[0], str):
+        return values
+
+    if isinstance(example, bool):
+        return None
+    if isinstance(example, datetime):
+        convert: Any = datetime.fromisoformat
+    elif isinstance(example, date):
+        convert = date.fromisoformat
+    elif isinstance(example, (int, float, Decimal)):
+        convert = type(example)
+    else:
+        return None
+
+    try:
+        return [convert(v) for v in values]
+    except (TypeError, ValueError, ArithmeticError):
+        return None
+
+
+def _quantile_splits(histogram: list[Any], num_partitions: int) -> list[Any]:
+    """Pick split points at equal-frequency positions of a histogram."""
+    last = len(histogram) - 1
+    return [histogram[round(last * i / num_partitions)] for i in range(1, num_partitions)]
+
+
+def _dedupe_adjacent(values: list[Any]) -> list[Any]:
+    """Drop repeated values of an ordered list without reordering it."""
+    return [v for i, v in enumerate(values) if i == 0 or v != values[i - 1]]
+
 
 class FileConnector(BaseConnector):
     """Base class for file-based connectors."""
@@ -34,6 +34,9 @@ class MongoDBConfig(ConnectorConfig):
 class MongoDBConnector(DatabaseConnector):
     """MongoDB database connector."""
 
+    # Queries are filter documents, not SQL
+    supports_keyset = False
+
     def __init__(self, config: MongoDBConfig) -> None:
         super().__init__(config)
         self.mongo_config = config
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from typing import Any
+from urllib.parse import quote
 
 import polars as pl
 from sqlalchemy import create_engine, text
@@ -31,6 +33,10 @@ class MySQLConfig(ConnectorConfig):
     charset: str = "utf8mb4"
     pool_size: int = 5
     max_overflow: int = 10
+    # "sqlalchemy" reuses pooled connections; "connectorx"/"adbc" (or "auto",
+    # which picks ConnectorX when installed) open a connection per query but
+    # transfer Arrow columns, which pays off for large reads
+    fetch_engine: str = "sqlalchemy"
 
     def __post_init__(self) -> None:
         self.connector_type = ConnectorType.DATABASE
@@ -43,6 +49,7 @@ class MySQLConnector(DatabaseConnector):
         super().__init__(config)
         self.mysql_config = config
         self._engine: Engine | None = None
+        self.fetch_engine = config.fetch_engine
 
     def _get_connection_string(self) -> str:
         """Build the connection string."""
@@ -52,6 +59,14 @@ class MySQLConnector(DatabaseConnector):
             f"?charset={self.mysql_config.charset}"
         )
 
+    def _arrow_uri(self) -> str:
+        """Connection URI for the ConnectorX reader (MySQL has no ADBC driver)."""
+        return (
+            f"mysql://{quote(self.mysql_config.user, safe='')}"
+            f":{quote(self.mysql_config.password, safe='')}"
+            f"@{self.mysql_config.host}:{self.mysql_config.port}/{self.mysql_config.database}"
+        )
+
     def connect(self) -> None:
         """Establish connection to MySQL."""
         try:
@@ -129,7 +144,7 @@ class MySQLConnector(DatabaseConnector):
                 query += f" OFFSET {offset}"
 
         try:
-            df = pl.read_database(query, self._get_connection_string())
+            df = self.read_sql(query)
 
             return ExtractionResult(
                 data=df,
@@ -137,6 +152,7 @@ class MySQLConnector(DatabaseConnector):
                 metadata={
                     "query": query[:500],
                     "database": self.mysql_config.database,
+                    "fetch_engine": self._resolve_fetch_engine(),
                 },
             )
         except Exception as e:
@@ -224,3 +240,44 @@ class MySQLConnector(DatabaseConnector):
         with self._engine.connect() as conn:
             result = conn.execute(text(query))
             return result.scalar()
+
+    def _histogram_bounds(self, table: str, key_column: str) -> list[Any] | None:
+        """Read an equi-height histogram (MySQL 8.0+, ANALYZE TABLE ... UPDATE HISTOGRAM)."""
+        query = """
+            SELECT HISTOGRAM
+            FROM information_schema.column_statistics
+            WHERE schema_name = :database
+            AND table_name = :table
+            AND column_name = :column
+        """
+
+        try:
+            with self._engine.connect() as conn:
+                histogram = conn.execute(
+                    text(query),
+                    {
+                        "database": self.mysql_config.database,
+                        "table": table,
+                        "column": key_column,
+                    },
+                ).scalar()
+        except Exception as e:
+            self.logger.debug("Histogram unavailable", table=table, error=str(e))
+            return None
+
+        if not histogram:
+            return None
+
+        histogram = json.loads(histogram) if isinstance(histogram, str) else histogram
+        if histogram.get("histogram-type") != "equi-height":
+            return None
+
+        buckets = histogram.get("buckets", [])
+        bounds = [bucket[0] for bucket in buckets]
+        if buckets:
+            bounds.append(buckets[-1][1])
+
+        # String and temporal values are reported encoded; only use numbers
+        if not all(isinstance(b, (int, float)) for b in bounds):
+            return None
+        return bounds
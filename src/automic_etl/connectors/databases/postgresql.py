@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import csv
 from dataclasses import dataclass, field
 from typing import Any
+from urllib.parse import quote
 
 import polars as pl
 from sqlalchemy import create_engine, text
@@ -32,6 +34,10 @@ class PostgreSQLConfig(ConnectorConfig):
     ssl_mode: str = "prefer"
     pool_size: int = 5
     max_overflow: int = 10
+    # "sqlalchemy" reuses pooled connections; "connectorx"/"adbc" (or "auto",
+    # which picks ConnectorX when installed) open a connection per query but
+    # transfer Arrow columns, which pays off for large reads
+    fetch_engine: str = "sqlalchemy"
 
     def __post_init__(self) -> None:
         self.connector_type = ConnectorType.DATABASE
@@ -44,6 +50,7 @@ class PostgreSQLConnector(DatabaseConnector):
         super().__init__(config)
         self.pg_config = config
         self._engine: Engine | None = None
+        self.fetch_engine = config.fetch_engine
 
     def _get_connection_string(self) -> str:
         """Build the connection string."""
@@ -53,6 +60,15 @@ class PostgreSQLConnector(DatabaseConnector):
             f"?sslmode={self.pg_config.ssl_mode}"
         )
 
+    def _arrow_uri(self) -> str:
+        """Connection URI for ConnectorX and ADBC readers."""
+        return (
+            f"postgresql://{quote(self.pg_config.user, safe='')}"
+            f":{quote(self.pg_config.password, safe='')}"
+            f"@{self.pg_config.host}:{self.pg_config.port}/{self.pg_config.database}"
+            f"?sslmode={self.pg_config.ssl_mode}"
+        )
+
     def connect(self) -> None:
         """Establish connection to PostgreSQL."""
         try:
@@ -133,7 +149,7 @@ class PostgreSQLConnector(DatabaseConnector):
 
         try:
             # Use Polars to read directly from the database
-            df = pl.read_database(query, self._get_connection_string())
+            df = self.read_sql(query)
 
             return ExtractionResult(
                 data=df,
@@ -141,6 +157,7 @@ class PostgreSQLConnector(DatabaseConnector):
                 metadata={
                     "query": query[:500],  # Truncate for logging
                     "database": self.pg_config.database,
+                    "fetch_engine": self._resolve_fetch_engine(),
                 },
             )
         except Exception as e:
@@ -232,6 +249,41 @@ class PostgreSQLConnector(DatabaseConnector):
             result = conn.execute(text(query))
             return result.scalar()
 
+    def _qualified_table(self, table: str) -> str:
+        """Qualify a table name with the configured schema."""
+        schema_prefix = f"{self.pg_config.schema}." if self.pg_config.schema else ""
+        return f"{schema_prefix}{table}"
+
+    def _histogram_bounds(self, table: str, key_column: str) -> list[Any] | None:
+        """Read the planner's equal-frequency histogram from pg_stats."""
+        query = """
+            SELECT histogram_bounds::text
+            FROM pg_stats
+            WHERE schemaname = :schema
+            AND tablename = :table
+            AND attname = :column
+        """
+
+        try:
+            with self._engine.connect() as conn:
+                bounds = conn.execute(
+                    text(query),
+                    {
+                        "schema": self.pg_config.schema,
+                        "table": table,
+                        "column": key_column,
+                    },
+                ).scalar()
+        except Exception as e:
+            self.logger.debug("Histogram unavailable", table=table, error=str(e))
+            return None
+
+        if not bounds:
+            return None
+
+        # Array text form: {v1,v2,"quoted, value"}
+        return next(csv.reader([bounds[1:-1]], escapechar="\\"))
+
     def execute(self, query: str, params: dict[str, Any] | None = None) -> int:
         """Execute a non-select query."""
         self._validate_connection()
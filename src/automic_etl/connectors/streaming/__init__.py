@@ -1,10 +1,15 @@
 """Streaming connectors for real-time data processing."""
 
+from automic_etl.connectors.streaming.messages import MessageBatch, STREAM_COLUMNS
+from automic_etl.connectors.streaming.schema_registry import SchemaRegistryDecoder
 from automic_etl.connectors.streaming.kafka import KafkaConnector, KafkaConfig
 from automic_etl.connectors.streaming.kinesis import KinesisConnector, KinesisConfig
 from automic_etl.connectors.streaming.pubsub import PubSubConnector, PubSubConfig
 
 __all__ = [
+    "MessageBatch",
+    "STREAM_COLUMNS",
+    "SchemaRegistryDecoder",
     "KafkaConnector",
     "KafkaConfig",
     "KinesisConnector",
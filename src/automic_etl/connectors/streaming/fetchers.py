@@ -0,0 +1,146 @@
+"""Worker pool running one fetch loop per shard or partition."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class FetcherPool(Generic[T]):
+    """
+    Fetch shards or partitions concurrently into a bounded queue.
+
+    Each fetcher is an iterable (typically a generator looping over fetch
+    calls for one shard) consumed on its own thread. Fetched items are put
+    on a shared queue of ``queue_size`` items; when the consumer falls
+    behind, fetchers block (backpressure), so memory stays bounded while a
+    slow or idle shard never holds up the others. Fetchers yield ``None``
+    when a fetch returns nothing so that stop requests are noticed. A
+    fetcher whose iterable is exhausted (e.g. a closed Kinesis shard) is
+    reported in ``finished``.
+    """
+
+    def __init__(self, queue_size: int = 8, name: str = "fetcher") -> None:
+        self.name = name
+        self._queue: queue.Queue[T] = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._threads: dict[str, threading.Thread] = {}
+        self._finished: set[str] = set()
+        self._errors: list[Exception] = []
+        self._lock = threading.Lock()
+
+    @property
+    def started(self) -> set[str]:
+        """Keys of all fetchers started."""
+        return set(self._threads)
+
+    @property
+    def finished(self) -> set[str]:
+        """Keys of fetchers that reached the end of their shard."""
+        with self._lock:
+            return set(self._finished)
+
+    def start(self, key: str, fetcher: Iterable[T | None]) -> None:
+        """Start consuming a fetcher on a new thread."""
+        thread = threading.Thread(
+            target=self._run,
+            args=(key, fetcher),
+            name=f"{self.name}-{key}",
+            daemon=True,
+        )
+        self._threads[key] = thread
+        thread.start()
+
+    def get(
+        self,
+        max_size: int,
+        timeout: float,
+        size: Callable[[T], int] = lambda item: 1,
+    ) -> list[T]:
+        """
+        Take fetched items from the queue.
+
+        Waits up to ``timeout`` seconds for the first item, then takes the
+        items already queued until their total ``size`` reaches ``max_size``
+        (so the last item may overshoot it).
+
+        Raises:
+            Exception: The first error raised by a fetcher
+        """
+        with self._lock:
+            if self._errors:
+                raise self._errors.pop(0)
+
+        items: list[T] = []
+        total = 0
+        try:
+            item = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return items
+        while True:
+            items.append(item)
+            total += size(item)
+            if total >= max_size:
+                return items
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop all fetchers and discard fetched items."""
+        self._stop.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads.values():
+            while thread.is_alive() and time.monotonic() < deadline:
+                # Drain so fetchers blocked on a full queue can exit
+                self._drain()
+                thread.join(timeout=0.1)
+        self._drain()
+        self._threads.clear()
+
+    def _drain(self) -> None:
+        """Discard all queued items."""
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _run(self, key: str, fetcher: Iterable[T | None]) -> None:
+        """Put a fetcher's items on the queue until it ends or the pool stops."""
+        iterator = iter(fetcher)
+        try:
+            for item in iterator:
+                if self._stop.is_set():
+                    return
+                if item is not None and not self._put(item):
+                    return
+            with self._lock:
+                self._finished.add(key)
+        except Exception as e:
+            logger.error(f"Fetcher {key} failed: {e}")
+            with self._lock:
+                self._errors.append(e)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+
+    def _put(self, item: T) -> bool:
+        """Block until the item is queued; give up if the pool stopped."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
@@ -9,6 +9,12 @@ from typing import Any, Callable, Iterator, Literal
 from datetime import datetime
 
 from automic_etl.connectors.base import BaseConnector
+from automic_etl.connectors.streaming.fetchers import FetcherPool
+from automic_etl.connectors.streaming.messages import MessageBatch
+from automic_etl.connectors.streaming.schema_registry import (
+    SCHEMA_REGISTRY_FORMATS,
+    SchemaRegistryDecoder,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +44,14 @@ class KafkaConfig:
     max_poll_interval_ms: int = 300000
     session_timeout_ms: int = 10000
 
+    # Worker-pool consumption: the partitions the group assigns to this
+    # member are fetched by ``fetch_workers`` consumer threads (one per
+    # partition if None) instead of by the group-subscribed consumer, so
+    # several instances with the same group_id still split the partitions
+    parallel_fetch: bool = False
+    fetch_workers: int | None = None
+    fetch_queue_size: int = 8
+
     # Producer settings
     acks: Literal["all", 0, 1] = "all"
     compression_type: Literal["none", "gzip", "snappy", "lz4", "zstd"] = "gzip"
@@ -47,10 +61,14 @@ class KafkaConfig:
     # Schema Registry
     schema_registry_url: str | None = None
     schema_registry_auth: tuple[str, str] | None = None
+    # Generated message class for protobuf values
+    protobuf_message_type: Any = None
 
     # Serialization
     key_deserializer: Literal["string", "json", "avro", "bytes"] = "string"
-    value_deserializer: Literal["string", "json", "avro", "bytes"] = "json"
+    value_deserializer: Literal[
+        "string", "json", "avro", "protobuf", "json_schema", "bytes"
+    ] = "json"
     key_serializer: Literal["string", "json", "avro", "bytes"] = "string"
     value_serializer: Literal["string", "json", "avro", "bytes"] = "json"
 
@@ -61,8 +79,10 @@ class KafkaConnector(BaseConnector):
 
     Supports:
     - Consumer groups for parallel processing
-    - Multiple serialization formats (JSON, Avro, String, Bytes)
-    - Schema Registry integration
+    - Worker-pool consumption with a consumer thread per partition
+    - Multiple serialization formats (JSON, Avro, Protobuf, JSON Schema,
+      String, Bytes)
+    - Schema Registry integration with schemas cached by ID
     - SSL/SASL authentication
     - Exactly-once semantics (with transactions)
 
@@ -89,6 +109,15 @@ class KafkaConnector(BaseConnector):
         self._consumer = None
         self._producer = None
         self._schema_registry = None
+        self._value_decoder: SchemaRegistryDecoder | None = None
+        self._start_offsets: dict[int, int] = {}
+        self._consumer_config: dict[str, Any] = {}
+        self._fetchers: FetcherPool | None = None
+        self._fetched_partitions: set[int] = set()
+        # Partitions the group currently assigns to this member
+        self._owned_partitions: set[int] = set()
+        # Partitions revoked during the current fetch
+        self._revoked: set[int] = set()
         self._connected = False
 
     @property
@@ -112,8 +141,15 @@ class KafkaConnector(BaseConnector):
                 "max.poll.interval.ms": self.config.max_poll_interval_ms,
                 "session.timeout.ms": self.config.session_timeout_ms,
             }
+            self._consumer_config = consumer_config
             self._consumer = Consumer(consumer_config)
-            self._consumer.subscribe([self.config.topic])
+            # In worker-pool mode this consumer keeps the group membership
+            # and commits; its partitions are paused and fetched by workers
+            self._consumer.subscribe(
+                [self.config.topic],
+                on_assign=self._on_assign,
+                on_revoke=self._on_revoke,
+            )
 
             # Initialize producer
             producer_config = {
@@ -178,13 +214,28 @@ class KafkaConnector(BaseConnector):
                 sr_config["basic.auth.user.info"] = ":".join(self.config.schema_registry_auth)
 
             self._schema_registry = SchemaRegistryClient(sr_config)
+            self._value_decoder = SchemaRegistryDecoder(
+                self._schema_registry,
+                message_type=self.config.protobuf_message_type,
+            )
             logger.info(f"Connected to Schema Registry: {self.config.schema_registry_url}")
 
         except ImportError:
             logger.warning("Schema Registry client not available")
 
+    def test_connection(self) -> bool:
+        """Test if the cluster and topic are reachable."""
+        try:
+            if not self._connected:
+                self.connect()
+            metadata = self._consumer.list_topics(topic=self.config.topic, timeout=10)
+            return self.config.topic in metadata.topics
+        except Exception:
+            return False
+
     def disconnect(self) -> None:
         """Close Kafka connections."""
+        self._stop_fetchers()
         if self._consumer:
             self._consumer.close()
             self._consumer = None
@@ -224,31 +275,34 @@ class KafkaConnector(BaseConnector):
                 if max_messages and total_consumed >= max_messages:
                     break
 
-                msg = self._consumer.poll(timeout_ms / 1000.0)
+                wanted = batch_size - len(batch)
+                if max_messages:
+                    wanted = min(wanted, max_messages - total_consumed)
+                messages = self._fetch_messages(wanted, timeout_ms / 1000.0)
 
-                if msg is None:
+                if not messages:
                     # No message received, yield current batch if any
                     if batch:
                         yield batch
                         batch = []
                     continue
 
-                if msg.error():
-                    from confluent_kafka import KafkaError
-                    if msg.error().code() == KafkaError._PARTITION_EOF:
+                for msg in messages:
+                    if msg.error():
+                        from confluent_kafka import KafkaError
+                        if msg.error().code() != KafkaError._PARTITION_EOF:
+                            logger.error(f"Kafka error: {msg.error()}")
                         continue
-                    logger.error(f"Kafka error: {msg.error()}")
-                    continue
 
-                # Deserialize message
-                record = self._deserialize_message(msg)
+                    # Deserialize message
+                    record = self._deserialize_message(msg)
 
-                # Apply transformation if provided
-                if transform:
-                    record = transform(record)
+                    # Apply transformation if provided
+                    if transform:
+                        record = transform(record)
 
-                batch.append(record)
-                total_consumed += 1
+                    batch.append(record)
+                    total_consumed += 1
 
                 # Yield batch when full
                 if len(batch) >= batch_size:
@@ -264,6 +318,80 @@ class KafkaConnector(BaseConnector):
             if batch:
                 yield batch
 
+    def _fetch_messages(self, max_messages: int, timeout: float) -> list:
+        """
+        Fetch up to about ``max_messages`` raw messages.
+
+        Uses one ``consume`` call on the subscribed consumer, or takes what
+        the partition fetchers have queued in worker-pool mode (which may
+        overshoot by up to one fetch).
+        """
+        if not self.config.parallel_fetch:
+            return self._consumer.consume(num_messages=max_messages, timeout=timeout)
+
+        # Serves rebalance callbacks and keeps this member in the group; its
+        # partitions are paused, so no messages are returned here
+        event = self._consumer.poll(0 if self._fetchers else timeout)
+        if event is not None and event.error():
+            logger.warning(f"Kafka consumer error: {event.error()}")
+        self._start_fetchers()
+        if self._fetchers is None:
+            return []
+        messages: list = []
+        for fetched in self._fetchers.get(max_messages, timeout, size=len):
+            messages.extend(fetched)
+        return messages
+
+    def _start_fetchers(self) -> None:
+        """Start worker consumers for owned partitions not fetched yet."""
+        partitions = sorted(self._owned_partitions - self._fetched_partitions)
+        if not partitions:
+            return
+
+        from confluent_kafka import OFFSET_STORED
+
+        if self._fetchers is None:
+            self._fetchers = FetcherPool(
+                self.config.fetch_queue_size, name=f"kafka-{self.config.topic}"
+            )
+
+        workers = min(self.config.fetch_workers or len(partitions), len(partitions))
+        for i in range(workers):
+            assigned = {
+                p: self._start_offsets.get(p, OFFSET_STORED) for p in partitions[i::workers]
+            }
+            key = ",".join(str(p) for p in assigned)
+            self._fetchers.start(key, self._partition_messages(assigned))
+        self._fetched_partitions.update(partitions)
+        logger.info(
+            f"Started {workers} fetchers for {len(partitions)} partitions of {self.config.topic}"
+        )
+
+    def _partition_messages(self, offsets: dict[int, int]) -> Iterator[list | None]:
+        """Consume assigned partitions in batches on a dedicated consumer."""
+        from confluent_kafka import Consumer, TopicPartition
+
+        # Workers do not join the group; offsets are committed by the group
+        # consumer that owns the partitions
+        consumer = Consumer({**self._consumer_config, "enable.auto.commit": False})
+        consumer.assign([
+            TopicPartition(self.config.topic, partition, offset)
+            for partition, offset in offsets.items()
+        ])
+        try:
+            while True:
+                messages = consumer.consume(num_messages=self.config.max_poll_records, timeout=1.0)
+                yield messages or None
+        finally:
+            consumer.close()
+
+    def _stop_fetchers(self) -> None:
+        """Stop the worker consumers; they restart from the start offsets."""
+        if self._fetchers is not None:
+            self._fetchers.stop()
+            self._fetchers = None
+            self._fetched_partitions = set()
+
     def _deserialize_message(self, msg) -> dict[str, Any]:
         """Deserialize a Kafka message."""
         # Deserialize key
@@ -279,8 +407,10 @@ class KafkaConnector(BaseConnector):
             value = json.loads(value.decode("utf-8"))
         elif self.config.value_deserializer == "string":
             value = value.decode("utf-8")
-        elif self.config.value_deserializer == "avro" and self._schema_registry:
-            value = self._deserialize_avro(value)
+        elif value and self._value_decoder and (
+            self.config.value_deserializer in SCHEMA_REGISTRY_FORMATS
+        ):
+            value = self._deserialize_registered(value)
 
         return {
             "key": key,
@@ -292,17 +422,164 @@ class KafkaConnector(BaseConnector):
             "headers": dict(msg.headers()) if msg.headers() else {},
         }
 
-    def _deserialize_avro(self, data: bytes) -> dict[str, Any]:
-        """Deserialize Avro message using Schema Registry."""
+    def _deserialize_registered(self, data: bytes) -> Any:
+        """Deserialize a message using its Schema Registry schema."""
         try:
-            from confluent_kafka.schema_registry.avro import AvroDeserializer
-
-            deserializer = AvroDeserializer(self._schema_registry)
-            return deserializer(data, None)
+            return self._value_decoder.decode_record(data)
         except Exception as e:
-            logger.error(f"Avro deserialization failed: {e}")
+            logger.error(f"{self.config.value_deserializer} deserialization failed: {e}")
             return {"raw": data}
 
+    def poll_batch(self, max_messages: int = 500, timeout: float = 1.0) -> MessageBatch:
+        """
+        Poll a batch of raw messages without decoding them.
+
+        Args:
+            max_messages: Maximum number of messages to return (may be
+                exceeded by up to one fetch in worker-pool mode)
+            timeout: Seconds to wait for the first message
+
+        Returns:
+            MessageBatch whose positions are the next offset of each partition,
+            and whose ``revoked`` lists the partitions a rebalance took away
+            during the poll
+        """
+        if not self._connected:
+            self.connect()
+
+        batch = MessageBatch(value_format=self.config.value_deserializer)
+        if self.config.value_deserializer in SCHEMA_REGISTRY_FORMATS and self._value_decoder:
+            batch.value_decoder = self._value_decoder.decode
+
+        self._revoked = set()
+        messages = self._fetch_messages(max_messages, timeout)
+        revoked, self._revoked = self._revoked, set()
+        # Worker fetchers restart after a rebalance, so all their messages
+        # are current; a single consume call may mix messages from before
+        # and after one, so those partitions are read again
+        stale = set() if self.config.parallel_fetch else revoked
+
+        for msg in messages:
+            if msg.error():
+                from confluent_kafka import KafkaError
+                if msg.error().code() != KafkaError._PARTITION_EOF:
+                    logger.error(f"Kafka error: {msg.error()}")
+                continue
+            if msg.partition() in stale:
+                continue
+
+            partition = str(msg.partition())
+            offset = msg.offset()
+            batch.values.append(msg.value())
+            batch.keys.append(msg.key())
+            batch.partitions.append(partition)
+            batch.offsets.append(offset)
+            batch.timestamps.append(msg.timestamp()[1])
+            batch.positions[partition] = offset + 1
+
+        if revoked:
+            batch.revoked = {str(partition) for partition in revoked}
+            if stale:
+                self._rewind(stale)
+        return batch
+
+    def _rewind(self, partitions: set[int]) -> None:
+        """Resume partitions from their committed offsets, others from their positions."""
+        from confluent_kafka import OFFSET_INVALID
+
+        assignment = self._consumer.assignment()
+        if not any(tp.partition in partitions for tp in assignment):
+            return
+        positions = self._consumer.position(assignment)
+        for tp in positions:
+            if tp.partition in partitions:
+                tp.offset = OFFSET_INVALID
+        self._consumer.assign(positions)
+
+    def commit_batch(self, batch: MessageBatch) -> None:
+        """Synchronously commit the offsets after a polled batch."""
+        # Partitions reassigned later resume after the batch, not before it
+        self._start_offsets.update(
+            {int(partition): int(offset) for partition, offset in batch.positions.items()}
+        )
+        if self._consumer and batch.positions:
+            from confluent_kafka import TopicPartition
+
+            self._consumer.commit(
+                offsets=[
+                    TopicPartition(self.config.topic, int(partition), int(offset))
+                    for partition, offset in batch.positions.items()
+                ],
+                asynchronous=False,
+            )
+
+    def seek_positions(self, positions: dict[str, int]) -> None:
+        """
+        Resume partitions from stored offsets.
+
+        The offsets are applied to partitions as they are assigned to this
+        consumer, and immediately to partitions it already owns. In
+        worker-pool mode the fetchers are restarted from the offsets.
+
+        Args:
+            positions: Next offset to read, by partition
+        """
+        self._start_offsets = {int(p): int(offset) for p, offset in positions.items()}
+        if self.config.parallel_fetch:
+            self._stop_fetchers()
+        elif self._consumer:
+            for tp in self._consumer.assignment():
+                if tp.partition in self._start_offsets:
+                    tp.offset = self._start_offsets[tp.partition]
+                    self._consumer.seek(tp)
+
+    def _on_assign(self, consumer, partitions) -> None:
+        """Start newly assigned partitions from their stored offsets."""
+        if self.config.parallel_fetch:
+            consumer.assign(partitions)
+            consumer.pause(partitions)
+            self._stop_fetchers()
+            self._owned_partitions = {tp.partition for tp in partitions}
+            return
+        for tp in partitions:
+            if tp.partition in self._start_offsets:
+                tp.offset = self._start_offsets[tp.partition]
+        consumer.assign(partitions)
+
+    def _on_revoke(self, consumer, partitions) -> None:
+        """Stop reading partitions that moved to another group member."""
+        revoked = {tp.partition for tp in partitions}
+        self._revoked |= revoked
+        # Another member may have advanced them; resume from the group's commits
+        for partition in revoked:
+            self._start_offsets.pop(partition, None)
+        if self.config.parallel_fetch:
+            self._owned_partitions -= revoked
+            self._stop_fetchers()
+
+    def get_lag(self, positions: dict[str, int]) -> dict[str, int]:
+        """
+        Messages between the given offsets and the end of each partition.
+
+        Args:
+            positions: Next offset to read, by partition
+
+        Returns:
+            Lag in messages, by partition
+        """
+        if not self._consumer:
+            return {}
+
+        from confluent_kafka import TopicPartition
+
+        lag = {}
+        for partition, offset in positions.items():
+            _, high = self._consumer.get_watermark_offsets(
+                TopicPartition(self.config.topic, int(partition)), timeout=5.0
+            )
+            lag[partition] = max(high - int(offset), 0)
+        return lag
+
     def load(
         self,
         data: list[dict[str, Any]],
@@ -10,9 +10,14 @@ from datetime import datetime
 import time
 
 from automic_etl.connectors.base import BaseConnector
+from automic_etl.connectors.streaming.fetchers import FetcherPool
+from automic_etl.connectors.streaming.messages import MessageBatch
 
 logger = logging.getLogger(__name__)
 
+# GetRecords is limited to five calls per second per shard
+_MIN_GET_RECORDS_INTERVAL = 0.2
+
 
 @dataclass
 class KinesisConfig:
@@ -35,10 +40,17 @@ class KinesisConfig:
     starting_sequence_number: str | None = None
     starting_timestamp: datetime | None = None
 
-    # Enhanced fan-out consumer (EFO)
+    # Enhanced fan-out consumer (EFO); shards are pushed to one
+    # subscription per shard, so this implies ``parallel_fetch``
     consumer_name: str | None = None
     use_enhanced_fanout: bool = False
 
+    # Worker-pool consumption: one fetcher thread per shard, children of
+    # split or merged shards started once their parents are read
+    parallel_fetch: bool = False
+    fetch_queue_size: int = 8
+    shard_discovery_interval_seconds: float = 30.0
+
     # Processing settings
     max_records_per_shard: int = 1000
     idle_time_between_reads_ms: int = 1000
@@ -57,6 +69,8 @@ class KinesisConnector(BaseConnector):
     - Multiple shard iteration strategies
     - Automatic shard discovery
     - Checkpointing for exactly-once processing
+    - Worker-pool consumption with a fetcher per shard and automatic
+      resharding
 
     Example:
         config = KinesisConfig(
@@ -75,6 +89,14 @@ class KinesisConnector(BaseConnector):
         self.config = config
         self._client = None
         self._shard_iterators: dict[str, str] = {}
+        # Last sequence number read and milliseconds behind the tip, by shard
+        self._positions: dict[str, str] = {}
+        self._millis_behind: dict[str, int] = {}
+        self._fetchers: FetcherPool | None = None
+        self._initial_shards: set[str] = set()
+        self._finished_shards: set[str] = set()
+        self._consumer_arn: str | None = None
+        self._last_discovery = 0.0
         self._connected = False
 
     @property
@@ -123,8 +145,9 @@ class KinesisConnector(BaseConnector):
             self._client = session.client("kinesis", **client_kwargs)
             self._connected = True
 
-            # Initialize shard iterators
-            self._init_shard_iterators()
+            # Initialize shard iterators (fetchers open their own)
+            if not self._parallel:
+                self._init_shard_iterators()
 
             logger.info(f"Connected to Kinesis stream: {self.config.stream_name}")
 
@@ -134,35 +157,80 @@ class KinesisConnector(BaseConnector):
                 "Install with: pip install boto3"
             )
 
+    @property
+    def _parallel(self) -> bool:
+        """Whether shards are consumed by the fetcher pool."""
+        return self.config.parallel_fetch or self.config.use_enhanced_fanout
+
     def _init_shard_iterators(self) -> None:
         """Initialize shard iterators for all shards."""
-        # Describe stream to get shards
-        response = self._client.describe_stream(StreamName=self.config.stream_name)
-        shards = response["StreamDescription"]["Shards"]
-
-        for shard in shards:
+        for shard in self._list_shards():
             shard_id = shard["ShardId"]
-            iterator_kwargs = {
-                "StreamName": self.config.stream_name,
-                "ShardId": shard_id,
-                "ShardIteratorType": self.config.shard_iterator_type,
-            }
+            position = self._starting_position(shard_id)
+            response = self._client.get_shard_iterator(**self._iterator_kwargs(shard_id, position))
+            self._shard_iterators[shard_id] = response["ShardIterator"]
 
-            if self.config.shard_iterator_type in ("AT_SEQUENCE_NUMBER", "AFTER_SEQUENCE_NUMBER"):
-                if self.config.starting_sequence_number:
-                    iterator_kwargs["StartingSequenceNumber"] = self.config.starting_sequence_number
+        logger.info(f"Initialized {len(self._shard_iterators)} shard iterators")
 
-            if self.config.shard_iterator_type == "AT_TIMESTAMP":
-                if self.config.starting_timestamp:
-                    iterator_kwargs["Timestamp"] = self.config.starting_timestamp
+    def _list_shards(self) -> list[dict[str, Any]]:
+        """List all shards of the stream, including closed ones."""
+        shards: list[dict[str, Any]] = []
+        kwargs: dict[str, Any] = {"StreamName": self.config.stream_name}
+        while True:
+            response = self._client.list_shards(**kwargs)
+            shards.extend(response["Shards"])
+            if not response.get("NextToken"):
+                return shards
+            kwargs = {"NextToken": response["NextToken"]}
 
-            response = self._client.get_shard_iterator(**iterator_kwargs)
-            self._shard_iterators[shard_id] = response["ShardIterator"]
+    def _starting_position(self, shard_id: str, initial: bool = True) -> dict[str, Any]:
+        """
+        Where to start reading a shard, as a SubscribeToShard StartingPosition.
 
-        logger.info(f"Initialized {len(self._shard_iterators)} shard iterators")
+        Shards resume after their stored position. Other shards present at
+        startup start at the configured iterator type; shards created later
+        by a split or merge start at their beginning.
+        """
+        if shard_id in self._positions:
+            return {"Type": "AFTER_SEQUENCE_NUMBER", "SequenceNumber": self._positions[shard_id]}
+        if not initial:
+            return {"Type": "TRIM_HORIZON"}
+
+        position: dict[str, Any] = {"Type": self.config.shard_iterator_type}
+        if self.config.shard_iterator_type in ("AT_SEQUENCE_NUMBER", "AFTER_SEQUENCE_NUMBER"):
+            if self.config.starting_sequence_number:
+                position["SequenceNumber"] = self.config.starting_sequence_number
+        if self.config.shard_iterator_type == "AT_TIMESTAMP":
+            if self.config.starting_timestamp:
+                position["Timestamp"] = self.config.starting_timestamp
+        return position
+
+    def _iterator_kwargs(self, shard_id: str, position: dict[str, Any]) -> dict[str, Any]:
+        """GetShardIterator arguments for a starting position."""
+        kwargs = {
+            "StreamName": self.config.stream_name,
+            "ShardId": shard_id,
+            "ShardIteratorType": position["Type"],
+        }
+        if "SequenceNumber" in position:
+            kwargs["StartingSequenceNumber"] = position["SequenceNumber"]
+        if "Timestamp" in position:
+            kwargs["Timestamp"] = position["Timestamp"]
+        return kwargs
+
+    def test_connection(self) -> bool:
+        """Test if the stream is reachable."""
+        try:
+            if not self._connected:
+                self.connect()
+            self._client.describe_stream_summary(StreamName=self.config.stream_name)
+            return True
+        except Exception:
+            return False
 
     def disconnect(self) -> None:
         """Close Kinesis connection."""
+        self._stop_fetchers()
         self._client = None
         self._shard_iterators = {}
         self._connected = False
@@ -188,6 +256,10 @@ class KinesisConnector(BaseConnector):
         if not self._connected:
             self.connect()
 
+        if self._parallel:
+            yield from self._extract_parallel(batch_size, max_records, transform)
+            return
+
         total_consumed = 0
         batch = []
 
@@ -247,18 +319,293 @@ class KinesisConnector(BaseConnector):
                 time.sleep(self.config.idle_time_between_reads_ms / 1000.0)
 
     def _reinit_shard_iterator(self, shard_id: str) -> None:
-        """Reinitialize a specific shard iterator."""
+        """Reinitialize a specific shard iterator after the last record read."""
+        position = {"Type": "LATEST"}
+        if shard_id in self._positions:
+            position = self._starting_position(shard_id)
         try:
-            response = self._client.get_shard_iterator(
-                StreamName=self.config.stream_name,
-                ShardId=shard_id,
-                ShardIteratorType="LATEST",
-            )
+            response = self._client.get_shard_iterator(**self._iterator_kwargs(shard_id, position))
             self._shard_iterators[shard_id] = response["ShardIterator"]
         except Exception as e:
             logger.error(f"Failed to reinitialize shard iterator: {e}")
             self._shard_iterators[shard_id] = None
 
+    def _extract_parallel(
+        self,
+        batch_size: int,
+        max_records: int | None,
+        transform: Callable[[dict], dict] | None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Consume records fetched by the per-shard fetchers."""
+        total_consumed = 0
+        batch = []
+        idle_seconds = self.config.idle_time_between_reads_ms / 1000.0
+
+        while not max_records or total_consumed < max_records:
+            wanted = batch_size - len(batch)
+            if max_records:
+                wanted = min(wanted, max_records - total_consumed)
+
+            fetched = self._fetch_records(wanted, idle_seconds)
+            if not fetched and batch:
+                yield batch
+                batch = []
+
+            for _, records in fetched:
+                for record in records:
+                    parsed = self._deserialize_record(record)
+                    if transform:
+                        parsed = transform(parsed)
+                    batch.append(parsed)
+                total_consumed += len(records)
+
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def _fetch_records(self, max_records: int, timeout: float) -> list[tuple[str, list[dict]]]:
+        """Take up to about ``max_records`` records queued by the fetchers, by shard."""
+        self._start_fetchers()
+        return self._fetchers.get(max_records, timeout, size=lambda item: len(item[1]))
+
+    def _start_fetchers(self) -> None:
+        """
+        Start fetchers for shards that are ready to be read.
+
+        Shards are listed when the discovery interval has passed or a shard
+        was read to its end. A shard created by a split or merge is started
+        only once its parents have been read, so records of a partition key
+        stay in order.
+        """
+        now = time.monotonic()
+        finished = self._fetchers.finished if self._fetchers is not None else set()
+        if (
+            self._fetchers is not None
+            and finished == self._finished_shards
+            and now - self._last_discovery < self.config.shard_discovery_interval_seconds
+        ):
+            return
+        self._last_discovery = now
+        self._finished_shards = finished
+
+        shards = self._list_shards()
+        if self._fetchers is None:
+            self._fetchers = FetcherPool(
+                self.config.fetch_queue_size, name=f"kinesis-{self.config.stream_name}"
+            )
+            self._initial_shards = {shard["ShardId"] for shard in shards}
+            if self.config.use_enhanced_fanout:
+                self._consumer_arn = self._get_consumer_arn()
+
+        listed = {shard["ShardId"] for shard in shards}
+        started = []
+        for shard in shards:
+            shard_id = shard["ShardId"]
+            if shard_id in self._fetchers.started:
+                continue
+            parents = (shard.get("ParentShardId"), shard.get("AdjacentParentShardId"))
+            if any(parent in listed and parent not in finished for parent in parents if parent):
+                continue
+
+            position = self._starting_position(shard_id, initial=shard_id in self._initial_shards)
+            if self.config.use_enhanced_fanout:
+                fetcher = self._subscribed_records(shard_id, position)
+            else:
+                fetcher = self._polled_records(shard_id, position)
+            self._fetchers.start(shard_id, fetcher)
+            started.append(shard_id)
+
+        if started:
+            logger.info(f"Started fetchers for shards: {', '.join(started)}")
+
+    def _polled_records(
+        self, shard_id: str, position: dict[str, Any]
+    ) -> Iterator[tuple[str, list[dict]] | None]:
+        """Read a shard with GetRecords until it is closed and fully read."""
+        iterator = self._client.get_shard_iterator(
+            **self._iterator_kwargs(shard_id, position)
+        )["ShardIterator"]
+        idle_seconds = self.config.idle_time_between_reads_ms / 1000.0
+
+        while iterator:
+            started = time.monotonic()
+            try:
+                response = self._client.get_records(
+                    ShardIterator=iterator,
+                    Limit=self.config.max_records_per_shard,
+                )
+            except self._client.exceptions.ExpiredIteratorException:
+                logger.warning(f"Shard iterator expired for {shard_id}, reinitializing")
+                iterator = self._client.get_shard_iterator(
+                    **self._iterator_kwargs(shard_id, self._starting_position(shard_id))
+                )["ShardIterator"]
+                continue
+
+            records = response["Records"]
+            iterator = response.get("NextShardIterator")
+            self._millis_behind[shard_id] = response.get("MillisBehindLatest", 0)
+            if records:
+                self._positions[shard_id] = records[-1]["SequenceNumber"]
+                yield shard_id, records
+                time.sleep(max(_MIN_GET_RECORDS_INTERVAL - (time.monotonic() - started), 0))
+            else:
+                yield None
+                time.sleep(idle_seconds)
+
+    def _subscribed_records(
+        self, shard_id: str, position: dict[str, Any]
+    ) -> Iterator[tuple[str, list[dict]] | None]:
+        """Receive a shard over enhanced fan-out until it is closed."""
+        while True:
+            response = self._client.subscribe_to_shard(
+                ConsumerARN=self._consumer_arn,
+                ShardId=shard_id,
+                StartingPosition=position,
+            )
+            for event in response["EventStream"]:
+                shard_event = event.get("SubscribeToShardEvent")
+                if shard_event is None:
+                    continue
+
+                records = shard_event["Records"]
+                self._millis_behind[shard_id] = shard_event.get("MillisBehindLatest", 0)
+                if records:
+                    self._positions[shard_id] = records[-1]["SequenceNumber"]
+                    yield shard_id, records
+                else:
+                    yield None
+
+                continuation = shard_event.get("ContinuationSequenceNumber")
+                if continuation is None:
+                    # The shard is closed and fully read
+                    return
+                position = {"Type": "AFTER_SEQUENCE_NUMBER", "SequenceNumber": continuation}
+            # Subscriptions end after five minutes; resubscribe where it ended
+
+    def _get_consumer_arn(self) -> str:
+        """Get the ARN of the enhanced fan-out consumer, registering it if needed."""
+        if not self.config.consumer_name:
+            raise ValueError("consumer_name must be configured for enhanced fan-out")
+
+        stream_arn = self._client.describe_stream_summary(
+            StreamName=self.config.stream_name
+        )["StreamDescriptionSummary"]["StreamARN"]
+        try:
+            consumer = self._client.describe_stream_consumer(
+                StreamARN=stream_arn, ConsumerName=self.config.consumer_name
+            )["ConsumerDescription"]
+        except self._client.exceptions.ResourceNotFoundException:
+            consumer = self._client.register_stream_consumer(
+                StreamARN=stream_arn, ConsumerName=self.config.consumer_name
+            )["Consumer"]
+
+        while consumer["ConsumerStatus"] != "ACTIVE":
+            time.sleep(1.0)
+            consumer = self._client.describe_stream_consumer(
+                ConsumerARN=consumer["ConsumerARN"]
+            )["ConsumerDescription"]
+        return consumer["ConsumerARN"]
+
+    def _stop_fetchers(self) -> None:
+        """Stop the shard fetchers; they restart from the stored positions."""
+        if self._fetchers is not None:
+            self._fetchers.stop()
+            self._fetchers = None
+
+    def poll_batch(self, max_messages: int = 500, timeout: float = 1.0) -> MessageBatch:
+        """
+        Read a batch of raw records from all shards without decoding them.
+
+        Sleeps for the idle time (at most ``timeout`` seconds) when no shard
+        returns records. In worker-pool mode the records are taken from the
+        shard fetchers instead.
+
+        Args:
+            max_messages: Maximum number of records to return (may be
+                exceeded by up to one fetch in worker-pool mode)
+            timeout: Maximum seconds to sleep or wait when the stream is idle
+
+        Returns:
+            MessageBatch whose positions are the last sequence number read
+            from each shard
+        """
+        if not self._connected:
+            self.connect()
+
+        batch = MessageBatch(value_format=self.config.deserializer)
+
+        if self._parallel:
+            for shard_id, records in self._fetch_records(max_messages, timeout):
+                self._append_records(batch, shard_id, records)
+            return batch
+
+        for shard_id, iterator in list(self._shard_iterators.items()):
+            remaining = max_messages - len(batch)
+            if remaining <= 0:
+                break
+            if not iterator:
+                continue
+
+            try:
+                response = self._client.get_records(
+                    ShardIterator=iterator,
+                    Limit=min(self.config.max_records_per_shard, remaining),
+                )
+            except self._client.exceptions.ExpiredIteratorException:
+                logger.warning(f"Shard iterator expired for {shard_id}, reinitializing")
+                self._reinit_shard_iterator(shard_id)
+                continue
+
+            self._shard_iterators[shard_id] = response.get("NextShardIterator")
+            self._millis_behind[shard_id] = response.get("MillisBehindLatest", 0)
+            self._append_records(batch, shard_id, response["Records"])
+
+        self._positions.update(batch.positions)
+        if not len(batch):
+            time.sleep(min(self.config.idle_time_between_reads_ms / 1000.0, timeout))
+        return batch
+
+    @staticmethod
+    def _append_records(batch: MessageBatch, shard_id: str, records: list[dict]) -> None:
+        """Add the raw records of one shard to a batch."""
+        for record in records:
+            batch.values.append(record["Data"])
+            batch.keys.append(record["PartitionKey"])
+            batch.partitions.append(shard_id)
+            batch.offsets.append(record["SequenceNumber"])
+            batch.timestamps.append(int(record["ApproximateArrivalTimestamp"].timestamp() * 1000))
+        if records:
+            batch.positions[shard_id] = records[-1]["SequenceNumber"]
+
+    def commit_batch(self, batch: MessageBatch) -> None:
+        """
+        Commit a polled batch.
+
+        Kinesis keeps no consumer positions, so there is nothing to commit;
+        callers checkpoint ``batch.positions`` themselves.
+        """
+
+    def seek_positions(self, positions: dict[str, str]) -> None:
+        """
+        Resume shards after stored sequence numbers.
+
+        Args:
+            positions: Last sequence number read, by shard
+        """
+        self._positions.update(positions)
+        if self._parallel:
+            self._stop_fetchers()
+        elif self._connected:
+            for shard_id in positions:
+                self._reinit_shard_iterator(shard_id)
+
+    def get_lag(self, positions: dict[str, str]) -> dict[str, int]:
+        """Milliseconds each shard was behind the tip of the stream at the last read."""
+        return dict(self._millis_behind)
+
     def _deserialize_record(self, record: dict) -> dict[str, Any]:
         """Deserialize a Kinesis record."""
         data = record["Data"]
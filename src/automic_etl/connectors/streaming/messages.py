@@ -0,0 +1,204 @@
+"""Columnar message batches for streaming ingestion."""
+
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.json as pa_json
+
+# Stream metadata columns added next to the decoded message values
+STREAM_COLUMNS = [
+    "_stream_partition",
+    "_stream_offset",
+    "_stream_key",
+    "_stream_timestamp",
+]
+
+# JSON only allows newlines as whitespace, so they can be blanked out to
+# put each message on one line of a newline-delimited buffer
+_NEWLINES_TO_SPACES = bytes.maketrans(b"\r\n", b"  ")
+
+
+@dataclass
+class MessageBatch:
+    """
+    Raw messages polled from a stream, stored column by column.
+
+    Connectors append payloads and metadata to plain lists without decoding
+    them or building per-message dicts; ``to_arrow`` decodes the whole batch
+    at once.
+
+    Attributes:
+        value_format: Payload encoding (json, string, bytes, or a Schema
+            Registry format with a ``value_decoder``)
+        values: Raw message payloads (None for tombstones)
+        keys: Message keys (Kafka key, Kinesis partition key, Pub/Sub
+            ordering key)
+        partitions: Partition or shard of each message
+        offsets: Offset, sequence number or message ID of each message
+        timestamps: Message timestamps in epoch milliseconds
+        positions: Position to resume each partition from after this batch
+            (next Kafka offset, last Kinesis sequence number)
+        ack_ids: Acknowledgement IDs (Pub/Sub)
+        revoked: Partitions taken from this consumer by a group rebalance
+            since the previous batch; messages of them polled earlier will
+            be delivered again and must be dropped (Kafka)
+        value_decoder: Decodes a list of payloads into an Arrow table
+            (used for Schema Registry formats: Avro, Protobuf, JSON Schema)
+    """
+
+    value_format: str = "json"
+    values: list[bytes | None] = field(default_factory=list)
+    keys: list[bytes | str | None] = field(default_factory=list)
+    partitions: list[str] = field(default_factory=list)
+    offsets: list[int | str] = field(default_factory=list)
+    timestamps: list[int | None] = field(default_factory=list)
+    positions: dict[str, int | str] = field(default_factory=dict)
+    ack_ids: list[str] = field(default_factory=list)
+    revoked: set[str] = field(default_factory=set)
+    value_decoder: Callable[[list[bytes | None]], pa.Table] | None = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        """Total payload size in bytes."""
+        return sum(len(value) for value in self.values if value)
+
+    def extend(self, other: MessageBatch) -> None:
+        """Append the messages of a later batch from the same source."""
+        self.values.extend(other.values)
+        self.keys.extend(other.keys)
+        self.partitions.extend(other.partitions)
+        self.offsets.extend(other.offsets)
+        self.timestamps.extend(other.timestamps)
+        self.positions.update(other.positions)
+        self.ack_ids.extend(other.ack_ids)
+
+    def drop_partitions(self, partitions: set[str]) -> int:
+        """Remove the messages and positions of partitions; returns the number removed."""
+        keep = [i for i, partition in enumerate(self.partitions) if partition not in partitions]
+        dropped = len(self.values) - len(keep)
+        if dropped:
+            self.values = [self.values[i] for i in keep]
+            self.keys = [self.keys[i] for i in keep]
+            self.partitions = [self.partitions[i] for i in keep]
+            self.offsets = [self.offsets[i] for i in keep]
+            self.timestamps = [self.timestamps[i] for i in keep]
+            if self.ack_ids:
+                self.ack_ids = [self.ack_ids[i] for i in keep]
+        for partition in partitions:
+            self.positions.pop(partition, None)
+        return dropped
+
+    def decode_values(self, schema: pa.Schema | None = None) -> pa.Table:
+        """
+        Decode the payloads into an Arrow table, one row per message.
+
+        JSON objects become one column per field, decoded in a single pass
+        by Arrow's JSON reader; string and bytes payloads become a ``value``
+        column.
+
+        Args:
+            schema: Expected schema of JSON payloads; fields not in the
+                schema are inferred
+
+        Returns:
+            Arrow table of the decoded values
+        """
+        if self.value_decoder is not None:
+            return self.value_decoder(self.values)
+        if self.value_format == "json":
+            return decode_json(self.values, schema)
+        if self.value_format == "string":
+            return pa.table({"value": _binary_to_string(pa.array(self.values, pa.binary()))})
+        return pa.table({"value": pa.array(self.values, pa.binary())})
+
+    def to_arrow(self, schema: pa.Schema | None = None) -> pa.Table:
+        """Decode the payloads and add the stream metadata columns."""
+        return self.with_metadata(self.decode_values(schema))
+
+    def with_metadata(self, values: pa.Table) -> pa.Table:
+        """Add the stream metadata columns to decoded values."""
+        offsets = (
+            pa.array(self.offsets, pa.int64())
+            if self.offsets and isinstance(self.offsets[0], int)
+            else pa.array(self.offsets, pa.string())
+        )
+        keys = pa.array(
+            [key.encode() if isinstance(key, str) else key for key in self.keys],
+            pa.binary(),
+        )
+        columns = {
+            "_stream_partition": pa.array(self.partitions, pa.string()),
+            "_stream_offset": offsets,
+            "_stream_key": _binary_to_string(keys),
+            "_stream_timestamp": pa.array(self.timestamps, pa.timestamp("ms", tz="UTC")),
+        }
+        for name, column in columns.items():
+            values = values.append_column(name, column)
+        return values
+
+
+def decode_json(values: list[bytes | None], schema: pa.Schema | None = None) -> pa.Table:
+    """
+    Decode JSON object payloads into an Arrow table.
+
+    The payloads are joined into one newline-delimited buffer and parsed by
+    Arrow's multithreaded JSON reader. Empty payloads become rows of nulls.
+    Columns whose values are all null are typed as strings so the schema
+    stays stable across batches. Batches containing payloads that are not
+    objects are decoded message by message, with non-object values in a
+    ``value`` column.
+    """
+    lines = [value.translate(_NEWLINES_TO_SPACES) if value else b"{}" for value in values]
+    buffer = b"\n".join(lines)
+    try:
+        table = pa_json.read_json(
+            io.BytesIO(buffer),
+            read_options=pa_json.ReadOptions(block_size=max(len(buffer), 1) + 1),
+            parse_options=pa_json.ParseOptions(
+                explicit_schema=schema,
+                unexpected_field_behavior="infer",
+            ),
+        )
+    except pa.ArrowInvalid:
+        records = pa.array([_as_record(json.loads(line)) for line in lines])
+        table = pa.Table.from_struct_array(records)
+        if schema is not None:
+            table = _conform(table, schema)
+
+    for i, table_field in enumerate(table.schema):
+        if pa.types.is_null(table_field.type):
+            table = table.set_column(i, table_field.name, table.column(i).cast(pa.string()))
+    return table
+
+
+def _as_record(value: Any) -> dict[str, Any]:
+    """Wrap non-object JSON values in a record."""
+    return value if isinstance(value, dict) else {"value": value}
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast the columns of a table that appear in a schema to its types."""
+    for table_field in schema:
+        index = table.schema.get_field_index(table_field.name)
+        if index >= 0:
+            table = table.set_column(
+                index, table_field.name, table.column(index).cast(table_field.type)
+            )
+    return table
+
+
+def _binary_to_string(array: pa.Array) -> pa.Array:
+    """Cast binary to UTF-8 strings, keeping binary if any value is not UTF-8."""
+    try:
+        return array.cast(pa.string())
+    except pa.ArrowInvalid:
+        return array
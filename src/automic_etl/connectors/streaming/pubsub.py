@@ -10,6 +10,7 @@ from datetime import datetime
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 from automic_etl.connectors.base import BaseConnector
+from automic_etl.connectors.streaming.messages import MessageBatch
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +130,19 @@ class PubSubConnector(BaseConnector):
                 "Install with: pip install google-cloud-pubsub"
             )
 
+    def test_connection(self) -> bool:
+        """Test if the subscription or topic is reachable."""
+        try:
+            if not self._connected:
+                self.connect()
+            if self._subscriber and self._subscription_path:
+                self._subscriber.get_subscription(request={"subscription": self._subscription_path})
+            elif self._publisher and self._topic_path:
+                self._publisher.get_topic(request={"topic": self._topic_path})
+            return True
+        except Exception:
+            return False
+
     def disconnect(self) -> None:
         """Close Pub/Sub connections."""
         if self._subscriber:
@@ -295,6 +309,70 @@ class PubSubConnector(BaseConnector):
         except KeyboardInterrupt:
             streaming_pull_future.cancel()
 
+    def poll_batch(self, max_messages: int = 500, timeout: float = 1.0) -> MessageBatch:
+        """
+        Pull a batch of raw messages without decoding or acknowledging them.
+
+        The messages must be acknowledged with ``commit_batch`` before their
+        ack deadline, or they are redelivered.
+
+        Args:
+            max_messages: Maximum number of messages to return
+            timeout: Seconds to wait for messages
+
+        Returns:
+            MessageBatch with the ack IDs of the messages
+        """
+        if not self._connected:
+            self.connect()
+
+        if not self._subscriber or not self._subscription_path:
+            raise ValueError("Subscription must be configured for extraction")
+
+        batch = MessageBatch(value_format=self.config.deserializer)
+        try:
+            response = self._subscriber.pull(
+                request={
+                    "subscription": self._subscription_path,
+                    "max_messages": min(self.config.max_messages, max_messages),
+                },
+                timeout=timeout,
+            )
+        except FuturesTimeoutError:
+            return batch
+
+        for received in response.received_messages:
+            message = received.message
+            batch.values.append(message.data)
+            batch.keys.append(getattr(message, "ordering_key", None) or None)
+            batch.partitions.append(self.config.subscription_id)
+            batch.offsets.append(message.message_id)
+            batch.timestamps.append(int(message.publish_time.timestamp() * 1000))
+            batch.ack_ids.append(received.ack_id)
+        return batch
+
+    def commit_batch(self, batch: MessageBatch) -> None:
+        """Acknowledge the messages of a polled batch."""
+        if self._subscriber and batch.ack_ids:
+            self._subscriber.acknowledge(
+                request={
+                    "subscription": self._subscription_path,
+                    "ack_ids": batch.ack_ids,
+                }
+            )
+
+    def seek_positions(self, positions: dict[str, Any]) -> None:
+        """
+        Resume from stored positions.
+
+        Pub/Sub subscriptions track delivery themselves, so there is nothing
+        to seek.
+        """
+
+    def get_lag(self, positions: dict[str, Any]) -> dict[str, int]:
+        """Pub/Sub does not report backlog per message; always empty."""
+        return {}
+
     def _deserialize_message(self, message) -> dict[str, Any]:
         """Deserialize a Pub/Sub message."""
         data = message.data
@@ -0,0 +1,624 @@
+"""Schema Registry payload decoding into Arrow tables."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from automic_etl.connectors.streaming.messages import decode_json
+from automic_etl.core.exceptions import ConfigurationError, ExtractionError, SchemaError
+
+logger = logging.getLogger(__name__)
+
+# Payload formats framed with a Schema Registry schema ID
+SCHEMA_REGISTRY_FORMATS = ("avro", "protobuf", "json_schema")
+
+# Confluent wire format: magic byte, then the schema ID as a big-endian int32
+MAGIC_BYTE = 0
+HEADER_SIZE = 5
+
+_AVRO_PRIMITIVES = {
+    "null": pa.null(),
+    "boolean": pa.bool_(),
+    "int": pa.int32(),
+    "long": pa.int64(),
+    "float": pa.float32(),
+    "double": pa.float64(),
+    "bytes": pa.binary(),
+    "string": pa.string(),
+}
+
+_AVRO_LOGICAL_TYPES = {
+    "date": pa.date32(),
+    "time-millis": pa.time32("ms"),
+    "time-micros": pa.time64("us"),
+    "timestamp-millis": pa.timestamp("ms", tz="UTC"),
+    "timestamp-micros": pa.timestamp("us", tz="UTC"),
+    "local-timestamp-millis": pa.timestamp("ms"),
+    "local-timestamp-micros": pa.timestamp("us"),
+    "uuid": pa.string(),
+}
+
+_JSON_SCHEMA_TYPES = {
+    "string": pa.string(),
+    "integer": pa.int64(),
+    "number": pa.float64(),
+    "boolean": pa.bool_(),
+}
+
+
+def split_header(value: bytes) -> tuple[int, bytes]:
+    """
+    Split a Schema Registry framed payload into its schema ID and body.
+
+    Raises:
+        ExtractionError: If the payload does not start with the magic byte
+    """
+    if len(value) < HEADER_SIZE or value[0] != MAGIC_BYTE:
+        raise ExtractionError(
+            "Message is not framed with a Schema Registry schema ID",
+            details={"prefix": value[:HEADER_SIZE].hex()},
+        )
+    return int.from_bytes(value[1:HEADER_SIZE], "big"), value[HEADER_SIZE:]
+
+
+class SchemaRegistryDecoder:
+    """
+    Decode Schema Registry framed payloads (Avro, Protobuf, JSON Schema).
+
+    Each schema ID is looked up in the registry once; its parsed schema,
+    compiled reader and Arrow schema are cached for the lifetime of the
+    decoder. ``decode`` groups a batch of payloads by schema ID and decodes
+    each group in one call into a table with that schema's Arrow schema, so
+    the columns written to bronze depend only on the registered schemas and
+    not on the values in a batch.
+
+    - JSON Schema payloads are parsed by Arrow's JSON reader with the
+      declared properties as an explicit schema.
+    - Protobuf payloads are parsed with ``message_type`` (the generated
+      message class) and read field by field into Arrow arrays.
+    - Avro payloads are read with fastavro's schemaless reader and converted
+      with the Arrow schema derived from the Avro schema. Unions of several
+      non-null types have no Arrow column type, so they are stored as JSON
+      text; ``decode_record`` returns their values unchanged.
+
+    Example:
+        decoder = SchemaRegistryDecoder(SchemaRegistryClient({"url": url}))
+        table = decoder.decode([msg.value() for msg in messages])
+    """
+
+    def __init__(self, registry: Any, message_type: Any = None) -> None:
+        """
+        Args:
+            registry: Schema Registry client with ``get_schema(schema_id)``
+            message_type: Generated Protobuf message class, required for
+                Protobuf payloads
+        """
+        self.registry = registry
+        self.message_type = message_type
+        self._formats: dict[int, _PayloadFormat] = {}
+        self._lock = threading.Lock()
+
+    def arrow_schema(self, schema_id: int) -> pa.Schema | None:
+        """Arrow schema of payloads written with a schema ID."""
+        return self._get_format(schema_id).arrow_schema
+
+    def decode(self, values: list[bytes | None]) -> pa.Table:
+        """
+        Decode a batch of framed payloads into an Arrow table.
+
+        Empty payloads (tombstones) become rows of nulls. Payloads written
+        with different schema versions are decoded per version and their
+        tables combined with type promotion, keeping the message order.
+
+        Raises:
+            ExtractionError: If a payload is not framed or cannot be decoded
+            SchemaError: If a registered schema cannot be mapped to Arrow
+        """
+        groups: dict[int, tuple[list[int], list[bytes]]] = {}
+        tombstones: list[int] = []
+        for i, value in enumerate(values):
+            if not value:
+                tombstones.append(i)
+                continue
+            schema_id, payload = split_header(value)
+            indices, payloads = groups.setdefault(schema_id, ([], []))
+            indices.append(i)
+            payloads.append(payload)
+
+        tables: list[pa.Table] = []
+        order: list[int] = []
+        for schema_id, (indices, payloads) in groups.items():
+            payload_format = self._get_format(schema_id)
+            try:
+                tables.append(payload_format.decode_batch(payloads))
+            except Exception as e:
+                raise ExtractionError(
+                    f"Failed to decode {payload_format.name} payloads: {e}",
+                    details={"schema_id": schema_id, "messages": len(payloads)},
+                ) from e
+            order.extend(indices)
+
+        if tombstones:
+            schema = tables[-1].schema if tables else pa.schema([])
+            tables.append(_null_table(schema, len(tombstones)))
+            order.extend(tombstones)
+
+        if not tables:
+            return pa.table({})
+        if len(tables) == 1:
+            return tables[0]
+        table = pa.concat_tables(tables, promote_options="permissive")
+        return table.take(pc.sort_indices(pa.array(order)))
+
+    def decode_record(self, value: bytes) -> Any:
+        """Decode one framed payload into Python values."""
+        schema_id, payload = split_header(value)
+        return self._get_format(schema_id).decode_record(payload)
+
+    def _get_format(self, schema_id: int) -> _PayloadFormat:
+        """Get the cached reader for a schema ID, fetching it on first use."""
+        payload_format = self._formats.get(schema_id)
+        if payload_format is not None:
+            return payload_format
+        with self._lock:
+            if schema_id not in self._formats:
+                registered = self.registry.get_schema(schema_id)
+                schema_type = (registered.schema_type or "AVRO").upper()
+                self._formats[schema_id] = self._create_format(
+                    schema_type, registered.schema_str
+                )
+                logger.info(f"Loaded {schema_type} schema {schema_id} from Schema Registry")
+            return self._formats[schema_id]
+
+    def _create_format(self, schema_type: str, schema_str: str) -> _PayloadFormat:
+        """Create the reader for a registered schema."""
+        if schema_type == "AVRO":
+            return _AvroFormat(json.loads(schema_str))
+        if schema_type == "JSON":
+            return _JsonSchemaFormat(json.loads(schema_str))
+        if schema_type == "PROTOBUF":
+            if self.message_type is None:
+                raise ConfigurationError(
+                    "Protobuf payloads require the generated message class "
+                    "(protobuf_message_type)",
+                )
+            return _ProtobufFormat(self.message_type)
+        raise SchemaError(f"Unsupported Schema Registry schema type: {schema_type}")
+
+
+class _PayloadFormat(ABC):
+    """Reader for the payloads of one registered schema."""
+
+    name = ""
+    arrow_schema: pa.Schema | None = None
+
+    @abstractmethod
+    def decode_batch(self, payloads: list[bytes]) -> pa.Table:
+        """Decode payloads (without header) into an Arrow table."""
+        pass
+
+    @abstractmethod
+    def decode_record(self, payload: bytes) -> Any:
+        """Decode one payload (without header) into Python values."""
+        pass
+
+
+class _AvroFormat(_PayloadFormat):
+    """Avro payloads, read with fastavro."""
+
+    name = "Avro"
+
+    def __init__(self, schema: Any) -> None:
+        try:
+            import fastavro
+        except ImportError as e:
+            raise ImportError(
+                "fastavro is required for Avro payloads. "
+                "Install with: pip install fastavro"
+            ) from e
+
+        self._reader = fastavro.schemaless_reader
+        self._schema = fastavro.parse_schema(schema)
+        value_type = _avro_type(schema, {}, None)
+        self._convert = _avro_converter(schema, {}, None)
+        self._is_record = pa.types.is_struct(value_type)
+        if self._is_record:
+            self.arrow_schema = pa.schema(list(value_type))
+        else:
+            self.arrow_schema = pa.schema([pa.field("value", value_type)])
+
+    def decode_batch(self, payloads: list[bytes]) -> pa.Table:
+        records = [self.decode_record(payload) for payload in payloads]
+        if self._convert is not None:
+            records = [self._convert(record) for record in records]
+        if self._is_record:
+            return pa.Table.from_pylist(records, schema=self.arrow_schema)
+        return pa.table({"value": records}, schema=self.arrow_schema)
+
+    def decode_record(self, payload: bytes) -> Any:
+        return self._reader(io.BytesIO(payload), self._schema)
+
+
+class _JsonSchemaFormat(_PayloadFormat):
+    """JSON payloads validated against a JSON Schema."""
+
+    name = "JSON Schema"
+
+    def __init__(self, schema: dict[str, Any]) -> None:
+        self.arrow_schema = _json_schema_to_arrow(schema)
+
+    def decode_batch(self, payloads: list[bytes]) -> pa.Table:
+        # Properties not declared in the schema are inferred by the reader
+        return decode_json(payloads, self.arrow_schema)
+
+    def decode_record(self, payload: bytes) -> Any:
+        return json.loads(payload)
+
+
+class _ProtobufFormat(_PayloadFormat):
+    """Protobuf payloads of a generated message class."""
+
+    name = "Protobuf"
+
+    def __init__(self, message_type: Any) -> None:
+        self.message_type = message_type
+        self.descriptor = message_type.DESCRIPTOR
+        self.arrow_schema = pa.schema(
+            [pa.field(f.name, _proto_field_type(f)) for f in self.descriptor.fields]
+        )
+
+    def decode_batch(self, payloads: list[bytes]) -> pa.Table:
+        parse = self.message_type.FromString
+        messages = [parse(payload[_message_indexes_size(payload):]) for payload in payloads]
+        arrays = [_proto_field_array(messages, f) for f in self.descriptor.fields]
+        return pa.Table.from_arrays(arrays, schema=self.arrow_schema)
+
+    def decode_record(self, payload: bytes) -> Any:
+        from google.protobuf.json_format import MessageToDict
+
+        message = self.message_type.FromString(payload[_message_indexes_size(payload):])
+        return MessageToDict(message, preserving_proto_field_name=True)
+
+
+def _null_table(schema: pa.Schema, num_rows: int) -> pa.Table:
+    """Table of null rows with a schema (or no columns)."""
+    if len(schema) == 0:
+        return pa.table({"_": pa.nulls(num_rows)}).drop_columns(["_"])
+    return pa.table([pa.nulls(num_rows, f.type) for f in schema], schema=schema)
+
+
+def _avro_type(
+    schema: Any,
+    named: dict[str, pa.DataType | None],
+    namespace: str | None,
+) -> pa.DataType:
+    """
+    Map an Avro schema to an Arrow type.
+
+    Unions of several non-null types map to a string column holding their
+    values as JSON (see ``_avro_converter``).
+
+    Raises:
+        SchemaError: For recursive and unknown types
+    """
+    if isinstance(schema, list):
+        branches = [branch for branch in schema if branch != "null"]
+        if len(branches) == 1:
+            return _avro_type(branches[0], named, namespace)
+        if not branches:
+            return pa.null()
+        return pa.string()
+
+    if isinstance(schema, str):
+        if schema in _AVRO_PRIMITIVES:
+            return _AVRO_PRIMITIVES[schema]
+        full_name = schema if "." in schema or not namespace else f"{namespace}.{schema}"
+        for name in (full_name, schema):
+            if name in named:
+                if named[name] is None:
+                    raise SchemaError(f"Recursive Avro type cannot be mapped to Arrow: {name}")
+                return named[name]
+        raise SchemaError(f"Unknown Avro type: {schema}")
+
+    avro_type = schema["type"]
+    logical_type = schema.get("logicalType")
+    if logical_type == "decimal":
+        precision, scale = schema["precision"], schema.get("scale", 0)
+        if precision <= 38:
+            return pa.decimal128(precision, scale)
+        return pa.decimal256(precision, scale)
+    if logical_type in _AVRO_LOGICAL_TYPES:
+        return _AVRO_LOGICAL_TYPES[logical_type]
+
+    if avro_type in ("record", "error", "enum", "fixed"):
+        namespace = schema.get("namespace", namespace)
+        name = schema["name"]
+        full_name = name if "." in name or not namespace else f"{namespace}.{name}"
+        named[full_name] = named[name] = None
+        if avro_type == "enum":
+            arrow_type = pa.string()
+        elif avro_type == "fixed":
+            arrow_type = pa.binary(schema["size"])
+        else:
+            arrow_type = pa.struct(
+                [
+                    pa.field(f["name"], _avro_type(f["type"], named, namespace))
+                    for f in schema["fields"]
+                ]
+            )
+        named[full_name] = named[name] = arrow_type
+        return arrow_type
+    if avro_type == "array":
+        return pa.list_(_avro_type(schema["items"], named, namespace))
+    if avro_type == "map":
+        return pa.map_(pa.string(), _avro_type(schema["values"], named, namespace))
+    return _avro_type(avro_type, named, namespace)
+
+
+def _avro_converter(
+    schema: Any,
+    named: dict[str, Callable[[Any], Any] | None],
+    namespace: str | None,
+) -> Callable[[Any], Any] | None:
+    """
+    Build a function turning decoded Avro values into values of the Arrow type.
+
+    Values of multi-branch unions are encoded as JSON text; everything else
+    is kept as decoded. Returns None where values need no conversion.
+    """
+    if isinstance(schema, list):
+        branches = [branch for branch in schema if branch != "null"]
+        if len(branches) == 1:
+            return _avro_converter(branches[0], named, namespace)
+        if not branches:
+            return None
+        return _avro_union_to_json
+
+    if isinstance(schema, str):
+        full_name = schema if "." in schema or not namespace else f"{namespace}.{schema}"
+        return named.get(full_name, named.get(schema))
+
+    avro_type = schema["type"]
+    if schema.get("logicalType") is not None or avro_type in ("enum", "fixed"):
+        return None
+
+    if avro_type in ("record", "error"):
+        namespace = schema.get("namespace", namespace)
+        name = schema["name"]
+        full_name = name if "." in name or not namespace else f"{namespace}.{name}"
+        named[full_name] = named[name] = None
+        converters = {
+            f["name"]: _avro_converter(f["type"], named, namespace) for f in schema["fields"]
+        }
+        fields = {field: convert for field, convert in converters.items() if convert is not None}
+        convert = _convert_record(fields) if fields else None
+        named[full_name] = named[name] = convert
+        return convert
+    if avro_type == "array":
+        items = _avro_converter(schema["items"], named, namespace)
+        if items is None:
+            return None
+        return lambda value: None if value is None else [items(item) for item in value]
+    if avro_type == "map":
+        values = _avro_converter(schema["values"], named, namespace)
+        if values is None:
+            return None
+        return lambda value: (
+            None if value is None else {key: values(item) for key, item in value.items()}
+        )
+    return _avro_converter(avro_type, named, namespace)
+
+
+def _convert_record(fields: dict[str, Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Converter of a record whose listed fields need converting."""
+    def convert(record: Any) -> Any:
+        if record is None:
+            return None
+        return {
+            **record,
+            **{name: convert_field(record.get(name)) for name, convert_field in fields.items()},
+        }
+    return convert
+
+
+def _avro_union_to_json(value: Any) -> str | None:
+    """Encode the value of a multi-branch Avro union as JSON text."""
+    if value is None:
+        return None
+    return json.dumps(value, default=str)
+
+
+def _json_schema_to_arrow(schema: dict[str, Any]) -> pa.Schema | None:
+    """Arrow schema of the declared properties of an object JSON Schema."""
+    arrow_type = _json_schema_type(schema, schema)
+    if arrow_type is None or not pa.types.is_struct(arrow_type):
+        return None
+    return pa.schema(list(arrow_type))
+
+
+def _json_schema_type(schema: dict[str, Any], root: dict[str, Any]) -> pa.DataType | None:
+    """Map a JSON Schema to an Arrow type (None where it must be inferred)."""
+    ref = schema.get("$ref")
+    if ref is not None:
+        if not ref.startswith("#/"):
+            return None
+        target: Any = root
+        for part in ref[2:].split("/"):
+            target = target.get(part, {}) if isinstance(target, dict) else {}
+        return _json_schema_type(target, root) if target else None
+
+    json_type = schema.get("type")
+    if isinstance(json_type, list):
+        types = [t for t in json_type if t != "null"]
+        json_type = types[0] if len(types) == 1 else None
+
+    if json_type in _JSON_SCHEMA_TYPES:
+        return _JSON_SCHEMA_TYPES[json_type]
+    if json_type == "array":
+        items = schema.get("items")
+        item_type = _json_schema_type(items, root) if isinstance(items, dict) else None
+        return pa.list_(item_type) if item_type is not None else None
+    if json_type == "object":
+        fields = []
+        for name, property_schema in schema.get("properties", {}).items():
+            property_type = _json_schema_type(property_schema, root)
+            if property_type is not None:
+                fields.append(pa.field(name, property_type))
+        return pa.struct(fields) if fields else None
+    return None
+
+
+def _message_indexes_size(payload: bytes) -> int:
+    """Size of the Protobuf message-index list that precedes the message."""
+    position, count = _read_varint(payload, 0)
+    count = (count >> 1) ^ -(count & 1)
+    for _ in range(count):
+        position, _value = _read_varint(payload, position)
+    return position
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    """Read a base-128 varint; returns the next position and the value."""
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return position, value
+        shift += 7
+
+
+def _proto_scalar_type(field: Any) -> pa.DataType:
+    """Arrow type of a scalar Protobuf field."""
+    from google.protobuf.descriptor import FieldDescriptor
+
+    return {
+        FieldDescriptor.CPPTYPE_INT32: pa.int32(),
+        FieldDescriptor.CPPTYPE_INT64: pa.int64(),
+        FieldDescriptor.CPPTYPE_UINT32: pa.uint32(),
+        FieldDescriptor.CPPTYPE_UINT64: pa.uint64(),
+        FieldDescriptor.CPPTYPE_DOUBLE: pa.float64(),
+        FieldDescriptor.CPPTYPE_FLOAT: pa.float32(),
+        FieldDescriptor.CPPTYPE_BOOL: pa.bool_(),
+        FieldDescriptor.CPPTYPE_ENUM: pa.string(),
+        FieldDescriptor.CPPTYPE_STRING: (
+            pa.binary() if field.type == FieldDescriptor.TYPE_BYTES else pa.string()
+        ),
+    }[field.cpp_type]
+
+
+def _proto_message_type(descriptor: Any) -> pa.DataType:
+    """Arrow type of a Protobuf message."""
+    if descriptor.full_name == "google.protobuf.Timestamp":
+        return pa.timestamp("us", tz="UTC")
+    return pa.struct([pa.field(f.name, _proto_field_type(f)) for f in descriptor.fields])
+
+
+def _proto_value_type(field: Any) -> pa.DataType:
+    """Arrow type of one value of a Protobuf field."""
+    if field.message_type is not None:
+        return _proto_message_type(field.message_type)
+    return _proto_scalar_type(field)
+
+
+def _proto_field_type(field: Any) -> pa.DataType:
+    """Arrow type of a Protobuf field, including repeated and map fields."""
+    if _is_map(field):
+        key_field, value_field = _map_fields(field)
+        return pa.map_(_proto_scalar_type(key_field), _proto_value_type(value_field))
+    if field.is_repeated:
+        return pa.list_(_proto_value_type(field))
+    return _proto_value_type(field)
+
+
+def _is_map(field: Any) -> bool:
+    """Whether a Protobuf field is a map."""
+    return field.message_type is not None and field.message_type.GetOptions().map_entry
+
+
+def _map_fields(field: Any) -> tuple[Any, Any]:
+    """Key and value fields of a Protobuf map field."""
+    fields = field.message_type.fields_by_name
+    return fields["key"], fields["value"]
+
+
+def _proto_field_array(messages: list[Any], field: Any) -> pa.Array:
+    """Read one field of a list of messages into an Arrow array."""
+    name = field.name
+    if _is_map(field):
+        key_field, value_field = _map_fields(field)
+        offsets, keys, values = [0], [], []
+        for message in messages:
+            entries = getattr(message, name)
+            for key in entries:
+                keys.append(key)
+                values.append(entries[key])
+            offsets.append(len(keys))
+        return pa.MapArray.from_arrays(
+            pa.array(offsets, pa.int32()),
+            _proto_values_array(keys, key_field),
+            _proto_values_array(values, value_field),
+            type=_proto_field_type(field),
+        )
+    if field.is_repeated:
+        offsets, items = [0], []
+        for message in messages:
+            items.extend(getattr(message, name))
+            offsets.append(len(items))
+        return pa.ListArray.from_arrays(
+            pa.array(offsets, pa.int32()),
+            _proto_values_array(items, field),
+            type=_proto_field_type(field),
+        )
+    if field.has_presence:
+        values = [getattr(m, name) if m.HasField(name) else None for m in messages]
+    else:
+        values = [getattr(m, name) for m in messages]
+    return _proto_values_array(values, field)
+
+
+def _proto_values_array(values: list[Any], field: Any) -> pa.Array:
+    """Convert values of a Protobuf field (None for unset) to an Arrow array."""
+    if field.message_type is not None:
+        return _proto_messages_array(values, field.message_type)
+    arrow_type = _proto_scalar_type(field)
+    if field.enum_type is not None:
+        names = field.enum_type.values_by_number
+        # Numbers missing from the enum (newer writers) are kept as text
+        values = [
+            None if value is None else names[value].name if value in names else str(value)
+            for value in values
+        ]
+    return pa.array(values, arrow_type)
+
+
+def _proto_messages_array(messages: list[Any], descriptor: Any) -> pa.Array:
+    """Convert messages (None for unset) to a struct array, field by field."""
+    arrow_type = _proto_message_type(descriptor)
+    if pa.types.is_timestamp(arrow_type):
+        return pa.array(
+            [None if m is None else m.ToMicroseconds() for m in messages], pa.int64()
+        ).cast(arrow_type)
+
+    present = next((m for m in messages if m is not None), None)
+    if present is None:
+        return pa.nulls(len(messages), arrow_type)
+    mask = [m is None for m in messages]
+    if any(mask):
+        default = type(present)()
+        messages = [default if m is None else m for m in messages]
+    return pa.StructArray.from_arrays(
+        [_proto_field_array(messages, f) for f in descriptor.fields],
+        fields=list(arrow_type),
+        mask=pa.array(mask) if any(mask) else None,
+    )
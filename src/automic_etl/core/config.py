@@ -108,12 +108,23 @@ class IcebergTableDefaults(BaseModel):
     compression_level: int = Field(default=3)
 
 
+class IcebergCompactionConfig(BaseModel):
+    """Iceberg small-file compaction configuration."""
+
+    target_file_size_bytes: int | None = Field(default=None)  # Table default if None
+    small_file_ratio: float = Field(default=0.75, gt=0, le=1)
+    min_input_files: int = Field(default=2, ge=1)
+    max_workers: int = Field(default=4, ge=1)
+
+
 class IcebergCatalogConfig(BaseModel):
     """Iceberg catalog configuration."""
 
     type: CatalogType = Field(default=CatalogType.SQL)
     name: str = Field(default="automic_catalog")
     uri: str = Field(default="sqlite:///catalog.db")
+    table_cache_size: int = Field(default=128, ge=0)  # 0 disables the cache
+    table_cache_ttl_seconds: float = Field(default=30.0, ge=0)
 
 
 class IcebergConfig(BaseModel):
@@ -122,6 +133,7 @@ class IcebergConfig(BaseModel):
     catalog: IcebergCatalogConfig = Field(default_factory=IcebergCatalogConfig)
     warehouse: str = Field(default="warehouse/")
     table_defaults: IcebergTableDefaults = Field(default_factory=IcebergTableDefaults)
+    compaction: IcebergCompactionConfig = Field(default_factory=IcebergCompactionConfig)
 
 
 # ============================================================================
@@ -134,6 +146,8 @@ class MedallionLayerConfig(BaseModel):
     description: str = ""
     retention_days: int | None = None
     partition_by: list[str] = Field(default_factory=list)
+    sort_by: list[str] = Field(default_factory=list)  # Applied on compaction
+    zorder_by: list[str] = Field(default_factory=list)  # Applied on compaction
 
 
 class MedallionConfig(BaseModel):
@@ -177,6 +191,15 @@ class LLMFeatures(BaseModel):
     query_building: bool = Field(default=True)
 
 
+class LLMCacheConfig(BaseModel):
+    """Persistent cache of deterministic (temperature 0) LLM responses."""
+
+    enabled: bool = Field(default=True)
+    path: str | None = Field(default=None, description="SQLite file, defaults to ~/.automic/llm_cache.db")
+    max_entries: int = Field(default=100_000, ge=1)
+    ttl_seconds: float = Field(default=7 * 24 * 3600, gt=0)
+
+
 class LLMConfig(BaseModel):
     """LLM configuration."""
 
@@ -187,6 +210,8 @@ class LLMConfig(BaseModel):
     temperature: float = Field(default=0.1, ge=0, le=2)
     max_tokens: int = Field(default=4096)
     timeout: int = Field(default=120)
+    max_concurrency: int = Field(default=8, ge=1, description="Concurrent requests in batch completions")
+    cache: LLMCacheConfig = Field(default_factory=LLMCacheConfig)
     features: LLMFeatures = Field(default_factory=LLMFeatures)
 
 
@@ -198,6 +223,22 @@ class BatchExtractionConfig(BaseModel):
 
     size: int = Field(default=100000)
     parallel_workers: int = Field(default=4)
+    # Streaming extraction: batches buffered between extractor and writer,
+    # and the rows/bytes accumulated before each commit to bronze
+    queue_size: int = Field(default=2, ge=1)
+    commit_rows: int | None = Field(default=None)  # 4 batches if None
+    commit_bytes: int = Field(default=268435456)  # 256MB
+
+
+class StreamingIngestionConfig(BaseModel):
+    """Streaming (Kafka/Kinesis/Pub/Sub) ingestion configuration."""
+
+    poll_size: int = Field(default=500, ge=1)
+    poll_timeout_seconds: float = Field(default=1.0)
+    # A micro-batch is committed to bronze when any trigger is reached
+    flush_rows: int = Field(default=100000, ge=1)
+    flush_bytes: int = Field(default=67108864)  # 64MB
+    flush_interval_seconds: float = Field(default=30.0)
 
 
 class IncrementalExtractionConfig(BaseModel):
@@ -220,6 +261,7 @@ class ExtractionConfig(BaseModel):
 
     default_mode: ExtractionMode = Field(default=ExtractionMode.INCREMENTAL)
     batch: BatchExtractionConfig = Field(default_factory=BatchExtractionConfig)
+    streaming: StreamingIngestionConfig = Field(default_factory=StreamingIngestionConfig)
     incremental: IncrementalExtractionConfig = Field(default_factory=IncrementalExtractionConfig)
     cdc: CDCConfig = Field(default_factory=CDCConfig)
 
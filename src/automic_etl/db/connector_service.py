@@ -8,6 +8,7 @@ import uuid
 from automic_etl.core.utils import utc_now
 from automic_etl.db.engine import get_session
 from automic_etl.db.models import ConnectorConfigModel
+from automic_etl.db.pagination import Page, paginate
 
 
 class ConnectorService:
@@ -81,6 +82,49 @@ class ConnectorService:
                 session.expunge(c)
             return connectors
 
+    def list_connectors_page(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: str | None = None,
+        created_by: str | None = None,
+        category: str | None = None,
+        enabled: bool | None = None,
+    ) -> Page[ConnectorConfigModel]:
+        """
+        List one page of connectors, by name.
+
+        Args:
+            page: Page number (ignored when a cursor is given)
+            page_size: Connectors per page
+            cursor: Cursor from the previous page
+            created_by: Only connectors of this tenant
+            category: Only connectors in this category
+            enabled: Only enabled (True) or disabled (False) connectors
+        """
+        with get_session() as session:
+            query = session.query(ConnectorConfigModel)
+
+            if created_by is not None:
+                query = query.filter(ConnectorConfigModel.created_by == created_by)
+            if category:
+                query = query.filter(ConnectorConfigModel.category == category)
+            if enabled is True:
+                query = query.filter(ConnectorConfigModel.status.is_distinct_from("disabled"))
+            elif enabled is False:
+                query = query.filter(ConnectorConfigModel.status == "disabled")
+
+            result = paginate(
+                query,
+                [(ConnectorConfigModel.name, False), (ConnectorConfigModel.id, False)],
+                page=page,
+                page_size=page_size,
+                cursor=cursor,
+            )
+            for c in result.items:
+                session.expunge(c)
+            return result
+
     def update_connector(
         self,
         connector_id: str,
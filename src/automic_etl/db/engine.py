@@ -6,7 +6,7 @@ import os
 from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func
 from sqlalchemy.orm import Session, sessionmaker
 
 _engine = None
@@ -64,6 +64,17 @@ def get_session() -> Generator[Session, None, None]:
 
 def init_db():
     """Initialize the database, creating all tables."""
-    from automic_etl.db.models import Base
+    from automic_etl.db.models import Base, DataTableModel, PipelineModel
     engine = get_engine()
     Base.metadata.create_all(bind=engine)
+
+    # updated_at is the keyset sort column of these tables; rows written
+    # before it became NOT NULL would be skipped by cursor pages
+    with engine.begin() as connection:
+        for model in (DataTableModel, PipelineModel):
+            table = model.__table__
+            connection.execute(
+                table.update()
+                .where(table.c.updated_at.is_(None))
+                .values(updated_at=func.coalesce(table.c.created_at, func.now()))
+            )
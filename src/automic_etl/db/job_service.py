@@ -11,6 +11,7 @@ from croniter import croniter
 from automic_etl.core.utils import utc_now
 from automic_etl.db.engine import get_session
 from automic_etl.db.models import JobScheduleModel, JobRunModel
+from automic_etl.db.pagination import Page, paginate
 
 
 class JobService:
@@ -90,6 +91,50 @@ class JobService:
                 session.expunge(s)
             return schedules
 
+    def list_schedules_page(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: str | None = None,
+        job_type: str | None = None,
+        enabled: bool | None = None,
+        target_id: str | None = None,
+    ) -> Page[JobScheduleModel]:
+        """
+        List one page of schedules, by name.
+
+        ``next_run_at`` is nullable and cannot drive keyset pagination, so
+        pages are ordered by the unique schedule name.
+
+        Args:
+            page: Page number (ignored when a cursor is given)
+            page_size: Schedules per page
+            cursor: Cursor from the previous page
+            job_type: Only schedules of this job type
+            enabled: Only enabled (True) or paused (False) schedules
+            target_id: Only schedules of this target (e.g. pipeline)
+        """
+        with get_session() as session:
+            query = session.query(JobScheduleModel)
+
+            if job_type:
+                query = query.filter(JobScheduleModel.job_type == job_type)
+            if enabled is not None:
+                query = query.filter(JobScheduleModel.enabled == enabled)
+            if target_id:
+                query = query.filter(JobScheduleModel.target_id == target_id)
+
+            result = paginate(
+                query,
+                [(JobScheduleModel.name, False), (JobScheduleModel.id, False)],
+                page=page,
+                page_size=page_size,
+                cursor=cursor,
+            )
+            for s in result.items:
+                session.expunge(s)
+            return result
+
     def get_due_schedules(self) -> List[JobScheduleModel]:
         """Get all enabled schedules that are due to run."""
         with get_session() as session:
@@ -142,15 +142,15 @@ class PipelineModel(Base):
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(200), nullable=False)
     description = Column(Text, default="")
-    owner_id = Column(String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    status = Column(String(20), default="draft")
+    owner_id = Column(String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    status = Column(String(20), default="draft", index=True)
     schedule = Column(String(100), nullable=True)
     source_type = Column(String(50), nullable=True)
     source_config = Column(JSON, default=dict)
     destination_layer = Column(String(20), default="bronze")
     transformations = Column(JSON, default=list)
     created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False, index=True)
     last_run_at = Column(DateTime, nullable=True)
     run_count = Column(Integer, default=0)
 
@@ -198,12 +198,12 @@ class DataTableModel(Base):
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(200), nullable=False)
-    layer = Column(String(20), nullable=False)
+    layer = Column(String(20), nullable=False, index=True)
     schema_definition = Column(JSON, default=dict)
     row_count = Column(Integer, default=0)
     size_bytes = Column(Integer, default=0)
     created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False, index=True)
     source_pipeline_id = Column(String(36), nullable=True)
     quality_score = Column(Float, nullable=True)
     last_profiled_at = Column(DateTime, nullable=True)
@@ -219,8 +219,8 @@ class JobScheduleModel(Base):
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(200), nullable=False, unique=True)
     description = Column(Text, default="")
-    job_type = Column(String(50), nullable=False)  # pipeline, validation, notification, custom
-    target_id = Column(String(36), nullable=True)  # pipeline_id or other target
+    job_type = Column(String(50), nullable=False, index=True)  # pipeline, validation, notification, custom
+    target_id = Column(String(36), nullable=True, index=True)  # pipeline_id or other target
     schedule_type = Column(String(20), nullable=False)  # cron, interval, once
     schedule_value = Column(String(100), nullable=False)  # cron expression or interval
     timezone = Column(String(50), default="UTC")
@@ -297,7 +297,7 @@ class ConnectorConfigModel(Base):
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(200), nullable=False, unique=True)
     connector_type = Column(String(50), nullable=False)  # postgresql, mysql, s3, kafka, salesforce, etc.
-    category = Column(String(50), nullable=False)  # database, api, storage, streaming
+    category = Column(String(50), nullable=False, index=True)  # database, api, storage, streaming
     config = Column(JSON, default=dict)  # encrypted connection details
     credentials = Column(JSON, default=dict)  # encrypted credentials
     status = Column(String(20), default="inactive")  # active, inactive, error
@@ -305,7 +305,7 @@ class ConnectorConfigModel(Base):
     last_test_status = Column(String(20), nullable=True)
     created_at = Column(DateTime, default=utc_now)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
-    created_by = Column(String(36), nullable=True)
+    created_by = Column(String(36), nullable=True, index=True)
     metadata_ = Column("metadata", JSON, default=dict)  # tables discovered, row counts, etc.
 
 
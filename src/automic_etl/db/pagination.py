@@ -0,0 +1,148 @@
+"""Keyset pagination for service list queries."""
+
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import String, and_, cast, func, or_
+from sqlalchemy.orm import Query
+
+T = TypeVar("T")
+
+# (column, descending) pairs; the last column must be the primary key so
+# the order is total
+SortKey = list[tuple[Any, bool]]
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a list query."""
+
+    items: list[T]
+    total: int
+    page: int
+    page_size: int
+    # Opaque cursor for the page after this one, None on the last page
+    next_cursor: str | None = None
+
+    @property
+    def pages(self) -> int:
+        """Number of pages."""
+        return (self.total + self.page_size - 1) // self.page_size
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode the sort key values of a row as an opaque cursor."""
+    payload = [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode a cursor from ``encode_cursor``."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(payload, list):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return [
+        datetime.fromisoformat(value["dt"]) if isinstance(value, dict) else value
+        for value in payload
+    ]
+
+
+def contains_pattern(text: str) -> str:
+    """LIKE pattern matching ``text`` anywhere, with wildcards escaped."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def json_list_contains(column: Any, value: str) -> Any:
+    """
+    Condition that a JSON list column contains a string.
+
+    Matches the JSON-encoded value in the column's text, which works on
+    every backend without JSON operators.
+    """
+    return cast(column, String).like(contains_pattern(json.dumps(value)), escape="\\")
+
+
+def paginate(
+    query: Query,
+    sort_key: SortKey,
+    page: int = 1,
+    page_size: int = 20,
+    cursor: str | None = None,
+) -> Page:
+    """
+    Fetch one page of a query.
+
+    With a cursor the page starts right after the row it encodes (keyset
+    pagination), so the database seeks through the sort index instead of
+    skipping ``(page - 1) * page_size`` rows. Without one, ``page`` is
+    read with OFFSET. Every page carries the cursor of the next one.
+
+    Args:
+        query: Filtered query of the model
+        sort_key: Sort columns and directions, ending with the primary key;
+            columns must not be null
+        page: Page number (used when no cursor is given)
+        page_size: Rows per page
+        cursor: Cursor from a previous page's ``next_cursor``
+
+    Returns:
+        Page with the rows, the total matching rows and the next cursor
+
+    Raises:
+        ValueError: If ``page`` or ``page_size`` is below 1, or the cursor
+            is invalid
+    """
+    if page < 1:
+        raise ValueError(f"Page must be at least 1, got {page}")
+    if page_size < 1:
+        raise ValueError(f"Page size must be at least 1, got {page_size}")
+
+    total = query.order_by(None).with_entities(func.count(sort_key[-1][0])).scalar() or 0
+
+    ordered = query.order_by(*[col.desc() if desc else col.asc() for col, desc in sort_key])
+    if cursor:
+        ordered = ordered.filter(_after(sort_key, decode_cursor(cursor)))
+    else:
+        ordered = ordered.offset((page - 1) * page_size)
+
+    # One extra row tells whether there is a next page
+    rows = ordered.limit(page_size + 1).all()
+    items = rows[:page_size]
+
+    next_cursor = None
+    if len(rows) > page_size:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, col.key) for col, _ in sort_key])
+
+    return Page(
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        next_cursor=next_cursor,
+    )
+
+
+def _after(sort_key: SortKey, values: list[Any]) -> Any:
+    """Condition selecting the rows after a sort key position."""
+    if len(values) != len(sort_key):
+        raise ValueError("Cursor does not match the sort order")
+
+    clauses = []
+    for i, (col, desc) in enumerate(sort_key):
+        equal = [c == v for (c, _), v in zip(sort_key[:i], values[:i], strict=True)]
+        beyond = col < values[i] if desc else col > values[i]
+        clauses.append(and_(*equal, beyond))
+    return or_(*clauses)
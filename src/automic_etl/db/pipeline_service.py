@@ -5,9 +5,12 @@ from __future__ import annotations
 from typing import Optional, List
 import uuid
 
+from sqlalchemy import or_
+
 from automic_etl.core.utils import utc_now
 from automic_etl.db.engine import get_session
 from automic_etl.db.models import PipelineModel, PipelineRunModel
+from automic_etl.db.pagination import Page, contains_pattern, paginate
 
 
 class PipelineService:
@@ -73,6 +76,51 @@ class PipelineService:
                 session.expunge(p)
             return pipelines
 
+    def list_pipelines_page(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: str | None = None,
+        owner_id: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+    ) -> Page[PipelineModel]:
+        """
+        List one page of pipelines, most recently updated first.
+
+        Args:
+            page: Page number (ignored when a cursor is given)
+            page_size: Pipelines per page
+            cursor: Cursor from the previous page
+            owner_id: Only pipelines of this owner
+            status: Only pipelines with this status
+            search: Substring of the name or description (case-insensitive)
+        """
+        with get_session() as session:
+            query = session.query(PipelineModel)
+
+            if owner_id is not None:
+                query = query.filter(PipelineModel.owner_id == owner_id)
+            if status:
+                query = query.filter(PipelineModel.status == status)
+            if search:
+                pattern = contains_pattern(search)
+                query = query.filter(or_(
+                    PipelineModel.name.ilike(pattern, escape="\\"),
+                    PipelineModel.description.ilike(pattern, escape="\\"),
+                ))
+
+            result = paginate(
+                query,
+                [(PipelineModel.updated_at, True), (PipelineModel.id, True)],
+                page=page,
+                page_size=page_size,
+                cursor=cursor,
+            )
+            for p in result.items:
+                session.expunge(p)
+            return result
+
     def update_pipeline(
         self,
         pipeline_id: str,
@@ -5,9 +5,12 @@ from __future__ import annotations
 from typing import Optional, List
 import uuid
 
+from sqlalchemy import or_
+
 from automic_etl.core.utils import utc_now
 from automic_etl.db.engine import get_session
 from automic_etl.db.models import DataTableModel
+from automic_etl.db.pagination import Page, contains_pattern, json_list_contains, paginate
 
 
 class TableService:
@@ -96,6 +99,59 @@ class TableService:
 
             return result
 
+    def list_tables_page(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: str | None = None,
+        company_id: str | None = None,
+        layers: list[str] | None = None,
+        tag: str | None = None,
+        search: str | None = None,
+    ) -> Page[DataTableModel]:
+        """
+        List one page of tables, most recently updated first.
+
+        All filters run in the database, so the cost depends on the page
+        size rather than the number of tables.
+
+        Args:
+            page: Page number (ignored when a cursor is given)
+            page_size: Tables per page
+            cursor: Cursor from the previous page
+            company_id: Only tables of this tenant
+            layers: Only tables in these layers
+            tag: Only tables with this tag
+            search: Substring of the name or description (case-insensitive)
+        """
+        with get_session() as session:
+            query = session.query(DataTableModel)
+
+            if company_id is not None:
+                owner = DataTableModel.schema_definition["_metadata"]["created_by"]
+                query = query.filter(owner.as_string() == company_id)
+            if layers is not None:
+                query = query.filter(DataTableModel.layer.in_(layers))
+            if tag:
+                query = query.filter(json_list_contains(DataTableModel.tags, tag))
+            if search:
+                pattern = contains_pattern(search)
+                query = query.filter(or_(
+                    DataTableModel.name.ilike(pattern, escape="\\"),
+                    DataTableModel.description.ilike(pattern, escape="\\"),
+                ))
+
+            result = paginate(
+                query,
+                [(DataTableModel.updated_at, True), (DataTableModel.id, True)],
+                page=page,
+                page_size=page_size,
+                cursor=cursor,
+            )
+            for table in result.items:
+                session.expunge(table)
+            return result
+
     def update_table(
         self,
         table_id: str,
@@ -2,21 +2,32 @@
 
 from __future__ import annotations
 
+import queue
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Iterator
 
 import polars as pl
 import structlog
 
-from automic_etl.connectors.base import BaseConnector, ExtractionResult
+from automic_etl.connectors.base import (
+    BaseConnector,
+    DatabaseConnector,
+    ExtractionResult,
+    KeyRange,
+)
 from automic_etl.core.config import Settings
 from automic_etl.core.exceptions import ExtractionError
 from automic_etl.core.utils import utc_now
 
 logger = structlog.get_logger()
 
+# Marks the end of the batch stream on the extractor -> writer queue
+_END_OF_STREAM = object()
+
 
 @dataclass
 class BatchResult:
@@ -42,6 +53,99 @@ class BatchResult:
         return 0
 
 
+@dataclass
+class BatchMetrics:
+    """Throughput of a single streamed batch."""
+
+    batch_number: int
+    rows: int
+    bytes: int
+    extract_seconds: float
+    queue_wait_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Extraction rate for this batch."""
+        if self.extract_seconds > 0:
+            return self.rows / self.extract_seconds
+        return 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "batch": self.batch_number,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "extract_seconds": round(self.extract_seconds, 4),
+            "queue_wait_seconds": round(self.queue_wait_seconds, 4),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+@dataclass
+class CommitMetrics:
+    """Throughput of a single write to the sink."""
+
+    commit_number: int
+    batches: int
+    rows: int
+    bytes: int
+    write_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Write rate for this commit."""
+        if self.write_seconds > 0:
+            return self.rows / self.write_seconds
+        return 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "commit": self.commit_number,
+            "batches": self.batches,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "write_seconds": round(self.write_seconds, 4),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+@dataclass
+class StreamResult:
+    """Result of a streaming extraction into a sink."""
+
+    total_rows: int
+    start_time: datetime
+    end_time: datetime
+    errors: list[Exception]
+    batch_metrics: list[BatchMetrics] = field(default_factory=list)
+    commits: list[CommitMetrics] = field(default_factory=list)
+    peak_buffered_bytes: int = 0
+
+    @property
+    def batches_processed(self) -> int:
+        """Number of batches that reached the writer queue."""
+        return len(self.batch_metrics)
+
+    @property
+    def bytes_written(self) -> int:
+        """Estimated in-memory size of all committed data."""
+        return sum(c.bytes for c in self.commits)
+
+    @property
+    def duration_seconds(self) -> float:
+        """Get extraction duration in seconds."""
+        return (self.end_time - self.start_time).total_seconds()
+
+    @property
+    def rows_per_second(self) -> float:
+        """Get end-to-end rate."""
+        if self.duration_seconds > 0:
+            return self.total_rows / self.duration_seconds
+        return 0
+
+
 class BatchExtractor:
     """
     Extract data in batches.
@@ -51,6 +155,7 @@ class BatchExtractor:
     - Parallel extraction
     - Progress tracking
     - Error handling per batch
+    - Streaming into a sink with bounded memory and backpressure
     """
 
     def __init__(self, settings: Settings) -> None:
@@ -67,6 +172,7 @@ class BatchExtractor:
         batch_size: int | None = None,
         transform: Callable[[pl.DataFrame], pl.DataFrame] | None = None,
         on_batch: Callable[[pl.DataFrame, int], None] | None = None,
+        key_column: str | None = None,
     ) -> BatchResult:
         """
         Extract data in batches.
@@ -78,9 +184,13 @@ class BatchExtractor:
             batch_size: Override batch size
             transform: Optional transformation per batch
             on_batch: Callback for each batch
+            key_column: Unique key of ``table`` for keyset pagination
 
         Returns:
             BatchResult with combined data
+
+        All batches are held in memory; use ``extract_stream`` to write
+        them to a sink with bounded memory instead.
         """
         batch_size = batch_size or self.batch_size
         start_time = utc_now()
@@ -99,6 +209,7 @@ class BatchExtractor:
             for batch_result in connector.extract_batch(
                 query=query,
                 batch_size=batch_size,
+                **_source_kwargs(table, key_column),
             ):
                 batch_num += 1
 
@@ -217,6 +328,120 @@ class BatchExtractor:
             errors=errors,
         )
 
+    def extract_partitioned(
+        self,
+        connector: DatabaseConnector,
+        table: str,
+        key_column: str,
+        num_partitions: int | None = None,
+        max_workers: int | None = None,
+        batch_size: int | None = None,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        transform: Callable[[pl.DataFrame], pl.DataFrame] | None = None,
+    ) -> BatchResult:
+        """
+        Extract a table as concurrent key ranges.
+
+        The connector splits the table into key ranges from min/max or
+        histogram statistics; each range is read with keyset pagination on
+        its own worker, so a full-table read is linear and scales with the
+        number of workers. All pages are collected and combined, so the
+        whole result must fit in memory (roughly twice its size while the
+        pages are concatenated); use ``extract_stream`` for larger tables.
+
+        Args:
+            connector: Database connector to use
+            table: Table to extract
+            key_column: Unique, non-null, indexed column to split and page on
+            num_partitions: Number of key ranges (defaults to max_workers)
+            max_workers: Maximum parallel workers
+            batch_size: Rows per page
+            columns: Columns to select
+            filter_expr: Optional SQL filter
+            transform: Optional transformation per page
+
+        Returns:
+            BatchResult with combined data
+        """
+        max_workers = max_workers or self.parallel_workers
+        num_partitions = num_partitions or max_workers
+        batch_size = batch_size or self.batch_size
+        start_time = utc_now()
+        errors: list[Exception] = []
+        results: list[pl.DataFrame] = []
+        pages = 0
+
+        key_ranges = connector.plan_key_ranges(
+            table, key_column, num_partitions, filter_expr=filter_expr
+        )
+
+        self.logger.info(
+            "Starting partitioned extraction",
+            table=table,
+            key_column=key_column,
+            ranges=len(key_ranges),
+            max_workers=max_workers,
+        )
+
+        def extract_range(key_range: KeyRange) -> tuple[list[pl.DataFrame], int]:
+            frames = []
+            page_count = 0
+            for page in connector.extract_keyset(
+                table,
+                key_column,
+                batch_size=batch_size,
+                columns=columns,
+                filter_expr=filter_expr,
+                key_range=key_range,
+            ):
+                page_count += 1
+                frames.append(transform(page.data) if transform else page.data)
+            return frames, page_count
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_range = {
+                executor.submit(extract_range, key_range): key_range
+                for key_range in key_ranges
+            }
+
+            for future in as_completed(future_to_range):
+                key_range = future_to_range[future]
+                try:
+                    frames, page_count = future.result()
+                    results.extend(frames)
+                    pages += page_count
+                except Exception as e:
+                    self.logger.error(
+                        f"Key range failed: {key_range.to_sql(key_column)}: {e}"
+                    )
+                    errors.append(e)
+
+        combined = pl.concat(results, how="vertical_relaxed") if results else pl.DataFrame()
+        end_time = utc_now()
+
+        result = BatchResult(
+            data=combined,
+            total_rows=len(combined),
+            batches_processed=pages,
+            start_time=start_time,
+            end_time=end_time,
+            errors=errors,
+        )
+
+        self.logger.info(
+            "Partitioned extraction completed",
+            table=table,
+            total_rows=result.total_rows,
+            ranges=len(key_ranges),
+            pages=pages,
+            duration_seconds=result.duration_seconds,
+            rows_per_second=result.rows_per_second,
+            errors=len(errors),
+        )
+
+        return result
+
     def extract_tables(
         self,
         connector: BaseConnector,
@@ -262,6 +487,156 @@ class BatchExtractor:
 
         return results
 
+    def extract_stream(
+        self,
+        connector: BaseConnector,
+        sink: Callable[[pl.DataFrame], int],
+        query: str | None = None,
+        batch_size: int | None = None,
+        transform: Callable[[pl.DataFrame], pl.DataFrame] | None = None,
+        commit_rows: int | None = None,
+        commit_bytes: int | None = None,
+        queue_size: int | None = None,
+        table: str | None = None,
+        key_column: str | None = None,
+    ) -> StreamResult:
+        """
+        Stream batches from a connector into a sink with bounded memory.
+
+        The connector is read on a background thread that pushes batches onto
+        a bounded queue; when the writer falls behind, the extractor blocks
+        (backpressure). The calling thread buffers batches and calls ``sink``
+        once ``commit_rows`` rows or ``commit_bytes`` bytes have accumulated,
+        so at most ``queue_size`` batches plus one commit are held in memory.
+
+        If reading or transforming a batch fails, the error is recorded in
+        the result and extraction stops. Batches not yet committed are
+        discarded rather than written, so the sink only ever receives data
+        from before the failure; earlier commits are kept.
+
+        Args:
+            connector: Data connector to use
+            sink: Writes a DataFrame (e.g. one bronze commit) and returns
+                the number of rows written
+            query: Optional query string
+            batch_size: Override batch size
+            transform: Optional transformation per batch
+            commit_rows: Rows per sink call (config default if None)
+            commit_bytes: Bytes per sink call (config default if None)
+            queue_size: Batches buffered between extractor and writer
+            table: Optional table name (instead of a query)
+            key_column: Unique key of ``table`` for keyset pagination
+
+        Returns:
+            StreamResult with per-batch and per-commit metrics
+
+        Raises:
+            ExtractionError: If the sink fails; the extractor is stopped
+        """
+        config = self.settings.extraction.batch
+        batch_size = batch_size or self.batch_size
+        commit_rows = commit_rows or config.commit_rows or 4 * batch_size
+        commit_bytes = commit_bytes or config.commit_bytes
+        queue_size = queue_size or config.queue_size
+
+        batches: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        result = StreamResult(
+            total_rows=0,
+            start_time=utc_now(),
+            end_time=utc_now(),
+            errors=[],
+        )
+
+        self.logger.info(
+            "Starting streaming extraction",
+            batch_size=batch_size,
+            commit_rows=commit_rows,
+            commit_bytes=commit_bytes,
+            queue_size=queue_size,
+            query=query[:100] if query else None,
+        )
+
+        producer = threading.Thread(
+            target=self._produce_batches,
+            args=(
+                connector,
+                query,
+                batch_size,
+                transform,
+                _source_kwargs(table, key_column),
+                batches,
+                stop,
+                result,
+            ),
+            name="batch-extractor",
+            daemon=True,
+        )
+        producer.start()
+
+        buffer: list[pl.DataFrame] = []
+        buffered_rows = 0
+        buffered_bytes = 0
+
+        try:
+            while True:
+                batch = batches.get()
+                if batch is _END_OF_STREAM:
+                    break
+
+                buffer.append(batch)
+                buffered_rows += len(batch)
+                buffered_bytes += batch.estimated_size()
+                result.peak_buffered_bytes = max(result.peak_buffered_bytes, buffered_bytes)
+
+                if result.errors:
+                    # The extraction failed; its remaining batches are dropped
+                    continue
+
+                if buffered_rows >= commit_rows or buffered_bytes >= commit_bytes:
+                    result.total_rows += self._commit_buffer(buffer, sink, result)
+                    buffer = []
+                    buffered_rows = 0
+                    buffered_bytes = 0
+
+            if result.errors:
+                if buffer:
+                    self.logger.warning(
+                        "Discarding uncommitted batches after extraction error",
+                        batches=len(buffer),
+                        rows=buffered_rows,
+                    )
+            elif buffer:
+                result.total_rows += self._commit_buffer(buffer, sink, result)
+
+        except Exception as e:
+            self.logger.error(f"Streaming write failed: {e}")
+            raise ExtractionError(
+                f"Streaming write failed: {str(e)}",
+                details={
+                    "rows_committed": result.total_rows,
+                    "commits": len(result.commits),
+                },
+            )
+        finally:
+            stop.set()
+            producer.join()
+
+        result.end_time = utc_now()
+
+        self.logger.info(
+            "Streaming extraction completed",
+            total_rows=result.total_rows,
+            batches=result.batches_processed,
+            commits=len(result.commits),
+            peak_buffered_bytes=result.peak_buffered_bytes,
+            duration_seconds=result.duration_seconds,
+            rows_per_second=result.rows_per_second,
+            errors=len(result.errors),
+        )
+
+        return result
+
     def extract_to_lakehouse(
         self,
         connector: BaseConnector,
@@ -269,16 +644,29 @@ class BatchExtractor:
         source: str,
         query: str | None = None,
         batch_size: int | None = None,
+        commit_rows: int | None = None,
+        commit_bytes: int | None = None,
+        table: str | None = None,
+        key_column: str | None = None,
     ) -> int:
         """
         Extract directly to lakehouse bronze layer.
 
+        Batches are streamed through ``extract_stream`` and committed to
+        bronze every ``commit_rows`` rows or ``commit_bytes`` bytes, so the
+        source is never held in memory in full and small batches do not each
+        produce a commit.
+
         Args:
             connector: Data connector
             table_name: Target table name
             source: Source identifier
             query: Optional query
             batch_size: Override batch size
+            commit_rows: Rows per bronze commit
+            commit_bytes: Bytes per bronze commit
+            table: Source table (instead of a query)
+            key_column: Unique key of ``table`` for keyset pagination
 
         Returns:
             Total rows ingested
@@ -286,17 +674,129 @@ class BatchExtractor:
         from automic_etl.medallion import Lakehouse
 
         lakehouse = Lakehouse(self.settings)
-        total_rows = 0
 
-        for batch_result in connector.extract_batch(
-            query=query,
-            batch_size=batch_size or self.batch_size,
-        ):
-            rows = lakehouse.ingest(
+        result = self.extract_stream(
+            connector,
+            sink=lambda df: lakehouse.ingest(
                 table_name=table_name,
-                data=batch_result.data,
+                data=df,
                 source=source,
+            ),
+            query=query,
+            batch_size=batch_size,
+            commit_rows=commit_rows,
+            commit_bytes=commit_bytes,
+            table=table,
+            key_column=key_column,
+        )
+
+        if result.errors:
+            raise ExtractionError(
+                f"Extraction to {table_name} failed: {result.errors[0]}",
+                source=source,
+                details={"rows_committed": result.total_rows},
+            )
+
+        return result.total_rows
+
+    # =========================================================================
+    # Streaming Helpers
+    # =========================================================================
+
+    def _produce_batches(
+        self,
+        connector: BaseConnector,
+        query: str | None,
+        batch_size: int,
+        transform: Callable[[pl.DataFrame], pl.DataFrame] | None,
+        source_kwargs: dict[str, Any],
+        batches: queue.Queue[Any],
+        stop: threading.Event,
+        result: StreamResult,
+    ) -> None:
+        """Read batches from the connector onto the queue until done or stopped."""
+        batch_num = 0
+        try:
+            iterator = iter(
+                connector.extract_batch(query=query, batch_size=batch_size, **source_kwargs)
             )
-            total_rows += rows
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    batch_result = next(iterator)
+                except StopIteration:
+                    break
+                batch_num += 1
+
+                try:
+                    df = batch_result.data
+                    if transform:
+                        df = transform(df)
+                except Exception as e:
+                    self.logger.error(f"Batch {batch_num} failed: {e}")
+                    result.errors.append(e)
+                    break
+
+                extract_seconds = time.perf_counter() - started
+                enqueued = time.perf_counter()
+                if not self._put(batches, df, stop):
+                    break
+
+                metrics = BatchMetrics(
+                    batch_number=batch_num,
+                    rows=len(df),
+                    bytes=df.estimated_size(),
+                    extract_seconds=extract_seconds,
+                    queue_wait_seconds=time.perf_counter() - enqueued,
+                )
+                result.batch_metrics.append(metrics)
+                self.logger.debug("Extracted batch", **metrics.to_dict())
 
-        return total_rows
+        except Exception as e:
+            self.logger.error(f"Extraction failed: {e}")
+            result.errors.append(e)
+        finally:
+            self._put(batches, _END_OF_STREAM, stop)
+
+    def _commit_buffer(
+        self,
+        buffer: list[pl.DataFrame],
+        sink: Callable[[pl.DataFrame], int],
+        result: StreamResult,
+    ) -> int:
+        """Write buffered batches to the sink as one commit."""
+        started = time.perf_counter()
+        df = pl.concat(buffer, how="vertical_relaxed", rechunk=False)
+        rows = sink(df)
+
+        metrics = CommitMetrics(
+            commit_number=len(result.commits) + 1,
+            batches=len(buffer),
+            rows=len(df),
+            bytes=df.estimated_size(),
+            write_seconds=time.perf_counter() - started,
+        )
+        result.commits.append(metrics)
+        self.logger.info("Committed batches", **metrics.to_dict())
+        return rows
+
+    @staticmethod
+    def _put(batches: queue.Queue[Any], item: Any, stop: threading.Event) -> bool:
+        """Block until the item is queued; give up if the writer stopped."""
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+def _source_kwargs(table: str | None, key_column: str | None) -> dict[str, Any]:
+    """Connector arguments selecting a table and its pagination key."""
+    kwargs: dict[str, Any] = {}
+    if table:
+        kwargs["table"] = table
+    if key_column:
+        kwargs["key_column"] = key_column
+    return kwargs
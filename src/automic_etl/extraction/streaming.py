@@ -0,0 +1,328 @@
+"""Micro-batch ingestion of message streams into the bronze layer."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import polars as pl
+import pyarrow as pa
+import structlog
+
+from automic_etl.connectors.streaming.messages import MessageBatch
+from automic_etl.core.config import Settings
+from automic_etl.core.exceptions import ConfigurationError
+from automic_etl.core.utils import utc_now
+from automic_etl.medallion.bronze import BronzeLayer
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class MicroBatchMetrics:
+    """Throughput and lag of one micro-batch committed to bronze."""
+
+    batch_number: int
+    rows: int
+    bytes: int
+    decode_seconds: float
+    commit_seconds: float
+    interval_seconds: float
+    # Messages (Kafka) or milliseconds (Kinesis) behind, by partition
+    lag: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Ingestion rate since the previous commit."""
+        if self.interval_seconds > 0:
+            return self.rows / self.interval_seconds
+        return 0
+
+    @property
+    def total_lag(self) -> int:
+        """Lag summed over partitions."""
+        return sum(self.lag.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "batch": self.batch_number,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "decode_seconds": round(self.decode_seconds, 4),
+            "commit_seconds": round(self.commit_seconds, 4),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "lag": self.total_lag,
+        }
+
+
+@dataclass
+class StreamIngestionResult:
+    """Result of a streaming ingestion run."""
+
+    total_rows: int
+    start_time: datetime
+    end_time: datetime
+    micro_batches: list[MicroBatchMetrics] = field(default_factory=list)
+    # Positions committed with the last micro-batch, by partition
+    positions: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_seconds(self) -> float:
+        """Get run duration in seconds."""
+        return (self.end_time - self.start_time).total_seconds()
+
+    @property
+    def rows_per_second(self) -> float:
+        """Get end-to-end rate."""
+        if self.duration_seconds > 0:
+            return self.total_rows / self.duration_seconds
+        return 0
+
+    @property
+    def lag(self) -> dict[str, int]:
+        """Lag by partition after the last micro-batch."""
+        return self.micro_batches[-1].lag if self.micro_batches else {}
+
+
+class StreamIngestor:
+    """
+    Ingest a message stream into a bronze table in micro-batches.
+
+    Messages are polled raw, decoded column by column into one Arrow table
+    per micro-batch, and appended to bronze when the row, byte or time
+    trigger is reached. The source positions are stored as a bronze table
+    property in the same Iceberg commit as the rows, and acknowledged to the
+    source only after that commit succeeds. A restarted run resumes from
+    the positions in the table, so each message is appended exactly once
+    for sources with replayable positions (Kafka, Kinesis). Pending
+    messages of Kafka partitions revoked by a group rebalance are dropped,
+    since they are read again from the committed offsets. Pub/Sub
+    messages are acknowledged after the commit, which is at-least-once.
+
+    Sources are the streaming connectors, or any object with ``name``,
+    ``poll_batch``, ``commit_batch``, ``seek_positions`` and ``get_lag``.
+
+    Example:
+        config = KafkaConfig(
+            bootstrap_servers="localhost:9092",
+            topic="events",
+            enable_auto_commit=False,
+        )
+        ingestor = StreamIngestor(settings)
+        result = ingestor.run(KafkaConnector(config), "events", idle_timeout=60)
+    """
+
+    def __init__(self, settings: Settings, bronze: BronzeLayer | None = None) -> None:
+        self.settings = settings
+        self.config = settings.extraction.streaming
+        self.bronze = bronze or BronzeLayer(settings)
+        self.logger = logger.bind(component="stream_ingestor")
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """Stop a running ingestion after committing the current micro-batch."""
+        self._stop.set()
+
+    def run(
+        self,
+        source: Any,
+        table_name: str,
+        max_messages: int | None = None,
+        idle_timeout: float | None = None,
+        schema: pa.Schema | None = None,
+    ) -> StreamIngestionResult:
+        """
+        Consume a stream into a bronze table until stopped.
+
+        Args:
+            source: Streaming connector to consume
+            table_name: Bronze table to append to
+            max_messages: Stop after this many messages
+            idle_timeout: Stop after this many seconds without messages
+            schema: Schema of JSON payloads (inferred from the first
+                micro-batch if None)
+
+        Returns:
+            StreamIngestionResult with per-micro-batch metrics
+
+        Raises:
+            ConfigurationError: If the source commits positions on its own
+            LoadError: If a micro-batch cannot be committed to bronze; the
+                source positions are not committed and the run stops
+        """
+        if getattr(getattr(source, "config", None), "enable_auto_commit", False):
+            raise ConfigurationError(
+                "Auto-commit must be disabled for stream ingestion; offsets are "
+                "committed after each bronze commit",
+                details={"source": source.name, "enable_auto_commit": True},
+            )
+
+        config = self.config
+        self._stop.clear()
+        result = StreamIngestionResult(total_rows=0, start_time=utc_now(), end_time=utc_now())
+
+        property_key = self._positions_property(source.name)
+        result.positions = self._load_positions(table_name, property_key)
+        if result.positions:
+            source.seek_positions(result.positions)
+
+        self.logger.info(
+            "Starting stream ingestion",
+            source=source.name,
+            table=table_name,
+            resume_partitions=len(result.positions),
+            flush_rows=config.flush_rows,
+            flush_bytes=config.flush_bytes,
+            flush_interval_seconds=config.flush_interval_seconds,
+        )
+
+        pending: MessageBatch | None = None
+        pending_bytes = 0
+        consumed = 0
+        last_flush = last_message = time.monotonic()
+
+        while not self._stop.is_set():
+            poll_size = config.poll_size
+            if max_messages is not None:
+                poll_size = min(poll_size, max_messages - consumed)
+
+            polled = source.poll_batch(max_messages=poll_size, timeout=config.poll_timeout_seconds)
+            now = time.monotonic()
+            if polled.revoked and pending is not None:
+                # The new owner of these partitions (possibly this consumer
+                # again) resumes from the last committed position
+                consumed -= pending.drop_partitions(polled.revoked)
+                pending_bytes = pending.nbytes
+                if not len(pending):
+                    pending = None
+                self.logger.info(
+                    "Dropped pending messages of revoked partitions",
+                    source=source.name,
+                    partitions=sorted(polled.revoked),
+                )
+            if len(polled):
+                consumed += len(polled)
+                pending_bytes += polled.nbytes
+                last_message = now
+                if pending is None:
+                    pending = polled
+                else:
+                    pending.extend(polled)
+
+            idle = (
+                not len(polled)
+                and not polled.revoked
+                and idle_timeout is not None
+                and now - last_message >= idle_timeout
+            )
+            done = idle or (max_messages is not None and consumed >= max_messages)
+            due = pending is not None and (
+                len(pending) >= config.flush_rows
+                or pending_bytes >= config.flush_bytes
+                or now - last_flush >= config.flush_interval_seconds
+            )
+            if pending is not None and (due or done):
+                schema = self._flush(
+                    source, table_name, pending, pending_bytes, property_key,
+                    schema, now - last_flush, result,
+                )
+                pending, pending_bytes = None, 0
+                last_flush = time.monotonic()
+            if done:
+                break
+
+        if pending is not None:
+            self._flush(
+                source, table_name, pending, pending_bytes, property_key,
+                schema, time.monotonic() - last_flush, result,
+            )
+
+        result.end_time = utc_now()
+        self.logger.info(
+            "Stream ingestion stopped",
+            source=source.name,
+            table=table_name,
+            total_rows=result.total_rows,
+            micro_batches=len(result.micro_batches),
+            rows_per_second=round(result.rows_per_second, 1),
+        )
+        return result
+
+    def _flush(
+        self,
+        source: Any,
+        table_name: str,
+        batch: MessageBatch,
+        batch_bytes: int,
+        property_key: str,
+        schema: pa.Schema | None,
+        interval_seconds: float,
+        result: StreamIngestionResult,
+    ) -> pa.Schema | None:
+        """Commit a micro-batch to bronze, then to the source; returns the payload schema."""
+        started = time.perf_counter()
+        values = batch.decode_values(schema)
+        if schema is None and batch.value_format == "json" and batch.value_decoder is None:
+            schema = values.schema
+        df = pl.from_arrow(batch.with_metadata(values))
+        decode_seconds = time.perf_counter() - started
+
+        positions = {**result.positions, **batch.positions}
+        properties = {property_key: json.dumps(positions)} if positions else None
+
+        started = time.perf_counter()
+        rows = self.bronze.ingest(
+            table_name=table_name,
+            df=df,
+            source=source.name,
+            batch_id=uuid.uuid4().hex,
+            properties=properties,
+        )
+        commit_seconds = time.perf_counter() - started
+        result.positions = positions
+        result.total_rows += rows
+
+        # The positions are durable in bronze, so a failed source commit
+        # only delays the consumer group's view of progress
+        try:
+            source.commit_batch(batch)
+        except Exception as e:
+            self.logger.warning("Source commit failed", source=source.name, error=str(e))
+
+        try:
+            lag = source.get_lag(positions)
+        except Exception as e:
+            self.logger.warning("Lag lookup failed", source=source.name, error=str(e))
+            lag = {}
+
+        metrics = MicroBatchMetrics(
+            batch_number=len(result.micro_batches) + 1,
+            rows=rows,
+            bytes=batch_bytes,
+            decode_seconds=decode_seconds,
+            commit_seconds=commit_seconds,
+            interval_seconds=interval_seconds,
+            lag=lag,
+        )
+        result.micro_batches.append(metrics)
+        self.logger.info("Committed micro-batch", table=table_name, **metrics.to_dict())
+        return schema
+
+    def _load_positions(self, table_name: str, property_key: str) -> dict[str, Any]:
+        """Get the source positions committed with the bronze table."""
+        if not self.bronze.table_exists(table_name):
+            return {}
+        properties = self.bronze.table_manager.get_properties(self.bronze.NAMESPACE, table_name)
+        value = properties.get(property_key)
+        return json.loads(value) if value else {}
+
+    @staticmethod
+    def _positions_property(source_name: str) -> str:
+        """Table property holding the source positions, by partition."""
+        return f"automic.source.stream.{source_name}.positions"
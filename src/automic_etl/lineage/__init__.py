@@ -2,10 +2,22 @@
 
 from automic_etl.lineage.tracker import LineageTracker, LineageEvent
 from automic_etl.lineage.graph import LineageGraph, LineageNode
+from automic_etl.lineage.store import (
+    LineageStore,
+    JsonlLineageStore,
+    ParquetLineageStore,
+    SQLiteLineageStore,
+)
+from automic_etl.lineage.writer import LineageWriter
 
 __all__ = [
     "LineageTracker",
     "LineageEvent",
     "LineageGraph",
     "LineageNode",
+    "LineageStore",
+    "JsonlLineageStore",
+    "ParquetLineageStore",
+    "SQLiteLineageStore",
+    "LineageWriter",
 ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 from enum import Enum
@@ -167,26 +168,9 @@ class LineageGraph:
             depth: Maximum depth (-1 for unlimited)
 
         Returns:
-            List of upstream node IDs
+            List of upstream node IDs, nearest first
         """
-        upstream = []
-        visited = set()
-
-        def traverse(nid: str, current_depth: int) -> None:
-            if nid in visited:
-                return
-            if depth >= 0 and current_depth > depth:
-                return
-
-            visited.add(nid)
-
-            for parent in self._reverse_adjacency.get(nid, []):
-                if parent not in visited:
-                    upstream.append(parent)
-                    traverse(parent, current_depth + 1)
-
-        traverse(node_id, 0)
-        return upstream
+        return self._traverse(self._reverse_adjacency, node_id, depth)
 
     def get_downstream(self, node_id: str, depth: int = -1) -> list[str]:
         """
@@ -197,26 +181,31 @@ class LineageGraph:
             depth: Maximum depth (-1 for unlimited)
 
         Returns:
-            List of downstream node IDs
+            List of downstream node IDs, nearest first
         """
-        downstream = []
-        visited = set()
+        return self._traverse(self._adjacency, node_id, depth)
 
-        def traverse(nid: str, current_depth: int) -> None:
-            if nid in visited:
-                return
-            if depth >= 0 and current_depth > depth:
-                return
-
-            visited.add(nid)
-
-            for child in self._adjacency.get(nid, []):
-                if child not in visited:
-                    downstream.append(child)
-                    traverse(child, current_depth + 1)
+    @staticmethod
+    def _traverse(adjacency: dict[str, list[str]], node_id: str, depth: int) -> list[str]:
+        """
+        Breadth-first walk from a node, visiting each edge once.
 
-        traverse(node_id, 0)
-        return downstream
+        Nodes up to ``depth`` hops away are expanded, so the result reaches
+        ``depth + 1`` hops (direct neighbors only for depth 0).
+        """
+        reached = []
+        visited = {node_id}
+        queue = deque([(node_id, 0)])
+        while queue:
+            nid, hops = queue.popleft()
+            if depth >= 0 and hops > depth:
+                continue
+            for neighbor in adjacency.get(nid, ()):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    reached.append(neighbor)
+                    queue.append((neighbor, hops + 1))
+        return reached
 
     def get_path(self, source_id: str, target_id: str) -> list[str] | None:
         """
@@ -228,21 +217,25 @@ class LineageGraph:
         if source_id not in self.nodes or target_id not in self.nodes:
             return None
 
-        visited = set()
-        queue = [(source_id, [source_id])]
+        # Breadth-first search recording each node's predecessor; the path
+        # is rebuilt once the target is reached
+        parents: dict[str, str | None] = {source_id: None}
+        queue = deque([source_id])
 
         while queue:
-            current, path = queue.pop(0)
+            current = queue.popleft()
             if current == target_id:
-                return path
-
-            if current in visited:
-                continue
-            visited.add(current)
+                path = []
+                node: str | None = current
+                while node is not None:
+                    path.append(node)
+                    node = parents[node]
+                return path[::-1]
 
             for neighbor in self._adjacency.get(current, []):
-                if neighbor not in visited:
-                    queue.append((neighbor, path + [neighbor]))
+                if neighbor not in parents:
+                    parents[neighbor] = current
+                    queue.append(neighbor)
 
         return None
 
@@ -0,0 +1,271 @@
+"""Persistent stores for lineage events."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    from automic_etl.lineage.tracker import LineageEvent
+
+
+class LineageStore(ABC):
+    """Base class for lineage event stores."""
+
+    @abstractmethod
+    def write(self, events: list[LineageEvent]) -> None:
+        """Persist a batch of events."""
+        pass
+
+    def close(self) -> None:
+        """Release the store's resources."""
+        return None
+
+
+class JsonlLineageStore(LineageStore):
+    """
+    Append events to newline-delimited JSON files.
+
+    Events go to one file per day and job
+    (``{YYYYMMDD}_{job_id}.jsonl``) under the storage directory.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def write(self, events: list[LineageEvent]) -> None:
+        files: dict[str, list[str]] = {}
+        for event in events:
+            name = f"{event.timestamp.strftime('%Y%m%d')}_{event.job_id}.jsonl"
+            files.setdefault(name, []).append(json.dumps(event.to_dict()) + "\n")
+
+        for name, lines in files.items():
+            with open(self.path / name, "a") as f:
+                f.writelines(lines)
+
+
+class ParquetLineageStore(LineageStore):
+    """
+    Write each batch of events as a Parquet segment.
+
+    Segments share one schema (asset names as lists, metadata as JSON), so
+    the directory can be scanned as a single table with Polars.
+
+    Example:
+        store = ParquetLineageStore("lineage/events")
+        writes = store.scan().filter(pl.col("operation") == "write").collect()
+    """
+
+    SCHEMA = pa.schema([
+        ("event_id", pa.string()),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("operation", pa.string()),
+        ("sources", pa.list_(pa.string())),
+        ("targets", pa.list_(pa.string())),
+        ("transformation", pa.string()),
+        ("pipeline_id", pa.string()),
+        ("pipeline_name", pa.string()),
+        ("job_id", pa.string()),
+        ("user", pa.string()),
+        ("row_count_in", pa.int64()),
+        ("row_count_out", pa.int64()),
+        ("duration_ms", pa.int64()),
+        ("status", pa.string()),
+        ("error", pa.string()),
+        ("metadata", pa.string()),
+    ])
+
+    def __init__(self, path: str | Path, compression: str = "zstd") -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.compression = compression
+
+    def write(self, events: list[LineageEvent]) -> None:
+        if not events:
+            return
+        columns = {
+            "event_id": [e.event_id for e in events],
+            "timestamp": [e.timestamp for e in events],
+            "operation": [e.operation.value for e in events],
+            "sources": [[a.name for a in e.source_assets] for e in events],
+            "targets": [[a.name for a in e.target_assets] for e in events],
+            "transformation": [e.transformation for e in events],
+            "pipeline_id": [e.pipeline_id for e in events],
+            "pipeline_name": [e.pipeline_name for e in events],
+            "job_id": [e.job_id for e in events],
+            "user": [e.user for e in events],
+            "row_count_in": [e.row_count_in for e in events],
+            "row_count_out": [e.row_count_out for e in events],
+            "duration_ms": [e.duration_ms for e in events],
+            "status": [e.status for e in events],
+            "error": [e.error for e in events],
+            "metadata": [json.dumps(e.metadata, default=str) for e in events],
+        }
+        table = pa.table(columns, schema=self.SCHEMA)
+
+        # Write under a temporary name so scans never see partial segments
+        name = f"{events[0].timestamp.strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        temp_path = self.path / f".{name}.parquet.tmp"
+        pq.write_table(table, temp_path, compression=self.compression)
+        temp_path.rename(self.path / f"{name}.parquet")
+
+    def scan(self) -> pl.LazyFrame:
+        """Lazily scan all segments."""
+        if not any(self.path.glob("*.parquet")):
+            return pl.from_arrow(self.SCHEMA.empty_table()).lazy()
+        return pl.scan_parquet(self.path / "*.parquet")
+
+
+class SQLiteLineageStore(LineageStore):
+    """
+    Store events in an indexed SQLite database.
+
+    Each event is stored once with its job, operation and time indexed, and
+    every distinct source-to-target asset pair is stored once as an edge,
+    so upstream and downstream queries walk the asset graph with a
+    recursive query over indexed edges instead of scanning events.
+
+    Example:
+        store = SQLiteLineageStore("lineage/lineage.db")
+        affected = store.get_downstream("bronze.orders")
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS lineage_events (
+            event_id TEXT PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            operation TEXT NOT NULL,
+            job_id TEXT,
+            pipeline_id TEXT,
+            status TEXT,
+            payload TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS ix_lineage_events_timestamp
+            ON lineage_events (timestamp);
+        CREATE INDEX IF NOT EXISTS ix_lineage_events_job
+            ON lineage_events (job_id, timestamp);
+        CREATE INDEX IF NOT EXISTS ix_lineage_events_operation
+            ON lineage_events (operation, timestamp);
+        CREATE TABLE IF NOT EXISTS lineage_edges (
+            source TEXT NOT NULL,
+            target TEXT NOT NULL,
+            PRIMARY KEY (source, target)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS ix_lineage_edges_target
+            ON lineage_edges (target, source);
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def write(self, events: list[LineageEvent]) -> None:
+        rows = []
+        edges = set()
+        for event in events:
+            rows.append((
+                event.event_id,
+                event.timestamp.isoformat(),
+                event.operation.value,
+                event.job_id,
+                event.pipeline_id,
+                event.status,
+                json.dumps(event.to_dict()),
+            ))
+            for source in event.source_assets:
+                for target in event.target_assets:
+                    edges.add((source.name, target.name))
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO lineage_events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO lineage_edges (source, target) VALUES (?, ?)",
+                edges,
+            )
+
+    def get_events(
+        self,
+        job_id: str | None = None,
+        operation: str | None = None,
+        since: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Query stored events in time order.
+
+        Args:
+            job_id: Only events of this job
+            operation: Only events of this operation (e.g. ``"write"``)
+            since: Only events at or after this time
+            limit: Maximum number of events
+
+        Returns:
+            Event dictionaries as produced by ``LineageEvent.to_dict``
+        """
+        conditions, params = [], []
+        if job_id:
+            conditions.append("job_id = ?")
+            params.append(job_id)
+        if operation:
+            conditions.append("operation = ?")
+            params.append(operation)
+        if since:
+            conditions.append("timestamp >= ?")
+            params.append(since.isoformat())
+
+        sql = "SELECT payload FROM lineage_events"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY timestamp"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def get_upstream(self, asset_name: str) -> list[str]:
+        """Names of all assets the asset is derived from, transitively."""
+        return self._traverse(asset_name, "target", "source")
+
+    def get_downstream(self, asset_name: str) -> list[str]:
+        """Names of all assets derived from the asset, transitively."""
+        return self._traverse(asset_name, "source", "target")
+
+    def _traverse(self, asset_name: str, start: str, end: str) -> list[str]:
+        """Follow edges from ``start`` to ``end`` columns; UNION stops at cycles."""
+        sql = f"""
+            WITH RECURSIVE reached(name) AS (
+                SELECT {end} FROM lineage_edges WHERE {start} = ?
+                UNION
+                SELECT e.{end} FROM lineage_edges e JOIN reached r ON e.{start} = r.name
+            )
+            SELECT name FROM reached
+        """
+        with self._lock:
+            rows = self._conn.execute(sql, (asset_name,)).fetchall()
+        return [name for (name,) in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import Any, Callable, Literal
 from datetime import datetime
 from enum import Enum
 import uuid
@@ -13,7 +15,15 @@ from pathlib import Path
 import polars as pl
 import structlog
 
+from automic_etl.core.exceptions import ConfigurationError
 from automic_etl.core.utils import utc_now
+from automic_etl.lineage.store import (
+    JsonlLineageStore,
+    LineageStore,
+    ParquetLineageStore,
+    SQLiteLineageStore,
+)
+from automic_etl.lineage.writer import LineageWriter
 
 logger = structlog.get_logger()
 
@@ -102,6 +112,10 @@ class LineageTracker:
     - Store lineage in local or remote backends
     - Query lineage history
     - Export lineage for visualization
+
+    Recorded events are indexed by asset, job, operation and time as they
+    arrive, so upstream/downstream traversal visits each asset edge once
+    and event queries read only the matching index entries.
     """
 
     def __init__(
@@ -109,14 +123,27 @@ class LineageTracker:
         storage_path: str | None = None,
         pipeline_id: str | None = None,
         pipeline_name: str | None = None,
+        storage_backend: Literal["jsonl", "sqlite", "parquet"] = "jsonl",
+        async_writes: bool = False,
     ) -> None:
         """
         Initialize lineage tracker.
 
         Args:
-            storage_path: Path to store lineage data (JSON files)
+            storage_path: Directory to store lineage data in
             pipeline_id: Current pipeline ID
             pipeline_name: Current pipeline name
+            storage_backend: "jsonl" for daily JSON-lines files per job,
+                "sqlite" for an indexed ``lineage.db`` that can be queried
+                across runs through ``store``, or "parquet" for Parquet
+                segments that ``store.scan()`` reads with Polars
+            async_writes: Persist events in batches on a background
+                ``LineageWriter`` instead of on the recording thread.
+                Events are then only durable after ``flush`` (done by
+                ``LineageContext`` on exit) or ``close``
+
+        Raises:
+            ConfigurationError: If the storage backend is unknown
         """
         self.storage_path = Path(storage_path) if storage_path else None
         self.pipeline_id = pipeline_id or str(uuid.uuid4())
@@ -124,9 +151,39 @@ class LineageTracker:
         self.events: list[LineageEvent] = []
         self.job_id = str(uuid.uuid4())
         self.logger = logger.bind(component="lineage_tracker", pipeline=pipeline_name)
+        self._reset_indexes()
 
+        self.store: LineageStore | None = None
+        self._writer: LineageWriter | None = None
         if self.storage_path:
-            self.storage_path.mkdir(parents=True, exist_ok=True)
+            self.store = self._create_store(storage_backend)
+            if async_writes:
+                self._writer = LineageWriter(self.store)
+
+    def _create_store(self, backend: str) -> LineageStore:
+        """Create the persistent store under the storage path."""
+        if backend == "jsonl":
+            return JsonlLineageStore(self.storage_path)
+        if backend == "sqlite":
+            return SQLiteLineageStore(self.storage_path / "lineage.db")
+        if backend == "parquet":
+            return ParquetLineageStore(self.storage_path)
+        raise ConfigurationError(
+            f"Unknown lineage storage backend: {backend}",
+            details={"storage_backend": backend},
+        )
+
+    def _reset_indexes(self) -> None:
+        """Create empty event indexes."""
+        # Asset name -> names of assets directly upstream/downstream of it
+        # (dicts as insertion-ordered sets)
+        self._upstream: dict[str, dict[str, None]] = {}
+        self._downstream: dict[str, dict[str, None]] = {}
+        self._events_by_job: dict[str, list[LineageEvent]] = {}
+        self._events_by_operation: dict[OperationType, list[LineageEvent]] = {}
+        # Events sorted by time, with their timestamps for bisection
+        self._events_by_time: list[LineageEvent] = []
+        self._timestamps: list[datetime] = []
 
     def start_job(self, job_name: str | None = None) -> str:
         """Start a new job and return job ID."""
@@ -370,21 +427,61 @@ class LineageTracker:
     def _record_event(self, event: LineageEvent) -> None:
         """Record an event and optionally persist."""
         self.events.append(event)
+        self._index_event(event)
         self.logger.debug(
             "Lineage event recorded",
             event_id=event.event_id,
             operation=event.operation.value,
         )
 
-        if self.storage_path:
+        if self.store:
             self._persist_event(event)
 
+    def _index_event(self, event: LineageEvent) -> None:
+        """Add an event to the asset, job, operation and time indexes."""
+        for source in event.source_assets:
+            downstream = self._downstream.setdefault(source.name, {})
+            for target in event.target_assets:
+                downstream[target.name] = None
+                self._upstream.setdefault(target.name, {})[source.name] = None
+
+        self._events_by_job.setdefault(event.job_id, []).append(event)
+        self._events_by_operation.setdefault(event.operation, []).append(event)
+
+        if not self._timestamps or event.timestamp >= self._timestamps[-1]:
+            self._events_by_time.append(event)
+            self._timestamps.append(event.timestamp)
+        else:
+            index = bisect_left(self._timestamps, event.timestamp)
+            self._events_by_time.insert(index, event)
+            self._timestamps.insert(index, event.timestamp)
+
     def _persist_event(self, event: LineageEvent) -> None:
         """Persist event to storage."""
-        file_path = self.storage_path / f"{event.timestamp.strftime('%Y%m%d')}_{self.job_id}.jsonl"
+        if self._writer:
+            self._writer.submit(event)
+        else:
+            self.store.write([event])
 
-        with open(file_path, "a") as f:
-            f.write(json.dumps(event.to_dict()) + "\n")
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all recorded events are persisted.
+
+        Returns:
+            True if the events were written within the timeout
+        """
+        if self._writer:
+            return self._writer.flush(timeout)
+        return True
+
+    def close(self) -> None:
+        """Persist pending events and close the store."""
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+        elif self.store:
+            self.store.close()
+        self.store = None
 
     def get_events(
         self,
@@ -392,55 +489,50 @@ class LineageTracker:
         operation: OperationType | None = None,
         since: datetime | None = None,
     ) -> list[LineageEvent]:
-        """Query events with optional filters."""
-        results = self.events
+        """
+        Query events with optional filters.
 
+        The job or operation index is read when filtering by them (events
+        in record order), otherwise the time index from ``since``.
+        """
         if job_id:
-            results = [e for e in results if e.job_id == job_id]
-        if operation:
+            results = self._events_by_job.get(job_id, [])
+        elif operation:
+            results = self._events_by_operation.get(operation, [])
+        elif since:
+            return self._events_by_time[bisect_left(self._timestamps, since):]
+        else:
+            return list(self.events)
+
+        if job_id and operation:
             results = [e for e in results if e.operation == operation]
         if since:
             results = [e for e in results if e.timestamp >= since]
-
-        return results
+        return list(results)
 
     def get_upstream(self, asset_name: str) -> list[DataAsset]:
-        """Get all upstream dependencies for an asset."""
-        upstream = set()
-
-        def find_upstream(name: str, visited: set) -> None:
-            if name in visited:
-                return
-            visited.add(name)
-
-            for event in self.events:
-                for target in event.target_assets:
-                    if target.name == name:
-                        for source in event.source_assets:
-                            upstream.add(source.name)
-                            find_upstream(source.name, visited)
-
-        find_upstream(asset_name, set())
-        return [DataAsset(name=n, asset_type="unknown") for n in upstream]
+        """Get all upstream dependencies for an asset, nearest first."""
+        names = self._traverse(self._upstream, asset_name)
+        return [DataAsset(name=n, asset_type="unknown") for n in names]
 
     def get_downstream(self, asset_name: str) -> list[DataAsset]:
-        """Get all downstream dependents for an asset."""
-        downstream = set()
-
-        def find_downstream(name: str, visited: set) -> None:
-            if name in visited:
-                return
-            visited.add(name)
-
-            for event in self.events:
-                for source in event.source_assets:
-                    if source.name == name:
-                        for target in event.target_assets:
-                            downstream.add(target.name)
-                            find_downstream(target.name, visited)
-
-        find_downstream(asset_name, set())
-        return [DataAsset(name=n, asset_type="unknown") for n in downstream]
+        """Get all downstream dependents for an asset, nearest first."""
+        names = self._traverse(self._downstream, asset_name)
+        return [DataAsset(name=n, asset_type="unknown") for n in names]
+
+    @staticmethod
+    def _traverse(adjacency: dict[str, dict[str, None]], asset_name: str) -> list[str]:
+        """Breadth-first walk of an asset index, visiting each edge once."""
+        reached: dict[str, None] = {}
+        visited = {asset_name}
+        queue = deque([asset_name])
+        while queue:
+            for neighbor in adjacency.get(queue.popleft(), ()):
+                reached[neighbor] = None
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+        return list(reached)
 
     def to_dataframe(self) -> pl.DataFrame:
         """Convert all events to a DataFrame."""
@@ -469,6 +561,7 @@ class LineageTracker:
     def clear(self) -> None:
         """Clear all recorded events."""
         self.events = []
+        self._reset_indexes()
 
 
 # Context manager for tracking
@@ -492,3 +585,4 @@ class LineageContext:
                 source=None,
                 error=str(exc_val),
             )
+        self.tracker.flush()
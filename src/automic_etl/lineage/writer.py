@@ -0,0 +1,168 @@
+"""Background writer batching lineage events into a store."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING
+
+import structlog
+
+from automic_etl.lineage.store import LineageStore
+
+if TYPE_CHECKING:
+    from automic_etl.lineage.tracker import LineageEvent
+
+logger = structlog.get_logger()
+
+_STOP = object()
+
+
+class LineageWriter:
+    """
+    Persist lineage events on a background thread in batches.
+
+    ``submit`` puts an event on a bounded queue and returns; the writer
+    thread collects events and writes them to the store in one call when
+    ``batch_size`` events are buffered or ``flush_interval_seconds`` have
+    passed since the first buffered event. When the queue is full,
+    ``submit`` blocks until the writer catches up, so memory stays bounded.
+
+    Submitted events are not durable until ``flush`` returns: it waits
+    until every event submitted before it is written. ``close`` writes
+    pending events, stops the thread and closes the store. A writer that is
+    garbage collected or still open at interpreter exit is closed the same
+    way, so neither the thread nor the store's connection outlives it.
+
+    Example:
+        writer = LineageWriter(SQLiteLineageStore("lineage/lineage.db"))
+        writer.submit(event)
+        writer.flush()
+    """
+
+    def __init__(
+        self,
+        store: LineageStore,
+        queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 1.0,
+    ) -> None:
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.logger = logger.bind(component="lineage_writer")
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        # The thread only references the worker, so the writer can be collected
+        self._worker = _Worker(store, self._queue, batch_size, flush_interval_seconds)
+        self._thread = threading.Thread(
+            target=self._worker.run, name="lineage-writer", daemon=True
+        )
+        self._thread.start()
+        self._finalizer = weakref.finalize(self, _shutdown, self._queue, self._thread, store, 30.0)
+
+    @property
+    def written(self) -> int:
+        """Number of events written to the store."""
+        return self._worker.written
+
+    @property
+    def failed(self) -> int:
+        """Number of events whose write failed."""
+        return self._worker.failed
+
+    def submit(self, event: LineageEvent) -> None:
+        """Queue an event for writing."""
+        if not self._finalizer.alive:
+            self.logger.warning("Lineage writer closed, event dropped", event_id=event.event_id)
+            return
+        self._queue.put(event)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Write all events submitted so far.
+
+        Returns:
+            True if the events were written within the timeout
+        """
+        if not self._finalizer.alive:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 30.0) -> None:
+        """Write pending events, stop the writer thread and close the store."""
+        if self._finalizer.detach() is not None:
+            _shutdown(self._queue, self._thread, self.store, timeout)
+
+
+def _shutdown(
+    events: queue.Queue,
+    thread: threading.Thread,
+    store: LineageStore,
+    timeout: float | None,
+) -> None:
+    """Stop a writer thread after it writes pending events, then close the store."""
+    events.put(_STOP)
+    thread.join(timeout)
+    store.close()
+
+
+class _Worker:
+    """Writer thread state: collects queued events into batches and writes them."""
+
+    def __init__(
+        self,
+        store: LineageStore,
+        events: queue.Queue,
+        batch_size: int,
+        flush_interval_seconds: float,
+    ) -> None:
+        self.store = store
+        self.events = events
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.written = 0
+        self.failed = 0
+        self.logger = logger.bind(component="lineage_writer")
+
+    def run(self) -> None:
+        """Collect queued events into batches and write them."""
+        buffer: list[LineageEvent] = []
+        deadline = 0.0
+        while True:
+            timeout = max(deadline - time.monotonic(), 0) if buffer else None
+            try:
+                item = self.events.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._write(buffer)
+                return
+            if isinstance(item, threading.Event):
+                self._write(buffer)
+                buffer = []
+                item.set()
+                continue
+            if item is not None:
+                if not buffer:
+                    deadline = time.monotonic() + self.flush_interval_seconds
+                buffer.append(item)
+
+            if buffer and (len(buffer) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(buffer)
+                buffer = []
+
+    def _write(self, events: list[LineageEvent]) -> None:
+        """Write a batch; failures are logged so the pipeline is not interrupted."""
+        if not events:
+            return
+        try:
+            self.store.write(events)
+            self.written += len(events)
+        except Exception as e:
+            self.failed += len(events)
+            self.logger.error("Failed to write lineage events", events=len(events), error=str(e))
@@ -9,8 +9,9 @@ from automic_etl.llm.client import (
     estimate_tokens,
     with_retry,
 )
+from automic_etl.llm.cache import LLMCacheStats, LLMResponseCache, get_llm_cache
 from automic_etl.llm.schema_generator import SchemaGenerator
-from automic_etl.llm.entity_extractor import EntityExtractor
+from automic_etl.llm.entity_extractor import EnrichmentStats, EntityExtractor
 from automic_etl.llm.data_classifier import DataClassifier
 from automic_etl.llm.query_builder import QueryBuilder
 from automic_etl.llm.augmented_etl import AugmentedETL
@@ -33,9 +34,14 @@ __all__ = [
     "RateLimiter",
     "estimate_tokens",
     "with_retry",
+    # Cache
+    "LLMResponseCache",
+    "LLMCacheStats",
+    "get_llm_cache",
     # Generators
     "SchemaGenerator",
     "EntityExtractor",
+    "EnrichmentStats",
     "DataClassifier",
     "QueryBuilder",
     "AugmentedETL",
@@ -17,10 +17,11 @@ import structlog
 from automic_etl.core.config import Settings
 from automic_etl.llm.client import LLMClient
 from automic_etl.llm.schema_generator import SchemaGenerator
-from automic_etl.llm.entity_extractor import EntityExtractor
+from automic_etl.llm.entity_extractor import EnrichmentStats, EntityExtractor, text_key
 from automic_etl.llm.data_classifier import DataClassifier
 from automic_etl.llm.query_builder import QueryBuilder
 from automic_etl.core.utils import utc_now
+from automic_etl.validation.quality import DataQualityChecker
 
 logger = structlog.get_logger()
 
@@ -71,6 +72,7 @@ class AugmentedETL:
         self.classifier = DataClassifier(settings)
         self.query_builder = QueryBuilder(settings)
         self.logger = logger.bind(component="augmented_etl")
+        self.last_enrichment_stats: EnrichmentStats | None = None
 
     def smart_ingest(
         self,
@@ -225,6 +227,7 @@ Respond with JSON:
         result, tokens = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are a Polars data transformation expert. Generate safe, efficient code.",
+            temperature=0.0,
         )
 
         transformed_df = df
@@ -297,6 +300,7 @@ Respond with JSON:
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are a data analyst expert. Provide actionable insights.",
+            temperature=0.0,
         )
 
         return result
@@ -311,45 +315,43 @@ Respond with JSON:
         Returns:
             DataProfile with detailed statistics and insights
         """
+        # All column statistics in one vectorized pass
+        report = DataQualityChecker(detect_outliers=False).profile(df)
         columns = []
 
-        for col in df.columns:
-            col_data = df[col]
-            dtype = str(col_data.dtype)
-
+        for col, profile in report.column_profiles.items():
             col_profile = {
                 "name": col,
-                "dtype": dtype,
-                "null_count": col_data.null_count(),
-                "null_pct": col_data.null_count() / len(df) * 100,
-                "unique_count": col_data.n_unique(),
-                "unique_pct": col_data.n_unique() / len(df) * 100,
+                "dtype": profile.dtype,
+                "null_count": profile.null_count,
+                "null_pct": profile.null_percentage,
+                "unique_count": profile.unique_count,
+                "unique_pct": profile.unique_percentage,
             }
 
             # Numeric stats
-            if col_data.dtype in [pl.Int64, pl.Float64, pl.Int32, pl.Float32]:
+            if profile.mean is not None:
                 col_profile.update({
-                    "min": col_data.min(),
-                    "max": col_data.max(),
-                    "mean": col_data.mean(),
-                    "std": col_data.std(),
-                    "median": col_data.median(),
+                    "min": profile.min_value,
+                    "max": profile.max_value,
+                    "mean": profile.mean,
+                    "std": profile.std,
+                    "median": profile.percentiles["50%"],
                 })
 
             # String stats
-            elif col_data.dtype in [pl.Utf8, pl.String]:
-                lengths = col_data.drop_nulls().str.len_chars()
+            elif profile.dtype == str(pl.Utf8):
                 col_profile.update({
-                    "min_length": lengths.min() if len(lengths) > 0 else 0,
-                    "max_length": lengths.max() if len(lengths) > 0 else 0,
-                    "avg_length": lengths.mean() if len(lengths) > 0 else 0,
+                    "min_length": profile.min_length or 0,
+                    "max_length": profile.max_length or 0,
+                    "avg_length": profile.avg_length or 0,
                 })
 
             columns.append(col_profile)
 
         # Calculate quality metrics
         quality_metrics = {
-            "completeness": 1 - (df.null_count().sum_horizontal().item() / (len(df) * len(df.columns))),
+            "completeness": report.completeness_score / 100,
             "uniqueness": sum(c["unique_pct"] for c in columns) / len(columns) / 100,
         }
 
@@ -412,6 +414,7 @@ Respond with JSON:
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are an ETL architect expert with deep knowledge of the Automic ETL framework.",
+            temperature=0.0,
         )
 
         return result
@@ -500,14 +503,20 @@ Respond with JSON:
         df: pl.DataFrame,
         text_column: str,
         entity_types: list[str] | None = None,
+        normalize: bool = False,
     ) -> pl.DataFrame:
         """
         Enrich DataFrame by extracting entities from a text column.
 
+        Entities are extracted once per distinct text and joined back onto
+        the frame; deduplication statistics are kept in
+        ``last_enrichment_stats``.
+
         Args:
             df: Input DataFrame
             text_column: Column containing text to process
             entity_types: Entity types to extract
+            normalize: Collapse whitespace before deduplicating texts
 
         Returns:
             DataFrame with new entity columns
@@ -515,30 +524,34 @@ Respond with JSON:
         if text_column not in df.columns:
             raise ValueError(f"Column '{text_column}' not found in DataFrame")
 
-        # Process each row
-        entity_data: dict[str, list] = {et: [] for et in (entity_types or self.entity_extractor.DEFAULT_ENTITY_TYPES)}
-
-        for row in df.iter_rows(named=True):
-            text = row.get(text_column, "")
-            if text:
-                entities = self.entity_extractor.extract(str(text), entity_types)
-                entity_by_type = {}
-                for entity in entities:
-                    if entity.entity_type not in entity_by_type:
-                        entity_by_type[entity.entity_type] = entity.value
-
-                for et in entity_data.keys():
-                    entity_data[et].append(entity_by_type.get(et))
-            else:
-                for et in entity_data.keys():
-                    entity_data[et].append(None)
-
-        # Add entity columns
-        for entity_type, values in entity_data.items():
-            col_name = f"_extracted_{entity_type.lower()}"
-            df = df.with_columns(pl.Series(col_name, values))
-
-        return df
+        entity_types = entity_types or self.entity_extractor.DEFAULT_ENTITY_TYPES
+        keyed = df.with_columns(text_key(text_column, normalize).alias("_text_key"))
+
+        entities, stats = self.entity_extractor.extract_distinct(
+            keyed["_text_key"], entity_types, stage="enrich_with_entities"
+        )
+        self.last_enrichment_stats = stats
+
+        # First value of each entity type per distinct text
+        lookup = (
+            entities.filter(pl.col("entity_type").is_in(entity_types))
+            .group_by("text", "entity_type", maintain_order=True)
+            .agg(pl.col("value").first())
+            .pivot(values="value", index="text", on="entity_type")
+        )
+        lookup = lookup.select(
+            pl.col("text").alias("_text_key"),
+            *[
+                (pl.col(et) if et in lookup.columns else pl.lit(None, dtype=pl.Utf8))
+                .alias(f"_extracted_{et.lower()}")
+                for et in entity_types
+            ],
+        )
+
+        return (
+            keyed.join(lookup, on="_text_key", how="left", maintain_order="left")
+            .drop("_text_key")
+        )
 
     def _to_dataframe(self, data: Any, data_type: str) -> pl.DataFrame:
         """Convert various data types to DataFrame."""
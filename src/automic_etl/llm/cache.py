@@ -0,0 +1,223 @@
+"""Persistent, content-addressed cache of LLM responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_CACHE_PATH = Path.home() / ".automic" / "llm_cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    tokens_used INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def cache_key(
+    provider: str,
+    model: str,
+    system_prompt: str | None,
+    prompt: str,
+    temperature: float,
+    json_mode: bool,
+    max_tokens: int,
+) -> str:
+    """Hash everything that determines a completion into a cache key."""
+    payload = json.dumps(
+        [provider, model, system_prompt, prompt, temperature, json_mode, max_tokens]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class LLMCacheStats:
+    """Hit/miss counters for the LLM response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    tokens_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "tokens_saved": self.tokens_saved,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed LRU + TTL cache of LLM responses.
+
+    Entries are keyed by ``cache_key`` and survive restarts, so re-running a
+    pipeline over unchanged inputs costs no tokens. The database uses WAL
+    mode, so several processes can share one file. The least recently read
+    entries are evicted once ``max_entries`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        max_entries: int = 100_000,
+        ttl_seconds: float = 7 * 24 * 3600,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = LLMCacheStats()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._size = self._count()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get a cached response payload, or None on a miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, tokens_used, created_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            payload, tokens_used, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._size -= 1
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.stats.hits += 1
+            self.stats.tokens_saved += tokens_used
+            return json.loads(payload)
+
+    def put(self, key: str, payload: dict[str, Any], tokens_used: int) -> None:
+        """Store a response payload, evicting the least recently read entries."""
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(payload, default=str), tokens_used, now, now),
+            )
+            self.stats.writes += 1
+            if not exists:
+                self._size += 1
+
+            if self._size > self.max_entries:
+                # Another process may have changed the file; recount first
+                self._size = self._count()
+                excess = self._size - self.max_entries
+                if excess > 0:
+                    self._conn.execute(
+                        "DELETE FROM responses WHERE key IN "
+                        "(SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                        (excess,),
+                    )
+                    self._size -= excess
+                    self.stats.evictions += excess
+            self._conn.commit()
+
+    def delete(self, key: str) -> bool:
+        """Remove one entry; returns True if it existed."""
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM responses WHERE key = ?", (key,)
+            ).rowcount
+            self._conn.commit()
+            self._size -= deleted
+            return deleted > 0
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._size = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Cache size, limits and counters."""
+        return {
+            "path": str(self.path),
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            **self.stats.to_dict(),
+        }
+
+    def _count(self) -> int:
+        """Number of stored entries (lock must be held)."""
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+_caches: dict[Path, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_cache(
+    path: str | Path | None = None,
+    max_entries: int = 100_000,
+    ttl_seconds: float = 7 * 24 * 3600,
+) -> LLMResponseCache:
+    """Get the process-wide cache for a database file, creating it on first use."""
+    resolved = Path(path or DEFAULT_CACHE_PATH).expanduser().resolve()
+    with _caches_lock:
+        cache = _caches.get(resolved)
+        if cache is None:
+            cache = LLMResponseCache(resolved, max_entries, ttl_seconds)
+            _caches[resolved] = cache
+            logger.debug("Opened LLM response cache", path=str(resolved))
+        return cache
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Callable
@@ -15,9 +18,13 @@ import structlog
 from automic_etl.core.config import LLMProvider, Settings
 from automic_etl.core.exceptions import LLMError
 from automic_etl.core.utils import utc_now
+from automic_etl.llm.cache import LLMResponseCache, cache_key, get_llm_cache
 
 logger = structlog.get_logger()
 
+# Finish reasons of responses cut off at the token limit; these are never cached
+TRUNCATED_FINISH_REASONS = frozenset({"length", "max_tokens", "max_output_tokens"})
+
 
 # ============================================================================
 # Retry Configuration
@@ -142,7 +149,8 @@ class RateLimiter:
     """
     Rate limiter for LLM API calls.
 
-    Tracks requests and tokens per minute and per day.
+    Tracks requests and tokens per minute and per day. All methods are
+    thread-safe, so one limiter can be shared by concurrent completions.
     """
 
     def __init__(self, config: RateLimitConfig | None = None):
@@ -151,6 +159,7 @@ class RateLimiter:
         self._minute_tokens: list[tuple[datetime, int]] = []
         self._day_requests: list[datetime] = []
         self._day_tokens: list[tuple[datetime, int]] = []
+        self._lock = threading.Lock()
 
     def check_limit(self, estimated_tokens: int = 0) -> tuple[bool, str | None]:
         """
@@ -159,41 +168,76 @@ class RateLimiter:
         Returns:
             Tuple of (allowed, reason if not allowed)
         """
-        now = utc_now()
-        minute_ago = now - timedelta(minutes=1)
-        day_ago = now - timedelta(days=1)
+        with self._lock:
+            allowed, reason, _ = self._check(estimated_tokens)
+            return allowed, reason
 
-        # Clean old entries
-        self._minute_requests = [t for t in self._minute_requests if t > minute_ago]
-        self._minute_tokens = [(t, n) for t, n in self._minute_tokens if t > minute_ago]
-        self._day_requests = [t for t in self._day_requests if t > day_ago]
-        self._day_tokens = [(t, n) for t, n in self._day_tokens if t > day_ago]
+    def try_acquire(
+        self,
+        estimated_tokens: int = 0,
+    ) -> tuple[bool, str | None, float | None]:
+        """
+        Check the limits and, if allowed, reserve capacity for one request.
 
-        # Check minute limits
-        if len(self._minute_requests) >= self.config.requests_per_minute:
-            return False, f"Rate limit: {self.config.requests_per_minute} requests/min"
+        Checking and reserving happen atomically, so concurrent callers
+        cannot overshoot a limit between the check and the record. The
+        reservation should be settled with ``settle`` once the actual token
+        count is known.
 
-        minute_tokens = sum(n for _, n in self._minute_tokens) + estimated_tokens
-        if minute_tokens > self.config.tokens_per_minute:
-            return False, f"Token limit: {self.config.tokens_per_minute} tokens/min"
+        Returns:
+            Tuple of (acquired, reason if not, seconds until capacity frees
+            up or None if it will not within a minute)
+        """
+        with self._lock:
+            allowed, reason, retry_after = self._check(estimated_tokens)
+            if allowed:
+                self._record(utc_now(), estimated_tokens, count_request=True)
+            return allowed, reason, retry_after
 
-        # Check daily limits
-        if len(self._day_requests) >= self.config.requests_per_day:
-            return False, f"Daily limit: {self.config.requests_per_day} requests/day"
+    def acquire(self, estimated_tokens: int = 0, timeout: float | None = None) -> float:
+        """
+        Block until capacity for one request is reserved.
 
-        day_tokens = sum(n for _, n in self._day_tokens) + estimated_tokens
-        if day_tokens > self.config.tokens_per_day:
-            return False, f"Daily token limit: {self.config.tokens_per_day} tokens/day"
+        Args:
+            estimated_tokens: Estimated tokens of the request
+            timeout: Maximum seconds to wait (None waits as long as needed)
+
+        Returns:
+            Seconds spent waiting
 
-        return True, None
+        Raises:
+            LLMError: If a daily limit is reached or the timeout expires
+        """
+        start = time.monotonic()
+        while True:
+            delay = self._next_delay(estimated_tokens, start, timeout)
+            if delay is None:
+                return time.monotonic() - start
+            time.sleep(delay)
+
+    async def acquire_async(
+        self,
+        estimated_tokens: int = 0,
+        timeout: float | None = None,
+    ) -> float:
+        """Async variant of ``acquire`` that yields to the event loop while waiting."""
+        start = time.monotonic()
+        while True:
+            delay = self._next_delay(estimated_tokens, start, timeout)
+            if delay is None:
+                return time.monotonic() - start
+            await asyncio.sleep(delay)
+
+    def settle(self, estimated_tokens: int, tokens_used: int) -> None:
+        """Replace a reservation's estimated tokens with the actual count."""
+        if tokens_used != estimated_tokens:
+            with self._lock:
+                self._record(utc_now(), tokens_used - estimated_tokens, count_request=False)
 
     def record_request(self, tokens_used: int):
         """Record a completed request."""
-        now = utc_now()
-        self._minute_requests.append(now)
-        self._minute_tokens.append((now, tokens_used))
-        self._day_requests.append(now)
-        self._day_tokens.append((now, tokens_used))
+        with self._lock:
+            self._record(utc_now(), tokens_used, count_request=True)
 
     def get_usage(self) -> dict[str, Any]:
         """Get current usage statistics."""
@@ -201,10 +245,11 @@ class RateLimiter:
         minute_ago = now - timedelta(minutes=1)
         day_ago = now - timedelta(days=1)
 
-        minute_requests = len([t for t in self._minute_requests if t > minute_ago])
-        minute_tokens = sum(n for t, n in self._minute_tokens if t > minute_ago)
-        day_requests = len([t for t in self._day_requests if t > day_ago])
-        day_tokens = sum(n for t, n in self._day_tokens if t > day_ago)
+        with self._lock:
+            minute_requests = len([t for t in self._minute_requests if t > minute_ago])
+            minute_tokens = sum(n for t, n in self._minute_tokens if t > minute_ago)
+            day_requests = len([t for t in self._day_requests if t > day_ago])
+            day_tokens = sum(n for t, n in self._day_tokens if t > day_ago)
 
         return {
             "minute": {
@@ -221,6 +266,76 @@ class RateLimiter:
             },
         }
 
+    def _next_delay(
+        self,
+        estimated_tokens: int,
+        start: float,
+        timeout: float | None,
+    ) -> float | None:
+        """Reserve capacity and return None, or return how long to sleep first."""
+        acquired, reason, retry_after = self.try_acquire(estimated_tokens)
+        if acquired:
+            return None
+
+        waited = time.monotonic() - start
+        if retry_after is None or (timeout is not None and waited + retry_after > timeout):
+            raise LLMError(
+                f"Rate limit exceeded: {reason}",
+                details={"usage": self.get_usage(), "waited_seconds": round(waited, 3)},
+            )
+        # Wake up a little after the oldest entry leaves the window
+        return retry_after + 0.01
+
+    def _check(self, estimated_tokens: int) -> tuple[bool, str | None, float | None]:
+        """Check the limits (lock must be held)."""
+        now = utc_now()
+        minute_ago = now - timedelta(minutes=1)
+        day_ago = now - timedelta(days=1)
+
+        # Clean old entries
+        self._minute_requests = [t for t in self._minute_requests if t > minute_ago]
+        self._minute_tokens = [(t, n) for t, n in self._minute_tokens if t > minute_ago]
+        self._day_requests = [t for t in self._day_requests if t > day_ago]
+        self._day_tokens = [(t, n) for t, n in self._day_tokens if t > day_ago]
+
+        # Check daily limits first; waiting a minute does not help with those
+        if len(self._day_requests) >= self.config.requests_per_day:
+            return False, f"Daily limit: {self.config.requests_per_day} requests/day", None
+
+        day_tokens = sum(n for _, n in self._day_tokens) + estimated_tokens
+        if day_tokens > self.config.tokens_per_day:
+            return False, f"Daily token limit: {self.config.tokens_per_day} tokens/day", None
+
+        # Check minute limits
+        if len(self._minute_requests) >= self.config.requests_per_minute:
+            retry_after = (self._minute_requests[0] - minute_ago).total_seconds()
+            return False, f"Rate limit: {self.config.requests_per_minute} requests/min", retry_after
+
+        minute_tokens = sum(n for _, n in self._minute_tokens) + estimated_tokens
+        if minute_tokens > self.config.tokens_per_minute:
+            if estimated_tokens > self.config.tokens_per_minute:
+                retry_after = None
+            else:
+                # Find when enough of the window's tokens have expired
+                excess = minute_tokens - self.config.tokens_per_minute
+                retry_after = 60.0
+                for t, n in self._minute_tokens:
+                    excess -= n
+                    if excess <= 0:
+                        retry_after = (t - minute_ago).total_seconds()
+                        break
+            return False, f"Token limit: {self.config.tokens_per_minute} tokens/min", retry_after
+
+        return True, None, None
+
+    def _record(self, now: datetime, tokens: int, count_request: bool) -> None:
+        """Record a request and/or token adjustment (lock must be held)."""
+        if count_request:
+            self._minute_requests.append(now)
+            self._day_requests.append(now)
+        self._minute_tokens.append((now, tokens))
+        self._day_tokens.append((now, tokens))
+
 
 def estimate_tokens(text: str) -> int:
     """
@@ -250,6 +365,7 @@ class LLMClient:
     - Multiple provider support (Anthropic, OpenAI, Ollama, LiteLLM)
     - Automatic retry with exponential backoff
     - Rate limiting with token tracking
+    - Persistent response cache for deterministic (temperature 0) calls
     - Usage statistics
     """
 
@@ -258,6 +374,7 @@ class LLMClient:
         settings: Settings,
         retry_config: RetryConfig | None = None,
         rate_limit_config: RateLimitConfig | None = None,
+        response_cache: LLMResponseCache | None = None,
     ) -> None:
         self.settings = settings
         self.llm_config = settings.llm
@@ -271,6 +388,8 @@ class LLMClient:
         self._rate_limiter = RateLimiter(rate_limit_config)
         self._total_tokens_used: int = 0
         self._total_requests: int = 0
+        self._usage_lock = threading.Lock()
+        self._response_cache = response_cache
 
     def _get_client(self) -> Any:
         """Get or create the LLM client."""
@@ -305,6 +424,96 @@ class LLMClient:
 
         return self._client
 
+    def _get_cache(self) -> LLMResponseCache | None:
+        """Get the response cache, opening it on first use (None if disabled)."""
+        if self._response_cache is None and self.llm_config.cache.enabled:
+            cache_config = self.llm_config.cache
+            self._response_cache = get_llm_cache(
+                cache_config.path, cache_config.max_entries, cache_config.ttl_seconds
+            )
+        return self._response_cache
+
+    def _cache_key(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> str | None:
+        """Cache key of a request, or None if its response must not be cached."""
+        # Sampled responses differ between calls; only cache deterministic ones
+        if temperature != 0 or not self.llm_config.cache.enabled:
+            return None
+        return cache_key(
+            self.llm_config.provider.value,
+            self.llm_config.model,
+            system_prompt,
+            prompt,
+            temperature,
+            json_mode,
+            max_tokens,
+        )
+
+    def _cached_response(self, key: str | None) -> LLMResponse | None:
+        """Look up a cached response; hits report zero tokens used."""
+        cache = self._get_cache() if key else None
+        if cache is None:
+            return None
+
+        payload = cache.get(key)
+        if payload is None:
+            return None
+
+        self.logger.debug("LLM cache hit", key=key[:16])
+        return LLMResponse(
+            content=payload["content"],
+            model=payload["model"],
+            tokens_used=0,
+            finish_reason=payload["finish_reason"],
+            metadata={
+                **payload.get("metadata", {}),
+                "cached": True,
+                "cached_tokens_used": payload["tokens_used"],
+            },
+        )
+
+    def _store_response(
+        self,
+        key: str | None,
+        response: LLMResponse,
+        json_mode: bool = False,
+    ) -> None:
+        """
+        Store a fresh response in the cache.
+
+        Truncated responses, and JSON-mode responses that do not parse, are
+        not stored so a bad answer is not replayed until it expires.
+        """
+        cache = self._get_cache() if key else None
+        if cache is None:
+            return
+        if response.finish_reason in TRUNCATED_FINISH_REASONS:
+            self.logger.debug("Not caching truncated response", key=key[:16])
+            return
+        if json_mode:
+            try:
+                self._parse_json(response)
+            except LLMError:
+                self.logger.debug("Not caching unparseable JSON response", key=key[:16])
+                return
+        cache.put(
+            key,
+            {
+                "content": response.content,
+                "model": response.model,
+                "tokens_used": response.tokens_used,
+                "finish_reason": response.finish_reason,
+                "metadata": response.metadata,
+            },
+            response.tokens_used,
+        )
+
     def complete(
         self,
         prompt: str,
@@ -314,7 +523,12 @@ class LLMClient:
         json_mode: bool = False,
     ) -> LLMResponse:
         """
-        Generate a completion with retry and rate limiting.
+        Generate a completion with caching, retry and rate limiting.
+
+        Calls at temperature 0 are served from the persistent response cache
+        when an identical request was completed before. Truncated responses
+        and JSON-mode responses that do not parse are not cached; use
+        ``invalidate_cached`` to drop an entry.
 
         Args:
             prompt: User prompt
@@ -329,16 +543,18 @@ class LLMClient:
         Raises:
             LLMError: If rate limited or completion fails after retries
         """
-        temperature = temperature or self.llm_config.temperature
+        temperature = self.llm_config.temperature if temperature is None else temperature
         max_tokens = max_tokens or self.llm_config.max_tokens
 
-        # Estimate tokens for rate limiting
-        estimated_tokens = estimate_tokens(prompt)
-        if system_prompt:
-            estimated_tokens += estimate_tokens(system_prompt)
+        key = self._cache_key(prompt, system_prompt, temperature, max_tokens, json_mode)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
 
-        # Check rate limits
-        allowed, reason = self._rate_limiter.check_limit(estimated_tokens)
+        estimated_tokens = self._estimate_request_tokens(prompt, system_prompt)
+
+        # Check rate limits and reserve capacity
+        allowed, reason, _ = self._rate_limiter.try_acquire(estimated_tokens)
         if not allowed:
             raise LLMError(
                 f"Rate limit exceeded: {reason}",
@@ -346,6 +562,28 @@ class LLMClient:
                 details={"usage": self._rate_limiter.get_usage()},
             )
 
+        return self._run_completion(
+            prompt, system_prompt, temperature, max_tokens, json_mode, estimated_tokens, key
+        )
+
+    def _estimate_request_tokens(self, prompt: str, system_prompt: str | None) -> int:
+        """Estimate the prompt tokens of a request for rate limiting."""
+        estimated_tokens = estimate_tokens(prompt)
+        if system_prompt:
+            estimated_tokens += estimate_tokens(system_prompt)
+        return estimated_tokens
+
+    def _run_completion(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+        estimated_tokens: int,
+        cache_key: str | None = None,
+    ) -> LLMResponse:
+        """Run a completion whose rate limit capacity is already reserved."""
         self.logger.debug(
             "Generating completion",
             prompt_length=len(prompt),
@@ -356,15 +594,21 @@ class LLMClient:
         provider = self.llm_config.provider
 
         # Use retry wrapper for actual completion
-        response = self._complete_with_retry(
-            prompt, system_prompt, temperature, max_tokens, json_mode, provider
-        )
+        try:
+            response = self._complete_with_retry(
+                prompt, system_prompt, temperature, max_tokens, json_mode, provider
+            )
+        except Exception:
+            self._rate_limiter.settle(estimated_tokens, 0)
+            raise
 
         # Record usage
-        self._rate_limiter.record_request(response.tokens_used)
-        self._total_tokens_used += response.tokens_used
-        self._total_requests += 1
+        self._rate_limiter.settle(estimated_tokens, response.tokens_used)
+        with self._usage_lock:
+            self._total_tokens_used += response.tokens_used
+            self._total_requests += 1
 
+        self._store_response(cache_key, response, json_mode)
         return response
 
     def _complete_with_retry(
@@ -440,12 +684,39 @@ class LLMClient:
             )
         raise LLMError("Unknown error during completion", provider=provider.value)
 
+    def invalidate_cached(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        json_mode: bool = False,
+    ) -> bool:
+        """
+        Drop the cached response of a request, so the next call is sent again.
+
+        Arguments match ``complete``; for ``complete_json`` requests pass the
+        system prompt including the JSON instruction and ``json_mode=True``.
+
+        Returns:
+            True if a cached response was removed
+        """
+        temperature = self.llm_config.temperature if temperature is None else temperature
+        max_tokens = max_tokens or self.llm_config.max_tokens
+        key = self._cache_key(prompt, system_prompt, temperature, max_tokens, json_mode)
+        cache = self._get_cache() if key else None
+        if cache is None:
+            return False
+        return cache.delete(key)
+
     def get_usage_stats(self) -> dict[str, Any]:
         """Get usage statistics."""
+        cache = self._response_cache
         return {
             "total_requests": self._total_requests,
             "total_tokens": self._total_tokens_used,
             "rate_limits": self._rate_limiter.get_usage(),
+            "cache": cache.to_dict() if cache else None,
         }
 
     def _complete_anthropic(
@@ -565,6 +836,7 @@ class LLMClient:
         prompt: str,
         system_prompt: str | None = None,
         schema: dict[str, Any] | None = None,
+        temperature: float | None = None,
     ) -> tuple[dict[str, Any], int]:
         """
         Generate a JSON completion.
@@ -573,25 +845,34 @@ class LLMClient:
             prompt: User prompt
             system_prompt: Optional system prompt
             schema: Optional JSON schema for validation
+            temperature: Override temperature
 
         Returns:
             Tuple of (parsed JSON dict, tokens used)
         """
-        # Add JSON instruction to system prompt
-        json_instruction = "Respond with valid JSON only. No markdown, no explanations."
-        if schema:
-            json_instruction += f"\n\nExpected schema: {json.dumps(schema)}"
-
-        full_system = f"{system_prompt}\n\n{json_instruction}" if system_prompt else json_instruction
-
         response = self.complete(
             prompt=prompt,
-            system_prompt=full_system,
+            system_prompt=self._json_system_prompt(system_prompt, schema),
+            temperature=temperature,
             json_mode=True,
         )
+        return self._parse_json(response), response.tokens_used
 
+    def _json_system_prompt(
+        self,
+        system_prompt: str | None,
+        schema: dict[str, Any] | None,
+    ) -> str:
+        """Add the JSON output instruction to a system prompt."""
+        json_instruction = "Respond with valid JSON only. No markdown, no explanations."
+        if schema:
+            json_instruction += f"\n\nExpected schema: {json.dumps(schema)}"
+
+        return f"{system_prompt}\n\n{json_instruction}" if system_prompt else json_instruction
+
+    def _parse_json(self, response: LLMResponse) -> dict[str, Any]:
+        """Parse the JSON content of a response."""
         try:
-            # Parse JSON from response
             content = response.content.strip()
             # Handle potential markdown code blocks
             if content.startswith("```"):
@@ -600,8 +881,7 @@ class LLMClient:
                     content = content[4:]
                 content = content.strip()
 
-            parsed = json.loads(content)
-            return parsed, response.tokens_used
+            return json.loads(content)
         except json.JSONDecodeError as e:
             raise LLMError(
                 f"Failed to parse JSON response: {str(e)}",
@@ -609,23 +889,179 @@ class LLMClient:
                 details={"content": response.content[:500]},
             )
 
+    async def abatch_complete(
+        self,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        json_mode: bool = False,
+        max_concurrency: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[LLMResponse | LLMError]:
+        """
+        Complete multiple prompts concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once. Every
+        request waits on the client's shared rate limiter instead of failing
+        when a per-minute limit is reached, so throughput is bounded by the
+        configured limits rather than by per-request latency. Each prompt is
+        retried independently.
+
+        Args:
+            prompts: Prompts to complete
+            system_prompt: Optional system prompt shared by all prompts
+            temperature: Override temperature
+            max_tokens: Override max tokens
+            json_mode: Request JSON output
+            max_concurrency: Override ``llm.max_concurrency``
+            return_exceptions: Return failures as ``LLMError`` entries
+                instead of raising the first one
+
+        Returns:
+            Responses in the order of ``prompts``
+
+        Raises:
+            LLMError: If a completion fails and ``return_exceptions`` is False
+        """
+        if not prompts:
+            return []
+
+        temperature = self.llm_config.temperature if temperature is None else temperature
+        max_tokens = max_tokens or self.llm_config.max_tokens
+        concurrency = max(1, min(max_concurrency or self.llm_config.max_concurrency, len(prompts)))
+
+        results: list[LLMResponse | LLMError | None] = [None] * len(prompts)
+        errors: list[LLMError] = []
+        pending = iter(range(len(prompts)))
+        loop = asyncio.get_running_loop()
+
+        async def worker(executor: ThreadPoolExecutor) -> None:
+            for index in pending:
+                if errors and not return_exceptions:
+                    return
+                prompt = prompts[index]
+                key = self._cache_key(prompt, system_prompt, temperature, max_tokens, json_mode)
+                if key is not None:
+                    # SQLite lookups block; keep them off the event loop
+                    cached = await loop.run_in_executor(executor, self._cached_response, key)
+                    if cached is not None:
+                        results[index] = cached
+                        continue
+
+                estimated_tokens = self._estimate_request_tokens(prompt, system_prompt)
+                try:
+                    await self._rate_limiter.acquire_async(estimated_tokens)
+                    results[index] = await loop.run_in_executor(
+                        executor,
+                        self._run_completion,
+                        prompt,
+                        system_prompt,
+                        temperature,
+                        max_tokens,
+                        json_mode,
+                        estimated_tokens,
+                        key,
+                    )
+                except LLMError as e:
+                    errors.append(e)
+                    results[index] = e
+
+        self.logger.info(
+            "Starting batch completion",
+            prompts=len(prompts),
+            max_concurrency=concurrency,
+        )
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            await asyncio.gather(*(worker(executor) for _ in range(concurrency)))
+
+        if errors and not return_exceptions:
+            raise errors[0]
+
+        self.logger.info(
+            "Batch completion finished",
+            prompts=len(prompts),
+            failed=len(errors),
+        )
+        return results  # type: ignore[return-value]
+
     def batch_complete(
         self,
         prompts: list[str],
         system_prompt: str | None = None,
         temperature: float | None = None,
-    ) -> list[LLMResponse]:
+        max_tokens: int | None = None,
+        json_mode: bool = False,
+        max_concurrency: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[LLMResponse | LLMError]:
+        """
+        Complete multiple prompts concurrently.
+
+        Synchronous wrapper around ``abatch_complete``; see it for details.
+        Safe to call from inside a running event loop.
+        """
+        batch = self.abatch_complete(
+            prompts,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            json_mode=json_mode,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(batch)
+
+        # Already inside an event loop: run the batch on a loop of its own
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, batch).result()
+
+    def batch_complete_json(
+        self,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        schema: dict[str, Any] | None = None,
+        temperature: float | None = None,
+        max_concurrency: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[tuple[dict[str, Any], int] | LLMError]:
         """
-        Complete multiple prompts.
+        Generate JSON completions for multiple prompts concurrently.
+
+        Args:
+            prompts: Prompts to complete
+            system_prompt: Optional system prompt shared by all prompts
+            schema: Optional JSON schema for validation
+            temperature: Override temperature
+            max_concurrency: Override ``llm.max_concurrency``
+            return_exceptions: Return failures as ``LLMError`` entries
+                instead of raising the first one
 
-        Currently processes sequentially. Future: support batch APIs.
+        Returns:
+            Tuples of (parsed JSON dict, tokens used) in the order of ``prompts``
         """
-        responses = []
-        for prompt in prompts:
-            response = self.complete(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                temperature=temperature,
-            )
-            responses.append(response)
-        return responses
+        responses = self.batch_complete(
+            prompts,
+            system_prompt=self._json_system_prompt(system_prompt, schema),
+            temperature=temperature,
+            json_mode=True,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+        results: list[tuple[dict[str, Any], int] | LLMError] = []
+        for response in responses:
+            if isinstance(response, LLMError):
+                results.append(response)
+                continue
+            try:
+                results.append((self._parse_json(response), response.tokens_used))
+            except LLMError as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
@@ -97,6 +97,7 @@ class DataClassifier:
         result, tokens = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are a data classification expert with expertise in data governance.",
+            temperature=0.0,
         )
 
         self.logger.info(
@@ -134,7 +135,8 @@ class DataClassifier:
         columns_to_check = columns or data.columns
         sample = data.head(10)
 
-        results = {}
+        checked_columns = []
+        prompts = []
 
         for col in columns_to_check:
             if col not in sample.columns:
@@ -146,7 +148,8 @@ class DataClassifier:
             if not non_null_values:
                 continue
 
-            prompt = f"""Analyze these values for PII (Personally Identifiable Information):
+            checked_columns.append(col)
+            prompts.append(f"""Analyze these values for PII (Personally Identifiable Information):
 
 Column: {col}
 Sample values: {non_null_values[:5]}
@@ -169,14 +172,15 @@ Respond with JSON:
     "pii_type": "type if applicable",
     "confidence": 0.9,
     "reasoning": "why"
-}}"""
-
-            result, _ = self.client.complete_json(
-                prompt=prompt,
-                system_prompt="You are a data privacy expert.",
-            )
+}}""")
 
-            results[col] = result
+        # Check all columns concurrently
+        responses = self.client.batch_complete_json(
+            prompts,
+            system_prompt="You are a data privacy expert.",
+            temperature=0.0,
+        )
+        results = {col: result for col, (result, _) in zip(checked_columns, responses, strict=True)}
 
         # Summarize findings
         pii_columns = [col for col, r in results.items() if r.get("contains_pii")]
@@ -234,6 +238,7 @@ Respond with JSON:
             result, _ = self.client.complete_json(
                 prompt=prompt,
                 system_prompt="You are a data modeling expert.",
+                temperature=0.0,
             )
 
             results[col] = result
@@ -282,6 +287,7 @@ Respond with JSON:
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are a data governance and security expert.",
+            temperature=0.0,
         )
 
         return result
@@ -28,6 +28,51 @@ class ExtractedEntity:
     metadata: dict[str, Any] | None = None
 
 
+@dataclass
+class EnrichmentStats:
+    """Deduplication statistics of one enrichment stage."""
+
+    stage: str
+    rows: int
+    non_empty_rows: int
+    distinct_values: int
+    tokens_used: int
+    tokens_saved: int
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Fraction of non-empty rows that did not need an LLM call of their own."""
+        if not self.non_empty_rows:
+            return 0.0
+        return 1 - self.distinct_values / self.non_empty_rows
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "stage": self.stage,
+            "rows": self.rows,
+            "non_empty_rows": self.non_empty_rows,
+            "distinct_values": self.distinct_values,
+            "dedup_ratio": round(self.dedup_ratio, 4),
+            "tokens_used": self.tokens_used,
+            "tokens_saved": self.tokens_saved,
+        }
+
+
+def text_key(column: str, normalize: bool = False) -> pl.Expr:
+    """
+    Expression giving the text sent to the LLM for each row of a column.
+
+    Empty values become null and are not enriched. With ``normalize``,
+    surrounding whitespace is stripped and inner runs of whitespace collapse
+    to one space, so values differing only in spacing share one LLM call.
+    """
+    text = pl.col(column).cast(pl.Utf8)
+    if normalize:
+        text = text.str.strip_chars().str.replace_all(r"\s+", " ")
+    return pl.when(text.str.len_chars() > 0).then(text)
+
+
 class EntityExtractor:
     """
     Extract structured entities from unstructured text using LLM.
@@ -59,6 +104,7 @@ class EntityExtractor:
         self.settings = settings
         self.client = LLMClient(settings)
         self.logger = logger.bind(component="entity_extractor")
+        self.last_enrichment_stats: EnrichmentStats | None = None
 
     def extract(
         self,
@@ -77,22 +123,21 @@ class EntityExtractor:
         Returns:
             List of extracted entities
         """
-        entity_types = entity_types or self.DEFAULT_ENTITY_TYPES
-
-        # Handle long text by chunking
-        if len(text) > 3000:
-            return self._extract_from_chunks(text, entity_types, min_confidence)
+        return self.batch_extract([text], entity_types, min_confidence)[0]
 
-        prompt = ENTITY_EXTRACTION_PROMPT.format(
+    def _build_prompt(self, text: str, entity_types: list[str]) -> str:
+        """Build the extraction prompt for one text."""
+        return ENTITY_EXTRACTION_PROMPT.format(
             entity_types=", ".join(entity_types),
             text=text,
         )
 
-        result, tokens = self.client.complete_json(
-            prompt=prompt,
-            system_prompt="You are an expert at extracting structured entities from unstructured text.",
-        )
-
+    def _parse_entities(
+        self,
+        result: dict[str, Any],
+        min_confidence: float,
+    ) -> list[ExtractedEntity]:
+        """Convert an extraction response to entities above the threshold."""
         entities = []
         for entity_data in result.get("entities", []):
             if entity_data.get("confidence", 0) >= min_confidence:
@@ -104,54 +149,23 @@ class EntityExtractor:
                     start_pos=entity_data.get("start_pos"),
                     end_pos=entity_data.get("end_pos"),
                 ))
-
-        self.logger.info(
-            "Extracted entities",
-            count=len(entities),
-            tokens_used=tokens,
-        )
-
         return entities
 
-    def _extract_from_chunks(
-        self,
-        text: str,
-        entity_types: list[str],
-        min_confidence: float,
-    ) -> list[ExtractedEntity]:
-        """Extract entities from long text by chunking."""
-        chunk_size = 2500
-        overlap = 200
-        all_entities = []
-        seen_values: set[tuple[str, str]] = set()
+    @staticmethod
+    def _chunk_text(text: str, chunk_size: int = 2500, overlap: int = 200) -> list[tuple[int, str]]:
+        """Split long text into overlapping (offset, chunk) pairs."""
+        if len(text) <= 3000:
+            return [(0, text)]
 
+        chunks = []
         start = 0
-        while start < len(text):
+        while True:
             end = min(start + chunk_size, len(text))
-            chunk = text[start:end]
-
-            chunk_entities = self.extract(
-                chunk,
-                entity_types=entity_types,
-                min_confidence=min_confidence,
-            )
-
-            # Deduplicate
-            for entity in chunk_entities:
-                key = (entity.entity_type, entity.value)
-                if key not in seen_values:
-                    seen_values.add(key)
-                    # Adjust positions for chunk offset
-                    if entity.start_pos is not None:
-                        entity.start_pos += start
-                    if entity.end_pos is not None:
-                        entity.end_pos += start
-                    all_entities.append(entity)
-
+            chunks.append((start, text[start:end]))
+            if end == len(text):
+                return chunks
             start = end - overlap
 
-        return all_entities
-
     def extract_to_dataframe(
         self,
         text: str,
@@ -214,6 +228,7 @@ Use null for values that cannot be determined."""
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are an expert at extracting structured data from unstructured text.",
+            temperature=0.0,
         )
 
         return result
@@ -274,6 +289,7 @@ Respond with JSON:
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are an expert at extracting relationships from text.",
+            temperature=0.0,
         )
 
         return result.get("relationships", [])
@@ -282,73 +298,201 @@ Respond with JSON:
         self,
         texts: list[str],
         entity_types: list[str] | None = None,
+        min_confidence: float = 0.7,
+        max_concurrency: int | None = None,
     ) -> list[list[ExtractedEntity]]:
         """
         Extract entities from multiple texts.
 
+        Requests for all texts (and chunks of long texts) run concurrently
+        through ``LLMClient.batch_complete_json``, bounded by the shared
+        rate limiter.
+
         Args:
             texts: List of texts to process
             entity_types: Types of entities to extract
+            min_confidence: Minimum confidence threshold
+            max_concurrency: Override ``llm.max_concurrency``
 
         Returns:
             List of entity lists for each text
         """
-        results = []
-        for text in texts:
-            entities = self.extract(text, entity_types)
-            results.append(entities)
+        results, _ = self._extract_batch(texts, entity_types, min_confidence, max_concurrency)
         return results
 
+    def _extract_batch(
+        self,
+        texts: list[str],
+        entity_types: list[str] | None,
+        min_confidence: float,
+        max_concurrency: int | None,
+    ) -> tuple[list[list[ExtractedEntity]], list[int]]:
+        """Extract entities from texts; also returns the tokens spent per text."""
+        entity_types = entity_types or self.DEFAULT_ENTITY_TYPES
+
+        # Long texts are split into chunks; every chunk is one request
+        chunk_owners: list[tuple[int, int]] = []
+        prompts: list[str] = []
+        for text_idx, text in enumerate(texts):
+            for offset, chunk in self._chunk_text(text):
+                chunk_owners.append((text_idx, offset))
+                prompts.append(self._build_prompt(chunk, entity_types))
+
+        responses = self.client.batch_complete_json(
+            prompts,
+            system_prompt="You are an expert at extracting structured entities from unstructured text.",
+            max_concurrency=max_concurrency,
+            temperature=0.0,
+        )
+
+        results: list[list[ExtractedEntity]] = [[] for _ in texts]
+        text_tokens = [0] * len(texts)
+        seen_values: list[set[tuple[str, str]]] = [set() for _ in texts]
+        for (text_idx, offset), (result, tokens) in zip(chunk_owners, responses, strict=True):
+            text_tokens[text_idx] += tokens
+            for entity in self._parse_entities(result, min_confidence):
+                # Deduplicate entities found in overlapping chunks
+                key = (entity.entity_type, entity.value)
+                if key in seen_values[text_idx]:
+                    continue
+                seen_values[text_idx].add(key)
+                # Adjust positions for chunk offset
+                if entity.start_pos is not None:
+                    entity.start_pos += offset
+                if entity.end_pos is not None:
+                    entity.end_pos += offset
+                results[text_idx].append(entity)
+
+        self.logger.info(
+            "Extracted entities",
+            texts=len(texts),
+            requests=len(prompts),
+            count=sum(len(entities) for entities in results),
+            tokens_used=sum(text_tokens),
+        )
+
+        return results, text_tokens
+
+    def extract_distinct(
+        self,
+        texts: pl.Series,
+        entity_types: list[str] | None = None,
+        min_confidence: float = 0.7,
+        stage: str = "entity_extraction",
+    ) -> tuple[pl.DataFrame, EnrichmentStats]:
+        """
+        Extract entities once per distinct value of a text column.
+
+        Text columns often repeat values (status messages, product names,
+        addresses). Only the distinct non-null values are sent to the LLM;
+        callers join the result back onto their frame by text.
+
+        Args:
+            texts: Texts to process, typically built with ``text_key``
+            entity_types: Types of entities to extract
+            min_confidence: Minimum confidence threshold
+            stage: Name of the calling stage, used in the statistics
+
+        Returns:
+            Tuple of (DataFrame with one row per entity and columns ``text``,
+            ``entity_type``, ``value`` and ``confidence``; deduplication stats)
+        """
+        counts = texts.drop_nulls().rename("text").value_counts(name="rows")
+        distinct = counts["text"].to_list()
+        results, text_tokens = self._extract_batch(distinct, entity_types, min_confidence, None)
+
+        rows = [
+            {
+                "text": text,
+                "entity_type": entity.entity_type,
+                "value": entity.value,
+                "confidence": entity.confidence,
+            }
+            for text, entities in zip(distinct, results, strict=True)
+            for entity in entities
+        ]
+        entities_df = pl.DataFrame(
+            rows,
+            schema={
+                "text": pl.Utf8,
+                "entity_type": pl.Utf8,
+                "value": pl.Utf8,
+                "confidence": pl.Float64,
+            },
+        )
+
+        stats = EnrichmentStats(
+            stage=stage,
+            rows=len(texts),
+            non_empty_rows=len(texts) - texts.null_count(),
+            distinct_values=len(distinct),
+            tokens_used=sum(text_tokens),
+            # Every duplicate row would have cost as much as its distinct value
+            tokens_saved=sum(
+                tokens * (repeats - 1)
+                for tokens, repeats in zip(text_tokens, counts["rows"].to_list(), strict=True)
+            ),
+        )
+        self.last_enrichment_stats = stats
+        self.logger.info("Enrichment deduplicated", **stats.to_dict())
+
+        return entities_df, stats
+
     def extract_from_dataframe(
         self,
         df: pl.DataFrame,
         text_column: str,
         entity_types: list[str] | None = None,
         output_format: str = "wide",
+        normalize: bool = False,
     ) -> pl.DataFrame:
         """
         Extract entities from a DataFrame column.
 
+        The LLM is called once per distinct text and the results are joined
+        back onto every row holding that text. Deduplication statistics are
+        kept in ``last_enrichment_stats``.
+
         Args:
             df: Input DataFrame
             text_column: Column containing text
             entity_types: Types of entities to extract
             output_format: 'wide' (one column per entity type) or 'long'
+            normalize: Collapse whitespace before deduplicating texts
 
         Returns:
             DataFrame with extracted entities
         """
-        all_entities = []
-
-        for idx, row in enumerate(df.iter_rows(named=True)):
-            text = row.get(text_column, "")
-            if text:
-                entities = self.extract(str(text), entity_types)
-                for entity in entities:
-                    all_entities.append({
-                        "_row_idx": idx,
-                        "entity_type": entity.entity_type,
-                        "value": entity.value,
-                        "confidence": entity.confidence,
-                    })
-
-        if not all_entities:
+        if text_column not in df.columns:
             return df
 
-        entities_df = pl.DataFrame(all_entities)
+        keyed = df.with_row_index("_row_idx").with_columns(
+            text_key(text_column, normalize).alias("_text_key")
+        )
+        entities_df, _ = self.extract_distinct(
+            keyed["_text_key"], entity_types, stage="extract_from_dataframe"
+        )
+
+        if entities_df.is_empty():
+            return df
+
+        entities_df = entities_df.rename({"text": "_text_key"})
 
         if output_format == "wide":
-            # Pivot to get one column per entity type
+            # Pivot to get one column per entity type, once per distinct text
             pivoted = entities_df.pivot(
                 values="value",
-                index="_row_idx",
+                index="_text_key",
                 on="entity_type",
                 aggregate_function="first",
             )
             # Join back to original
-            df = df.with_row_index("_row_idx")
-            result = df.join(pivoted, on="_row_idx", how="left")
-            return result.drop("_row_idx")
+            result = keyed.join(pivoted, on="_text_key", how="left", maintain_order="left")
+            return result.drop("_row_idx", "_text_key")
         else:
             # Return long format with entity details
-            return entities_df
+            return (
+                keyed.select("_row_idx", "_text_key")
+                .join(entities_df, on="_text_key", how="inner", maintain_order="left")
+                .drop("_text_key")
+            )
@@ -122,6 +122,7 @@ Columns:
         result, tokens = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are a SQL expert specializing in Apache Iceberg and analytical queries.",
+            temperature=0.0,
         )
 
         self.logger.info(
@@ -172,6 +173,7 @@ Provide:
         response = self.client.complete(
             prompt=prompt,
             system_prompt="You are a SQL teacher explaining queries to beginners.",
+            temperature=0.0,
         )
 
         return response.content
@@ -217,6 +219,7 @@ Respond with JSON:
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are a query optimization expert for Apache Iceberg.",
+            temperature=0.0,
         )
 
         return result
@@ -261,6 +264,7 @@ Respond with JSON:
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are an Apache Iceberg performance expert.",
+            temperature=0.0,
         )
 
         return [result]
@@ -302,6 +306,7 @@ Respond with JSON:
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are a SQL validation expert.",
+            temperature=0.0,
         )
 
         return result
@@ -349,6 +354,7 @@ Respond with JSON:
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are a SQL query generator.",
+            temperature=0.0,
         )
 
         return [q["sql"] for q in result.get("queries", [])]
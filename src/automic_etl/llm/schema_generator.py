@@ -64,6 +64,7 @@ class SchemaGenerator:
         result, tokens = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are a data engineering expert specializing in schema design.",
+            temperature=0.0,
         )
 
         self.logger.info(
@@ -107,6 +108,7 @@ Include:
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are an expert at converting unstructured data to structured schemas.",
+            temperature=0.0,
         )
 
         return result
@@ -167,6 +169,7 @@ Respond with JSON:
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are an Apache Iceberg optimization expert.",
+            temperature=0.0,
         )
 
         return result
@@ -208,6 +211,7 @@ Output only the SQL statement, no explanations."""
         response = self.client.complete(
             prompt=prompt,
             system_prompt="You are an Apache Iceberg SQL expert.",
+            temperature=0.0,
         )
 
         return response.content.strip()
@@ -244,6 +248,7 @@ Respond with JSON mapping old names to new names:
         result, _ = self.client.complete_json(
             prompt=prompt,
             system_prompt="You are a data modeling expert.",
+            temperature=0.0,
         )
 
         return result
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import uuid
 import re
-import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable
@@ -259,7 +258,6 @@ class SQLAssistant:
         self._schema_provider = schema_provider
         self._table_schemas: dict[str, TableSchema] = {}
         self._conversations: dict[str, ConversationContext] = {}
-        self._query_cache: dict[str, SQLGenerationResult] = {}
 
     def register_table(self, schema: TableSchema) -> None:
         """Register a table schema."""
@@ -365,13 +363,6 @@ Row Count: {schema.row_count or 'Unknown'}
         # Get or create conversation
         context = self.get_or_create_conversation(user_id, company_id, conversation_id)
 
-        # Check cache
-        cache_key = self._get_cache_key(query, company_id, tables)
-        if cache_key in self._query_cache:
-            cached = self._query_cache[cache_key]
-            self.logger.info("Using cached SQL", query_id=query_id)
-            return cached
-
         # Build prompt
         schema_str = self._format_schemas_for_prompt(tables, company_id)
         context_str = context.to_context_string() if context.messages else "No previous context"
@@ -382,11 +373,12 @@ Row Count: {schema.row_count or 'Unknown'}
             user_query=query,
         )
 
-        # Generate SQL
+        # Generate SQL deterministically so repeated questions hit the LLM cache
         try:
             result, tokens = self.client.complete_json(
                 prompt=prompt,
                 system_prompt="You are an expert SQL analyst. Generate precise, efficient SQL queries.",
+                temperature=0.0,
             )
         except Exception as e:
             self.logger.error("SQL generation failed", error=str(e))
@@ -424,9 +416,6 @@ Row Count: {schema.row_count or 'Unknown'}
         context.last_sql = gen_result.sql
         context.referenced_tables.update(gen_result.tables_used)
 
-        # Cache result
-        self._query_cache[cache_key] = gen_result
-
         self.logger.info(
             "Generated SQL",
             query_id=query_id,
@@ -588,19 +577,6 @@ Row Count: {schema.row_count or 'Unknown'}
 
         return result
 
-    def _get_cache_key(
-        self,
-        query: str,
-        company_id: str,
-        tables: list[str] | None,
-    ) -> str:
-        """Generate cache key for query."""
-        key_parts = [query.lower().strip(), company_id]
-        if tables:
-            key_parts.extend(sorted(tables))
-        key_str = "|".join(key_parts)
-        return hashlib.md5(key_str.encode()).hexdigest()
-
     def get_suggested_queries(
         self,
         tables: list[str] | None = None,
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
 import polars as pl
+import pyarrow as pa
 import structlog
 
 from automic_etl.core.config import Settings
 from automic_etl.core.exceptions import LoadError
-from automic_etl.storage.iceberg import IcebergTableManager, schema_from_polars
-from automic_etl.core.utils import utc_now
+from automic_etl.storage.iceberg import (
+    AppendedData,
+    IcebergTableManager,
+    schema_from_polars,
+)
+from automic_etl.storage.iceberg.tables import DEFAULT_BATCH_SIZE
+from automic_etl.core.utils import ensure_utc, utc_now
 
 logger = structlog.get_logger()
 
@@ -54,6 +61,7 @@ class BronzeLayer:
         source_file: str | None = None,
         batch_id: str | None = None,
         additional_metadata: dict[str, Any] | None = None,
+        properties: dict[str, str] | None = None,
     ) -> int:
         """
         Ingest raw data into the bronze layer.
@@ -65,6 +73,8 @@ class BronzeLayer:
             source_file: Optional source file name
             batch_id: Optional batch identifier
             additional_metadata: Optional additional metadata
+            properties: Table properties to set in the same commit as the
+                data, e.g. the source positions it was read up to
 
         Returns:
             Number of rows ingested
@@ -92,7 +102,9 @@ class BronzeLayer:
             # Check if table exists
             if self.table_manager.catalog.table_exists(self.NAMESPACE, table_name):
                 # Append to existing table
-                rows = self.table_manager.append(self.NAMESPACE, table_name, df)
+                rows = self.table_manager.append(
+                    self.NAMESPACE, table_name, df, properties=properties
+                )
             else:
                 # Create new table with partitioning
                 partition_columns = self.settings.medallion.bronze.partition_by
@@ -106,7 +118,9 @@ class BronzeLayer:
                         "automic.source": source,
                     },
                 )
-                rows = self.table_manager.append(self.NAMESPACE, table_name, df)
+                rows = self.table_manager.append(
+                    self.NAMESPACE, table_name, df, properties=properties
+                )
 
             self.logger.info(
                 "Ingested data to bronze",
@@ -234,6 +248,7 @@ class BronzeLayer:
         columns: list[str] | None = None,
         filter_expr: str | None = None,
         limit: int | None = None,
+        snapshot_id: int | None = None,
     ) -> pl.DataFrame:
         """
         Read data from the bronze layer.
@@ -243,10 +258,20 @@ class BronzeLayer:
             columns: Columns to select
             filter_expr: Filter expression
             limit: Maximum rows
+            snapshot_id: Optional snapshot to read instead of the current one
 
         Returns:
             Polars DataFrame
         """
+        if snapshot_id is not None:
+            return self.table_manager.read_at_snapshot(
+                namespace=self.NAMESPACE,
+                table_name=table_name,
+                snapshot_id=snapshot_id,
+                columns=columns,
+                filter_expr=filter_expr,
+                limit=limit,
+            )
         return self.table_manager.read(
             namespace=self.NAMESPACE,
             table_name=table_name,
@@ -260,32 +285,126 @@ class BronzeLayer:
         table_name: str,
         since: datetime,
         columns: list[str] | None = None,
+        snapshot_id: int | None = None,
     ) -> pl.DataFrame:
         """
         Read data ingested since a specific time.
 
-        Useful for incremental processing to silver layer.
+        Useful for incremental processing to silver layer. The bound on
+        ``_ingestion_date`` lets Iceberg prune whole partitions, while the
+        ``_ingestion_time`` bound is checked against file statistics. Pass
+        ``snapshot_id`` to read exactly the rows present at that snapshot, so
+        rows appended concurrently are left for the next run.
+        """
+        since = ensure_utc(since)
+        filter_expr = (
+            f"_ingestion_time > '{since.isoformat()}' "
+            f"AND _ingestion_date >= '{since.date().isoformat()}'"
+        )
+        return self.read(table_name, columns, filter_expr=filter_expr, snapshot_id=snapshot_id)
+
+    def read_appended_since(
+        self,
+        table_name: str,
+        since_snapshot_id: int | None,
+        columns: list[str] | None = None,
+    ) -> AppendedData | None:
+        """
+        Read only the data files appended after a bronze snapshot.
+
+        Bronze tables are append-only, so the snapshot lineage since the
+        last consumed snapshot is an exact changelog of newly ingested rows.
+
+        Args:
+            table_name: Table to read
+            since_snapshot_id: Last consumed snapshot (None reads everything)
+            columns: Columns to select
+
+        Returns:
+            AppendedData with the new rows and the snapshot they are current
+            as of, or None if the lineage cannot be used and the caller should
+            fall back to ``read_new_since``
         """
-        df = self.read(table_name, columns)
-        return df.filter(pl.col("_ingestion_time") > since)
+        return self.table_manager.read_appended_since(
+            namespace=self.NAMESPACE,
+            table_name=table_name,
+            since_snapshot_id=since_snapshot_id,
+            columns=columns,
+        )
+
+    def current_snapshot_id(self, table_name: str) -> int | None:
+        """Get the current snapshot ID of a bronze table."""
+        return self.table_manager.current_snapshot_id(self.NAMESPACE, table_name)
 
     def get_latest_ingestion_time(self, table_name: str) -> datetime | None:
         """Get the latest ingestion time for a table."""
         try:
-            df = self.read(table_name, columns=["_ingestion_time"], limit=1)
-            if df.is_empty():
-                return None
-
-            # Get max ingestion time
-            max_time = (
-                self.read(table_name, columns=["_ingestion_time"])
+            return (
+                self.scan_lazy(table_name, columns=["_ingestion_time"])
                 .select(pl.col("_ingestion_time").max())
+                .collect()
                 .item()
             )
-            return max_time
         except Exception:
             return None
 
+    def scan_lazy(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        snapshot_id: int | None = None,
+    ) -> pl.LazyFrame:
+        """
+        Lazily scan a bronze table.
+
+        Args:
+            table_name: Table to scan
+            columns: Columns to select
+            filter_expr: Filter expression
+            snapshot_id: Optional snapshot to read
+
+        Returns:
+            Polars LazyFrame with projection and predicates pushed into the scan
+        """
+        return self.table_manager.scan_lazy(
+            namespace=self.NAMESPACE,
+            table_name=table_name,
+            columns=columns,
+            filter_expr=filter_expr,
+            snapshot_id=snapshot_id,
+        )
+
+    def iter_batches(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        snapshot_id: int | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream a bronze table as bounded Arrow record batches.
+
+        Args:
+            table_name: Table to read
+            columns: Columns to select
+            filter_expr: Filter expression
+            batch_size: Maximum rows per batch
+            snapshot_id: Optional snapshot to read
+
+        Yields:
+            PyArrow RecordBatch objects
+        """
+        yield from self.table_manager.iter_batches(
+            namespace=self.NAMESPACE,
+            table_name=table_name,
+            columns=columns,
+            filter_expr=filter_expr,
+            snapshot_id=snapshot_id,
+            batch_size=batch_size,
+        )
+
     def list_tables(self) -> list[str]:
         """List all tables in the bronze layer."""
         return self.table_manager.catalog.list_tables(self.NAMESPACE)
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable
+from typing import Any
 
 import polars as pl
+import pyarrow as pa
 import structlog
 
 from automic_etl.core.config import Settings
 from automic_etl.core.exceptions import TransformationError
 from automic_etl.storage.iceberg import IcebergTableManager
+from automic_etl.storage.iceberg.tables import DEFAULT_BATCH_SIZE
 from automic_etl.core.utils import utc_now
 
 logger = structlog.get_logger()
@@ -88,19 +91,22 @@ class GoldLayer:
 
         silver = SilverLayer(self.settings)
 
-        # Read from silver
-        df = silver.read(source_table, filter_expr=filter_expr)
+        # Build aggregation expressions
+        agg_exprs = self._build_aggregation_exprs(aggregations)
+
+        # Aggregate over a lazy silver scan so only the aggregated result is
+        # materialized, streaming the source in batches
+        df = (
+            silver.scan_lazy(source_table, filter_expr=filter_expr)
+            .group_by(group_by)
+            .agg(agg_exprs)
+            .collect(engine="streaming")
+        )
 
         if df.is_empty():
             self.logger.warning("No data to aggregate", source=source_table)
             return 0
 
-        # Build aggregation expressions
-        agg_exprs = self._build_aggregation_exprs(aggregations)
-
-        # Apply aggregation
-        df = df.group_by(group_by).agg(agg_exprs)
-
         # Apply having clause
         if having_expr:
             df = df.filter(pl.sql_expr(having_expr))
@@ -397,6 +403,40 @@ class GoldLayer:
             limit=limit,
         )
 
+    def scan_lazy(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        snapshot_id: int | None = None,
+    ) -> pl.LazyFrame:
+        """Lazily scan a gold table with pushdown into the Iceberg scan."""
+        return self.table_manager.scan_lazy(
+            namespace=self.NAMESPACE,
+            table_name=table_name,
+            columns=columns,
+            filter_expr=filter_expr,
+            snapshot_id=snapshot_id,
+        )
+
+    def iter_batches(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        snapshot_id: int | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream a gold table as bounded Arrow record batches."""
+        yield from self.table_manager.iter_batches(
+            namespace=self.NAMESPACE,
+            table_name=table_name,
+            columns=columns,
+            filter_expr=filter_expr,
+            snapshot_id=snapshot_id,
+            batch_size=batch_size,
+        )
+
     def list_tables(self) -> list[str]:
         """List all tables in the gold layer."""
         return self.table_manager.catalog.list_tables(self.NAMESPACE)
@@ -18,6 +18,7 @@ from automic_etl.core.validation import (
 from automic_etl.medallion.bronze import BronzeLayer
 from automic_etl.medallion.silver import SilverLayer
 from automic_etl.medallion.gold import GoldLayer, AggregationType, MetricDefinition
+from automic_etl.storage.iceberg import CompactionResult
 
 logger = structlog.get_logger()
 
@@ -385,19 +386,87 @@ class Lakehouse:
 
     def initialize(self) -> None:
         """Initialize the lakehouse namespaces."""
-        from automic_etl.storage.iceberg import IcebergCatalog
+        from automic_etl.storage.iceberg import get_catalog
 
-        catalog = IcebergCatalog(self.settings)
+        catalog = get_catalog(self.settings)
 
         for namespace in ["bronze", "silver", "gold"]:
             catalog.ensure_namespace(namespace)
 
         self.logger.info("Lakehouse initialized")
 
+    def compact(
+        self,
+        layer: str | None = None,
+        table: str | None = None,
+        partition_filter: str | None = None,
+        rewrite_all: bool = False,
+        dry_run: bool = False,
+    ) -> list[CompactionResult]:
+        """
+        Compact small files in lakehouse tables.
+
+        Rewritten files are sorted or Z-ordered by the layer's configured
+        ``sort_by``/``zorder_by`` columns; columns a table lacks are reported
+        in its result's ``missing_columns``. A table that fails to compact
+        does not stop the others: its result carries the ``error`` instead.
+
+        Args:
+            layer: Only compact tables in this layer
+            table: Only compact this table (requires layer)
+            partition_filter: Only compact files matching this filter
+            rewrite_all: Rewrite all files, not only small ones
+            dry_run: Only report the files and bytes that would be rewritten
+
+        Returns:
+            Compaction result per table, including failed tables
+        """
+        from automic_etl.storage.iceberg import IcebergTableManager
+
+        if table and not layer:
+            raise ValueError("A layer is required when compacting a single table")
+
+        table_manager = IcebergTableManager(self.settings)
+        tables = {layer: [table]} if table else self.list_tables(layer)
+        results: list[CompactionResult] = []
+
+        for layer_name, layer_tables in tables.items():
+            layer_config = getattr(self.settings.medallion, layer_name)
+            for table_name in layer_tables:
+                try:
+                    results.append(
+                        table_manager.compact(
+                            layer_name,
+                            table_name,
+                            partition_filter=partition_filter,
+                            sort_by=layer_config.sort_by or None,
+                            zorder_by=layer_config.zorder_by or None,
+                            rewrite_all=rewrite_all,
+                            dry_run=dry_run,
+                        )
+                    )
+                except Exception as e:
+                    self.logger.warning(
+                        "Failed to compact table",
+                        table=f"{layer_name}.{table_name}",
+                        error=str(e),
+                    )
+                    results.append(
+                        CompactionResult(
+                            table=f"{layer_name}.{table_name}",
+                            dry_run=dry_run,
+                            error=str(e),
+                        )
+                    )
+
+        return results
+
     def cleanup(
         self,
         bronze_retention_days: int | None = None,
         expire_snapshots: bool = True,
+        compact: bool = True,
+        dry_run: bool = False,
     ) -> dict[str, Any]:
         """
         Clean up old data and snapshots.
@@ -405,6 +474,9 @@ class Lakehouse:
         Args:
             bronze_retention_days: Days to retain bronze data (uses config default if None)
             expire_snapshots: Whether to expire old snapshots
+            compact: Whether to compact small files first
+            dry_run: Only report what compaction would rewrite; nothing is
+                changed
 
         Returns:
             Cleanup statistics
@@ -416,7 +488,27 @@ class Lakehouse:
             retention = 90
 
         cutoff = utc_now() - timedelta(days=retention)
-        stats = {"expired_snapshots": 0, "tables_cleaned": 0}
+        stats = {
+            "expired_snapshots": 0,
+            "tables_cleaned": 0,
+            "tables_compacted": 0,
+            "files_compacted": 0,
+            "bytes_compacted": 0,
+            "compaction_failures": 0,
+        }
+
+        if compact:
+            for result in self.compact(dry_run=dry_run):
+                if result.error:
+                    stats["compaction_failures"] += 1
+                elif result.groups:
+                    stats["tables_compacted"] += 1
+                    stats["files_compacted"] += result.files_rewritten
+                    stats["bytes_compacted"] += result.bytes_rewritten
+
+        if dry_run:
+            self.logger.info("Cleanup dry run completed", stats=stats)
+            return stats
 
         from automic_etl.storage.iceberg import IcebergTableManager
 
@@ -11,7 +11,7 @@ import structlog
 from automic_etl.core.config import Settings
 from automic_etl.core.exceptions import TransformationError
 from automic_etl.storage.iceberg import IcebergTableManager
-from automic_etl.core.utils import utc_now
+from automic_etl.core.utils import ensure_utc, utc_now
 
 logger = structlog.get_logger()
 
@@ -31,6 +31,13 @@ class SCDType2Manager:
     - _scd_is_current: Boolean flag for current version
     - _scd_version: Version number for the record
     - _scd_hash: Hash of tracked columns for change detection
+
+    ``_scd_hash`` is stored as Int64 (the bits of the Polars UInt64 hash) and
+    validity bounds as UTC timestamps. Writes are cast to the table's column
+    types, so existing tables whose ``_scd_effective_to`` is a timezone-naive
+    timestamp keep working and receive UTC wall-clock times. Polars hashes
+    are not stable across Polars versions: after an upgrade, the next load
+    reports every matched row as updated and opens a new version for it.
     """
 
     # Default SCD2 metadata columns
@@ -45,8 +52,20 @@ class SCDType2Manager:
     # Default end date for current records
     END_OF_TIME = datetime(9999, 12, 31, 23, 59, 59)
 
-    def __init__(self, settings: Settings) -> None:
+    # Filter selecting current versions
+    CURRENT_FILTER = "_scd_is_current = true"
+
+    def __init__(self, settings: Settings, key_buckets: int = 16) -> None:
+        """
+        Initialize the SCD2 manager.
+
+        Args:
+            settings: Application settings
+            key_buckets: Number of hash buckets on the first business key for
+                new tables, so key lookups prune to a few files (0 disables)
+        """
         self.settings = settings
+        self.key_buckets = key_buckets
         self.table_manager = IcebergTableManager(settings)
         self.logger = logger.bind(component="scd2_manager")
 
@@ -73,7 +92,7 @@ class SCDType2Manager:
         Returns:
             Dict with counts: inserted, updated, unchanged
         """
-        effective_date = effective_date or utc_now()
+        effective_date = ensure_utc(effective_date) or utc_now()
 
         # Determine tracked columns (exclude business keys and SCD columns)
         if tracked_columns is None:
@@ -103,11 +122,13 @@ class SCDType2Manager:
                 effective_date=effective_date,
             )
 
-        # Load existing current records
-        existing_df = self.table_manager.read(
+        # Load current versions of only the business keys in this batch
+        existing_df = self.table_manager.read_matching(
             namespace=namespace,
             table_name=table_name,
-            filter_expr="_scd_is_current = true",
+            keys=source_df.select(business_keys),
+            key_columns=business_keys,
+            filter_expr=self.CURRENT_FILTER,
         )
 
         # Identify changes
@@ -133,11 +154,12 @@ class SCDType2Manager:
         tracked_columns: list[str],
     ) -> pl.DataFrame:
         """Add a hash column for change detection."""
-        # Concatenate tracked columns and hash
+        # Concatenate tracked columns and hash; reinterpret as Int64 so the
+        # hash fits the Iceberg long column
         hash_expr = pl.concat_str(
             [pl.col(c).cast(pl.String).fill_null("") for c in tracked_columns],
             separator="|",
-        ).hash()
+        ).hash().reinterpret(signed=True)
 
         return df.with_columns(hash_expr.alias("_scd_hash"))
 
@@ -153,17 +175,22 @@ class SCDType2Manager:
         # Add SCD2 columns
         df = source_df.with_columns([
             pl.lit(effective_date).alias("_scd_effective_from"),
-            pl.lit(None).cast(pl.Datetime).alias("_scd_effective_to"),
+            pl.lit(None).cast(pl.Datetime(time_zone="UTC")).alias("_scd_effective_to"),
             pl.lit(True).alias("_scd_is_current"),
             pl.lit(1).alias("_scd_version"),
         ])
 
-        # Create table and insert
+        # Create table partitioned by current flag and bucketed business key
+        bucket_columns = None
+        if self.key_buckets > 0:
+            bucket_columns = {business_keys[0]: self.key_buckets}
+
         self.table_manager.create_table_from_dataframe(
             namespace=namespace,
             table_name=table_name,
             df=df,
             partition_columns=["_scd_is_current"],
+            bucket_columns=bucket_columns,
             properties={"automic.scd_type": "2"},
         )
         self.table_manager.append(namespace, table_name, df)
@@ -225,7 +252,13 @@ class SCDType2Manager:
         business_keys: list[str],
         effective_date: datetime,
     ) -> dict[str, int]:
-        """Apply identified changes to the SCD2 table."""
+        """
+        Apply identified changes to the SCD2 table.
+
+        Current versions of updated keys are closed in place and the new
+        versions appended in a single commit. Only data files holding those
+        keys are rewritten, so the cost follows the churn, not the table size.
+        """
         inserts = changes["inserts"]
         updates = changes["updates"]
         unchanged = changes["unchanged"]
@@ -247,68 +280,46 @@ class SCDType2Manager:
         if not inserts.is_empty():
             new_inserts = inserts.with_columns([
                 pl.lit(effective_date).alias("_scd_effective_from"),
-                pl.lit(None).cast(pl.Datetime).alias("_scd_effective_to"),
+                pl.lit(None).cast(pl.Datetime(time_zone="UTC")).alias("_scd_effective_to"),
                 pl.lit(True).alias("_scd_is_current"),
                 pl.lit(1).alias("_scd_version"),
             ])
             rows_to_insert.append(new_inserts)
 
-        # 2. Updates - need to close old records and insert new versions
+        # 2. Updates - new versions numbered after the current ones
         if not updates.is_empty():
-            # Get current versions for updated records
-            update_keys = updates.select(business_keys)
-
-            # Find existing versions to determine new version number
-            old_versions = existing_df.join(
-                update_keys,
+            version_map = existing_df.join(
+                updates.select(business_keys),
                 on=business_keys,
-                how="inner",
-            )
-
-            # Create version map
-            version_map = old_versions.select(
+                how="semi",
+            ).select(
                 business_keys + ["_scd_version"]
             ).rename({"_scd_version": "_old_version"})
 
-            # Add new version info to updates
             new_updates = updates.join(
                 version_map,
                 on=business_keys,
                 how="left",
             ).with_columns([
                 pl.lit(effective_date).alias("_scd_effective_from"),
-                pl.lit(None).cast(pl.Datetime).alias("_scd_effective_to"),
+                pl.lit(None).cast(pl.Datetime(time_zone="UTC")).alias("_scd_effective_to"),
                 pl.lit(True).alias("_scd_is_current"),
                 (pl.col("_old_version").fill_null(0) + 1).alias("_scd_version"),
             ]).drop("_old_version")
 
             rows_to_insert.append(new_updates)
 
-            # Close old records (will be handled via merge)
-            closed_records = old_versions.with_columns([
-                pl.lit(effective_date).alias("_scd_effective_to"),
-                pl.lit(False).alias("_scd_is_current"),
-            ])
-
-            # Get records that aren't being updated
-            unchanged_existing = existing_df.join(
-                update_keys,
-                on=business_keys,
-                how="anti",
-            )
-
-            # Rebuild table with: unchanged + closed + new
-            all_records = pl.concat([
-                unchanged_existing,
-                closed_records,
-            ] + rows_to_insert)
-
-            # Overwrite table
-            self.table_manager.overwrite(namespace, table_name, all_records)
-
-        elif not inserts.is_empty():
-            # Only inserts, just append
-            self.table_manager.append(namespace, table_name, rows_to_insert[0])
+        # Close current versions of updated keys and append new versions
+        self.table_manager.update_matching(
+            namespace=namespace,
+            table_name=table_name,
+            keys=updates.select(business_keys),
+            key_columns=business_keys,
+            updates=self._close_version_updates(effective_date),
+            filter_expr=self.CURRENT_FILTER,
+            append=pl.concat(rows_to_insert, how="vertical_relaxed"),
+            operation="scd2",
+        )
 
         self.logger.info(
             "SCD2 changes applied",
@@ -318,6 +329,13 @@ class SCDType2Manager:
 
         return counts
 
+    def _close_version_updates(self, effective_date: datetime) -> dict[str, pl.Expr]:
+        """Column updates that close a current version."""
+        return {
+            "_scd_effective_to": pl.lit(effective_date),
+            "_scd_is_current": pl.lit(False),
+        }
+
     def get_current_records(
         self,
         table_name: str,
@@ -329,7 +347,7 @@ class SCDType2Manager:
             namespace=namespace,
             table_name=table_name,
             columns=columns,
-            filter_expr="_scd_is_current = true",
+            filter_expr=self.CURRENT_FILTER,
         )
 
     def get_record_at_time(
@@ -351,11 +369,12 @@ class SCDType2Manager:
         Returns:
             DataFrame with the record version, or None if not found
         """
-        df = self.table_manager.read(namespace, table_name)
-
-        # Filter by business keys
-        for col, value in business_key_values.items():
-            df = df.filter(pl.col(col) == value)
+        df = self.table_manager.read_matching(
+            namespace=namespace,
+            table_name=table_name,
+            keys=pl.DataFrame({k: [v] for k, v in business_key_values.items()}),
+            key_columns=list(business_key_values),
+        )
 
         # Filter by time range
         df = df.filter(
@@ -385,11 +404,12 @@ class SCDType2Manager:
         Returns:
             DataFrame with all versions ordered by effective date
         """
-        df = self.table_manager.read(namespace, table_name)
-
-        # Filter by business keys
-        for col, value in business_key_values.items():
-            df = df.filter(pl.col(col) == value)
+        df = self.table_manager.read_matching(
+            namespace=namespace,
+            table_name=table_name,
+            keys=pl.DataFrame({k: [v] for k, v in business_key_values.items()}),
+            key_columns=list(business_key_values),
+        )
 
         # Order by version
         return df.sort("_scd_version")
@@ -417,7 +437,7 @@ class SCDType2Manager:
         Returns:
             Counts of inserted, updated, deleted, unchanged
         """
-        effective_date = effective_date or utc_now()
+        effective_date = ensure_utc(effective_date) or utc_now()
 
         # Separate deletes from regular records
         if delete_indicator and delete_indicator in source_df.columns:
@@ -458,46 +478,14 @@ class SCDType2Manager:
         namespace: str,
         effective_date: datetime,
     ) -> int:
-        """Close records for deleted entities."""
-        existing_df = self.table_manager.read(
+        """Close current versions of deleted entities in place."""
+        result = self.table_manager.update_matching(
             namespace=namespace,
             table_name=table_name,
+            keys=deletes_df.select(business_keys),
+            key_columns=business_keys,
+            updates=self._close_version_updates(effective_date),
+            filter_expr=self.CURRENT_FILTER,
+            operation="scd2_delete",
         )
-
-        delete_keys = deletes_df.select(business_keys)
-
-        # Find current records to close
-        to_close = existing_df.join(
-            delete_keys,
-            on=business_keys,
-            how="inner",
-        ).filter(pl.col("_scd_is_current") == True)
-
-        if to_close.is_empty():
-            return 0
-
-        # Close the records
-        closed = to_close.with_columns([
-            pl.lit(effective_date).alias("_scd_effective_to"),
-            pl.lit(False).alias("_scd_is_current"),
-        ])
-
-        # Get unchanged records
-        unchanged = existing_df.join(
-            delete_keys,
-            on=business_keys,
-            how="anti",
-        )
-
-        # Also keep already-closed versions of deleted records
-        already_closed = existing_df.join(
-            delete_keys,
-            on=business_keys,
-            how="inner",
-        ).filter(pl.col("_scd_is_current") == False)
-
-        # Rebuild table
-        all_records = pl.concat([unchanged, already_closed, closed])
-        self.table_manager.overwrite(namespace, table_name, all_records)
-
-        return len(to_close)
+        return result.rows_updated
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from datetime import datetime
-from typing import Any, Callable
+from typing import Any
 
 import polars as pl
+import pyarrow as pa
 import structlog
 
 from automic_etl.core.config import Settings
 from automic_etl.core.exceptions import TransformationError
 from automic_etl.storage.iceberg import IcebergTableManager
+from automic_etl.storage.iceberg.tables import DEFAULT_BATCH_SIZE
 from automic_etl.core.utils import utc_now
 
 logger = structlog.get_logger()
@@ -62,6 +65,11 @@ class SilverLayer:
         """
         Process data from bronze to silver layer.
 
+        Incremental runs read only the bronze data files appended since the
+        snapshot recorded in the silver table properties, and record the new
+        bronze snapshot in the same commit as the processed rows. Tables
+        without a usable checkpoint fall back to the watermark column.
+
         Args:
             source_table: Bronze table name
             target_table: Silver table name
@@ -78,19 +86,45 @@ class SilverLayer:
         from automic_etl.medallion.bronze import BronzeLayer
 
         bronze = BronzeLayer(self.settings)
+        target_exists = self.table_exists(target_table)
 
         # Get data from bronze
-        if incremental and self.table_exists(target_table):
-            # Get last processing time
-            last_processed = self._get_last_watermark(target_table)
-            if last_processed:
-                df = bronze.read_new_since(source_table, last_processed)
+        changes = None
+        last_snapshot = None
+        if incremental and target_exists:
+            last_snapshot = self._get_source_snapshot(target_table, source_table)
+            if last_snapshot is not None:
+                changes = bronze.read_appended_since(source_table, last_snapshot)
+
+            if changes is None:
+                # No usable snapshot checkpoint: fall back to the watermark,
+                # reading at the captured snapshot so the checkpoint covers
+                # exactly the rows processed
+                source_snapshot = bronze.current_snapshot_id(source_table)
+                last_processed = self._get_last_watermark(target_table)
+                if last_processed:
+                    df = bronze.read_new_since(
+                        source_table, last_processed, snapshot_id=source_snapshot
+                    )
+                else:
+                    df = bronze.read(source_table, snapshot_id=source_snapshot)
             else:
-                df = bronze.read(source_table)
+                df = changes.df
+                source_snapshot = changes.snapshot_id
         else:
-            df = bronze.read(source_table)
+            changes = bronze.read_appended_since(source_table, None)
+            df = changes.df
+            source_snapshot = changes.snapshot_id
+
+        checkpoint: dict[str, str] = {}
+        if source_snapshot is not None:
+            checkpoint[self._checkpoint_property(source_table)] = str(source_snapshot)
 
         if df.is_empty():
+            if target_exists and checkpoint and source_snapshot != last_snapshot:
+                self.table_manager.set_properties(
+                    self.NAMESPACE, target_table, checkpoint
+                )
             self.logger.info(
                 "No new data to process",
                 source=source_table,
@@ -115,8 +149,8 @@ class SilverLayer:
             processing_time=processing_time,
         )
 
-        # Write to silver layer
-        return self._write(target_table, df, processing_time)
+        # Write to silver layer, advancing the checkpoint in the same commit
+        return self._write(target_table, df, processing_time, checkpoint)
 
     def _apply_pipeline(
         self,
@@ -246,11 +280,14 @@ class SilverLayer:
         table_name: str,
         df: pl.DataFrame,
         processing_time: datetime,
+        properties: dict[str, str] | None = None,
     ) -> int:
         """Write data to silver layer."""
         try:
             if self.table_exists(table_name):
-                rows = self.table_manager.append(self.NAMESPACE, table_name, df)
+                rows = self.table_manager.append(
+                    self.NAMESPACE, table_name, df, properties=properties
+                )
             else:
                 partition_columns = self.settings.medallion.silver.partition_by
                 self.table_manager.create_table_from_dataframe(
@@ -263,7 +300,9 @@ class SilverLayer:
                         "automic.created": processing_time.isoformat(),
                     },
                 )
-                rows = self.table_manager.append(self.NAMESPACE, table_name, df)
+                rows = self.table_manager.append(
+                    self.NAMESPACE, table_name, df, properties=properties
+                )
 
             self.logger.info(
                 "Processed data to silver",
@@ -295,6 +334,40 @@ class SilverLayer:
             limit=limit,
         )
 
+    def scan_lazy(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        snapshot_id: int | None = None,
+    ) -> pl.LazyFrame:
+        """Lazily scan a silver table with pushdown into the Iceberg scan."""
+        return self.table_manager.scan_lazy(
+            namespace=self.NAMESPACE,
+            table_name=table_name,
+            columns=columns,
+            filter_expr=filter_expr,
+            snapshot_id=snapshot_id,
+        )
+
+    def iter_batches(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        snapshot_id: int | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream a silver table as bounded Arrow record batches."""
+        yield from self.table_manager.iter_batches(
+            namespace=self.NAMESPACE,
+            table_name=table_name,
+            columns=columns,
+            filter_expr=filter_expr,
+            snapshot_id=snapshot_id,
+            batch_size=batch_size,
+        )
+
     def list_tables(self) -> list[str]:
         """List all tables in the silver layer."""
         return self.table_manager.catalog.list_tables(self.NAMESPACE)
@@ -306,13 +379,34 @@ class SilverLayer:
     def _get_last_watermark(self, table_name: str) -> datetime | None:
         """Get the last processing time for incremental processing."""
         try:
-            df = self.read(table_name, columns=["_processing_time"])
-            if df.is_empty():
-                return None
-            return df.select(pl.col("_processing_time").max()).item()
+            return (
+                self.scan_lazy(table_name, columns=["_processing_time"])
+                .select(pl.col("_processing_time").max())
+                .collect()
+                .item()
+            )
+        except Exception:
+            return None
+
+    def _get_source_snapshot(
+        self,
+        table_name: str,
+        source_table: str,
+    ) -> int | None:
+        """Get the last bronze snapshot consumed into a silver table."""
+        try:
+            properties = self.table_manager.get_properties(self.NAMESPACE, table_name)
         except Exception:
             return None
 
+        value = properties.get(self._checkpoint_property(source_table))
+        return int(value) if value else None
+
+    @staticmethod
+    def _checkpoint_property(source_table: str) -> str:
+        """Table property holding the consumed bronze snapshot ID."""
+        return f"automic.source.bronze.{source_table}.snapshot-id"
+
 
 # ============================================================================
 # Common Transformations
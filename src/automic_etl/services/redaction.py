@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import re
 from dataclasses import dataclass, field
 from typing import Any, Callable
@@ -50,18 +51,24 @@ class EntityPattern:
         if self.tag is None:
             self.tag = f"[{self.name.upper()}]"
 
-    def get_compiled_patterns(self) -> list[re.Pattern]:
-        """Compile all patterns with appropriate flags."""
-        compiled = []
-        flags = re.IGNORECASE if self.case_insensitive else 0
-
+    def get_regex_sources(self) -> list[str]:
+        """Regex source of each pattern, escaped and bounded as configured."""
+        sources = []
         for pattern in self.patterns:
             if self.word_boundary and not pattern.startswith(r"\b"):
                 escaped = re.escape(pattern) if not self._is_regex(pattern) else pattern
                 pattern = rf"\b{escaped}\b"
             elif not self._is_regex(pattern):
                 pattern = re.escape(pattern)
+            sources.append(pattern)
+        return sources
+
+    def get_compiled_patterns(self) -> list[re.Pattern]:
+        """Compile all patterns with appropriate flags."""
+        compiled = []
+        flags = re.IGNORECASE if self.case_insensitive else 0
 
+        for pattern in self.get_regex_sources():
             try:
                 compiled.append(re.compile(pattern, flags))
             except re.error as e:
@@ -69,6 +76,10 @@ class EntityPattern:
 
         return compiled
 
+    def get_literal_terms(self) -> list[str]:
+        """Patterns that are exact strings rather than regexes."""
+        return [p for p in self.patterns if p and not self._is_regex(p)]
+
     def _is_regex(self, pattern: str) -> bool:
         """Check if pattern appears to be a regex."""
         regex_chars = r"[](){}*+?|^$\\"
@@ -276,6 +287,250 @@ class RedactionConfig:
         return self
 
 
+class _MatchEngine:
+    """
+    Finds all entity matches in a text.
+
+    The patterns of each entity are combined into one regex (see
+    ``_entity_source``) whose non-overlapping matches are the entity's
+    candidates, the same candidates the vectorized column path finds with
+    Polars. Entities made only of literal terms are matched with an
+    Aho-Corasick automaton instead when ``pyahocorasick`` is installed.
+    Overlapping candidates of different entities are resolved by priority,
+    then earliest start, then longest match.
+    """
+
+    def __init__(self, patterns: list[EntityPattern]) -> None:
+        self.patterns = sorted(patterns, key=lambda p: p.priority, reverse=True)
+        self.sources = [_entity_source(pattern) for pattern in self.patterns]
+        self._regexes: list[tuple[int, re.Pattern]] = []
+        self._literal_patterns: set[int] = set()
+        self._automata: dict[bool, Any] = {}
+
+        automaton_cls = self._automaton_class()
+        for index, (pattern, source) in enumerate(zip(self.patterns, self.sources, strict=True)):
+            literals = pattern.get_literal_terms()
+            if automaton_cls and literals and len(literals) == len(pattern.patterns):
+                for term in literals:
+                    self._add_literal(automaton_cls, term, index)
+                self._literal_patterns.add(index)
+            elif source is not None:
+                self._regexes.append((index, re.compile(source)))
+
+        for automaton in self._automata.values():
+            automaton.make_automaton()
+
+    def find(self, text: str) -> list[tuple[int, int, EntityPattern]]:
+        """
+        Find non-overlapping matches in a text.
+
+        Returns:
+            List of (start, end, pattern) sorted by start
+        """
+        candidates: list[tuple[int, int, int, int]] = []
+
+        for index, regex in self._regexes:
+            priority = -self.patterns[index].priority
+            for match in regex.finditer(text):
+                start, end = match.span()
+                if end > start:
+                    candidates.append((priority, start, end, index))
+
+        if self._automata:
+            if len(text.lower()) == len(text):
+                self._find_literals(text, candidates)
+            else:
+                # Lower-casing changes offsets; match these terms by regex
+                for index in self._literal_patterns:
+                    source = self.sources[index]
+                    if source is None:
+                        continue
+                    priority = -self.patterns[index].priority
+                    for match in re.finditer(source, text):
+                        start, end = match.span()
+                        if end > start:
+                            candidates.append((priority, start, end, index))
+
+        return self._resolve_overlaps(candidates)
+
+    def _find_literals(
+        self,
+        text: str,
+        candidates: list[tuple[int, int, int, int]],
+    ) -> None:
+        """Collect literal term candidates, leftmost-longest per entity like the regexes."""
+        hits: list[tuple[int, int, int]] = []
+        for case_insensitive, automaton in self._automata.items():
+            haystack = text.lower() if case_insensitive else text
+            for end_index, entries in automaton.iter(haystack):
+                end = end_index + 1
+                for length, index in entries:
+                    start = end - length
+                    pattern = self.patterns[index]
+                    if pattern.word_boundary and not (
+                        _is_boundary(text, start) and _is_boundary(text, end)
+                    ):
+                        continue
+                    hits.append((index, start, end))
+
+        hits.sort(key=lambda h: (h[0], h[1], h[1] - h[2]))
+        last_index, last_end = -1, 0
+        for index, start, end in hits:
+            if index != last_index:
+                last_index, last_end = index, 0
+            if start >= last_end:
+                candidates.append((-self.patterns[index].priority, start, end, index))
+                last_end = end
+
+    def _add_literal(self, automaton_cls: Any, term: str, index: int) -> None:
+        """Register a literal term for an entity."""
+        case_insensitive = self.patterns[index].case_insensitive
+        key = term.lower() if case_insensitive else term
+        if len(key) != len(term):
+            key = term
+            case_insensitive = False
+
+        automaton = self._automata.get(case_insensitive)
+        if automaton is None:
+            automaton = self._automata[case_insensitive] = automaton_cls()
+
+        entries = automaton.get(key, [])
+        entries.append((len(key), index))
+        automaton.add_word(key, entries)
+
+    def _resolve_overlaps(
+        self,
+        candidates: list[tuple[int, int, int, int]],
+    ) -> list[tuple[int, int, EntityPattern]]:
+        """Keep the best candidates that do not overlap a better one."""
+        candidates.sort(key=lambda c: (c[0], c[1], c[1] - c[2], c[3]))
+
+        starts: list[int] = []
+        ends: list[int] = []
+        selected: dict[int, tuple[int, int, EntityPattern]] = {}
+
+        for _, start, end, index in candidates:
+            position = bisect.bisect_right(starts, start)
+            if position > 0 and ends[position - 1] > start:
+                continue
+            if position < len(starts) and starts[position] < end:
+                continue
+            starts.insert(position, start)
+            ends.insert(position, end)
+            selected[start] = (start, end, self.patterns[index])
+
+        return [selected[start] for start in starts]
+
+    @staticmethod
+    def _automaton_class() -> Any | None:
+        """Aho-Corasick automaton class, or None if pyahocorasick is missing."""
+        try:
+            import ahocorasick
+        except ImportError:
+            return None
+        return ahocorasick.Automaton
+
+
+def _entity_source(pattern: EntityPattern) -> str | None:
+    """
+    Combine the patterns of an entity into one regex source.
+
+    Regex patterns keep their order; literal terms follow, longest first,
+    so a leftmost-first scan picks the longest term at each position. The
+    source is valid for both Python's ``re`` and Polars. Returns None if
+    the entity has no valid pattern.
+    """
+    literals = set(pattern.get_literal_terms())
+    regexes: list[str] = []
+    terms: list[str] = []
+    for source, raw in zip(pattern.get_regex_sources(), pattern.patterns, strict=True):
+        try:
+            re.compile(source)
+        except re.error as e:
+            logger.warning(f"Invalid regex pattern '{source}': {e}")
+            continue
+        if raw in literals:
+            terms.append(raw)
+        else:
+            regexes.append(source)
+
+    branches = [f"(?:{source})" for source in regexes]
+    if terms:
+        alternation = "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+        branches.append(rf"\b(?:{alternation})\b" if pattern.word_boundary else f"(?:{alternation})")
+    if not branches:
+        return None
+    flags = "?i:" if pattern.case_insensitive else "?:"
+    return f"({flags}{'|'.join(branches)})"
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """Whether a regex word boundary (``\\b``) falls at an index."""
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == "_")
+    after = index < len(text) and (text[index].isalnum() or text[index] == "_")
+    return before != after
+
+
+
+# Spans of matches found by the vectorized column path
+_EMPTY_SPANS = pl.DataFrame(
+    schema={
+        "row": pl.UInt32,
+        "start": pl.Int64,
+        "end": pl.Int64,
+        "entity": pl.UInt32,
+        "priority": pl.Int64,
+    }
+)
+
+
+def _drop_overlapping(spans: pl.DataFrame, kept: pl.DataFrame) -> pl.DataFrame:
+    """Drop spans overlapping a kept span of the same row."""
+    combined = pl.concat([
+        kept.with_columns(pl.lit(True).alias("is_kept")),
+        spans.with_columns(pl.lit(False).alias("is_kept")),
+    ]).sort("row", "start", "is_kept", descending=[False, False, True])
+
+    # Furthest end of the kept spans starting at or before each span, and
+    # start of the next kept span after it
+    kept_end = pl.when("is_kept").then("end").otherwise(0).cum_max().over("row")
+    next_start = (
+        pl.when("is_kept").then("start").otherwise(None)
+        .fill_null(strategy="backward").over("row")
+    )
+    return (
+        combined.filter(
+            ~pl.col("is_kept")
+            & (kept_end <= pl.col("start"))
+            & (next_start.is_null() | (next_start >= pl.col("end")))
+        )
+        .drop("is_kept")
+    )
+
+
+def _select_level(spans: pl.DataFrame) -> pl.DataFrame:
+    """Keep the earliest, then longest spans of one priority level that do not overlap."""
+    spans = spans.sort(
+        "row", "start", "end", "entity", descending=[False, False, True, False]
+    )
+    previous_end = pl.col("end").cum_max().shift(1).over("row")
+    overlaps = (pl.col("start") < previous_end).fill_null(False).any().over("row")
+    spans = spans.with_columns(overlaps.alias("overlaps"))
+
+    selected = []
+    last_row, last_end = None, 0
+    for row, start, end, entity in spans.filter("overlaps").drop("overlaps").iter_rows():
+        if row != last_row:
+            last_row, last_end = row, 0
+        if start >= last_end:
+            selected.append((row, start, end, entity))
+            last_end = end
+
+    return pl.concat([
+        spans.filter(~pl.col("overlaps")).drop("overlaps"),
+        pl.DataFrame(selected, schema=spans.drop("overlaps").schema, orient="row"),
+    ])
+
 class RedactionService:
     """
     Service for redacting sensitive information from text.
@@ -291,24 +546,38 @@ class RedactionService:
     def __init__(self, config: RedactionConfig) -> None:
         self.config = config
         self.logger = logger.bind(component="redaction_service")
-        self._compiled_patterns: dict[str, list[re.Pattern]] = {}
+        self._engine = _MatchEngine(config.patterns)
+        self._column_regexes: list[tuple[int, str]] = []
+        self._python_patterns: list[EntityPattern] = []
         self._compile_patterns()
 
     def _compile_patterns(self) -> None:
-        """Pre-compile all patterns for efficiency."""
-        sorted_patterns = sorted(
-            self.config.patterns,
-            key=lambda p: p.priority,
-            reverse=True,
-        )
-
-        for pattern in sorted_patterns:
-            self._compiled_patterns[pattern.name] = pattern.get_compiled_patterns()
+        """Check the per-entity regexes against Polars for vectorized column redaction."""
+        for index, (pattern, source) in enumerate(
+            zip(self._engine.patterns, self._engine.sources, strict=True)
+        ):
+            if source is None:
+                continue
+            try:
+                matches_empty = pl.Series([""], dtype=pl.String).str.contains(source).item()
+            except Exception:
+                matches_empty = True
+            if matches_empty or re.match(source, ""):
+                # Pattern uses syntax the Rust regex engine lacks (e.g.
+                # lookaround) or can match nothing; values it matches are
+                # redacted in Python
+                self._python_patterns.append(pattern)
+                continue
+            self._column_regexes.append((index, source))
 
     def redact(self, text: str) -> RedactionResult:
         """
         Redact sensitive information from text.
 
+        Each entity is matched in one scan of the original text;
+        overlapping matches are resolved in favour of higher priority, then
+        earlier and longer matches, and the text is rebuilt once.
+
         Args:
             text: Input text to redact
 
@@ -322,49 +591,40 @@ class RedactionService:
                 total_redactions=0,
             )
 
-        redacted = text
+        parts: list[str] = []
         all_matches: list[RedactionMatch] = []
         entity_counts: dict[str, int] = {}
-
-        sorted_patterns = sorted(
-            self.config.patterns,
-            key=lambda p: p.priority,
-            reverse=True,
-        )
-
-        for pattern in sorted_patterns:
-            compiled = self._compiled_patterns.get(pattern.name, [])
-
-            for regex in compiled:
-                for match in regex.finditer(redacted):
-                    original = match.group()
-                    replacement = self._get_replacement(original, pattern)
-
-                    context = ""
-                    if self.config.include_context:
-                        start = max(0, match.start() - self.config.context_chars)
-                        end = min(len(redacted), match.end() + self.config.context_chars)
-                        context = redacted[start:end]
-
-                    all_matches.append(RedactionMatch(
-                        original=original,
-                        replacement=replacement,
-                        entity_type=pattern.name,
-                        start=match.start(),
-                        end=match.end(),
-                        context=context,
-                    ))
-
-                    entity_counts[pattern.name] = entity_counts.get(pattern.name, 0) + 1
-
-                redacted = regex.sub(
-                    lambda m: self._get_replacement(m.group(), pattern),
-                    redacted,
-                )
+        position = 0
+
+        for start, end, pattern in self._engine.find(text):
+            original = text[start:end]
+            replacement = self._get_replacement(original, pattern)
+
+            context = ""
+            if self.config.include_context:
+                context_start = max(0, start - self.config.context_chars)
+                context_end = min(len(text), end + self.config.context_chars)
+                context = text[context_start:context_end]
+
+            all_matches.append(RedactionMatch(
+                original=original,
+                replacement=replacement,
+                entity_type=pattern.name,
+                start=start,
+                end=end,
+                context=context,
+            ))
+            entity_counts[pattern.name] = entity_counts.get(pattern.name, 0) + 1
+
+            parts.append(text[position:start])
+            parts.append(replacement)
+            position = end
+
+        parts.append(text[position:])
 
         result = RedactionResult(
             original_text=text,
-            redacted_text=redacted,
+            redacted_text="".join(parts),
             matches=all_matches,
             entity_counts=entity_counts,
             total_redactions=len(all_matches),
@@ -405,6 +665,161 @@ class RedactionService:
         """Redact a batch of texts."""
         return [self.redact(text) for text in texts]
 
+    def redact_series(self, series: pl.Series) -> tuple[pl.Series, dict[str, int]]:
+        """
+        Redact a column of texts.
+
+        When every replacement is a fixed string (tag, fixed-width mask or
+        removal), matches are found by Polars without materializing Python
+        strings: each entity's regex yields the spans of its matches in the
+        original values, overlaps between entities are resolved like
+        ``redact`` (priority, then earliest start, then longest match), and
+        each value is rebuilt once from the kept spans. Values matched by a
+        pattern the Polars regex engine does not support go through
+        ``redact`` instead, as does every value when replacements depend on
+        the matched text.
+
+        Args:
+            series: Column to redact (non-string values are cast to text)
+
+        Returns:
+            Tuple of (redacted series, entity counts)
+        """
+        series = series.cast(pl.String)
+        entity_counts: dict[str, int] = {}
+
+        if not self._is_vectorizable():
+            return self._redact_values(series, entity_counts), entity_counts
+
+        fallback = pl.repeat(False, len(series), eager=True)
+        for pattern in self._python_patterns:
+            regexes = pattern.get_compiled_patterns()
+            fallback = fallback | series.map_elements(
+                lambda value, regexes=regexes: any(r.search(value) for r in regexes),
+                return_dtype=pl.Boolean,
+            )
+        fallback = fallback.fill_null(False)
+
+        spans = self._match_spans(series)
+        if fallback.any():
+            rows = pl.DataFrame({"row": fallback.arg_true().cast(pl.UInt32)})
+            spans = spans.join(rows, on="row", how="anti")
+        kept = self._resolve_spans(spans)
+
+        for entity, count in kept.group_by("entity").len().sort("entity").iter_rows():
+            name = self._engine.patterns[entity].name
+            entity_counts[name] = entity_counts.get(name, 0) + count
+
+        source = series
+        series = self._apply_spans(series, kept)
+        if fallback.any():
+            rows = fallback.arg_true()
+            series = series.scatter(
+                rows, self._redact_values(source.gather(rows), entity_counts)
+            )
+        return series, entity_counts
+
+    def _match_spans(self, series: pl.Series) -> pl.DataFrame:
+        """
+        Character spans of each entity's matches.
+
+        ``extract_all`` returns the matches but not their offsets, so each
+        regex also runs behind a lazy ``.*?`` prefix: the k-th match of that
+        is the text from the end of the previous match through the end of
+        the k-th match, and cumulative lengths give the offsets.
+        """
+        frames = [_EMPTY_SPANS]
+        for index, regex in self._column_regexes:
+            matches = (
+                pl.DataFrame({
+                    "through": series.str.extract_all(f"(?s:.*?){regex}"),
+                    "match": series.str.extract_all(regex),
+                })
+                .with_row_index("row")
+                .filter(pl.col("match").list.len() > 0)
+            )
+            if matches.is_empty():
+                continue
+            frames.append(
+                matches.explode(["through", "match"])
+                .with_columns(
+                    pl.col("through").str.len_chars().cast(pl.Int64).cum_sum().over("row").alias("end")
+                )
+                .select(
+                    "row",
+                    (pl.col("end") - pl.col("match").str.len_chars().cast(pl.Int64)).alias("start"),
+                    "end",
+                    pl.lit(index, pl.UInt32).alias("entity"),
+                    pl.lit(self._engine.patterns[index].priority, pl.Int64).alias("priority"),
+                )
+            )
+        return pl.concat(frames)
+
+    def _resolve_spans(self, spans: pl.DataFrame) -> pl.DataFrame:
+        """
+        Keep the spans ``redact`` would keep.
+
+        Priority levels are resolved from highest to lowest: spans of a
+        level overlapping a kept span are dropped, and the rest are kept
+        unless they overlap each other. Only rows with overlaps inside one
+        level are resolved in Python, from the spans alone.
+        """
+        kept = _EMPTY_SPANS.drop("priority")
+        for priority in spans["priority"].unique().sort(descending=True):
+            level = spans.filter(pl.col("priority") == priority).drop("priority")
+            if not kept.is_empty():
+                level = _drop_overlapping(level, kept)
+            kept = pl.concat([kept, _select_level(level)])
+        return kept.sort("row", "start")
+
+    def _apply_spans(self, series: pl.Series, kept: pl.DataFrame) -> pl.Series:
+        """Rebuild values with each kept span replaced."""
+        if kept.is_empty():
+            return series
+
+        replacements = pl.DataFrame({
+            "entity": pl.Series(range(len(self._engine.patterns)), dtype=pl.UInt32),
+            "replacement": [self._get_replacement("", p) for p in self._engine.patterns],
+        })
+        texts = pl.DataFrame({"text": series}).with_row_index("row")
+        gap_start = pl.col("end").shift(1, fill_value=0).over("row")
+        redacted = (
+            kept.join(replacements, on="entity")
+            .join(texts, on="row")
+            .sort("row", "start")
+            .group_by("row", maintain_order=True)
+            .agg(
+                pl.concat_str(
+                    pl.col("text").str.slice(gap_start, pl.col("start") - gap_start),
+                    pl.col("replacement"),
+                ).str.join("").alias("redacted"),
+                pl.col("text").first().str.slice(pl.col("end").last()).alias("tail"),
+            )
+        )
+        return (
+            texts.join(redacted, on="row", how="left")
+            .select(
+                pl.when(pl.col("redacted").is_not_null())
+                .then(pl.concat_str("redacted", "tail"))
+                .otherwise(pl.col("text"))
+                .alias(series.name)
+            )
+            .to_series()
+        )
+
+    def _redact_values(self, series: pl.Series, entity_counts: dict[str, int]) -> pl.Series:
+        """Redact each value with ``redact``, adding to the entity counts."""
+        values = []
+        for value in series.to_list():
+            if value is None:
+                values.append(None)
+                continue
+            result = self.redact(value)
+            values.append(result.redacted_text)
+            for entity, count in result.entity_counts.items():
+                entity_counts[entity] = entity_counts.get(entity, 0) + count
+        return pl.Series(series.name, values, dtype=pl.String)
+
     def redact_dataframe(
         self,
         df: pl.DataFrame,
@@ -435,27 +850,25 @@ class RedactionService:
                 self.logger.warning(f"Column '{col}' not found in DataFrame")
                 continue
 
-            redacted_values = []
-            for value in df[col].to_list():
-                if value is None:
-                    redacted_values.append(None)
-                else:
-                    result = self.redact(str(value))
-                    redacted_values.append(result.redacted_text)
-                    total_stats["total_redactions"] += result.total_redactions
-
-                    for entity, count in result.entity_counts.items():
-                        total_stats["entity_counts"][entity] = (
-                            total_stats["entity_counts"].get(entity, 0) + count
-                        )
-
-            new_col_name = f"{col}{output_suffix}"
-            result_df = result_df.with_columns(
-                pl.Series(new_col_name, redacted_values)
-            )
+            redacted, entity_counts = self.redact_series(df[col])
+            for entity, count in entity_counts.items():
+                total_stats["total_redactions"] += count
+                total_stats["entity_counts"][entity] = (
+                    total_stats["entity_counts"].get(entity, 0) + count
+                )
+
+            result_df = result_df.with_columns(redacted.alias(f"{col}{output_suffix}"))
 
         return result_df, total_stats
 
+    def _is_vectorizable(self) -> bool:
+        """Whether every replacement is a fixed string, so columns can be redacted by Polars."""
+        if any(p.custom_replacer for p in self.config.patterns):
+            return False
+        if self.config.strategy == RedactionStrategy.HASH:
+            return False
+        return not (self.config.strategy == RedactionStrategy.MASK and self.config.preserve_length)
+
     def get_entity_counts(self, text: str) -> dict[str, int]:
         """Count entities in text without redacting."""
         result = self.redact(text)
@@ -2,17 +2,187 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterator
 from datetime import datetime
 from pathlib import Path
 
 import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as pads
 import structlog
+from pyiceberg.expressions import (
+    And,
+    BooleanExpression,
+    EqualTo,
+    GreaterThan,
+    GreaterThanOrEqual,
+    In,
+    IsNull,
+    LessThan,
+    LessThanOrEqual,
+    NotEqualTo,
+    NotIn,
+    NotNull,
+)
+from pyiceberg.expressions.parser import parse
 
 from automic_etl.core.config import Settings
+from automic_etl.storage.iceberg.expressions import split_conjuncts
+
+if TYPE_CHECKING:
+    from deltalake import DeltaTable
 
 logger = structlog.get_logger()
 
+# Comparison predicates that map to Delta tuple filters and Arrow expressions
+_COMPARISON_OPERATORS: dict[type, str] = {
+    EqualTo: "=",
+    NotEqualTo: "!=",
+    LessThan: "<",
+    LessThanOrEqual: "<=",
+    GreaterThan: ">",
+    GreaterThanOrEqual: ">=",
+}
+
+
+@dataclass
+class DeltaFilter:
+    """
+    A filter expression split into Delta file pruning and row filters.
+
+    ``file_filters`` are Delta tuple filters: conjuncts on partition columns
+    select files exactly, conjuncts on other columns are checked against the
+    per-file min/max statistics in the Delta log. ``row_filter`` is the same
+    set of conjuncts as an Arrow dataset expression, so Parquet row groups are
+    skipped by their statistics and rows are filtered during the scan. The
+    residual holds conjuncts neither can evaluate and is applied in Polars.
+    """
+
+    file_filters: list[tuple[str, str, Any]] = field(default_factory=list)
+    row_filter: pads.Expression | None = None
+    residual: str | None = None
+    pushed: list[str] = field(default_factory=list)
+
+    @property
+    def is_fully_pushed(self) -> bool:
+        """Whether the whole expression is evaluated by the dataset scan."""
+        return self.residual is None
+
+
+def translate_delta_filter(filter_expr: str | None, schema: pa.Schema) -> DeltaFilter:
+    """
+    Translate a string filter into Delta file filters plus an Arrow expression.
+
+    Each top-level conjunct is parsed with the Iceberg expression parser.
+    Comparisons, IN/NOT IN, IS [NOT] NULL and BETWEEN on known columns with
+    literals castable to the column type are pushed down; everything else
+    (functions, OR, LIKE, arithmetic) stays in the Polars residual.
+
+    Args:
+        filter_expr: SQL-style boolean expression, e.g. ``"region = 'EU'"``
+        schema: Arrow schema of the Delta table
+
+    Returns:
+        DeltaFilter with the pushed-down filters and residual
+    """
+    result = DeltaFilter()
+    if not filter_expr or not filter_expr.strip():
+        return result
+
+    residual: list[str] = []
+    for conjunct in split_conjuncts(filter_expr):
+        try:
+            file_filters, row_filter = _translate_predicate(parse(conjunct), schema)
+        except Exception as e:
+            logger.debug(
+                "Filter conjunct not pushed down",
+                conjunct=conjunct,
+                reason=type(e).__name__,
+            )
+            residual.append(conjunct)
+            continue
+
+        result.file_filters.extend(file_filters)
+        result.row_filter = (
+            row_filter if result.row_filter is None else result.row_filter & row_filter
+        )
+        result.pushed.append(conjunct)
+
+    if residual:
+        result.residual = " AND ".join(f"({c})" for c in residual)
+
+    return result
+
+
+def _translate_predicate(
+    expression: BooleanExpression,
+    schema: pa.Schema,
+) -> tuple[list[tuple[str, str, Any]], pads.Expression]:
+    """Convert one parsed predicate into Delta tuple filters and an Arrow expression."""
+    if isinstance(expression, And):
+        left_filters, left = _translate_predicate(expression.left, schema)
+        right_filters, right = _translate_predicate(expression.right, schema)
+        return left_filters + right_filters, left & right
+
+    name = expression.term.name
+    column = pads.field(name)
+    field_type = schema.field(name).type
+
+    if isinstance(expression, IsNull):
+        return [], column.is_null()
+    if isinstance(expression, NotNull):
+        return [], column.is_valid()
+
+    if isinstance(expression, (In, NotIn)):
+        values = sorted(_cast_literal(lit.value, field_type) for lit in expression.literals)
+        is_in = column.isin(pa.array(values, type=field_type))
+        if isinstance(expression, In):
+            return [(name, "in", values)], is_in
+        return [(name, "not in", values)], ~is_in
+
+    operator = _COMPARISON_OPERATORS[type(expression)]
+    value = _cast_literal(expression.literal.value, field_type)
+    scalar = pa.scalar(value, type=field_type)
+    row_filter = {
+        "=": column == scalar,
+        "!=": column != scalar,
+        "<": column < scalar,
+        "<=": column <= scalar,
+        ">": column > scalar,
+        ">=": column >= scalar,
+    }[operator]
+    return [(name, operator, value)], row_filter
+
+
+def _cast_literal(value: Any, field_type: pa.DataType) -> Any:
+    """Cast a parsed literal to a column's type (raises if incompatible)."""
+    return pa.scalar(value).cast(field_type).as_py()
+
+
+def _tuple_filter_sql(partition_filter: tuple[str, str, Any]) -> str:
+    """Render a ``(column, op, value)`` Delta tuple filter as a SQL predicate."""
+    column, operator, value = partition_filter
+    operator = operator.lower()
+    if operator in ("in", "not in"):
+        values = ", ".join(_sql_literal(v) for v in value)
+        return f'"{column}" {operator.upper()} ({values})'
+    if operator not in ("=", "!=", "<", "<=", ">", ">="):
+        raise ValueError(f"Unsupported partition filter operator: {operator}")
+    return f'"{column}" {operator} {_sql_literal(value)}'
+
+
+def _sql_literal(value: Any) -> str:
+    """SQL literal of a partition value."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
 
 class DeltaTableManager:
     """
@@ -84,33 +254,73 @@ class DeltaTableManager:
         Args:
             path: Table path
             columns: Columns to read
-            filter_expr: Filter expression (Polars syntax)
+            filter_expr: SQL-style filter expression, pushed down where possible
             version: Specific version to read
             timestamp: Read as of timestamp
 
         Returns:
             Polars DataFrame
         """
-        from deltalake import DeltaTable
+        return self.scan(
+            path,
+            columns=columns,
+            filter_expr=filter_expr,
+            version=version,
+            timestamp=timestamp,
+        ).collect()
 
-        if version is not None:
-            dt = DeltaTable(path, version=version)
-        elif timestamp is not None:
-            if isinstance(timestamp, datetime):
-                timestamp = timestamp.isoformat()
-            dt = DeltaTable(path)
-            dt.load_as_version(timestamp)
-        else:
-            dt = DeltaTable(path)
+    def scan(
+        self,
+        path: str,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        version: int | None = None,
+        timestamp: datetime | str | None = None,
+    ) -> pl.LazyFrame:
+        """
+        Lazily scan a Delta table with predicate and projection pushdown.
+
+        The filter is split into Delta tuple filters, which prune files by
+        partition values and file statistics from the Delta log, and an Arrow
+        dataset expression, which prunes row groups and filters rows during
+        the scan. Conjuncts that cannot be pushed down are applied by Polars.
+        Columns selected on the returned frame are pushed into the scan.
+
+        Args:
+            path: Table path
+            columns: Columns to read
+            filter_expr: SQL-style filter expression
+            version: Specific version to read
+            timestamp: Read as of timestamp
+
+        Returns:
+            Polars LazyFrame over the matching files
+        """
+        dt = self._open(path, version=version, timestamp=timestamp)
+        translated = translate_delta_filter(filter_expr, pa.schema(dt.schema().to_arrow()))
 
-        # Read to Arrow then convert
-        arrow_table = dt.to_pyarrow_table(columns=columns)
-        df = pl.from_arrow(arrow_table)
+        dataset = dt.to_pyarrow_dataset(
+            file_pruning_predicate=translated.file_filters or None,
+            as_large_types=True,
+        )
+        self.logger.debug(
+            "Planned Delta scan",
+            path=path,
+            version=dt.version(),
+            files=len(dataset.files),
+            pushed=translated.pushed,
+            residual=translated.residual,
+        )
 
-        if filter_expr:
-            df = df.filter(pl.sql_expr(filter_expr))
+        if translated.row_filter is not None:
+            dataset = dataset.filter(translated.row_filter)
 
-        return df
+        lf = pl.scan_pyarrow_dataset(dataset)
+        if translated.residual:
+            lf = lf.filter(pl.sql_expr(translated.residual))
+        if columns:
+            lf = lf.select(columns)
+        return lf
 
     def append(self, path: str, df: pl.DataFrame) -> None:
         """Append data to existing Delta table."""
@@ -124,22 +334,33 @@ class DeltaTableManager:
         path: str,
         df: pl.DataFrame,
         partition_filters: list[tuple] | None = None,
+        predicate: str | None = None,
     ) -> None:
         """
         Overwrite Delta table or partitions.
 
+        Only rows matching the predicate are replaced; without one the
+        whole table is overwritten.
+
         Args:
             path: Table path
             df: Data to write
-            partition_filters: Partition predicates for selective overwrite
+            partition_filters: Partition predicates for selective overwrite,
+                as ``(column, op, value)`` tuples combined with AND
+            predicate: SQL predicate for selective overwrite, e.g.
+                ``"region = 'EU'"`` (combined with ``partition_filters``)
         """
         from deltalake import write_deltalake
 
+        conditions = [_tuple_filter_sql(f) for f in partition_filters or []]
+        if predicate:
+            conditions.append(f"({predicate})")
+
         write_deltalake(
             path,
             df.to_arrow(),
             mode="overwrite",
-            partition_filters=partition_filters,
+            predicate=" AND ".join(conditions) or None,
         )
         self.logger.info("Data overwritten", path=path, rows=len(df))
 
@@ -499,12 +720,12 @@ class DeltaTableManager:
         from deltalake import DeltaTable
 
         dt = DeltaTable(path)
-        files = dt.files()
+        sizes = pa.table(dt.get_add_actions(flatten=True)).column("size_bytes")
 
         return {
             "version": dt.version(),
-            "num_files": len(files),
-            "total_size_bytes": sum(f.size for f in dt.get_add_actions()),
+            "num_files": len(sizes),
+            "total_size_bytes": pc.sum(sizes).as_py() or 0,
         }
 
     def enable_change_data_feed(self, path: str) -> None:
@@ -516,6 +737,25 @@ class DeltaTableManager:
 
         self.logger.info("Change Data Feed enabled", path=path)
 
+    def _open(
+        self,
+        path: str,
+        version: int | None = None,
+        timestamp: datetime | str | None = None,
+    ) -> DeltaTable:
+        """Open a Delta table, optionally at a version or timestamp."""
+        from deltalake import DeltaTable
+
+        if version is not None:
+            return DeltaTable(path, version=version)
+
+        dt = DeltaTable(path)
+        if timestamp is not None:
+            if isinstance(timestamp, datetime):
+                timestamp = timestamp.isoformat()
+            dt.load_as_version(timestamp)
+        return dt
+
     def get_changes(
         self,
         path: str,
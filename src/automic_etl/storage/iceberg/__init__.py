@@ -1,12 +1,24 @@
 """Apache Iceberg integration for Automic ETL."""
 
-from automic_etl.storage.iceberg.catalog import IcebergCatalog
+from automic_etl.storage.iceberg.catalog import IcebergCatalog, get_catalog
+from automic_etl.storage.iceberg.changelog import AppendedData
+from automic_etl.storage.iceberg.compaction import CompactionEngine, CompactionResult
+from automic_etl.storage.iceberg.expressions import TranslatedFilter, translate_filter
+from automic_etl.storage.iceberg.merge import MergeEngine, MergeResult
 from automic_etl.storage.iceberg.tables import IcebergTableManager
 from automic_etl.storage.iceberg.schemas import SchemaBuilder, schema_from_polars
 
 __all__ = [
+    "AppendedData",
+    "CompactionEngine",
+    "CompactionResult",
     "IcebergCatalog",
+    "get_catalog",
     "IcebergTableManager",
+    "MergeEngine",
+    "MergeResult",
+    "TranslatedFilter",
+    "translate_filter",
     "SchemaBuilder",
     "schema_from_polars",
 ]
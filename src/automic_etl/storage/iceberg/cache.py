@@ -0,0 +1,129 @@
+"""LRU + TTL cache of loaded Iceberg tables."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from pyiceberg.table import Table
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a table cache."""
+
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class TableCache:
+    """
+    Thread-safe LRU cache of ``Table`` objects with a time-to-live.
+
+    PyIceberg updates a ``Table`` in place when a commit made through it
+    succeeds, so cached tables stay current for local writes. The TTL bounds
+    how long commits made by other processes can go unnoticed.
+
+    The lock only guards the cache itself: one ``Table`` object is handed to
+    every thread that loads it, without a per-table lock or refresh. This is
+    safe because PyIceberg swaps a table's metadata in a single assignment
+    and commits are checked by the catalog, so of two threads committing on
+    the same base snapshot one fails (and callers invalidate its entry).
+    Code that must observe other writers' commits should load with
+    ``refresh=True``.
+    """
+
+    def __init__(self, max_size: int = 128, ttl_seconds: float = 30.0) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[float, Table]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything."""
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get(self, identifier: str) -> Table | None:
+        """Get a cached table, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(identifier)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            loaded_at, table = entry
+            if time.monotonic() - loaded_at > self.ttl_seconds:
+                del self._entries[identifier]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(identifier)
+            self.stats.hits += 1
+            return table
+
+    def put(self, identifier: str, table: Table) -> None:
+        """Cache a freshly loaded or committed table."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[identifier] = (time.monotonic(), table)
+            self._entries.move_to_end(identifier)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, identifier: str | None = None) -> None:
+        """Drop one table, or every table if no identifier is given."""
+        with self._lock:
+            if identifier is None:
+                self.stats.invalidations += len(self._entries)
+                self._entries.clear()
+            elif self._entries.pop(identifier, None) is not None:
+                self.stats.invalidations += 1
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        """Drop every cached table in a namespace."""
+        prefix = f"{namespace}."
+        with self._lock:
+            for identifier in [i for i in self._entries if i.startswith(prefix)]:
+                del self._entries[identifier]
+                self.stats.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Cache size, limits and counters."""
+        return {
+            "size": len(self),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            **self.stats.to_dict(),
+        }
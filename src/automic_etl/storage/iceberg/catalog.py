@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import structlog
 from pyiceberg.catalog import Catalog, load_catalog
+from pyiceberg.catalog.rest import RestCatalog
 from pyiceberg.catalog.sql import SqlCatalog
 from pyiceberg.exceptions import (
     NamespaceAlreadyExistsError,
@@ -16,23 +18,42 @@ from pyiceberg.table import Table
 
 from automic_etl.core.config import CatalogType, Settings
 from automic_etl.core.exceptions import IcebergError
+from automic_etl.storage.iceberg.cache import TableCache
 
 logger = structlog.get_logger()
 
+# Process-wide catalogs shared by all layers, keyed by catalog identity
+_shared_catalogs: dict[tuple[str, ...], IcebergCatalog] = {}
+_shared_catalogs_lock = threading.Lock()
+
 
 class IcebergCatalog:
-    """Wrapper for Iceberg catalog operations."""
+    """
+    Wrapper for Iceberg catalog operations.
+
+    Loaded tables are kept in an LRU cache with a TTL so repeated operations
+    on the same table do not each pay a metadata round trip. Use
+    ``get_catalog`` to share one instance (and cache) across the process.
+    """
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self._catalog: Catalog | None = None
+        self._catalog_lock = threading.Lock()
+        catalog_config = settings.iceberg.catalog
+        self.table_cache = TableCache(
+            max_size=catalog_config.table_cache_size,
+            ttl_seconds=catalog_config.table_cache_ttl_seconds,
+        )
         self.logger = logger.bind(component="iceberg_catalog")
 
     @property
     def catalog(self) -> Catalog:
         """Get or create the Iceberg catalog."""
         if self._catalog is None:
-            self._catalog = self._create_catalog()
+            with self._catalog_lock:
+                if self._catalog is None:
+                    self._catalog = self._create_catalog()
         return self._catalog
 
     def _create_catalog(self) -> Catalog:
@@ -147,6 +168,7 @@ class IcebergCatalog:
         """Drop a namespace."""
         try:
             self.catalog.drop_namespace(namespace)
+            self.table_cache.invalidate_namespace(namespace)
             self.logger.info("Dropped namespace", namespace=namespace)
         except NoSuchNamespaceError:
             self.logger.debug("Namespace does not exist", namespace=namespace)
@@ -162,17 +184,59 @@ class IcebergCatalog:
     # =========================================================================
 
     def table_exists(self, namespace: str, table_name: str) -> bool:
-        """Check if a table exists."""
-        try:
-            self.catalog.load_table(f"{namespace}.{table_name}")
+        """
+        Check if a table exists.
+
+        Answered from the table cache when possible. REST catalogs support a
+        metadata-free existence check; for other catalogs (SQL, Glue, Hive,
+        DynamoDB) checking existence means loading the table and reading its
+        full metadata file, so the loaded table is cached for the operation
+        that usually follows.
+        """
+        identifier = f"{namespace}.{table_name}"
+        if self.table_cache.get(identifier) is not None:
             return True
-        except NoSuchTableError:
+
+        try:
+            if isinstance(self.catalog, RestCatalog):
+                return self.catalog.table_exists(identifier)
+            table = self.catalog.load_table(identifier)
+        except (NoSuchTableError, NoSuchNamespaceError):
             return False
 
-    def load_table(self, namespace: str, table_name: str) -> Table:
-        """Load an existing table."""
+        self.table_cache.put(identifier, table)
+        return True
+
+    def load_table(
+        self,
+        namespace: str,
+        table_name: str,
+        refresh: bool = False,
+    ) -> Table:
+        """
+        Load an existing table.
+
+        Cached tables are shared between threads and may be up to the cache
+        TTL behind commits made by other processes; see ``TableCache``.
+
+        Args:
+            namespace: Table namespace
+            table_name: Table name
+            refresh: Bypass the cache and reload the table metadata
+
+        Returns:
+            The loaded table
+        """
+        identifier = f"{namespace}.{table_name}"
+        if not refresh:
+            table = self.table_cache.get(identifier)
+            if table is not None:
+                return table
+
         try:
-            return self.catalog.load_table(f"{namespace}.{table_name}")
+            table = self.catalog.load_table(identifier)
+            self.table_cache.put(identifier, table)
+            return table
         except NoSuchTableError:
             raise IcebergError(
                 f"Table not found: {namespace}.{table_name}",
@@ -203,6 +267,7 @@ class IcebergCatalog:
     def drop_table(self, namespace: str, table_name: str, purge: bool = False) -> None:
         """Drop a table."""
         identifier = f"{namespace}.{table_name}"
+        self.table_cache.invalidate(identifier)
         try:
             self.catalog.drop_table(identifier, purge=purge)
             self.logger.info("Dropped table", table=identifier, purge=purge)
@@ -224,6 +289,7 @@ class IcebergCatalog:
         """Rename a table."""
         old_identifier = f"{namespace}.{old_name}"
         new_identifier = f"{namespace}.{new_name}"
+        self.table_cache.invalidate(old_identifier)
         try:
             self.catalog.rename_table(old_identifier, new_identifier)
             self.logger.info(
@@ -261,3 +327,55 @@ class IcebergCatalog:
         """Get all snapshots of a table."""
         table = self.load_table(namespace, table_name)
         return list(table.history())
+
+    # =========================================================================
+    # Table Cache
+    # =========================================================================
+
+    def cache_table(self, namespace: str, table_name: str, table: Table) -> None:
+        """Cache a table created or committed by this process."""
+        self.table_cache.put(f"{namespace}.{table_name}", table)
+
+    def invalidate(self, namespace: str, table_name: str | None = None) -> None:
+        """
+        Drop cached tables so the next load reads fresh metadata.
+
+        Called after failed commits, whose cached table may be stale.
+        """
+        if table_name is None:
+            self.table_cache.invalidate_namespace(namespace)
+        else:
+            self.table_cache.invalidate(f"{namespace}.{table_name}")
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Table cache size and hit/miss metrics."""
+        return self.table_cache.to_dict()
+
+
+def get_catalog(settings: Settings) -> IcebergCatalog:
+    """
+    Get the process-wide catalog for the configured Iceberg catalog.
+
+    Layers and table managers built from equivalent settings share one
+    catalog client and one table cache.
+    """
+    catalog_config = settings.iceberg.catalog
+    key = (
+        catalog_config.type.value,
+        catalog_config.name,
+        catalog_config.uri,
+        settings.get_warehouse_path(),
+    )
+
+    with _shared_catalogs_lock:
+        catalog = _shared_catalogs.get(key)
+        if catalog is None:
+            catalog = IcebergCatalog(settings)
+            _shared_catalogs[key] = catalog
+        return catalog
+
+
+def reset_catalogs() -> None:
+    """Forget the shared catalogs (e.g. after a configuration change)."""
+    with _shared_catalogs_lock:
+        _shared_catalogs.clear()
@@ -0,0 +1,154 @@
+"""Append-only changelog scans driven by Iceberg snapshot lineage."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import polars as pl
+import structlog
+from pyiceberg.expressions import AlwaysTrue
+from pyiceberg.io.pyarrow import ArrowScan
+from pyiceberg.manifest import DataFile, DataFileContent, ManifestEntryStatus
+from pyiceberg.table import FileScanTask, Table
+from pyiceberg.table.snapshots import Operation, Snapshot
+
+from automic_etl.storage.iceberg.compaction import COMPACTION_OPERATION
+
+logger = structlog.get_logger()
+
+# Snapshot operations that add rows without removing or changing existing ones
+APPEND_OPERATIONS = {Operation.APPEND}
+
+# Snapshot operations that only reorganize existing rows (e.g. compaction)
+# and can be skipped by a changelog reader
+NO_CHANGE_OPERATIONS = {Operation.REPLACE}
+
+# Values of the ``automic.operation`` snapshot property marking rewrites that
+# do not change table contents (committed as overwrites by PyIceberg)
+NO_CHANGE_AUTOMIC_OPERATIONS = {COMPACTION_OPERATION}
+
+
+@dataclass
+class AppendedData:
+    """Rows appended to a table between two snapshots."""
+
+    df: pl.DataFrame
+    snapshot_id: int | None = None
+    since_snapshot_id: int | None = None
+    snapshots_read: int = 0
+    files_read: list[str] = field(default_factory=list)
+
+
+def snapshots_since(table: Table, since_snapshot_id: int) -> list[Snapshot] | None:
+    """
+    Collect the snapshots committed after a given snapshot, oldest first.
+
+    Walks the parent chain back from the current snapshot. Returns None if
+    ``since_snapshot_id`` is not an ancestor of the current snapshot, e.g.
+    because it was expired or the table was rolled back.
+    """
+    chain: list[Snapshot] = []
+    snapshot = table.current_snapshot()
+
+    while snapshot is not None and snapshot.snapshot_id != since_snapshot_id:
+        chain.append(snapshot)
+        if snapshot.parent_snapshot_id is None:
+            return None
+        snapshot = table.snapshot_by_id(snapshot.parent_snapshot_id)
+
+    if snapshot is None:
+        return None
+
+    chain.reverse()
+    return chain
+
+
+def appended_data_files(table: Table, snapshot: Snapshot) -> list[DataFile]:
+    """List the data files added by a single snapshot."""
+    files: list[DataFile] = []
+    for manifest in snapshot.manifests(table.io):
+        if manifest.added_snapshot_id != snapshot.snapshot_id:
+            continue
+        for entry in manifest.fetch_manifest_entry(table.io, discard_deleted=True):
+            if (
+                entry.status == ManifestEntryStatus.ADDED
+                and entry.data_file.content == DataFileContent.DATA
+            ):
+                files.append(entry.data_file)
+    return files
+
+
+def plan_appended_files(
+    table: Table,
+    since_snapshot_id: int,
+) -> tuple[list[DataFile], int] | None:
+    """
+    Plan the data files appended after a snapshot.
+
+    Only the manifests written by the new snapshots are opened, so planning
+    cost is proportional to the number of commits since the checkpoint, not
+    to the size of the table.
+
+    Args:
+        table: Table to plan against
+        since_snapshot_id: Last snapshot already consumed
+
+    Returns:
+        Tuple of (added data files, number of snapshots covered), or None if
+        the history since the checkpoint is not append-only and the caller
+        has to fall back to a filtered scan
+    """
+    snapshots = snapshots_since(table, since_snapshot_id)
+    if snapshots is None:
+        logger.info(
+            "Checkpoint snapshot is not an ancestor of the current snapshot",
+            table=".".join(table.name()),
+            since_snapshot_id=since_snapshot_id,
+        )
+        return None
+
+    files: list[DataFile] = []
+    for snapshot in snapshots:
+        operation = snapshot.summary.operation if snapshot.summary else None
+        if operation in NO_CHANGE_OPERATIONS or _is_rewrite(snapshot):
+            continue
+        if operation not in APPEND_OPERATIONS:
+            logger.info(
+                "Snapshot history is not append-only",
+                table=".".join(table.name()),
+                snapshot_id=snapshot.snapshot_id,
+                operation=operation.value if operation else None,
+            )
+            return None
+        files.extend(appended_data_files(table, snapshot))
+
+    return files, len(snapshots)
+
+
+def _is_rewrite(snapshot: Snapshot) -> bool:
+    """Whether a snapshot was committed by an automic rewrite such as compaction."""
+    if snapshot.summary is None:
+        return False
+    return snapshot.summary.get("automic.operation") in NO_CHANGE_AUTOMIC_OPERATIONS
+
+
+def read_data_files(
+    table: Table,
+    files: list[DataFile],
+    columns: list[str] | None = None,
+) -> pl.DataFrame:
+    """Read a set of data files with the table's current schema."""
+    schema = table.schema()
+    projected = schema.select(*columns) if columns else schema
+
+    if not files:
+        return pl.from_arrow(projected.as_arrow().empty_table())
+
+    arrow_scan = ArrowScan(
+        table_metadata=table.metadata,
+        io=table.io,
+        projected_schema=projected,
+        row_filter=AlwaysTrue(),
+    )
+    tasks = [FileScanTask(data_file) for data_file in files]
+    return pl.from_arrow(arrow_scan.to_table(tasks=tasks))
@@ -0,0 +1,384 @@
+"""Small-file compaction and sort/Z-order rewrites for Iceberg tables."""
+
+from __future__ import annotations
+
+import itertools
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import polars as pl
+import pyarrow as pa
+import structlog
+from pyiceberg.expressions import AlwaysTrue
+from pyiceberg.io.pyarrow import ArrowScan, _dataframe_to_data_files
+from pyiceberg.manifest import DataFile
+from pyiceberg.table import FileScanTask, Table
+
+from automic_etl.storage.iceberg.expressions import translate_filter
+
+logger = structlog.get_logger()
+
+# Value of the ``automic.operation`` snapshot property for compaction commits.
+# Such snapshots rewrite existing rows without changing table contents.
+COMPACTION_OPERATION = "compact"
+
+# Bits available to the interleaved Z-order key, and per column so that the
+# scaled ranks cannot overflow UInt64 before interleaving
+ZORDER_KEY_BITS = 63
+ZORDER_MAX_COLUMN_BITS = 20
+
+
+@dataclass
+class CompactionGroup:
+    """A bin of small files from one partition rewritten together."""
+
+    partition: dict[str, Any]
+    tasks: list[FileScanTask] = field(default_factory=list)
+
+    @property
+    def input_files(self) -> int:
+        """Number of data files in the bin."""
+        return len(self.tasks)
+
+    @property
+    def input_bytes(self) -> int:
+        """Total size of the data files in the bin."""
+        return sum(task.file.file_size_in_bytes for task in self.tasks)
+
+    @property
+    def input_rows(self) -> int:
+        """Total record count of the data files in the bin."""
+        return sum(task.file.record_count for task in self.tasks)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "partition": {k: str(v) for k, v in self.partition.items()},
+            "input_files": self.input_files,
+            "input_bytes": self.input_bytes,
+            "input_rows": self.input_rows,
+        }
+
+
+@dataclass
+class CompactionResult:
+    """Outcome (or dry-run plan) of a compaction."""
+
+    table: str
+    dry_run: bool = False
+    groups: list[CompactionGroup] = field(default_factory=list)
+    files_added: int = 0
+    bytes_added: int = 0
+    snapshot_id: int | None = None
+    missing_columns: list[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def files_rewritten(self) -> int:
+        """Number of data files replaced (or that would be replaced)."""
+        return sum(group.input_files for group in self.groups)
+
+    @property
+    def bytes_rewritten(self) -> int:
+        """Bytes of data files replaced (or that would be replaced)."""
+        return sum(group.input_bytes for group in self.groups)
+
+    @property
+    def partitions(self) -> int:
+        """Number of distinct partitions touched."""
+        return len({tuple(group.partition.items()) for group in self.groups})
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "table": self.table,
+            "dry_run": self.dry_run,
+            "partitions": self.partitions,
+            "groups": len(self.groups),
+            "files_rewritten": self.files_rewritten,
+            "bytes_rewritten": self.bytes_rewritten,
+            "files_added": self.files_added,
+            "bytes_added": self.bytes_added,
+            "snapshot_id": self.snapshot_id,
+            "missing_columns": self.missing_columns,
+            "error": self.error,
+        }
+
+
+class CompactionEngine:
+    """
+    Bin-pack small data files per partition into files near a target size.
+
+    Compaction:
+    1. Plans the live data files (optionally restricted by a partition filter)
+       and keeps files smaller than ``small_file_ratio * target_file_size_bytes``
+       or carrying delete files
+    2. Groups candidates by partition and bin-packs them into groups of at
+       most the target size (first-fit decreasing)
+    3. Rewrites groups in parallel, optionally sorted or Z-ordered so that
+       column statistics prune better on the sort columns
+    4. Commits all replaced and added files as a single snapshot
+
+    The snapshot carries ``automic.operation=compact`` so incremental readers
+    know it does not change table contents. Sort or Z-order columns the table
+    does not have are ignored and reported in ``missing_columns``.
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        target_file_size_bytes: int,
+        small_file_ratio: float = 0.75,
+        min_input_files: int = 2,
+        sort_by: list[str] | None = None,
+        zorder_by: list[str] | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        if sort_by and zorder_by:
+            raise ValueError("Specify either sort_by or zorder_by, not both")
+
+        self.table = table
+        self.target_file_size_bytes = target_file_size_bytes
+        self.small_file_ratio = small_file_ratio
+        self.min_input_files = min_input_files
+        columns = set(table.schema().column_names)
+        self.missing_columns = [c for c in sort_by or zorder_by or [] if c not in columns]
+        self.sort_by = [c for c in sort_by or [] if c in columns]
+        self.zorder_by = [c for c in zorder_by or [] if c in columns]
+        self.max_workers = max_workers
+        self.logger = logger.bind(
+            component="iceberg_compaction",
+            table=".".join(table.name()),
+        )
+        if self.missing_columns:
+            self.logger.warning(
+                "Ignoring sort columns missing from table",
+                columns=self.missing_columns,
+            )
+
+    def plan(
+        self,
+        partition_filter: str | None = None,
+        rewrite_all: bool = False,
+    ) -> list[CompactionGroup]:
+        """
+        Plan the groups of files to rewrite.
+
+        Args:
+            partition_filter: Restrict compaction to files matching this
+                filter, e.g. ``"_ingestion_date = '2024-01-01'"``
+            rewrite_all: Rewrite every file regardless of size, e.g. to apply
+                a new sort order
+
+        Returns:
+            List of file groups, one per output bin
+        """
+        if self.table.current_snapshot() is None:
+            return []
+
+        row_filter = AlwaysTrue()
+        if partition_filter:
+            translated = translate_filter(partition_filter, self.table.schema())
+            if not translated.is_fully_pushed:
+                raise ValueError(
+                    f"Partition filter cannot be evaluated by Iceberg: {translated.residual}"
+                )
+            row_filter = translated.row_filter
+
+        threshold = self.target_file_size_bytes * self.small_file_ratio
+        by_partition: dict[tuple[Any, ...], list[FileScanTask]] = {}
+        for task in self.table.scan(row_filter=row_filter).plan_files():
+            if rewrite_all or task.delete_files or task.file.file_size_in_bytes < threshold:
+                key = (task.file.spec_id, *self._partition_values(task.file))
+                by_partition.setdefault(key, []).append(task)
+
+        groups: list[CompactionGroup] = []
+        for tasks in by_partition.values():
+            has_deletes = any(task.delete_files for task in tasks)
+            if len(tasks) < self.min_input_files and not has_deletes and not rewrite_all:
+                continue
+
+            partition = self._partition_dict(tasks[0].file)
+            for bin_tasks in self._bin_pack(tasks):
+                if len(bin_tasks) > 1 or rewrite_all or any(t.delete_files for t in bin_tasks):
+                    groups.append(CompactionGroup(partition=partition, tasks=bin_tasks))
+
+        return groups
+
+    def run(
+        self,
+        partition_filter: str | None = None,
+        rewrite_all: bool = False,
+        dry_run: bool = False,
+    ) -> CompactionResult:
+        """
+        Compact the table.
+
+        Args:
+            partition_filter: Restrict compaction to matching partitions
+            rewrite_all: Rewrite every file regardless of size
+            dry_run: Only report the files and bytes that would be rewritten
+
+        Returns:
+            CompactionResult with the plan and, unless dry-run, the commit
+        """
+        result = CompactionResult(
+            table=".".join(self.table.name()),
+            dry_run=dry_run,
+            groups=self.plan(partition_filter, rewrite_all),
+            missing_columns=self.missing_columns,
+        )
+
+        if dry_run or not result.groups:
+            self.logger.info("Planned compaction", **result.to_dict())
+            return result
+
+        commit_uuid = uuid.uuid4()
+        counter = itertools.count(0)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            outputs = list(
+                executor.map(
+                    lambda group: self._rewrite_group(group, commit_uuid, counter),
+                    result.groups,
+                )
+            )
+
+        added = [data_file for files in outputs for data_file in files]
+        result.files_added = len(added)
+        result.bytes_added = sum(f.file_size_in_bytes for f in added)
+
+        self._commit(result, added, commit_uuid)
+        return result
+
+    # =========================================================================
+    # Helper Methods
+    # =========================================================================
+
+    def _bin_pack(self, tasks: list[FileScanTask]) -> list[list[FileScanTask]]:
+        """Pack files into bins of at most the target size (first-fit decreasing)."""
+        bins: list[tuple[int, list[FileScanTask]]] = []
+        for task in sorted(tasks, key=lambda t: t.file.file_size_in_bytes, reverse=True):
+            size = task.file.file_size_in_bytes
+            for i, (used, bin_tasks) in enumerate(bins):
+                if used + size <= self.target_file_size_bytes:
+                    bin_tasks.append(task)
+                    bins[i] = (used + size, bin_tasks)
+                    break
+            else:
+                bins.append((size, [task]))
+        return [bin_tasks for _, bin_tasks in bins]
+
+    def _rewrite_group(
+        self,
+        group: CompactionGroup,
+        commit_uuid: uuid.UUID,
+        counter: itertools.count,
+    ) -> list[DataFile]:
+        """Read a bin of files, apply the sort order and write new files."""
+        arrow_table = ArrowScan(
+            table_metadata=self.table.metadata,
+            io=self.table.io,
+            projected_schema=self.table.schema(),
+            row_filter=AlwaysTrue(),
+        ).to_table(tasks=group.tasks)
+        df = pl.from_arrow(arrow_table)
+
+        if df.is_empty():
+            return []
+
+        if self.sort_by:
+            df = df.sort(self.sort_by, nulls_last=True)
+        elif self.zorder_by:
+            df = (
+                df.with_columns(zorder_key(self.zorder_by).alias("__zorder"))
+                .sort("__zorder")
+                .drop("__zorder")
+            )
+
+        schema = self._arrow_schema()
+        return list(
+            _dataframe_to_data_files(
+                table_metadata=self.table.metadata,
+                df=df.select(schema.names).to_arrow().cast(schema),
+                io=self.table.io,
+                write_uuid=commit_uuid,
+                counter=counter,
+            )
+        )
+
+    def _commit(
+        self,
+        result: CompactionResult,
+        added: list[DataFile],
+        commit_uuid: uuid.UUID,
+    ) -> None:
+        """Replace the compacted files with the new ones in a single snapshot."""
+        properties = {
+            "automic.operation": COMPACTION_OPERATION,
+            "automic.files-rewritten": str(result.files_rewritten),
+            "automic.files-added": str(result.files_added),
+        }
+
+        with self.table.transaction() as tx:
+            with tx.update_snapshot(snapshot_properties=properties).overwrite() as update:
+                update.commit_uuid = commit_uuid
+                for group in result.groups:
+                    for task in group.tasks:
+                        update.delete_data_file(task.file)
+                for data_file in added:
+                    update.append_data_file(data_file)
+
+        snapshot = self.table.current_snapshot()
+        result.snapshot_id = snapshot.snapshot_id if snapshot else None
+
+        self.logger.info("Compacted table", **result.to_dict())
+
+    def _arrow_schema(self) -> pa.Schema:
+        """Arrow schema matching the table schema, with all fields nullable."""
+        schema = self.table.schema().as_arrow()
+        return pa.schema([f.with_nullable(True) for f in schema])
+
+    @staticmethod
+    def _partition_values(data_file: DataFile) -> tuple[Any, ...]:
+        """Partition values of a data file as a hashable tuple."""
+        partition = data_file.partition
+        return tuple(partition[i] for i in range(len(partition)))
+
+    def _partition_dict(self, data_file: DataFile) -> dict[str, Any]:
+        """Partition values of a data file keyed by partition field name."""
+        spec = self.table.specs()[data_file.spec_id]
+        values = self._partition_values(data_file)
+        return {f.name: values[i] for i, f in enumerate(spec.fields)}
+
+
+def zorder_key(columns: list[str]) -> pl.Expr:
+    """
+    Build a Z-order (Morton) key expression over the given columns.
+
+    Each column is dense-ranked, scaled to a fixed number of bits, and the
+    bits of all columns are interleaved so that rows close in every column
+    end up close in the sort order.
+
+    Args:
+        columns: Columns to interleave
+
+    Returns:
+        UInt64 expression to sort by
+    """
+    bits = min(ZORDER_KEY_BITS // len(columns), ZORDER_MAX_COLUMN_BITS)
+    max_value = (1 << bits) - 1
+
+    scaled: list[pl.Expr] = []
+    for col in columns:
+        rank = pl.col(col).rank("dense").cast(pl.UInt64).fill_null(0)
+        top = pl.max_horizontal(rank.max(), pl.lit(1, dtype=pl.UInt64))
+        scaled.append(rank * max_value // top)
+
+    key = pl.lit(0, dtype=pl.UInt64)
+    for bit in range(bits):
+        for i, value in enumerate(scaled):
+            key = key + (value // (1 << bit) % 2) * (1 << (bit * len(columns) + i))
+    return key
@@ -0,0 +1,175 @@
+"""Translation of string filter expressions into Iceberg row filters."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+import polars as pl
+import pyarrow as pa
+import structlog
+from pyiceberg.expressions import AlwaysTrue, And, BooleanExpression, Not, Or
+from pyiceberg.expressions.parser import parse
+from pyiceberg.expressions.visitors import bind
+from pyiceberg.io.pyarrow import schema_to_pyarrow
+from pyiceberg.schema import Schema
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class TranslatedFilter:
+    """
+    A filter expression split into an Iceberg row filter and a Polars residual.
+
+    The row filter is pushed into the Iceberg scan so partition pruning and
+    manifest/file statistics can skip data before any Parquet is read. The
+    residual holds the conjuncts Iceberg cannot evaluate and is applied in
+    Polars after the scan.
+    """
+
+    row_filter: BooleanExpression = field(default_factory=AlwaysTrue)
+    residual: str | None = None
+    pushed: list[str] = field(default_factory=list)
+
+    @property
+    def is_fully_pushed(self) -> bool:
+        """Whether the whole expression is evaluated by the Iceberg scan."""
+        return self.residual is None
+
+    def residual_columns(self) -> list[str]:
+        """Columns referenced by the residual Polars filter."""
+        if self.residual is None:
+            return []
+        return pl.sql_expr(self.residual).meta.root_names()
+
+
+def split_conjuncts(filter_expr: str) -> list[str]:
+    """
+    Split a filter expression on its top-level AND operators.
+
+    AND keywords nested inside parentheses or string literals, and the AND
+    belonging to a BETWEEN clause, are left untouched. AND binds tighter
+    than OR, so an expression with a top-level OR is a single conjunct
+    (``a OR b AND c`` is ``a OR (b AND c)``) and is returned whole.
+    """
+    conjuncts: list[str] = []
+    has_top_level_or = False
+    depth = 0
+    quote: str | None = None
+    start = 0
+    pending_between = False
+    i = 0
+    text = filter_expr
+    upper = text.upper()
+
+    while i < len(text):
+        char = text[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ("'", '"'):
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif depth == 0 and _keyword_at(upper, i, "BETWEEN"):
+            pending_between = True
+            i += len("BETWEEN")
+            continue
+        elif depth == 0 and _keyword_at(upper, i, "AND"):
+            if pending_between:
+                pending_between = False
+            else:
+                conjuncts.append(text[start:i].strip())
+                start = i + len("AND")
+            i += len("AND")
+            continue
+        elif depth == 0 and _keyword_at(upper, i, "OR"):
+            has_top_level_or = True
+        i += 1
+
+    if has_top_level_or:
+        return [text.strip()]
+    conjuncts.append(text[start:].strip())
+    return [c for c in conjuncts if c]
+
+
+def translate_filter(filter_expr: str | None, schema: Schema) -> TranslatedFilter:
+    """
+    Translate a string filter into an Iceberg row filter plus Polars residual.
+
+    Each top-level conjunct is parsed with the Iceberg expression parser and
+    bound against the table schema. Conjuncts that fail to parse or bind
+    (functions, arithmetic, unknown columns, incompatible literals) are kept
+    in the residual and evaluated by Polars after the scan. So are conjuncts
+    with a numeric literal that does not convert to its column's type
+    without loss (``id > 2.7`` on an integer column), since binding would
+    round it and select different rows than Polars.
+
+    Args:
+        filter_expr: SQL-style boolean expression, e.g. ``"_scd_is_current = true"``
+        schema: Schema of the table being scanned
+
+    Returns:
+        TranslatedFilter with the pushed-down row filter and residual
+    """
+    result = TranslatedFilter()
+    if not filter_expr or not filter_expr.strip():
+        return result
+
+    arrow_schema = schema_to_pyarrow(schema, include_field_ids=False)
+    residual: list[str] = []
+    for conjunct in split_conjuncts(filter_expr):
+        try:
+            expression = parse(conjunct)
+            bind(schema, expression, case_sensitive=True)
+            _check_literals(expression, arrow_schema)
+        except Exception as e:
+            logger.debug(
+                "Filter conjunct not pushed down",
+                conjunct=conjunct,
+                reason=type(e).__name__,
+            )
+            residual.append(conjunct)
+            continue
+
+        result.row_filter = And(result.row_filter, expression)
+        result.pushed.append(conjunct)
+
+    if residual:
+        result.residual = " AND ".join(f"({c})" for c in residual)
+
+    return result
+
+
+def _check_literals(expression: BooleanExpression, schema: pa.Schema) -> None:
+    """Raise if a numeric literal does not convert to its column's type without loss."""
+    if isinstance(expression, (And, Or)):
+        _check_literals(expression.left, schema)
+        _check_literals(expression.right, schema)
+        return
+    if isinstance(expression, Not):
+        _check_literals(expression.child, schema)
+        return
+
+    literals = getattr(expression, "literals", None)
+    if literals is None:
+        literal = getattr(expression, "literal", None)
+        literals = [] if literal is None else [literal]
+    for literal in literals:
+        value = literal.value
+        if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+            field_type = schema.field(expression.term.name).type
+            pa.scalar(value).cast(field_type)
+
+
+def _keyword_at(upper_text: str, index: int, keyword: str) -> bool:
+    """Check whether a whole-word keyword starts at the given index."""
+    end = index + len(keyword)
+    if upper_text[index:end] != keyword:
+        return False
+    before = upper_text[index - 1] if index > 0 else " "
+    after = upper_text[end] if end < len(upper_text) else " "
+    return not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_")
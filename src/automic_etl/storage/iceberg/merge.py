@@ -0,0 +1,460 @@
+"""Row-level MERGE for Iceberg tables using file-scoped copy-on-write."""
+
+from __future__ import annotations
+
+import itertools
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import polars as pl
+import pyarrow as pa
+import structlog
+from pyiceberg.expressions import (
+    AlwaysTrue,
+    And,
+    BooleanExpression,
+    GreaterThanOrEqual,
+    In,
+    LessThanOrEqual,
+)
+from pyiceberg.expressions.visitors import bind
+from pyiceberg.io.pyarrow import ArrowScan, _dataframe_to_data_files
+from pyiceberg.manifest import DataFile
+from pyiceberg.table import FileScanTask, Table
+
+from automic_etl.storage.iceberg.expressions import translate_filter
+
+logger = structlog.get_logger()
+
+# Above this many distinct values per key column, file pruning uses a
+# min/max range instead of an IN list to keep the predicate cheap to evaluate
+MAX_IN_LIST_VALUES = 1000
+
+
+@dataclass
+class MergeResult:
+    """
+    Outcome of a merge or row-level delete.
+
+    ``rows_updated`` counts source rows whose keys matched existing rows,
+    as ``IcebergTableManager.upsert`` always reported; for
+    ``update_matching`` it counts the table rows updated in place.
+    """
+
+    rows_inserted: int = 0
+    rows_updated: int = 0
+    rows_deleted: int = 0
+    files_scanned: int = 0
+    files_rewritten: int = 0
+    files_added: int = 0
+    snapshot_id: int | None = None
+    details: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "rows_inserted": self.rows_inserted,
+            "rows_updated": self.rows_updated,
+            "rows_deleted": self.rows_deleted,
+            "files_scanned": self.files_scanned,
+            "files_rewritten": self.files_rewritten,
+            "files_added": self.files_added,
+            "snapshot_id": self.snapshot_id,
+        }
+
+
+class MergeEngine:
+    """
+    Row-level MERGE and DELETE for a single Iceberg table.
+
+    Instead of reading and overwriting the whole table, the engine:
+    1. Plans candidate data files with a predicate on the key columns, so
+       partition values and column statistics prune files that cannot match
+    2. Reads candidate files one at a time and finds the matching rows
+    3. Rewrites only files that contain matches, with those rows removed or
+       updated in place
+    4. Commits the replaced and added files as a single snapshot
+
+    PyIceberg cannot write equality or position delete files, so format v2
+    tables are also handled copy-on-write; the cost is proportional to the
+    files touched rather than the table size.
+    """
+
+    def __init__(self, table: Table) -> None:
+        self.table = table
+        self.logger = logger.bind(
+            component="iceberg_merge",
+            table=".".join(table.name()),
+        )
+
+    def merge(
+        self,
+        source: pl.DataFrame,
+        key_columns: list[str],
+        when_matched_update: bool = True,
+        when_not_matched_insert: bool = True,
+    ) -> MergeResult:
+        """
+        Merge source rows into the table on key columns.
+
+        Args:
+            source: Rows to merge
+            key_columns: Columns identifying a row
+            when_matched_update: Replace existing rows whose keys match
+            when_not_matched_insert: Insert source rows without a match
+
+        Returns:
+            MergeResult with row and file counts
+        """
+        result = MergeResult()
+        if source.is_empty():
+            return result
+
+        source_keys = source.select(key_columns).unique()
+        table_keys = self._align_keys(source_keys, key_columns)
+        tasks = self._plan_files(self._key_predicate(table_keys, key_columns))
+        result.files_scanned = len(tasks)
+
+        commit_uuid = uuid.uuid4()
+        counter = itertools.count(0)
+        matched_keys: list[pl.DataFrame] = []
+
+        def rewrite(existing: pl.DataFrame) -> pl.DataFrame | None:
+            matched = existing.join(table_keys, on=key_columns, how="semi")
+            if matched.is_empty():
+                return None
+
+            matched_keys.append(matched.select(key_columns))
+            if not when_matched_update:
+                return None
+            return existing.join(table_keys, on=key_columns, how="anti")
+
+        replaced = self._rewrite_files(tasks, rewrite, commit_uuid, counter)
+
+        if matched_keys:
+            all_matched = pl.concat(matched_keys).unique().cast(source_keys.schema)
+            unmatched = source.join(all_matched, on=key_columns, how="anti")
+            matched_source = source.join(all_matched, on=key_columns, how="semi")
+        else:
+            unmatched = source
+            matched_source = source.clear()
+
+        to_append: list[pl.DataFrame] = []
+        if when_matched_update and not matched_source.is_empty():
+            to_append.append(matched_source)
+            result.rows_updated = len(matched_source)
+        if when_not_matched_insert and not unmatched.is_empty():
+            to_append.append(unmatched)
+            result.rows_inserted = len(unmatched)
+
+        added: list[DataFile] = []
+        if to_append:
+            added = self._write_files(pl.concat(to_append), commit_uuid, counter)
+
+        self._commit(replaced, added, commit_uuid, result, operation="merge")
+        return result
+
+    def delete_where(self, condition: str) -> MergeResult:
+        """
+        Delete rows matching a filter expression.
+
+        The pushable part of the condition prunes files; the full condition
+        is then evaluated per candidate file. Conjuncts that Iceberg would
+        evaluate differently from Polars (e.g. rounded literals) are never
+        used for pruning, so no file holding a matching row is skipped.
+
+        Args:
+            condition: Filter expression selecting rows to delete
+
+        Returns:
+            MergeResult with the number of rows deleted
+        """
+        result = MergeResult()
+        translated = translate_filter(condition, self.table.schema())
+        tasks = self._plan_files(translated.row_filter)
+        result.files_scanned = len(tasks)
+
+        predicate = pl.sql_expr(condition).fill_null(False)
+        commit_uuid = uuid.uuid4()
+        counter = itertools.count(0)
+
+        def rewrite(existing: pl.DataFrame) -> pl.DataFrame | None:
+            kept = existing.filter(~predicate)
+            deleted = len(existing) - len(kept)
+            if deleted == 0:
+                return None
+
+            result.rows_deleted += deleted
+            return kept
+
+        replaced = self._rewrite_files(tasks, rewrite, commit_uuid, counter)
+        self._commit(replaced, [], commit_uuid, result, operation="delete")
+        return result
+
+    def read_matching(
+        self,
+        keys: pl.DataFrame,
+        key_columns: list[str],
+        filter_expr: str | None = None,
+    ) -> pl.DataFrame:
+        """
+        Read only the rows whose keys appear in ``keys``.
+
+        Args:
+            keys: Key values to look up
+            key_columns: Columns identifying a row
+            filter_expr: Optional additional filter expression
+
+        Returns:
+            Matching rows from the table
+        """
+        keys = self._align_keys(keys.select(key_columns).unique(), key_columns)
+        if keys.is_empty():
+            return self._empty_frame()
+
+        translated = translate_filter(filter_expr, self.table.schema())
+        row_filter = And(self._key_predicate(keys, key_columns), translated.row_filter)
+        predicate = self._polars_predicate(filter_expr)
+
+        frames = [
+            self._read_task(task).filter(predicate).join(keys, on=key_columns, how="semi")
+            for task in self._plan_files(row_filter)
+        ]
+        if not frames:
+            return self._empty_frame()
+        return pl.concat(frames)
+
+    def update_matching(
+        self,
+        keys: pl.DataFrame,
+        key_columns: list[str],
+        updates: dict[str, pl.Expr],
+        filter_expr: str | None = None,
+        append: pl.DataFrame | None = None,
+        operation: str = "update",
+    ) -> MergeResult:
+        """
+        Update rows whose keys appear in ``keys`` in place.
+
+        Only files containing matching rows are rewritten. Optional rows to
+        append are written in the same snapshot, so an update and its
+        accompanying inserts become visible atomically.
+
+        Args:
+            keys: Key values of the rows to update
+            key_columns: Columns identifying a row
+            updates: Column name -> expression giving the new value
+            filter_expr: Optional additional filter rows must match
+            append: Optional rows to append in the same commit
+            operation: Operation name recorded in the snapshot summary
+
+        Returns:
+            MergeResult with rows updated and inserted
+        """
+        result = MergeResult()
+        keys = self._align_keys(keys.select(key_columns).unique(), key_columns)
+        commit_uuid = uuid.uuid4()
+        counter = itertools.count(0)
+        replaced: list[tuple[DataFile, list[DataFile]]] = []
+
+        if not keys.is_empty():
+            translated = translate_filter(filter_expr, self.table.schema())
+            row_filter = And(self._key_predicate(keys, key_columns), translated.row_filter)
+            tasks = self._plan_files(row_filter)
+            result.files_scanned = len(tasks)
+
+            predicate = self._polars_predicate(filter_expr)
+            marked_keys = keys.with_columns(pl.lit(True).alias("__matched"))
+
+            def rewrite(existing: pl.DataFrame) -> pl.DataFrame | None:
+                marked = existing.join(marked_keys, on=key_columns, how="left")
+                is_match = pl.col("__matched").fill_null(False) & predicate
+                matched = marked.select(is_match.sum()).item()
+                if not matched:
+                    return None
+
+                result.rows_updated += matched
+                return marked.with_columns([
+                    pl.when(is_match)
+                    .then(expr.cast(existing.schema[col]))
+                    .otherwise(pl.col(col))
+                    .alias(col)
+                    for col, expr in updates.items()
+                ]).select(existing.columns)
+
+            replaced = self._rewrite_files(tasks, rewrite, commit_uuid, counter)
+
+        added: list[DataFile] = []
+        if append is not None and not append.is_empty():
+            added = self._write_files(append, commit_uuid, counter)
+            result.rows_inserted = len(append)
+
+        self._commit(replaced, added, commit_uuid, result, operation=operation)
+        return result
+
+    # =========================================================================
+    # Helper Methods
+    # =========================================================================
+
+    def _key_predicate(
+        self,
+        source_keys: pl.DataFrame,
+        key_columns: list[str],
+    ) -> BooleanExpression:
+        """
+        Build a file-pruning predicate from the source keys.
+
+        The predicate is a superset of the matching rows: each key column is
+        constrained by an IN list or a min/max range, and exact matching
+        happens when candidate files are read.
+        """
+        predicate: BooleanExpression = AlwaysTrue()
+        schema = self.table.schema()
+
+        for col in key_columns:
+            values = source_keys.get_column(col).drop_nulls().unique()
+            if values.is_empty():
+                continue
+
+            if len(values) <= MAX_IN_LIST_VALUES:
+                expr: BooleanExpression = In(col, set(values.to_list()))
+            else:
+                expr = And(
+                    GreaterThanOrEqual(col, values.min()),
+                    LessThanOrEqual(col, values.max()),
+                )
+
+            try:
+                bind(schema, expr, case_sensitive=True)
+            except Exception as e:
+                self.logger.debug("Key column not used for pruning", column=col, reason=str(e))
+                continue
+
+            predicate = And(predicate, expr)
+
+        return predicate
+
+    def _align_keys(self, keys: pl.DataFrame, key_columns: list[str]) -> pl.DataFrame:
+        """Cast key values to the table's column types so joins line up."""
+        table_schema = self._empty_frame().schema
+        return keys.cast({col: table_schema[col] for col in key_columns})
+
+    def _empty_frame(self) -> pl.DataFrame:
+        """An empty DataFrame with the table's schema."""
+        return pl.from_arrow(self._arrow_schema().empty_table())
+
+    def _plan_files(self, row_filter: BooleanExpression) -> list[FileScanTask]:
+        """Plan the data files that may contain rows matching the filter."""
+        if self.table.current_snapshot() is None:
+            return []
+        return list(self.table.scan(row_filter=row_filter).plan_files())
+
+    def _rewrite_files(
+        self,
+        tasks: list[FileScanTask],
+        rewrite: Callable[[pl.DataFrame], pl.DataFrame | None],
+        commit_uuid: uuid.UUID,
+        counter: itertools.count,
+    ) -> list[tuple[DataFile, list[DataFile]]]:
+        """
+        Read candidate files one at a time and rewrite those that change.
+
+        The rewrite callback returns the new file contents, or None to leave
+        the file untouched.
+        """
+        replaced: list[tuple[DataFile, list[DataFile]]] = []
+        for task in tasks:
+            new_contents = rewrite(self._read_task(task))
+            if new_contents is None:
+                continue
+            replaced.append((task.file, self._write_files(new_contents, commit_uuid, counter)))
+        return replaced
+
+    def _polars_predicate(self, filter_expr: str | None) -> pl.Expr:
+        """Polars equivalent of a filter expression, treating nulls as false."""
+        if not filter_expr:
+            return pl.lit(True)
+        return pl.sql_expr(filter_expr).fill_null(False)
+
+    def _read_task(self, task: FileScanTask) -> pl.DataFrame:
+        """Read one data file, applying any delete files attached to it."""
+        arrow_table = ArrowScan(
+            table_metadata=self.table.metadata,
+            io=self.table.io,
+            projected_schema=self.table.schema(),
+            row_filter=AlwaysTrue(),
+        ).to_table(tasks=[task])
+        return pl.from_arrow(arrow_table)
+
+    def _write_files(
+        self,
+        df: pl.DataFrame,
+        commit_uuid: uuid.UUID,
+        counter: itertools.count,
+    ) -> list[DataFile]:
+        """Write rows as new data files using the table's partition spec."""
+        if df.is_empty():
+            return []
+
+        schema = self._arrow_schema()
+        arrow_table = df.select(schema.names).to_arrow().cast(schema)
+        return list(
+            _dataframe_to_data_files(
+                table_metadata=self.table.metadata,
+                df=arrow_table,
+                io=self.table.io,
+                write_uuid=commit_uuid,
+                counter=counter,
+            )
+        )
+
+    def _arrow_schema(self) -> pa.Schema:
+        """Arrow schema matching the table schema, with all fields nullable."""
+        schema = self.table.schema().as_arrow()
+        return pa.schema([f.with_nullable(True) for f in schema])
+
+    def _commit(
+        self,
+        replaced: list[tuple[DataFile, list[DataFile]]],
+        added: list[DataFile],
+        commit_uuid: uuid.UUID,
+        result: MergeResult,
+        operation: str,
+    ) -> None:
+        """Commit replaced and added data files as a single snapshot."""
+        result.files_rewritten = len(replaced)
+        result.files_added = len(added) + sum(len(new) for _, new in replaced)
+
+        if not replaced and not added:
+            self.logger.info("Nothing to commit", operation=operation)
+            return
+
+        properties = {
+            "automic.operation": operation,
+            "automic.rows-inserted": str(result.rows_inserted),
+            "automic.rows-updated": str(result.rows_updated),
+            "automic.rows-deleted": str(result.rows_deleted),
+        }
+
+        with self.table.transaction() as tx:
+            snapshot_update = tx.update_snapshot(snapshot_properties=properties)
+            producer = snapshot_update.overwrite() if replaced else snapshot_update.fast_append()
+            with producer as update:
+                update.commit_uuid = commit_uuid
+                for original, new_files in replaced:
+                    update.delete_data_file(original)
+                    for data_file in new_files:
+                        update.append_data_file(data_file)
+                for data_file in added:
+                    update.append_data_file(data_file)
+
+        snapshot = self.table.current_snapshot()
+        result.snapshot_id = snapshot.snapshot_id if snapshot else None
+
+        self.logger.info(
+            "Committed row-level changes",
+            operation=operation,
+            **result.to_dict(),
+        )
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
 import polars as pl
 import pyarrow as pa
 import structlog
-from pyiceberg.partitioning import PartitionSpec, PartitionField
+from pyiceberg.partitioning import UNPARTITIONED_PARTITION_SPEC, PartitionSpec, PartitionField
 from pyiceberg.schema import Schema
-from pyiceberg.table import Table
-from pyiceberg.table.sorting import SortOrder
+from pyiceberg.table import DataScan, Table
+from pyiceberg.table.sorting import UNSORTED_SORT_ORDER, SortOrder
 from pyiceberg.transforms import (
     DayTransform,
     HourTransform,
@@ -24,18 +25,29 @@ from pyiceberg.transforms import (
 
 from automic_etl.core.config import Settings
 from automic_etl.core.exceptions import IcebergError
-from automic_etl.storage.iceberg.catalog import IcebergCatalog
+from automic_etl.storage.iceberg.catalog import get_catalog
+from automic_etl.storage.iceberg.changelog import (
+    AppendedData,
+    plan_appended_files,
+    read_data_files,
+)
+from automic_etl.storage.iceberg.compaction import CompactionEngine, CompactionResult
+from automic_etl.storage.iceberg.expressions import TranslatedFilter, translate_filter
+from automic_etl.storage.iceberg.merge import MergeEngine, MergeResult
 from automic_etl.storage.iceberg.schemas import schema_from_polars
 
 logger = structlog.get_logger()
 
+# Default upper bound on rows per record batch for streaming reads
+DEFAULT_BATCH_SIZE = 100_000
+
 
 class IcebergTableManager:
     """Manager for Iceberg table operations."""
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self.catalog = IcebergCatalog(settings)
+        self.catalog = get_catalog(settings)
         self.logger = logger.bind(component="iceberg_tables")
 
     # =========================================================================
@@ -85,11 +97,12 @@ class IcebergTableManager:
             table = self.catalog.catalog.create_table(
                 identifier=identifier,
                 schema=schema,
-                partition_spec=partition_spec,
-                sort_order=sort_order,
+                partition_spec=partition_spec or UNPARTITIONED_PARTITION_SPEC,
+                sort_order=sort_order or UNSORTED_SORT_ORDER,
                 location=location,
                 properties=default_properties,
             )
+            self.catalog.cache_table(namespace, table_name, table)
             self.logger.info(
                 "Created table",
                 table=identifier,
@@ -111,6 +124,7 @@ class IcebergTableManager:
         partition_columns: list[str] | None = None,
         sort_columns: list[str] | None = None,
         properties: dict[str, str] | None = None,
+        bucket_columns: dict[str, int] | None = None,
     ) -> Table:
         """
         Create a table from a Polars DataFrame schema.
@@ -122,6 +136,7 @@ class IcebergTableManager:
             partition_columns: Columns to partition by
             sort_columns: Columns to sort by
             properties: Optional table properties
+            bucket_columns: Columns to hash-partition, mapped to bucket counts
 
         Returns:
             The created Table
@@ -129,8 +144,10 @@ class IcebergTableManager:
         schema = schema_from_polars(df)
 
         partition_spec = None
-        if partition_columns:
-            partition_spec = self._build_partition_spec(schema, partition_columns)
+        if partition_columns or bucket_columns:
+            partition_spec = self._build_partition_spec(
+                schema, partition_columns or [], bucket_columns
+            )
 
         sort_order = None
         if sort_columns:
@@ -174,6 +191,7 @@ class IcebergTableManager:
         namespace: str,
         table_name: str,
         df: pl.DataFrame,
+        properties: dict[str, str] | None = None,
     ) -> int:
         """
         Append data to an existing table.
@@ -182,6 +200,8 @@ class IcebergTableManager:
             namespace: Table namespace
             table_name: Table name
             df: Data to append
+            properties: Table properties to set in the same commit as the
+                appended data, e.g. a processing checkpoint
 
         Returns:
             Number of rows appended
@@ -192,7 +212,10 @@ class IcebergTableManager:
         arrow_table = df.to_arrow()
 
         try:
-            table.append(arrow_table)
+            with table.transaction() as tx:
+                tx.append(arrow_table)
+                if properties:
+                    tx.set_properties(properties)
             self.logger.info(
                 "Appended data",
                 table=f"{namespace}.{table_name}",
@@ -200,6 +223,7 @@ class IcebergTableManager:
             )
             return len(df)
         except Exception as e:
+            self.catalog.invalidate(namespace, table_name)
             raise IcebergError(
                 f"Failed to append data: {str(e)}",
                 table=f"{namespace}.{table_name}",
@@ -237,66 +261,156 @@ class IcebergTableManager:
             )
             return len(df)
         except Exception as e:
+            self.catalog.invalidate(namespace, table_name)
             raise IcebergError(
                 f"Failed to overwrite data: {str(e)}",
                 table=f"{namespace}.{table_name}",
                 operation="overwrite",
             )
 
-    def upsert(
+    def merge(
         self,
         namespace: str,
         table_name: str,
         df: pl.DataFrame,
         key_columns: list[str],
-    ) -> tuple[int, int]:
+        when_matched_update: bool = True,
+        when_not_matched_insert: bool = True,
+    ) -> MergeResult:
         """
-        Upsert data (insert or update based on key columns).
+        Merge rows into a table on key columns.
+
+        Only data files that can contain the merged keys (by partition values
+        and column statistics) are read, only files with matching rows are
+        rewritten, and all changes are committed as one snapshot.
 
         Args:
             namespace: Table namespace
             table_name: Table name
-            df: Data to upsert
+            df: Rows to merge
             key_columns: Columns to use as keys
+            when_matched_update: Replace existing rows whose keys match
+            when_not_matched_insert: Insert rows without a match
 
         Returns:
-            Tuple of (rows_inserted, rows_updated)
+            MergeResult with rows inserted/updated and files rewritten
         """
-        # Read existing data
-        existing_df = self.read(namespace, table_name)
-
-        if existing_df.is_empty():
-            # No existing data, just append
-            self.append(namespace, table_name, df)
-            return len(df), 0
-
-        # Identify new and existing rows
-        new_rows = df.join(
-            existing_df.select(key_columns),
-            on=key_columns,
-            how="anti",
-        )
+        table = self.catalog.load_table(namespace, table_name)
 
-        updated_rows = df.join(
-            existing_df.select(key_columns),
-            on=key_columns,
-            how="inner",
-        )
+        try:
+            return MergeEngine(table).merge(
+                df,
+                key_columns=key_columns,
+                when_matched_update=when_matched_update,
+                when_not_matched_insert=when_not_matched_insert,
+            )
+        except Exception as e:
+            self.catalog.invalidate(namespace, table_name)
+            raise IcebergError(
+                f"Failed to merge data: {str(e)}",
+                table=f"{namespace}.{table_name}",
+                operation="merge",
+            )
 
-        # Get rows from existing that aren't being updated
-        unchanged_rows = existing_df.join(
-            df.select(key_columns),
-            on=key_columns,
-            how="anti",
-        )
+    def read_matching(
+        self,
+        namespace: str,
+        table_name: str,
+        keys: pl.DataFrame,
+        key_columns: list[str],
+        filter_expr: str | None = None,
+    ) -> pl.DataFrame:
+        """
+        Read only rows whose key columns match the given keys.
 
-        # Combine unchanged + updated + new
-        result_df = pl.concat([unchanged_rows, updated_rows, new_rows])
+        Args:
+            namespace: Table namespace
+            table_name: Table name
+            keys: DataFrame of key values to look up
+            key_columns: Columns to match on
+            filter_expr: Optional additional filter expression
 
-        # Overwrite table
-        self.overwrite(namespace, table_name, result_df)
+        Returns:
+            Matching rows
+        """
+        table = self.catalog.load_table(namespace, table_name)
+
+        try:
+            return MergeEngine(table).read_matching(keys, key_columns, filter_expr)
+        except Exception as e:
+            raise IcebergError(
+                f"Failed to read matching rows: {str(e)}",
+                table=f"{namespace}.{table_name}",
+                operation="read_matching",
+            )
+
+    def update_matching(
+        self,
+        namespace: str,
+        table_name: str,
+        keys: pl.DataFrame,
+        key_columns: list[str],
+        updates: dict[str, pl.Expr],
+        filter_expr: str | None = None,
+        append: pl.DataFrame | None = None,
+        operation: str = "update",
+    ) -> MergeResult:
+        """
+        Update matching rows in place and optionally append rows, in one commit.
 
-        return len(new_rows), len(updated_rows)
+        Args:
+            namespace: Table namespace
+            table_name: Table name
+            keys: DataFrame of key values identifying rows to update
+            key_columns: Columns to match on
+            updates: Column name -> expression for the new value
+            filter_expr: Optional additional filter rows must match
+            append: Optional rows to append in the same snapshot
+            operation: Operation name recorded in the snapshot summary
+
+        Returns:
+            MergeResult with rows updated and inserted
+        """
+        table = self.catalog.load_table(namespace, table_name)
+
+        try:
+            return MergeEngine(table).update_matching(
+                keys,
+                key_columns,
+                updates,
+                filter_expr=filter_expr,
+                append=append,
+                operation=operation,
+            )
+        except Exception as e:
+            self.catalog.invalidate(namespace, table_name)
+            raise IcebergError(
+                f"Failed to update rows: {str(e)}",
+                table=f"{namespace}.{table_name}",
+                operation=operation,
+            )
+
+    def upsert(
+        self,
+        namespace: str,
+        table_name: str,
+        df: pl.DataFrame,
+        key_columns: list[str],
+    ) -> tuple[int, int]:
+        """
+        Upsert data (insert or update based on key columns).
+
+        Args:
+            namespace: Table namespace
+            table_name: Table name
+            df: Data to upsert
+            key_columns: Columns to use as keys
+
+        Returns:
+            Tuple of (rows_inserted, rows_updated)
+        """
+        result = self.merge(namespace, table_name, df, key_columns)
+        return result.rows_inserted, result.rows_updated
 
     def delete(
         self,
@@ -307,6 +421,9 @@ class IcebergTableManager:
         """
         Delete rows matching a condition.
 
+        Only data files that may contain matching rows are read, and only
+        those with matches are rewritten.
+
         Args:
             namespace: Table namespace
             table_name: Table name
@@ -318,24 +435,16 @@ class IcebergTableManager:
         table = self.catalog.load_table(namespace, table_name)
 
         try:
-            # Read current data
-            df = self.read(namespace, table_name)
-            original_count = len(df)
-
-            # Filter out rows to delete
-            remaining_df = df.filter(~pl.sql_expr(condition))
-
-            # Overwrite with remaining data
-            self.overwrite(namespace, table_name, remaining_df)
-
-            deleted_count = original_count - len(remaining_df)
+            result = MergeEngine(table).delete_where(condition)
             self.logger.info(
                 "Deleted rows",
                 table=f"{namespace}.{table_name}",
-                deleted=deleted_count,
+                deleted=result.rows_deleted,
+                files_rewritten=result.files_rewritten,
             )
-            return deleted_count
+            return result.rows_deleted
         except Exception as e:
+            self.catalog.invalidate(namespace, table_name)
             raise IcebergError(
                 f"Failed to delete data: {str(e)}",
                 table=f"{namespace}.{table_name}",
@@ -357,6 +466,10 @@ class IcebergTableManager:
         """
         Read data from a table.
 
+        The filter expression is translated into an Iceberg row filter so
+        partition pruning and file statistics skip data before it is read.
+        Predicates Iceberg cannot evaluate are applied in Polars afterwards.
+
         Args:
             namespace: Table namespace
             table_name: Table name
@@ -370,18 +483,14 @@ class IcebergTableManager:
         table = self.catalog.load_table(namespace, table_name)
 
         try:
-            scan = table.scan(
-                selected_fields=tuple(columns) if columns else (),
+            scan, translated = self._build_scan(
+                table,
+                columns=columns,
+                filter_expr=filter_expr,
                 limit=limit,
             )
-
-            arrow_table = scan.to_arrow()
-            df = pl.from_arrow(arrow_table)
-
-            if filter_expr:
-                df = df.filter(pl.sql_expr(filter_expr))
-
-            return df
+            df = pl.from_arrow(scan.to_arrow())
+            return self._apply_residual(df, translated, columns, limit)
         except Exception as e:
             raise IcebergError(
                 f"Failed to read table: {str(e)}",
@@ -395,17 +504,22 @@ class IcebergTableManager:
         table_name: str,
         snapshot_id: int,
         columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        limit: int | None = None,
     ) -> pl.DataFrame:
         """Read data at a specific snapshot (time travel)."""
         table = self.catalog.load_table(namespace, table_name)
 
         try:
-            scan = table.scan(
-                selected_fields=tuple(columns) if columns else (),
+            scan, translated = self._build_scan(
+                table,
+                columns=columns,
+                filter_expr=filter_expr,
+                limit=limit,
                 snapshot_id=snapshot_id,
             )
-            arrow_table = scan.to_arrow()
-            return pl.from_arrow(arrow_table)
+            df = pl.from_arrow(scan.to_arrow())
+            return self._apply_residual(df, translated, columns, limit)
         except Exception as e:
             raise IcebergError(
                 f"Failed to read at snapshot: {str(e)}",
@@ -419,6 +533,7 @@ class IcebergTableManager:
         table_name: str,
         timestamp: datetime,
         columns: list[str] | None = None,
+        filter_expr: str | None = None,
     ) -> pl.DataFrame:
         """Read data at a specific timestamp (time travel)."""
         table = self.catalog.load_table(namespace, table_name)
@@ -438,7 +553,186 @@ class IcebergTableManager:
                 operation="read_at_timestamp",
             )
 
-        return self.read_at_snapshot(namespace, table_name, target_snapshot, columns)
+        return self.read_at_snapshot(
+            namespace, table_name, target_snapshot, columns, filter_expr
+        )
+
+    def read_appended_since(
+        self,
+        namespace: str,
+        table_name: str,
+        since_snapshot_id: int | None,
+        columns: list[str] | None = None,
+    ) -> AppendedData | None:
+        """
+        Read only the rows appended after a snapshot (append-only changelog).
+
+        The snapshot lineage since ``since_snapshot_id`` is walked and only
+        the data files added by those snapshots are read, so the cost is
+        proportional to the new data. Compaction (``replace``) snapshots are
+        skipped since they do not change table contents.
+
+        Args:
+            namespace: Table namespace
+            table_name: Table name
+            since_snapshot_id: Last snapshot already consumed, or None to
+                read the whole table
+            columns: Columns to read (None for all)
+
+        Returns:
+            AppendedData with the new rows and the snapshot they are current
+            as of, or None if the history since the checkpoint contains
+            overwrites or deletes, or the checkpoint snapshot has expired
+        """
+        table = self.catalog.load_table(namespace, table_name)
+        current = table.current_snapshot()
+        current_id = current.snapshot_id if current else None
+
+        try:
+            if since_snapshot_id is None:
+                if current_id is None:
+                    df = read_data_files(table, [], columns)
+                else:
+                    scan, _ = self._build_scan(
+                        table, columns=columns, snapshot_id=current_id
+                    )
+                    df = pl.from_arrow(scan.to_arrow())
+                return AppendedData(df=df, snapshot_id=current_id)
+
+            planned = plan_appended_files(table, since_snapshot_id)
+            if planned is None:
+                return None
+
+            files, snapshots_read = planned
+            df = read_data_files(table, files, columns)
+            self.logger.info(
+                "Read appended data",
+                table=f"{namespace}.{table_name}",
+                since_snapshot_id=since_snapshot_id,
+                snapshot_id=current_id,
+                snapshots=snapshots_read,
+                files=len(files),
+                rows=len(df),
+            )
+            return AppendedData(
+                df=df,
+                snapshot_id=current_id,
+                since_snapshot_id=since_snapshot_id,
+                snapshots_read=snapshots_read,
+                files_read=[f.file_path for f in files],
+            )
+        except Exception as e:
+            raise IcebergError(
+                f"Failed to read appended data: {str(e)}",
+                table=f"{namespace}.{table_name}",
+                operation="read_appended_since",
+            )
+
+    def scan_lazy(
+        self,
+        namespace: str,
+        table_name: str,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        snapshot_id: int | None = None,
+    ) -> pl.LazyFrame:
+        """
+        Expose a table as a Polars LazyFrame without reading any data.
+
+        Projections and predicates, including any added later on the
+        LazyFrame, are pushed into the Iceberg scan by the Polars optimizer,
+        and the frame can be collected with the streaming engine to process
+        tables larger than memory.
+
+        Args:
+            namespace: Table namespace
+            table_name: Table name
+            columns: Columns to select
+            filter_expr: Filter expression
+            snapshot_id: Optional snapshot to read (time travel)
+
+        Returns:
+            Polars LazyFrame over the table
+        """
+        table = self.catalog.load_table(namespace, table_name)
+
+        try:
+            lf = pl.scan_iceberg(table, snapshot_id=snapshot_id)
+            if filter_expr:
+                lf = lf.filter(pl.sql_expr(filter_expr))
+            if columns:
+                lf = lf.select(columns)
+            return lf
+        except Exception as e:
+            raise IcebergError(
+                f"Failed to scan table: {str(e)}",
+                table=f"{namespace}.{table_name}",
+                operation="scan_lazy",
+            )
+
+    def iter_batches(
+        self,
+        namespace: str,
+        table_name: str,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        limit: int | None = None,
+        snapshot_id: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream a table as bounded Arrow record batches.
+
+        Data files are read one at a time, so memory use is bounded by the
+        batch size rather than the table size. The filter is pushed into the
+        scan as in ``read``; any residual is applied batch by batch.
+
+        Args:
+            namespace: Table namespace
+            table_name: Table name
+            columns: Columns to select
+            filter_expr: Filter expression
+            limit: Maximum rows to return
+            snapshot_id: Optional snapshot to read (time travel)
+            batch_size: Maximum rows per yielded batch
+
+        Yields:
+            PyArrow RecordBatch objects of at most ``batch_size`` rows
+        """
+        table = self.catalog.load_table(namespace, table_name)
+
+        try:
+            scan, translated = self._build_scan(
+                table,
+                columns=columns,
+                filter_expr=filter_expr,
+                limit=limit,
+                snapshot_id=snapshot_id,
+            )
+            reader = scan.to_arrow_batch_reader()
+        except Exception as e:
+            raise IcebergError(
+                f"Failed to scan table: {str(e)}",
+                table=f"{namespace}.{table_name}",
+                operation="iter_batches",
+            )
+
+        remaining = limit
+        for batch in reader:
+            if translated.residual is not None:
+                df = self._apply_residual(pl.from_arrow(batch), translated, columns, remaining)
+                if df.is_empty():
+                    continue
+                batch = df.to_arrow().combine_chunks().to_batches()[0]
+
+            for offset in range(0, batch.num_rows, batch_size):
+                chunk = batch.slice(offset, batch_size)
+                if remaining is not None:
+                    chunk = chunk.slice(0, remaining)
+                    remaining -= chunk.num_rows
+                yield chunk
+                if remaining == 0:
+                    return
 
     # =========================================================================
     # Schema Evolution
@@ -466,6 +760,7 @@ class IcebergTableManager:
                 column=column_name,
             )
         except Exception as e:
+            self.catalog.invalidate(namespace, table_name)
             raise IcebergError(
                 f"Failed to add column: {str(e)}",
                 table=f"{namespace}.{table_name}",
@@ -491,6 +786,7 @@ class IcebergTableManager:
                 column=column_name,
             )
         except Exception as e:
+            self.catalog.invalidate(namespace, table_name)
             raise IcebergError(
                 f"Failed to drop column: {str(e)}",
                 table=f"{namespace}.{table_name}",
@@ -518,6 +814,7 @@ class IcebergTableManager:
                 new_name=new_name,
             )
         except Exception as e:
+            self.catalog.invalidate(namespace, table_name)
             raise IcebergError(
                 f"Failed to rename column: {str(e)}",
                 table=f"{namespace}.{table_name}",
@@ -525,21 +822,101 @@ class IcebergTableManager:
             )
 
     # =========================================================================
-    # Maintenance Operations
+    # Metadata Operations
     # =========================================================================
 
-    def compact(self, namespace: str, table_name: str) -> None:
-        """Compact small files in a table."""
+    def current_snapshot_id(self, namespace: str, table_name: str) -> int | None:
+        """Get the ID of the table's current snapshot (None if empty)."""
+        table = self.catalog.load_table(namespace, table_name)
+        snapshot = table.current_snapshot()
+        return snapshot.snapshot_id if snapshot else None
+
+    def get_properties(self, namespace: str, table_name: str) -> dict[str, str]:
+        """Get the table properties."""
+        table = self.catalog.load_table(namespace, table_name)
+        return dict(table.properties)
+
+    def set_properties(
+        self,
+        namespace: str,
+        table_name: str,
+        properties: dict[str, str],
+    ) -> None:
+        """Set table properties without writing data."""
         table = self.catalog.load_table(namespace, table_name)
 
         try:
-            # Rewrite data files
-            table.refresh()
-            self.logger.info(
-                "Compacted table",
+            with table.transaction() as tx:
+                tx.set_properties(properties)
+        except Exception as e:
+            self.catalog.invalidate(namespace, table_name)
+            raise IcebergError(
+                f"Failed to set table properties: {str(e)}",
                 table=f"{namespace}.{table_name}",
+                operation="set_properties",
+            )
+
+    # =========================================================================
+    # Maintenance Operations
+    # =========================================================================
+
+    def compact(
+        self,
+        namespace: str,
+        table_name: str,
+        partition_filter: str | None = None,
+        sort_by: list[str] | None = None,
+        zorder_by: list[str] | None = None,
+        target_file_size_bytes: int | None = None,
+        rewrite_all: bool = False,
+        dry_run: bool = False,
+        max_workers: int | None = None,
+    ) -> CompactionResult:
+        """
+        Compact small files in a table.
+
+        Small files are bin-packed per partition into files close to the
+        target size and rewritten in parallel, optionally sorted or
+        Z-ordered, then committed as a single snapshot.
+
+        Args:
+            namespace: Table namespace
+            table_name: Table name
+            partition_filter: Only compact files matching this filter
+            sort_by: Columns to sort rewritten files by
+            zorder_by: Columns to Z-order rewritten files by
+            target_file_size_bytes: Output file size (config default if None)
+            rewrite_all: Rewrite all files, not only small ones
+            dry_run: Only report the files and bytes that would be rewritten
+            max_workers: Parallel rewrite workers (config default if None)
+
+        Returns:
+            CompactionResult with the rewritten groups and new snapshot
+        """
+        table = self.catalog.load_table(namespace, table_name)
+        config = self.settings.iceberg.compaction
+
+        try:
+            engine = CompactionEngine(
+                table,
+                target_file_size_bytes=(
+                    target_file_size_bytes
+                    or config.target_file_size_bytes
+                    or self.settings.iceberg.table_defaults.target_file_size_bytes
+                ),
+                small_file_ratio=config.small_file_ratio,
+                min_input_files=config.min_input_files,
+                sort_by=sort_by,
+                zorder_by=zorder_by,
+                max_workers=max_workers or config.max_workers,
+            )
+            return engine.run(
+                partition_filter=partition_filter,
+                rewrite_all=rewrite_all,
+                dry_run=dry_run,
             )
         except Exception as e:
+            self.catalog.invalidate(namespace, table_name)
             raise IcebergError(
                 f"Failed to compact table: {str(e)}",
                 table=f"{namespace}.{table_name}",
@@ -568,6 +945,7 @@ class IcebergTableManager:
             )
             return 0  # PyIceberg doesn't return count
         except Exception as e:
+            self.catalog.invalidate(namespace, table_name)
             raise IcebergError(
                 f"Failed to expire snapshots: {str(e)}",
                 table=f"{namespace}.{table_name}",
@@ -578,12 +956,70 @@ class IcebergTableManager:
     # Helper Methods
     # =========================================================================
 
+    def _build_scan(
+        self,
+        table: Table,
+        columns: list[str] | None = None,
+        filter_expr: str | None = None,
+        limit: int | None = None,
+        snapshot_id: int | None = None,
+    ) -> tuple[DataScan, TranslatedFilter]:
+        """
+        Build a table scan with the filter pushed down as far as possible.
+
+        The row limit is only pushed into the scan when the whole filter is
+        evaluated by Iceberg; otherwise rows dropped by the residual filter
+        would count towards the limit.
+        """
+        translated = translate_filter(filter_expr, table.schema())
+
+        selected: tuple[str, ...] = ("*",)
+        if columns:
+            extra = [c for c in translated.residual_columns() if c not in columns]
+            selected = tuple(columns) + tuple(extra)
+
+        scan = table.scan(
+            row_filter=translated.row_filter,
+            selected_fields=selected,
+            snapshot_id=snapshot_id,
+            limit=limit if translated.is_fully_pushed else None,
+        )
+
+        if filter_expr:
+            self.logger.debug(
+                "Planned filtered scan",
+                table=".".join(table.name()),
+                pushed=translated.pushed,
+                residual=translated.residual,
+            )
+
+        return scan, translated
+
+    def _apply_residual(
+        self,
+        df: pl.DataFrame,
+        translated: TranslatedFilter,
+        columns: list[str] | None = None,
+        limit: int | None = None,
+    ) -> pl.DataFrame:
+        """Apply the part of a filter that could not be pushed into the scan."""
+        if translated.residual is None:
+            return df
+
+        df = df.filter(pl.sql_expr(translated.residual))
+        if columns:
+            df = df.select(columns)
+        if limit is not None:
+            df = df.head(limit)
+        return df
+
     def _build_partition_spec(
         self,
         schema: Schema,
         partition_columns: list[str],
+        bucket_columns: dict[str, int] | None = None,
     ) -> PartitionSpec:
-        """Build a partition spec from column names."""
+        """Build a partition spec from column names and bucket definitions."""
         fields = []
 
         for i, col_name in enumerate(partition_columns):
@@ -616,6 +1052,23 @@ class IcebergTableManager:
                 )
             )
 
+        for col_name, num_buckets in (bucket_columns or {}).items():
+            field = schema.find_field(col_name)
+            if field is None:
+                raise IcebergError(
+                    f"Bucket column not found in schema: {col_name}",
+                    operation="build_partition_spec",
+                )
+
+            fields.append(
+                PartitionField(
+                    source_id=field.field_id,
+                    field_id=1000 + len(fields),
+                    transform=BucketTransform(num_buckets),
+                    name=f"{col_name}_bucket",
+                )
+            )
+
         return PartitionSpec(*fields)
 
     def _build_sort_order(
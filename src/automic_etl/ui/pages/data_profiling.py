@@ -8,6 +8,13 @@ import httpx
 import streamlit as st
 import polars as pl
 import json
+import structlog
+
+from automic_etl.core.config import get_settings
+from automic_etl.storage.iceberg import IcebergTableManager
+from automic_etl.validation.quality import DataQualityChecker, QualityReport
+
+logger = structlog.get_logger()
 
 # API base URL
 API_BASE_URL = "http://localhost:8000/api/v1"
@@ -85,19 +92,42 @@ def show_profile_section():
 
     if st.button("🔍 Generate Profile", type="primary"):
         with st.spinner("Analyzing data..."):
-            show_profile_results()
+            report = _profile_table(namespace, table)
+        if report is not None:
+            show_profile_results(report)
+
+
+def _profile_table(namespace: str, table: str) -> QualityReport | None:
+    """Profile a lakehouse table, streaming its record batches; None after showing an error."""
+    try:
+        manager = IcebergTableManager(get_settings())
+        return DataQualityChecker().profile(
+            manager.iter_batches(namespace, table),
+            dataset_name=f"{namespace}.{table}",
+        )
+    except Exception as e:
+        logger.warning("Table profiling failed", table=f"{namespace}.{table}", error=str(e))
+        st.error(f"Could not profile {namespace}.{table}: {str(e)}")
+        return None
 
 
-def show_profile_results():
+def show_profile_results(report: QualityReport):
     """Display profile results."""
     st.markdown("---")
 
+    total_cells = report.row_count * report.column_count
+    missing_pct = 100 - report.completeness_score if total_cells else 0.0
+    duplicate_pct = report.duplicate_rows / report.row_count * 100 if report.row_count else 0.0
+
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Total Rows", "125,432")
-    col2.metric("Total Columns", "15")
-    col3.metric("Missing Values", "2.3%")
-    col4.metric("Duplicates", "0.1%")
+    col1.metric("Total Rows", f"{report.row_count:,}")
+    col2.metric("Total Columns", str(report.column_count))
+    col3.metric("Missing Values", f"{missing_pct:.1f}%")
+    col4.metric("Duplicates", f"{duplicate_pct:.1f}%")
+
+    if report.approximate:
+        st.caption("Distinct counts, percentiles and top values are estimates.")
 
     st.markdown("---")
 
@@ -106,61 +136,13 @@ def show_profile_results():
 
     columns_data = [
         {
-            "column": "customer_id",
-            "type": "String",
-            "non_null": "100%",
-            "unique": "100%",
-            "top_value": "CUST0001",
-            "pii_risk": "Low",
-        },
-        {
-            "column": "full_name",
-            "type": "String",
-            "non_null": "99.8%",
-            "unique": "87%",
-            "top_value": "John Smith",
-            "pii_risk": "High",
-        },
-        {
-            "column": "email",
-            "type": "String",
-            "non_null": "98.5%",
-            "unique": "99.2%",
-            "top_value": "user@email.com",
-            "pii_risk": "High",
-        },
-        {
-            "column": "phone",
-            "type": "String",
-            "non_null": "95.2%",
-            "unique": "98.5%",
-            "top_value": "555-123-4567",
-            "pii_risk": "High",
-        },
-        {
-            "column": "annual_revenue",
-            "type": "Float64",
-            "non_null": "100%",
-            "unique": "45%",
-            "top_value": "$50,000",
-            "pii_risk": "Low",
-        },
-        {
-            "column": "segment",
-            "type": "String",
-            "non_null": "100%",
-            "unique": "0.03%",
-            "top_value": "Enterprise",
-            "pii_risk": "None",
-        },
-        {
-            "column": "created_at",
-            "type": "Datetime",
-            "non_null": "100%",
-            "unique": "85%",
-            "top_value": "2024-01-15",
-            "pii_risk": "None",
-        },
+            "column": name,
+            "type": profile.dtype,
+            "non_null": f"{100 - profile.null_percentage:.1f}%",
+            "unique": f"{profile.unique_percentage:.1f}%",
+            "top_value": str(profile.top_values[0][0]) if profile.top_values else "",
+        }
+        for name, profile in report.column_profiles.items()
     ]
 
     # Display as dataframe
@@ -173,10 +155,6 @@ def show_profile_results():
             "non_null": "Non-Null %",
             "unique": "Unique %",
             "top_value": "Most Common",
-            "pii_risk": st.column_config.TextColumn(
-                "PII Risk",
-                help="Risk level for PII data",
-            ),
         },
     )
 
@@ -188,26 +166,33 @@ def show_profile_results():
         "Select column for detailed analysis",
         [c["column"] for c in columns_data],
     )
+    profile = report.column_profiles[selected_col]
 
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("**Value Distribution**")
-        # Mock distribution chart
-        st.bar_chart({
-            "Value": [45, 30, 15, 7, 3],
-        })
+        if profile.top_values:
+            st.bar_chart({
+                "Value": [str(value) for value, _ in profile.top_values],
+                "Count": [count for _, count in profile.top_values],
+            }, x="Value", y="Count")
+        else:
+            st.caption("No frequent values")
 
     with col2:
         st.markdown("**Statistics**")
-        st.json({
-            "count": 125432,
-            "null_count": 234,
-            "unique_count": 115890,
-            "min": "A001",
-            "max": "Z999",
-            "mean_length": 8.5,
-        })
+        stats = {
+            "count": profile.total_count,
+            "null_count": profile.null_count,
+            "unique_count": profile.unique_count,
+            "min": profile.min_value,
+            "max": profile.max_value,
+            "mean": profile.mean,
+            "std": profile.std,
+            "mean_length": profile.avg_length,
+        }
+        st.json({key: value for key, value in stats.items() if value is not None})
 
 
 def show_pii_detection_section():
@@ -407,26 +392,29 @@ def show_statistics_section():
 
     if st.button("📈 Generate Statistics", type="primary"):
         with st.spinner("Calculating statistics..."):
-            show_statistics_results()
+            report = _profile_table(namespace, table)
+        if report is not None:
+            show_statistics_results(report)
 
 
-def show_statistics_results():
+def show_statistics_results(report: QualityReport):
     """Display statistical results."""
     st.markdown("---")
 
     # Numeric columns statistics
     st.subheader("Numeric Column Statistics")
 
+    numeric = [p for p in report.column_profiles.values() if p.percentiles]
     stats = {
-        "Column": ["annual_revenue", "order_count", "days_active"],
-        "Count": [125432, 125432, 125432],
-        "Mean": [45230.50, 12.3, 234.5],
-        "Std": [28450.20, 8.7, 156.2],
-        "Min": [0, 0, 1],
-        "25%": [15000, 5, 89],
-        "50%": [38000, 10, 212],
-        "75%": [65000, 18, 345],
-        "Max": [250000, 156, 1095],
+        "Column": [p.name for p in numeric],
+        "Count": [p.total_count - p.null_count for p in numeric],
+        "Mean": [p.mean for p in numeric],
+        "Std": [p.std for p in numeric],
+        "Min": [p.min_value for p in numeric],
+        "25%": [p.percentiles["25%"] for p in numeric],
+        "50%": [p.percentiles["50%"] for p in numeric],
+        "75%": [p.percentiles["75%"] for p in numeric],
+        "Max": [p.max_value for p in numeric],
     }
 
     st.dataframe(stats, use_container_width=True)
@@ -1,6 +1,7 @@
 """Data validation framework for Automic ETL."""
 
 from automic_etl.validation.rules import (
+    CompiledRule,
     ValidationRule,
     NotNullRule,
     UniqueRule,
@@ -11,11 +12,14 @@ from automic_etl.validation.rules import (
     CustomSQLRule,
     SchemaRule,
 )
-from automic_etl.validation.validator import DataValidator, ValidationResult
+from automic_etl.validation.validator import DataValidator, ValidationPlan, ValidationResult
 from automic_etl.validation.quality import DataQualityChecker, QualityReport
+from automic_etl.validation.sketches import CountMinSketch, HyperLogLog, TDigest
+from automic_etl.validation.batches import BatchSource, iter_batches
 
 __all__ = [
     "ValidationRule",
+    "CompiledRule",
     "NotNullRule",
     "UniqueRule",
     "RangeRule",
@@ -25,7 +29,13 @@ __all__ = [
     "CustomSQLRule",
     "SchemaRule",
     "DataValidator",
+    "ValidationPlan",
     "ValidationResult",
     "DataQualityChecker",
     "QualityReport",
+    "HyperLogLog",
+    "TDigest",
+    "CountMinSketch",
+    "BatchSource",
+    "iter_batches",
 ]
@@ -0,0 +1,72 @@
+"""Batch iteration helpers for validating and profiling large tables."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+import polars as pl
+import pyarrow as pa
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZE = 100_000
+
+# Anything validation and profiling can consume batch by batch, e.g. a
+# LazyFrame over Parquet files or an Iceberg scan's ``to_arrow_batch_reader()``
+BatchSource = (
+    pl.LazyFrame
+    | pa.Table
+    | pa.RecordBatch
+    | pa.RecordBatchReader
+    | Iterable[pl.DataFrame | pa.RecordBatch | pa.Table]
+)
+
+
+def iter_batches(
+    source: BatchSource | pl.DataFrame,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[pl.DataFrame]:
+    """
+    Iterate over a data source as Polars DataFrames.
+
+    LazyFrames are executed in streaming batches of ``batch_size`` rows, so
+    the full result is never materialized. Arrow record batches and tables
+    are converted without copying where possible.
+    """
+    if isinstance(source, pl.LazyFrame):
+        yield from source.collect_batches(chunk_size=batch_size)
+    elif isinstance(source, pl.DataFrame):
+        yield from source.iter_slices(batch_size)
+    elif isinstance(source, (pa.Table, pa.RecordBatch)):
+        yield from pl.from_arrow(source).iter_slices(batch_size)
+    else:
+        for batch in source:
+            if isinstance(batch, pl.DataFrame):
+                yield batch
+            else:
+                yield pl.from_arrow(batch)
+
+
+def map_batches(
+    func: Callable[[pl.DataFrame], T],
+    batches: Iterable[pl.DataFrame],
+    max_workers: int = 4,
+) -> Iterator[T]:
+    """
+    Apply a function to batches in a thread pool, yielding results in order.
+
+    At most ``2 * max_workers`` batches are in flight, so memory stays
+    bounded however long the input is. Polars and NumPy release the GIL
+    for the heavy lifting, so the workers run in parallel.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque = deque()
+        for batch in batches:
+            pending.append(executor.submit(func, batch))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any
 from datetime import datetime
 
@@ -10,9 +13,26 @@ import polars as pl
 import structlog
 
 from automic_etl.core.utils import utc_now
+from automic_etl.validation.batches import (
+    DEFAULT_BATCH_SIZE,
+    BatchSource,
+    iter_batches,
+    map_batches,
+)
+from automic_etl.validation.sketches import CountMinSketch, HyperLogLog, TDigest
+
+# Columns up to this many rows get exact top values; longer ones are
+# estimated with a count-min sketch
+EXACT_TOP_VALUES_ROWS = 100_000
 
 logger = structlog.get_logger()
 
+NUMERIC_DTYPES = [
+    pl.Int8, pl.Int16, pl.Int32, pl.Int64,
+    pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64,
+    pl.Float32, pl.Float64,
+]
+
 
 @dataclass
 class ColumnProfile:
@@ -65,6 +85,10 @@ class QualityReport:
     # Issues found
     issues: list[dict[str, Any]] = field(default_factory=list)
 
+    # True if distinct counts, percentiles, top values, outliers and
+    # duplicates were estimated from sketches (chunked profiling)
+    approximate: bool = False
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -78,6 +102,7 @@ class QualityReport:
                 "complete_rows": self.complete_rows,
                 "completeness_score": self.completeness_score,
                 "quality_score": self.quality_score,
+                "approximate": self.approximate,
             },
             "columns": {
                 name: {
@@ -112,12 +137,89 @@ class QualityReport:
         return pl.DataFrame(rows)
 
 
+@dataclass
+class _ColumnPartial:
+    """Mergeable statistics of one column over one or more chunks."""
+    dtype: pl.DataType
+    distinct: HyperLogLog = field(default_factory=HyperLogLog)
+    top: CountMinSketch = field(default_factory=CountMinSketch)
+    digest: TDigest | None = None
+    count: int = 0
+    null_count: int = 0
+    min_value: Any = None
+    max_value: Any = None
+
+    # Numeric moments (Chan et al. parallel variance)
+    mean: float = 0.0
+    m2: float = 0.0
+
+    # String lengths
+    min_length: int | None = None
+    max_length: int | None = None
+    total_length: int = 0
+
+    @property
+    def non_null(self) -> int:
+        return self.count - self.null_count
+
+    def merge(self, other: _ColumnPartial) -> None:
+        """Merge the statistics of another chunk into this one."""
+        n_left, n_right = self.non_null, other.non_null
+        if n_right:
+            n = n_left + n_right
+            delta = other.mean - self.mean
+            self.mean += delta * n_right / n
+            self.m2 += other.m2 + delta * delta * n_left * n_right / n
+
+        self.count += other.count
+        self.null_count += other.null_count
+        self.min_value = _merge_extreme(min, self.min_value, other.min_value)
+        self.max_value = _merge_extreme(max, self.max_value, other.max_value)
+        self.min_length = _merge_extreme(min, self.min_length, other.min_length)
+        self.max_length = _merge_extreme(max, self.max_length, other.max_length)
+        self.total_length += other.total_length
+
+        self.distinct.merge(other.distinct)
+        self.top.merge(other.top)
+        if self.digest is not None and other.digest is not None:
+            self.digest.merge(other.digest)
+
+
+@dataclass
+class _ProfilePartial:
+    """Mergeable statistics of a table over one or more chunks."""
+    columns: dict[str, _ColumnPartial]
+    rows: HyperLogLog = field(default_factory=lambda: HyperLogLog(precision=18))
+    row_count: int = 0
+    complete_rows: int = 0
+    memory_bytes: int = 0
+
+    def merge(self, other: _ProfilePartial) -> None:
+        """Merge the statistics of another chunk into this one."""
+        self.row_count += other.row_count
+        self.complete_rows += other.complete_rows
+        self.memory_bytes += other.memory_bytes
+        self.rows.merge(other.rows)
+        for name, column in other.columns.items():
+            self.columns[name].merge(column)
+
+
+def _merge_extreme(func: Any, left: Any, right: Any) -> Any:
+    """Min or max of two values, either of which may be None."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return func(left, right)
+
+
 class DataQualityChecker:
     """
     Comprehensive data quality checker and profiler.
 
     Features:
     - Column-level profiling
+    - Chunked profiling of larger-than-memory tables
     - Statistical analysis
     - Anomaly detection
     - Quality scoring
@@ -129,6 +231,9 @@ class DataQualityChecker:
         sample_size: int | None = None,
         detect_outliers: bool = True,
         outlier_std: float = 3.0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = 4,
+        exact_top_values_rows: int = EXACT_TOP_VALUES_ROWS,
     ) -> None:
         """
         Initialize quality checker.
@@ -137,41 +242,257 @@ class DataQualityChecker:
             sample_size: If set, profile a sample instead of full data
             detect_outliers: Whether to detect outliers
             outlier_std: Standard deviations for outlier detection
+            batch_size: Rows per chunk when profiling LazyFrames or batches
+            max_workers: Chunks profiled in parallel
+            exact_top_values_rows: Longest column whose top values are
+                counted exactly
         """
         self.sample_size = sample_size
         self.detect_outliers = detect_outliers
         self.outlier_std = outlier_std
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.exact_top_values_rows = exact_top_values_rows
         self.logger = logger.bind(component="quality_checker")
 
     def profile(
         self,
-        df: pl.DataFrame,
+        df: pl.DataFrame | BatchSource,
         dataset_name: str = "unnamed",
     ) -> QualityReport:
         """
         Generate a complete quality profile.
 
+        DataFrames are profiled exactly, except for the top values of
+        columns longer than ``exact_top_values_rows``, which come from a
+        count-min sketch. LazyFrames and batch sources are profiled chunk by
+        chunk with sketches (see ``profile_batches``).
+
         Args:
-            df: DataFrame to profile
+            df: DataFrame, LazyFrame or batch source to profile
             dataset_name: Name for the dataset
 
         Returns:
             QualityReport with detailed analysis
         """
+        if not isinstance(df, pl.DataFrame):
+            return self.profile_batches(df, dataset_name)
+
         self.logger.info("Starting quality profile", dataset=dataset_name, rows=len(df))
 
         # Sample if needed
         if self.sample_size and len(df) > self.sample_size:
             df = df.sample(n=self.sample_size)
 
-        column_profiles = {}
-        issues = []
+        # Every statistic of every column in one parallel pass
+        stats = df.select(self._profile_exprs(df.schema)).row(0, named=True) if df.width else {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            top_values = list(executor.map(
+                lambda i: self._top_values(df[:, i], stats[f"{i}.unique"]),
+                range(df.width),
+            ))
+        column_profiles = {
+            col: self._column_from_stats(df[col], i, stats, top_values[i])
+            for i, col in enumerate(df.columns)
+        }
+
+        return self._build_report(
+            dataset_name,
+            column_profiles,
+            row_count=len(df),
+            memory_bytes=df.estimated_size(),
+            duplicate_rows=len(df) - stats.get("distinct_rows", len(df)),
+            complete_rows=stats.get("complete_rows", len(df)),
+        )
+
+    def profile_batches(
+        self,
+        source: BatchSource,
+        dataset_name: str = "unnamed",
+    ) -> QualityReport:
+        """
+        Profile a table chunk by chunk, in bounded memory.
+
+        Each chunk is summarized by a pool of workers into mergeable
+        statistics: counts, null counts, min/max, mean and variance,
+        string lengths, and sketches (HyperLogLog for distinct counts,
+        t-digest for percentiles, count-min for top values). Only these
+        summaries are kept, so memory use does not grow with the table.
+
+        Counts, nulls, min/max, mean, std and lengths are exact. Distinct
+        counts, percentiles, top value counts, outliers and duplicate rows
+        are estimates, and the report is marked ``approximate``.
+        ``sample_size`` is ignored.
+
+        Args:
+            source: LazyFrame, Arrow table/record batches or an iterable of
+                DataFrames, e.g. an Iceberg scan's ``to_arrow_batch_reader()``
+            dataset_name: Name for the dataset
+
+        Returns:
+            QualityReport built from the merged statistics
+        """
+        batches = iter_batches(source, self.batch_size)
+        first = next(batches, None)
+        if first is None:
+            schema = source.collect_schema() if isinstance(source, pl.LazyFrame) else pl.Schema()
+            return self.profile(pl.DataFrame(schema=schema), dataset_name)
+
+        self.logger.info(
+            "Starting chunked quality profile",
+            dataset=dataset_name,
+            batch_size=self.batch_size,
+            workers=self.max_workers,
+        )
+
+        total: _ProfilePartial | None = None
+        for partial in map_batches(self._profile_chunk, chain([first], batches), self.max_workers):
+            if total is None:
+                total = partial
+            else:
+                total.merge(partial)
+
+        column_profiles = {
+            name: self._column_from_partial(name, column)
+            for name, column in total.columns.items()
+        }
+
+        # Rows minus distinct rows, ignoring differences within the error of the estimate
+        distinct_rows = min(total.rows.count(), total.row_count)
+        duplicate_rows = total.row_count - distinct_rows
+        if duplicate_rows <= 3 * total.rows.relative_error * distinct_rows:
+            duplicate_rows = 0
+
+        return self._build_report(
+            dataset_name,
+            column_profiles,
+            row_count=total.row_count,
+            memory_bytes=total.memory_bytes,
+            duplicate_rows=duplicate_rows,
+            complete_rows=total.complete_rows,
+            approximate=True,
+        )
+
+    def _profile_chunk(self, df: pl.DataFrame) -> _ProfilePartial:
+        """Summarize one chunk into mergeable statistics."""
+        exprs = []
+        for i, col in enumerate(df.columns):
+            exprs.append(pl.col(col).null_count().alias(f"{i}.nulls"))
+            if df.schema[col] in NUMERIC_DTYPES:
+                exprs += [
+                    pl.col(col).min().alias(f"{i}.min"),
+                    pl.col(col).max().alias(f"{i}.max"),
+                    pl.col(col).mean().alias(f"{i}.mean"),
+                    pl.col(col).var(ddof=0).alias(f"{i}.var"),
+                ]
+            elif df.schema[col] == pl.Utf8:
+                lengths = pl.col(col).str.len_chars()
+                exprs += [
+                    lengths.min().alias(f"{i}.min_length"),
+                    lengths.max().alias(f"{i}.max_length"),
+                    lengths.sum().alias(f"{i}.total_length"),
+                ]
+        if df.width:
+            exprs.append(
+                pl.all_horizontal(pl.all().is_not_null()).sum().alias("complete_rows")
+            )
+        stats = df.select(exprs).row(0, named=True) if exprs else {}
+
+        partial = _ProfilePartial(
+            columns={},
+            row_count=len(df),
+            complete_rows=stats.get("complete_rows", len(df)),
+            memory_bytes=df.estimated_size(),
+        )
+        if df.width:
+            partial.rows.update(df.hash_rows())
+
+        for i, col in enumerate(df.columns):
+            series = df[col]
+            column = _ColumnPartial(
+                dtype=series.dtype,
+                count=len(series),
+                null_count=stats[f"{i}.nulls"],
+            )
+            column.distinct.update(series)
+            column.top.update(series)
+
+            if series.dtype in NUMERIC_DTYPES and column.non_null:
+                column.min_value = stats[f"{i}.min"]
+                column.max_value = stats[f"{i}.max"]
+                column.mean = stats[f"{i}.mean"]
+                column.m2 = stats[f"{i}.var"] * column.non_null
+                column.digest = TDigest()
+                column.digest.update(series)
+            elif series.dtype in NUMERIC_DTYPES:
+                column.digest = TDigest()
+            elif series.dtype == pl.Utf8 and column.non_null:
+                column.min_length = stats[f"{i}.min_length"]
+                column.max_length = stats[f"{i}.max_length"]
+                column.total_length = stats[f"{i}.total_length"]
+
+            partial.columns[col] = column
+
+        return partial
+
+    def _column_from_partial(self, name: str, column: _ColumnPartial) -> ColumnProfile:
+        """Build a column profile from merged chunk statistics."""
+        total = column.count
+        unique_count = min(column.distinct.count(), total)
+
+        profile = ColumnProfile(
+            name=name,
+            dtype=str(column.dtype),
+            total_count=total,
+            null_count=column.null_count,
+            unique_count=unique_count,
+            null_percentage=(column.null_count / total * 100) if total > 0 else 0,
+            unique_percentage=(unique_count / total * 100) if total > 0 else 0,
+            is_constant=unique_count <= 1,
+            top_values=column.top.top(5),
+        )
 
-        for col in df.columns:
-            profile = self._profile_column(df, col)
-            column_profiles[col] = profile
+        non_null = column.non_null
+        if column.digest is not None and non_null > 0:
+            profile.mean = column.mean
+            profile.std = math.sqrt(column.m2 / (non_null - 1)) if non_null > 1 else None
+            profile.min_value = column.min_value
+            profile.max_value = column.max_value
+            profile.percentiles = {
+                "25%": column.digest.quantile(0.25),
+                "50%": column.digest.quantile(0.50),
+                "75%": column.digest.quantile(0.75),
+            }
+
+            if self.detect_outliers and profile.std and profile.std > 0:
+                lower = profile.mean - (self.outlier_std * profile.std)
+                upper = profile.mean + (self.outlier_std * profile.std)
+                fraction = column.digest.cdf(lower) + (1 - column.digest.cdf(upper))
+                outliers = round(fraction * column.digest.count)
+                profile.has_outliers = outliers > 0
+                profile.outlier_count = outliers
+
+        elif column.min_length is not None:
+            profile.min_length = column.min_length
+            profile.max_length = column.max_length
+            profile.avg_length = column.total_length / non_null
 
-            # Collect issues
+        return profile
+
+    def _build_report(
+        self,
+        dataset_name: str,
+        column_profiles: dict[str, ColumnProfile],
+        row_count: int,
+        memory_bytes: int,
+        duplicate_rows: int,
+        complete_rows: int,
+        approximate: bool = False,
+    ) -> QualityReport:
+        """Collect issues and scores from column profiles into a report."""
+        issues = []
+
+        for col, profile in column_profiles.items():
             if profile.null_percentage > 50:
                 issues.append({
                     "type": "high_null_rate",
@@ -195,17 +516,13 @@ class DataQualityChecker:
                     "message": f"Column {col} has {profile.outlier_count} outliers",
                 })
 
-        # Calculate dataset-level metrics
-        duplicate_rows = len(df) - len(df.unique())
-        complete_rows = len(df.drop_nulls())
-
         # Completeness score (percentage of non-null values)
-        total_cells = len(df) * len(df.columns)
+        total_cells = row_count * len(column_profiles)
         null_cells = sum(p.null_count for p in column_profiles.values())
         completeness_score = ((total_cells - null_cells) / total_cells * 100) if total_cells > 0 else 100
 
         # Quality score (composite)
-        quality_score = self._calculate_quality_score(column_profiles, duplicate_rows, len(df))
+        quality_score = self._calculate_quality_score(column_profiles, duplicate_rows, row_count)
 
         if duplicate_rows > 0:
             issues.append({
@@ -217,15 +534,16 @@ class DataQualityChecker:
         report = QualityReport(
             dataset_name=dataset_name,
             profile_time=utc_now(),
-            row_count=len(df),
-            column_count=len(df.columns),
-            memory_bytes=df.estimated_size(),
+            row_count=row_count,
+            column_count=len(column_profiles),
+            memory_bytes=memory_bytes,
             column_profiles=column_profiles,
             duplicate_rows=duplicate_rows,
             complete_rows=complete_rows,
             completeness_score=completeness_score,
             quality_score=quality_score,
             issues=issues,
+            approximate=approximate,
         )
 
         self.logger.info(
@@ -237,72 +555,105 @@ class DataQualityChecker:
 
         return report
 
-    def _profile_column(self, df: pl.DataFrame, col: str) -> ColumnProfile:
-        """Profile a single column."""
-        series = df[col]
-        dtype = str(series.dtype)
+    def _profile_exprs(self, schema: pl.Schema) -> list[pl.Expr]:
+        """Scalar expressions for every statistic of every column."""
+        exprs = [
+            pl.struct(pl.all()).n_unique().alias("distinct_rows"),
+            pl.all_horizontal(pl.all().is_not_null()).sum().alias("complete_rows"),
+        ]
+
+        for i, (col, dtype) in enumerate(schema.items()):
+            column = pl.col(col)
+            exprs += [
+                column.null_count().alias(f"{i}.nulls"),
+                column.n_unique().alias(f"{i}.unique"),
+            ]
+
+            if dtype in NUMERIC_DTYPES:
+                lower = column.mean() - self.outlier_std * column.std()
+                upper = column.mean() + self.outlier_std * column.std()
+                exprs += [
+                    column.mean().alias(f"{i}.mean"),
+                    column.std().alias(f"{i}.std"),
+                    column.min().alias(f"{i}.min"),
+                    column.max().alias(f"{i}.max"),
+                    column.quantile(0.25).alias(f"{i}.25%"),
+                    column.quantile(0.50).alias(f"{i}.50%"),
+                    column.quantile(0.75).alias(f"{i}.75%"),
+                    ((column < lower) | (column > upper)).sum().alias(f"{i}.outliers"),
+                ]
+            elif dtype == pl.Utf8:
+                lengths = column.str.len_chars()
+                exprs += [
+                    lengths.min().alias(f"{i}.min_length"),
+                    lengths.max().alias(f"{i}.max_length"),
+                    lengths.mean().alias(f"{i}.avg_length"),
+                ]
+
+        return exprs
+
+    def _top_values(self, series: pl.Series, unique_count: int) -> list[tuple[Any, int]]:
+        """Five most frequent values, exact for short columns and sketched otherwise."""
+        if len(series) <= self.exact_top_values_rows:
+            # top_k selects without sorting every group
+            counts = series.value_counts(name="__count").top_k(5, by="__count")
+            return sorted(counts.iter_rows(), key=lambda row: row[1], reverse=True)
+
+        sketch = CountMinSketch()
+        # No value occurs more often than this; if that is within the sketch's
+        # error bound nothing would be reported (e.g. key columns)
+        if len(series) - unique_count + 1 <= math.e / sketch.width * len(series):
+            return []
+        sketch.update(series)
+        return sketch.top(5)
+
+    def _column_from_stats(
+        self,
+        series: pl.Series,
+        index: int,
+        stats: dict[str, Any],
+        top_values: list[tuple[Any, int]],
+    ) -> ColumnProfile:
+        """Build a column profile from the evaluated statistics."""
         total = len(series)
-        null_count = series.null_count()
-        unique_count = series.n_unique()
+        null_count = stats[f"{index}.nulls"]
+        unique_count = stats[f"{index}.unique"]
 
         profile = ColumnProfile(
-            name=col,
-            dtype=dtype,
+            name=series.name,
+            dtype=str(series.dtype),
             total_count=total,
             null_count=null_count,
             unique_count=unique_count,
             null_percentage=(null_count / total * 100) if total > 0 else 0,
             unique_percentage=(unique_count / total * 100) if total > 0 else 0,
             is_constant=unique_count <= 1,
+            top_values=top_values,
         )
 
+        if null_count == total:
+            return profile
+
         # Numeric stats
-        if series.dtype in [pl.Int8, pl.Int16, pl.Int32, pl.Int64,
-                           pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64,
-                           pl.Float32, pl.Float64]:
-            non_null = series.drop_nulls()
-            if len(non_null) > 0:
-                profile.mean = non_null.mean()
-                profile.std = non_null.std()
-                profile.min_value = non_null.min()
-                profile.max_value = non_null.max()
-
-                # Percentiles
-                try:
-                    profile.percentiles = {
-                        "25%": non_null.quantile(0.25),
-                        "50%": non_null.quantile(0.50),
-                        "75%": non_null.quantile(0.75),
-                    }
-                except Exception:
-                    pass
-
-                # Outlier detection
-                if self.detect_outliers and profile.std and profile.std > 0:
-                    lower = profile.mean - (self.outlier_std * profile.std)
-                    upper = profile.mean + (self.outlier_std * profile.std)
-                    outliers = ((non_null < lower) | (non_null > upper)).sum()
-                    profile.has_outliers = outliers > 0
-                    profile.outlier_count = outliers
+        if series.dtype in NUMERIC_DTYPES:
+            profile.mean = stats[f"{index}.mean"]
+            profile.std = stats[f"{index}.std"]
+            profile.min_value = stats[f"{index}.min"]
+            profile.max_value = stats[f"{index}.max"]
+            profile.percentiles = {
+                key: stats[f"{index}.{key}"] for key in ("25%", "50%", "75%")
+            }
+
+            if self.detect_outliers and profile.std and profile.std > 0:
+                outliers = stats[f"{index}.outliers"]
+                profile.has_outliers = outliers > 0
+                profile.outlier_count = outliers
 
         # String stats
         elif series.dtype == pl.Utf8:
-            non_null = series.drop_nulls()
-            if len(non_null) > 0:
-                lengths = non_null.str.len_chars()
-                profile.min_length = lengths.min()
-                profile.max_length = lengths.max()
-                profile.avg_length = lengths.mean()
-
-        # Top values
-        try:
-            value_counts = df.group_by(col).agg(pl.count().alias("count")).sort("count", descending=True)
-            profile.top_values = [
-                (row[col], row["count"])
-                for row in value_counts.head(5).to_dicts()
-            ]
-        except Exception:
-            pass
+            profile.min_length = stats[f"{index}.min_length"]
+            profile.max_length = stats[f"{index}.max_length"]
+            profile.avg_length = stats[f"{index}.avg_length"]
 
         return profile
 
@@ -38,6 +38,70 @@ class ValidationResult:
         return ((self.total_rows - self.failing_rows) / self.total_rows) * 100
 
 
+@dataclass
+class CompiledRule:
+    """
+    A rule compiled to Polars expressions.
+
+    Compiled rules from one validator are evaluated together in a single
+    ``select``, so Polars computes all of them in one parallel pass.
+    """
+    # Row-level expression, true where a row fails the rule
+    failing_mask: pl.Expr
+    # Named scalar expressions the result is built from
+    aggregates: dict[str, pl.Expr]
+    # Builds the result from the evaluated aggregates and the row count
+    build_result: Callable[[dict[str, Any], int], ValidationResult]
+    # How each aggregate combines across chunks of a table (a key of
+    # _MERGERS); None if the rule needs the whole table at once
+    merge: dict[str, str] | None = None
+
+    @property
+    def mergeable(self) -> bool:
+        """Whether the rule can be evaluated chunk by chunk."""
+        return self.merge is not None
+
+    def merge_aggregates(self, left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
+        """Combine the aggregates of two chunks."""
+        return {name: _MERGERS[kind](left[name], right[name]) for name, kind in self.merge.items()}
+
+    @property
+    def columns(self) -> set[str]:
+        """Columns the expressions read."""
+        names: set[str] = set(self.failing_mask.meta.root_names())
+        for expr in self.aggregates.values():
+            names.update(expr.meta.root_names())
+        return names
+
+    def evaluate(self, df: pl.DataFrame) -> ValidationResult:
+        """Evaluate this rule on its own."""
+        values = df.select(**self.aggregates).row(0, named=True) if self.aggregates else {}
+        return self.build_result(values, len(df))
+
+
+def _merge_samples(left: list[Any], right: list[Any]) -> list[Any]:
+    return (left + right)[:10]
+
+
+def _merge_distinct_samples(left: list[Any], right: list[Any]) -> list[Any]:
+    merged = list(left)
+    for value in right:
+        if len(merged) >= 10:
+            break
+        if value not in merged:
+            merged.append(value)
+    return merged
+
+
+_MERGERS: dict[str, Callable[[Any, Any], Any]] = {
+    "sum": lambda left, right: left + right,
+    "min": lambda left, right: right if left is None else left if right is None else min(left, right),
+    "max": lambda left, right: right if left is None else left if right is None else max(left, right),
+    "samples": _merge_samples,
+    "distinct_samples": _merge_distinct_samples,
+}
+
+
 class ValidationRule(ABC):
     """Base class for validation rules."""
 
@@ -56,6 +120,15 @@ class ValidationRule(ABC):
         """Validate the DataFrame against this rule."""
         pass
 
+    def compile(self, schema: pl.Schema) -> CompiledRule | None:
+        """
+        Compile the rule to expressions for fused evaluation.
+
+        Returns None for rules that cannot be expressed in Polars; the
+        validator runs those through ``validate`` instead.
+        """
+        return None
+
 
 class NotNullRule(ValidationRule):
     """Validate that column(s) contain no null values."""
@@ -76,31 +149,38 @@ class NotNullRule(ValidationRule):
         )
 
     def validate(self, df: pl.DataFrame) -> ValidationResult:
-        total_rows = len(df)
-        failing_rows = 0
-        failing_details = {}
+        return self.compile(df.schema).evaluate(df)
 
+    def compile(self, schema: pl.Schema) -> CompiledRule:
+        masks = {}
         for col in self.columns:
-            if col not in df.columns:
+            if col not in schema:
                 continue
 
-            null_mask = df[col].is_null()
-            if not self.allow_empty and df[col].dtype == pl.Utf8:
-                null_mask = null_mask | (df[col] == "")
+            null_mask = pl.col(col).is_null()
+            if not self.allow_empty and schema[col] == pl.Utf8:
+                null_mask = null_mask | (pl.col(col) == "")
+            masks[col] = null_mask
 
-            col_failing = null_mask.sum()
-            if col_failing > 0:
-                failing_rows += col_failing
-                failing_details[col] = col_failing
+        def build_result(values: dict[str, Any], total_rows: int) -> ValidationResult:
+            failing_details = {col: count for col, count in values.items() if count > 0}
+            failing_rows = sum(failing_details.values())
 
-        return ValidationResult(
-            rule_name=self.name,
-            passed=failing_rows == 0,
-            severity=self.severity,
-            message=f"Found {failing_rows} null values" if failing_rows > 0 else "No null values found",
-            failing_rows=failing_rows,
-            total_rows=total_rows * len(self.columns),
-            details=failing_details,
+            return ValidationResult(
+                rule_name=self.name,
+                passed=failing_rows == 0,
+                severity=self.severity,
+                message=f"Found {failing_rows} null values" if failing_rows > 0 else "No null values found",
+                failing_rows=failing_rows,
+                total_rows=total_rows * len(self.columns),
+                details=failing_details,
+            )
+
+        return CompiledRule(
+            failing_mask=pl.any_horizontal(*masks.values()) if masks else pl.lit(False),
+            aggregates={col: mask.sum() for col, mask in masks.items()},
+            build_result=build_result,
+            merge=dict.fromkeys(masks, "sum"),
         )
 
 
@@ -121,28 +201,38 @@ class UniqueRule(ValidationRule):
         )
 
     def validate(self, df: pl.DataFrame) -> ValidationResult:
-        total_rows = len(df)
+        return self.compile(df.schema).evaluate(df)
 
-        # Count duplicates
-        dupe_count = df.group_by(self.columns).agg(
-            pl.count().alias("_count")
-        ).filter(pl.col("_count") > 1)
+    def compile(self, schema: pl.Schema) -> CompiledRule:
+        key = pl.col(self.columns[0]) if len(self.columns) == 1 else pl.struct(self.columns)
+        # Every occurrence after the first of a value is a duplicate row
+        duplicate_mask = ~key.is_first_distinct()
 
-        duplicate_rows = dupe_count["_count"].sum() - len(dupe_count) if len(dupe_count) > 0 else 0
+        def build_result(values: dict[str, Any], total_rows: int) -> ValidationResult:
+            duplicate_rows = values["duplicates"]
+            failing_values = [
+                value if isinstance(value, dict) else {self.columns[0]: value}
+                for value in values["samples"]
+            ]
 
-        # Get sample of duplicate values
-        failing_values = []
-        if len(dupe_count) > 0:
-            failing_values = dupe_count.head(10).select(self.columns).to_dicts()
+            return ValidationResult(
+                rule_name=self.name,
+                passed=duplicate_rows == 0,
+                severity=self.severity,
+                message=f"Found {duplicate_rows} duplicate rows" if duplicate_rows > 0 else "All values are unique",
+                failing_rows=duplicate_rows,
+                total_rows=total_rows,
+                failing_values=failing_values,
+            )
 
-        return ValidationResult(
-            rule_name=self.name,
-            passed=duplicate_rows == 0,
-            severity=self.severity,
-            message=f"Found {duplicate_rows} duplicate rows" if duplicate_rows > 0 else "All values are unique",
-            failing_rows=duplicate_rows,
-            total_rows=total_rows,
-            failing_values=failing_values,
+        return CompiledRule(
+            failing_mask=duplicate_mask,
+            aggregates={
+                "duplicates": duplicate_mask.sum(),
+                # Sample of duplicated values
+                "samples": key.filter(duplicate_mask).unique(maintain_order=True).head(10).implode(),
+            },
+            build_result=build_result,
         )
 
 
@@ -169,8 +259,10 @@ class RangeRule(ValidationRule):
         )
 
     def validate(self, df: pl.DataFrame) -> ValidationResult:
-        total_rows = len(df)
-        col = df[self.column]
+        return self.compile(df.schema).evaluate(df)
+
+    def compile(self, schema: pl.Schema) -> CompiledRule:
+        col = pl.col(self.column)
 
         # Build condition
         conditions = []
@@ -186,27 +278,35 @@ class RangeRule(ValidationRule):
             else:
                 conditions.append(col >= self.max_value)
 
-        if conditions:
-            failing_mask = conditions[0]
-            for cond in conditions[1:]:
-                failing_mask = failing_mask | cond
-            failing_rows = failing_mask.sum()
-        else:
-            failing_rows = 0
+        failing_mask = pl.any_horizontal(*conditions) if conditions else pl.lit(False)
 
-        return ValidationResult(
-            rule_name=self.name,
-            passed=failing_rows == 0,
-            severity=self.severity,
-            message=f"Found {failing_rows} values outside range" if failing_rows > 0 else "All values in range",
-            failing_rows=failing_rows,
-            total_rows=total_rows,
-            details={
-                "min_value": self.min_value,
-                "max_value": self.max_value,
+        def build_result(values: dict[str, Any], total_rows: int) -> ValidationResult:
+            failing_rows = values["failing"]
+
+            return ValidationResult(
+                rule_name=self.name,
+                passed=failing_rows == 0,
+                severity=self.severity,
+                message=f"Found {failing_rows} values outside range" if failing_rows > 0 else "All values in range",
+                failing_rows=failing_rows,
+                total_rows=total_rows,
+                details={
+                    "min_value": self.min_value,
+                    "max_value": self.max_value,
+                    "actual_min": values["actual_min"],
+                    "actual_max": values["actual_max"],
+                },
+            )
+
+        return CompiledRule(
+            failing_mask=failing_mask,
+            aggregates={
+                "failing": failing_mask.sum(),
                 "actual_min": col.min(),
                 "actual_max": col.max(),
             },
+            build_result=build_result,
+            merge={"failing": "sum", "actual_min": "min", "actual_max": "max"},
         )
 
 
@@ -231,30 +331,35 @@ class RegexRule(ValidationRule):
         )
 
     def validate(self, df: pl.DataFrame) -> ValidationResult:
-        total_rows = len(df)
+        return self.compile(df.schema).evaluate(df)
 
+    def compile(self, schema: pl.Schema) -> CompiledRule:
         # Apply regex match
-        matches = df[self.column].str.contains(self.pattern)
+        matches = pl.col(self.column).str.contains(self.pattern)
+        failing_mask = matches if self.negate else ~matches
 
-        if self.negate:
-            failing_rows = matches.sum()
-        else:
-            failing_rows = (~matches).sum()
+        def build_result(values: dict[str, Any], total_rows: int) -> ValidationResult:
+            failing_rows = values["failing"]
 
-        # Get sample failing values
-        if self.negate:
-            failing_values = df.filter(matches)[self.column].head(10).to_list()
-        else:
-            failing_values = df.filter(~matches)[self.column].head(10).to_list()
+            return ValidationResult(
+                rule_name=self.name,
+                passed=failing_rows == 0,
+                severity=self.severity,
+                message=f"Found {failing_rows} values not matching pattern" if failing_rows > 0 else "All values match pattern",
+                failing_rows=failing_rows,
+                total_rows=total_rows,
+                failing_values=values["samples"],
+            )
 
-        return ValidationResult(
-            rule_name=self.name,
-            passed=failing_rows == 0,
-            severity=self.severity,
-            message=f"Found {failing_rows} values not matching pattern" if failing_rows > 0 else "All values match pattern",
-            failing_rows=failing_rows,
-            total_rows=total_rows,
-            failing_values=failing_values,
+        return CompiledRule(
+            failing_mask=failing_mask,
+            aggregates={
+                "failing": failing_mask.sum(),
+                # Sample failing values
+                "samples": pl.col(self.column).filter(failing_mask).head(10).implode(),
+            },
+            build_result=build_result,
+            merge={"failing": "sum", "samples": "samples"},
         )
 
 
@@ -279,29 +384,41 @@ class InSetRule(ValidationRule):
         )
 
     def validate(self, df: pl.DataFrame) -> ValidationResult:
-        total_rows = len(df)
-        col = df[self.column]
+        return self.compile(df.schema).evaluate(df)
 
-        if not self.case_sensitive and col.dtype == pl.Utf8:
+    def compile(self, schema: pl.Schema) -> CompiledRule:
+        col = pl.col(self.column)
+
+        if not self.case_sensitive and schema.get(self.column) == pl.Utf8:
             col = col.str.to_lowercase()
             allowed = [v.lower() if isinstance(v, str) else v for v in self.allowed_values]
         else:
             allowed = self.allowed_values
 
         failing_mask = ~col.is_in(allowed)
-        failing_rows = failing_mask.sum()
 
-        # Get unique failing values
-        failing_values = df.filter(failing_mask)[self.column].unique().head(10).to_list()
+        def build_result(values: dict[str, Any], total_rows: int) -> ValidationResult:
+            failing_rows = values["failing"]
 
-        return ValidationResult(
-            rule_name=self.name,
-            passed=failing_rows == 0,
-            severity=self.severity,
-            message=f"Found {failing_rows} values not in allowed set" if failing_rows > 0 else "All values in allowed set",
-            failing_rows=failing_rows,
-            total_rows=total_rows,
-            failing_values=failing_values,
+            return ValidationResult(
+                rule_name=self.name,
+                passed=failing_rows == 0,
+                severity=self.severity,
+                message=f"Found {failing_rows} values not in allowed set" if failing_rows > 0 else "All values in allowed set",
+                failing_rows=failing_rows,
+                total_rows=total_rows,
+                failing_values=values["samples"],
+            )
+
+        return CompiledRule(
+            failing_mask=failing_mask,
+            aggregates={
+                "failing": failing_mask.sum(),
+                # Get unique failing values
+                "samples": pl.col(self.column).filter(failing_mask).unique(maintain_order=True).head(10).implode(),
+            },
+            build_result=build_result,
+            merge={"failing": "sum", "samples": "distinct_samples"},
         )
 
 
@@ -326,25 +443,36 @@ class ForeignKeyRule(ValidationRule):
         )
 
     def validate(self, df: pl.DataFrame) -> ValidationResult:
-        total_rows = len(df)
+        return self.compile(df.schema).evaluate(df)
 
+    def compile(self, schema: pl.Schema) -> CompiledRule:
         # Get reference values
         ref_values = self.reference_df[self.reference_column].unique()
 
         # Check which values don't exist
-        failing_mask = ~df[self.column].is_in(ref_values)
-        failing_rows = failing_mask.sum()
+        failing_mask = ~pl.col(self.column).is_in(ref_values)
 
-        failing_values = df.filter(failing_mask)[self.column].unique().head(10).to_list()
+        def build_result(values: dict[str, Any], total_rows: int) -> ValidationResult:
+            failing_rows = values["failing"]
 
-        return ValidationResult(
-            rule_name=self.name,
-            passed=failing_rows == 0,
-            severity=self.severity,
-            message=f"Found {failing_rows} orphan records" if failing_rows > 0 else "All foreign keys valid",
-            failing_rows=failing_rows,
-            total_rows=total_rows,
-            failing_values=failing_values,
+            return ValidationResult(
+                rule_name=self.name,
+                passed=failing_rows == 0,
+                severity=self.severity,
+                message=f"Found {failing_rows} orphan records" if failing_rows > 0 else "All foreign keys valid",
+                failing_rows=failing_rows,
+                total_rows=total_rows,
+                failing_values=values["samples"],
+            )
+
+        return CompiledRule(
+            failing_mask=failing_mask,
+            aggregates={
+                "failing": failing_mask.sum(),
+                "samples": pl.col(self.column).filter(failing_mask).unique(maintain_order=True).head(10).implode(),
+            },
+            build_result=build_result,
+            merge={"failing": "sum", "samples": "distinct_samples"},
         )
 
 
@@ -370,9 +498,7 @@ class CustomSQLRule(ValidationRule):
 
         # Use SQL context to evaluate expression
         try:
-            # The expression should return rows that FAIL the validation
-            failing_df = df.filter(pl.sql_expr(self.expression))
-            failing_rows = len(failing_df)
+            return self._compile(pl.sql_expr(self.expression)).evaluate(df)
         except Exception as e:
             return ValidationResult(
                 rule_name=self.name,
@@ -383,13 +509,33 @@ class CustomSQLRule(ValidationRule):
                 total_rows=total_rows,
             )
 
-        return ValidationResult(
-            rule_name=self.name,
-            passed=failing_rows == 0,
-            severity=self.severity,
-            message=f"Found {failing_rows} failing rows" if failing_rows > 0 else "Validation passed",
-            failing_rows=failing_rows,
-            total_rows=total_rows,
+    def compile(self, schema: pl.Schema) -> CompiledRule | None:
+        try:
+            # The expression should return rows that FAIL the validation
+            failing_mask = pl.sql_expr(self.expression)
+        except Exception:
+            return None
+        return self._compile(failing_mask)
+
+    def _compile(self, failing_mask: pl.Expr) -> CompiledRule:
+        """Build the compiled rule around the parsed expression."""
+        def build_result(values: dict[str, Any], total_rows: int) -> ValidationResult:
+            failing_rows = values["failing"]
+
+            return ValidationResult(
+                rule_name=self.name,
+                passed=failing_rows == 0,
+                severity=self.severity,
+                message=f"Found {failing_rows} failing rows" if failing_rows > 0 else "Validation passed",
+                failing_rows=failing_rows,
+                total_rows=total_rows,
+            )
+
+        return CompiledRule(
+            failing_mask=failing_mask,
+            aggregates={"failing": failing_mask.sum()},
+            build_result=build_result,
+            merge={"failing": "sum"},
         )
 
 
@@ -0,0 +1,287 @@
+"""Mergeable sketches for profiling data in bounded memory.
+
+Each sketch summarizes one chunk of data and can be merged with the sketch
+of another chunk, so tables larger than memory are profiled by sketching
+batches independently (possibly in parallel) and merging the results.
+Values are fed in as Polars Series and hashed with ``Series.hash``.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count estimator.
+
+    Uses ``2**precision`` one-byte registers; the standard error of the
+    estimate is about ``1.04 / sqrt(2**precision)`` (0.8% at the default
+    precision of 14, using 16 KiB).
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        if not 12 <= precision <= 18:
+            raise ValueError("precision must be between 12 and 18")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Standard error of the estimate, relative to the true count."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def update(self, values: pl.Series) -> None:
+        """Add the values of a Series."""
+        self.update_hashes(values.hash().to_numpy())
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        """Add 64-bit hashes."""
+        if len(hashes) == 0:
+            return
+        tail_bits = 64 - self.precision
+        index = (hashes >> np.uint64(tail_bits)).astype(np.int64)
+        tail = hashes & np.uint64((1 << tail_bits) - 1)
+        # Tails have at most 52 bits, so the float conversion is exact and
+        # frexp's exponent is the bit length
+        bit_length = np.frexp(tail.astype(np.float64))[1]
+        rank = (tail_bits - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: HyperLogLog) -> None:
+        """Merge another sketch of the same precision into this one."""
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        """
+        Estimated number of distinct values.
+
+        Uses Ertl's improved estimator, which needs neither bias tables nor
+        a switch to linear counting for small cardinalities.
+        """
+        m = len(self.registers)
+        tail_bits = 64 - self.precision
+        histogram = np.bincount(self.registers, minlength=tail_bits + 2)
+
+        z = m * _tau(1 - histogram[tail_bits + 1] / m)
+        for k in range(tail_bits, 0, -1):
+            z = 0.5 * (z + histogram[k])
+        z += m * _sigma(histogram[0] / m)
+        if math.isinf(z):
+            return 0
+        return int(round(m * m / (2 * math.log(2) * z)))
+
+
+def _sigma(x: float) -> float:
+    """Correction for empty registers in Ertl's estimator."""
+    if x == 1:
+        return math.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        previous = z
+        z += x * y
+        y += y
+        if z == previous:
+            return z
+
+
+def _tau(x: float) -> float:
+    """Correction for saturated registers in Ertl's estimator."""
+    if x == 0 or x == 1:
+        return 0.0
+    y, z = 1.0, 1 - x
+    while True:
+        x = math.sqrt(x)
+        previous = z
+        y *= 0.5
+        z -= (1 - x) ** 2 * y
+        if z == previous:
+            return z / 3
+
+
+class TDigest:
+    """
+    t-digest for approximate quantiles.
+
+    Values are clustered into centroids whose size shrinks towards the
+    tails (arcsine scale function), so extreme quantiles stay accurate.
+    At most about ``compression`` centroids are kept.
+    """
+
+    def __init__(self, compression: float = 200.0) -> None:
+        self.compression = compression
+        self.means = np.empty(0, dtype=np.float64)
+        self.weights = np.empty(0, dtype=np.float64)
+        self.min: float | None = None
+        self.max: float | None = None
+
+    @property
+    def count(self) -> float:
+        """Number of values added."""
+        return float(self.weights.sum())
+
+    def update(self, values: pl.Series) -> None:
+        """Add the non-null values of a numeric Series."""
+        array = values.drop_nulls().cast(pl.Float64).drop_nans().to_numpy()
+        if len(array) == 0:
+            return
+        self._add(array, np.ones(len(array)), float(array.min()), float(array.max()))
+
+    def merge(self, other: TDigest) -> None:
+        """Merge another digest into this one."""
+        if len(other.means):
+            self._add(other.means, other.weights, other.min, other.max)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimated value at quantile ``q`` (0-1)."""
+        if not len(self.means):
+            return None
+        positions = np.cumsum(self.weights) - self.weights / 2
+        xp = np.concatenate(([0.0], positions, [self.count]))
+        fp = np.concatenate(([self.min], self.means, [self.max]))
+        return float(np.interp(q * self.count, xp, fp))
+
+    def cdf(self, value: float) -> float:
+        """Estimated fraction of values below ``value``."""
+        if not len(self.means):
+            return 0.0
+        if value <= self.min:
+            return 0.0
+        if value >= self.max:
+            return 1.0
+        positions = np.cumsum(self.weights) - self.weights / 2
+        xp = np.concatenate(([self.min], self.means, [self.max]))
+        fp = np.concatenate(([0.0], positions, [self.count]))
+        return float(np.interp(value, xp, fp) / self.count)
+
+    def _add(self, means: np.ndarray, weights: np.ndarray, lo: float, hi: float) -> None:
+        """Add centroids and re-cluster."""
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+
+        means = np.concatenate((self.means, means))
+        weights = np.concatenate((self.weights, weights))
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+
+        # Centroids whose left edge falls in the same unit of the scale
+        # function k(q) = delta / (2 pi) * asin(2q - 1) are merged
+        total = weights.sum()
+        q_left = (np.cumsum(weights) - weights) / total
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * q_left - 1)
+        cluster = np.floor(k - k[0]).astype(np.int64)
+
+        self.weights = np.bincount(cluster, weights=weights)
+        self.means = np.bincount(cluster, weights=means * weights)
+        keep = self.weights > 0
+        self.weights = self.weights[keep]
+        self.means = self.means[keep] / self.weights
+
+
+class CountMinSketch:
+    """
+    Count-min sketch with a bounded set of heavy-hitter candidates.
+
+    Frequencies are estimated from a ``depth x width`` counter table (never
+    underestimated, overestimated by at most ``e / width`` of the total with
+    high probability). The ``capacity`` values with the highest estimates
+    are remembered so the most frequent values can be reported.
+    """
+
+    def __init__(self, width: int = 4096, depth: int = 6, capacity: int = 50) -> None:
+        if width < 2 or width & (width - 1):
+            raise ValueError("width must be a power of two")
+        self.width = width
+        self.depth = depth
+        self.capacity = capacity
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.candidates: dict[int, Any] = {}
+
+    def update(self, values: pl.Series) -> None:
+        """Count the values of a Series (nulls included)."""
+        if len(values) == 0:
+            return
+        hashes = values.hash()
+        cells = self._cells(hashes.to_numpy())
+        counts = np.bincount(cells.ravel().astype(np.intp), minlength=self.table.size)
+        self.table += counts.reshape(self.table.shape)
+
+        # Distinct values of this batch with the highest estimates become candidates
+        distinct = hashes.unique().to_numpy()
+        estimates = self._estimate(distinct)
+        if len(distinct) > self.capacity:
+            keep = np.argpartition(-estimates, self.capacity)[: self.capacity]
+            distinct, estimates = distinct[keep], estimates[keep]
+        known = np.fromiter(self.candidates, np.uint64, len(self.candidates))
+        new = distinct[(estimates > self.error_bound) & ~np.isin(distinct, known)]
+        if len(new):
+            found = (
+                pl.DataFrame({"hash": hashes, "value": values})
+                .filter(pl.col("hash").is_in(pl.Series(new).implode()))
+                .unique("hash", keep="first")
+            )
+            self.candidates.update(
+                zip(found["hash"].to_list(), found["value"].to_list(), strict=True)
+            )
+        self._prune()
+
+    def merge(self, other: CountMinSketch) -> None:
+        """Merge a sketch of the same shape into this one."""
+        self.table += other.table
+        for key, value in other.candidates.items():
+            self.candidates.setdefault(key, value)
+        self._prune()
+
+    @property
+    def error_bound(self) -> float:
+        """Overestimate of any count that holds with high probability."""
+        return math.e / self.width * float(self.table[0].sum())
+
+    def top(self, k: int) -> list[tuple[Any, int]]:
+        """
+        The ``k`` most frequent values with their estimated counts.
+
+        Values whose estimate is within the error bound are left out, since
+        their counts may be mostly collisions (e.g. in a unique column).
+        """
+        if not self.candidates:
+            return []
+        keys = np.fromiter(self.candidates, np.uint64, len(self.candidates))
+        estimates = self._estimate(keys)
+        order = np.argsort(-estimates, kind="stable")[:k]
+        bound = self.error_bound
+        return [
+            (self.candidates[int(keys[i])], int(estimates[i]))
+            for i in order
+            if estimates[i] > bound
+        ]
+
+    def _cells(self, hashes: np.ndarray) -> np.ndarray:
+        """Flat counter index per row and value, by double hashing."""
+        # The width divides 2**32, so wrapping uint32 arithmetic is exact
+        index = hashes.astype(np.uint32)
+        step = (hashes >> np.uint64(32)).astype(np.uint32)
+        cells = np.empty((self.depth, len(hashes)), dtype=np.uint32)
+        for row in range(self.depth):
+            if row:
+                np.add(index, step, out=index)
+            np.bitwise_and(index, np.uint32(self.width - 1), out=cells[row])
+            cells[row] += np.uint32(row * self.width)
+        return cells
+
+    def _estimate(self, hashes: np.ndarray) -> np.ndarray:
+        """Estimated counts of hashed values."""
+        return self.table.ravel()[self._cells(hashes)].min(axis=0)
+
+    def _prune(self) -> None:
+        """Keep only the candidates with the highest estimates."""
+        if len(self.candidates) <= self.capacity:
+            return
+        keys = np.fromiter(self.candidates, np.uint64, len(self.candidates))
+        keep = keys[np.argsort(-self._estimate(keys), kind="stable")[: self.capacity]]
+        self.candidates = {int(key): self.candidates[int(key)] for key in keep}
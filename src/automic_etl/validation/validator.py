@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any
 from datetime import datetime
 
 import polars as pl
 import structlog
 
-from automic_etl.validation.rules import ValidationRule, ValidationResult, Severity
+from automic_etl.validation.batches import (
+    DEFAULT_BATCH_SIZE,
+    BatchSource,
+    iter_batches,
+    map_batches,
+)
+from automic_etl.validation.rules import (
+    CompiledRule,
+    Severity,
+    ValidationResult,
+    ValidationRule,
+)
 from automic_etl.core.utils import utc_now
 
 logger = structlog.get_logger()
@@ -87,12 +100,159 @@ class ValidationReport:
         ])
 
 
+class ValidationPlan:
+    """
+    Validation rules compiled into one fused Polars query.
+
+    Rules that compile to expressions are evaluated together in a single
+    ``select``, so Polars scans the data once and computes every rule in
+    parallel. Rules that cannot be compiled (custom functions, schema
+    checks) or that reference missing columns run individually.
+    """
+
+    def __init__(self, rules: list[ValidationRule], schema: pl.Schema) -> None:
+        self.rules = rules
+        self.compiled: dict[int, CompiledRule] = {}
+
+        for index, rule in enumerate(rules):
+            compiled = rule.compile(schema)
+            # Rules on missing columns run alone so they report their own error
+            if compiled is not None and compiled.columns <= set(schema.names()):
+                self.compiled[index] = compiled
+
+    @property
+    def fused_rules(self) -> int:
+        """Number of rules evaluated in the fused query."""
+        return len(self.compiled)
+
+    @property
+    def fallback_rules(self) -> int:
+        """Number of rules evaluated one by one."""
+        return len(self.rules) - len(self.compiled)
+
+    def evaluate(
+        self,
+        df: pl.DataFrame,
+        indices: Iterable[int] | None = None,
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Evaluate compiled rules in one pass; returns aggregates per rule index.
+
+        Args:
+            df: DataFrame to evaluate
+            indices: Rule indices to evaluate (all compiled rules by default)
+        """
+        indices = list(self.compiled if indices is None else indices)
+        exprs = [
+            expr.alias(f"{index}.{name}")
+            for index in indices
+            for name, expr in self.compiled[index].aggregates.items()
+        ]
+        row = df.select(exprs).row(0, named=True) if exprs else {}
+
+        values: dict[int, dict[str, Any]] = {index: {} for index in indices}
+        for key, value in row.items():
+            index, name = key.split(".", 1)
+            values[int(index)][name] = value
+        return values
+
+    def failing_mask(self, severity: Severity = Severity.ERROR) -> pl.Expr:
+        """Row-level expression, true where a row fails any compiled rule of a severity."""
+        masks = [
+            compiled.failing_mask
+            for index, compiled in self.compiled.items()
+            if self.rules[index].severity == severity
+        ]
+        if not masks:
+            return pl.lit(False)
+        return pl.any_horizontal(*masks).fill_null(False)
+
+    def evaluate_mask(
+        self,
+        df: pl.DataFrame,
+        severity: Severity = Severity.ERROR,
+    ) -> tuple[pl.Series, dict[int, Exception]]:
+        """
+        Evaluate the failing-row mask of a severity on a DataFrame.
+
+        If the fused mask fails, each rule's mask is evaluated on its own
+        and rules whose mask cannot be built (e.g. a regex on an integer
+        column) are left out.
+
+        Returns:
+            Tuple of (mask, exception per rule index left out)
+        """
+        try:
+            return df.select(self.failing_mask(severity)).to_series(), {}
+        except Exception:
+            pass
+
+        mask = pl.repeat(False, len(df), eager=True)
+        errors: dict[int, Exception] = {}
+        for index, compiled in self.compiled.items():
+            if self.rules[index].severity != severity:
+                continue
+            try:
+                mask = mask | df.select(compiled.failing_mask.fill_null(False)).to_series()
+            except Exception as e:
+                errors[index] = e
+        return mask, errors
+
+
+@dataclass
+class _ChunkState:
+    """Partial validation state of one or more chunks of a table."""
+    rows: int = 0
+    batches: int = 0
+    # Mergeable aggregates per rule index
+    aggregates: dict[int, dict[str, Any]] = field(default_factory=dict)
+    # Rules whose aggregates failed to evaluate
+    errors: dict[int, Exception] = field(default_factory=dict)
+    # Projected columns of rules that need the whole table
+    projections: dict[int, list[pl.DataFrame]] = field(default_factory=dict)
+    # Results of rules that run on each chunk
+    results: dict[int, ValidationResult] = field(default_factory=dict)
+
+    def merge(self, other: _ChunkState, plan: ValidationPlan) -> None:
+        """Merge the state of later chunks into this one."""
+        self.rows += other.rows
+        self.batches += other.batches
+        self.errors = {**other.errors, **self.errors}
+        for index, values in other.aggregates.items():
+            mine = self.aggregates.get(index)
+            self.aggregates[index] = (
+                values if mine is None else plan.compiled[index].merge_aggregates(mine, values)
+            )
+        for index, frames in other.projections.items():
+            self.projections.setdefault(index, []).extend(frames)
+        for index, result in other.results.items():
+            mine = self.results.get(index)
+            self.results[index] = result if mine is None else _merge_results(mine, result)
+
+
+def _merge_results(left: ValidationResult, right: ValidationResult) -> ValidationResult:
+    """Combine the results of one rule on two chunks."""
+    first = left if not left.passed or right.passed else right
+    return ValidationResult(
+        rule_name=first.rule_name,
+        passed=left.passed and right.passed,
+        severity=first.severity,
+        message=first.message,
+        failing_rows=left.failing_rows + right.failing_rows,
+        total_rows=left.total_rows + right.total_rows,
+        failing_values=(left.failing_values + right.failing_values)[:10],
+        details=first.details,
+    )
+
+
 class DataValidator:
     """
     Data validation engine.
 
     Features:
     - Register and execute validation rules
+    - Fused single-pass evaluation of expression-based rules
+    - Chunked validation of LazyFrames and record batch streams
     - Generate validation reports
     - Support fail-fast or complete validation
     - Configurable thresholds
@@ -103,6 +263,8 @@ class DataValidator:
         name: str = "default_validator",
         fail_fast: bool = False,
         error_threshold: float | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = 4,
     ) -> None:
         """
         Initialize validator.
@@ -111,10 +273,14 @@ class DataValidator:
             name: Validator name
             fail_fast: Stop on first failure
             error_threshold: Maximum allowed error percentage (0-100)
+            batch_size: Rows per chunk when validating LazyFrames or batches
+            max_workers: Chunks validated in parallel
         """
         self.name = name
         self.fail_fast = fail_fast
         self.error_threshold = error_threshold
+        self.batch_size = batch_size
+        self.max_workers = max_workers
         self.rules: list[ValidationRule] = []
         self.logger = logger.bind(validator=name)
 
@@ -133,21 +299,42 @@ class DataValidator:
         self.rules = []
         return self
 
+    def compile(self, schema: pl.Schema) -> ValidationPlan:
+        """Compile the registered rules for a schema."""
+        return ValidationPlan(self.rules, schema)
+
     def validate(
         self,
-        df: pl.DataFrame,
+        df: pl.DataFrame | BatchSource,
         dataset_name: str = "unnamed",
     ) -> ValidationReport:
         """
         Validate a DataFrame against all rules.
 
+        Expression-based rules are evaluated together in one pass over the
+        data; the remaining rules run one by one. LazyFrames and batch
+        sources are validated chunk by chunk (see ``validate_batches``).
+
         Args:
-            df: DataFrame to validate
+            df: DataFrame, LazyFrame or batch source to validate
             dataset_name: Name for the dataset
 
         Returns:
             ValidationReport with all results
         """
+        if not isinstance(df, pl.DataFrame):
+            return self.validate_batches(df, dataset_name)
+        return self._validate_frame(df, dataset_name, self.compile(df.schema))
+
+    def _validate_frame(
+        self,
+        df: pl.DataFrame,
+        dataset_name: str,
+        plan: ValidationPlan,
+        broken: dict[int, Exception] | None = None,
+    ) -> ValidationReport:
+        """Validate a DataFrame with a compiled plan; ``broken`` rules report their error."""
+        broken = broken or {}
         self.logger.info(
             "Starting validation",
             dataset=dataset_name,
@@ -155,14 +342,137 @@ class DataValidator:
             rows=len(df),
         )
 
+        try:
+            aggregates = plan.evaluate(df, [i for i in plan.compiled if i not in broken])
+        except Exception as e:
+            # One bad expression must not fail every rule; evaluate them separately
+            self.logger.warning("Fused validation failed, running rules individually", error=str(e))
+            aggregates = {}
+
+        def runner(index: int) -> Callable[[], ValidationResult]:
+            if index in broken:
+                def fail() -> ValidationResult:
+                    raise broken[index]
+                return fail
+            if index in aggregates:
+                return lambda: plan.compiled[index].build_result(aggregates[index], len(df))
+            return lambda: self.rules[index].validate(df)
+
+        return self._build_report(
+            dataset_name,
+            len(df),
+            [runner(index) for index in range(len(self.rules))],
+            metadata={
+                "fused_rules": len(aggregates),
+                "individual_rules": len(self.rules) - len(aggregates),
+            },
+        )
+
+    def validate_batches(
+        self,
+        source: BatchSource,
+        dataset_name: str = "unnamed",
+    ) -> ValidationReport:
+        """
+        Validate a table chunk by chunk, in bounded memory.
+
+        Each chunk is validated by a pool of workers and only mergeable
+        partial aggregates (failing row counts, min/max, value samples) are
+        kept, so the whole table is never loaded. Rules that compile to
+        expressions give the same results as validating the full table.
+
+        ``UniqueRule`` needs to see every key at once, so only its key
+        columns are accumulated and checked at the end. Rules that do not
+        compile (custom functions, schema checks) run on each chunk and
+        their results are summed.
+
+        Args:
+            source: LazyFrame, Arrow table/record batches or an iterable of
+                DataFrames, e.g. an Iceberg scan's ``to_arrow_batch_reader()``
+            dataset_name: Name for the dataset
+
+        Returns:
+            ValidationReport with all results
+        """
+        batches = iter_batches(source, self.batch_size)
+        first = next(batches, None)
+        if first is None:
+            schema = source.collect_schema() if isinstance(source, pl.LazyFrame) else pl.Schema()
+            return self.validate(pl.DataFrame(schema=schema), dataset_name)
+
+        self.logger.info(
+            "Starting chunked validation",
+            dataset=dataset_name,
+            rules=len(self.rules),
+            batch_size=self.batch_size,
+            workers=self.max_workers,
+        )
+
+        plan = self.compile(first.schema)
+        chunked = [i for i, compiled in plan.compiled.items() if compiled.mergeable]
+        whole_table = {i: sorted(c.columns) for i, c in plan.compiled.items() if not c.mergeable}
+        per_chunk = [i for i in range(len(self.rules)) if i not in plan.compiled]
+
+        def process(batch: pl.DataFrame) -> _ChunkState:
+            state = _ChunkState(rows=len(batch), batches=1)
+            try:
+                state.aggregates = plan.evaluate(batch, chunked)
+            except Exception:
+                for index in chunked:
+                    try:
+                        state.aggregates.update(plan.evaluate(batch, [index]))
+                    except Exception as e:
+                        state.errors[index] = e
+            state.projections = {i: [batch.select(columns)] for i, columns in whole_table.items()}
+            for index in per_chunk:
+                try:
+                    state.results[index] = self.rules[index].validate(batch)
+                except Exception as e:
+                    state.errors[index] = e
+            return state
+
+        state = _ChunkState()
+        for partial in map_batches(process, chain([first], batches), self.max_workers):
+            state.merge(partial, plan)
+
+        def runner(index: int) -> Callable[[], ValidationResult]:
+            def run() -> ValidationResult:
+                if index in state.errors:
+                    raise state.errors[index]
+                if index in whole_table:
+                    return plan.compiled[index].evaluate(pl.concat(state.projections[index]))
+                if index in state.results:
+                    return state.results[index]
+                return plan.compiled[index].build_result(state.aggregates[index], state.rows)
+            return run
+
+        return self._build_report(
+            dataset_name,
+            state.rows,
+            [runner(index) for index in range(len(self.rules))],
+            metadata={
+                "fused_rules": len(plan.compiled),
+                "individual_rules": len(per_chunk),
+                "batches": state.batches,
+            },
+        )
+
+    def _build_report(
+        self,
+        dataset_name: str,
+        total_rows: int,
+        runners: list[Callable[[], ValidationResult]],
+        metadata: dict[str, Any],
+    ) -> ValidationReport:
+        """Collect rule results in order, honoring fail-fast, into a report."""
         results = []
         passed = 0
         failed = 0
         warnings = 0
 
-        for rule in self.rules:
+        for rule, run in zip(self.rules, runners, strict=True):
             try:
-                result = rule.validate(df)
+                result = run()
                 results.append(result)
 
                 if result.passed:
@@ -190,7 +500,7 @@ class DataValidator:
                     passed=False,
                     severity=Severity.ERROR,
                     message=f"Rule execution error: {str(e)}",
-                    total_rows=len(df),
+                    total_rows=total_rows,
                 ))
                 failed += 1
 
@@ -201,8 +511,9 @@ class DataValidator:
             passed_rules=passed,
             failed_rules=failed,
             warning_rules=warnings,
-            total_rows=len(df),
+            total_rows=total_rows,
             results=results,
+            metadata=metadata,
         )
 
         # Check threshold
@@ -234,6 +545,11 @@ class DataValidator:
         """
         Validate and separate valid/invalid rows.
 
+        A row is invalid if it fails any error-level rule that compiles to
+        expressions. Rules that cannot be compiled only contribute to the
+        report, and rules whose row mask cannot be evaluated on ``df`` are
+        left out of the filter and reported as rule errors.
+
         Args:
             df: DataFrame to validate
             dataset_name: Name for the dataset
@@ -241,19 +557,18 @@ class DataValidator:
         Returns:
             Tuple of (valid_df, invalid_df, report)
         """
-        report = self.validate(df, dataset_name)
-
-        # Build combined filter for invalid rows
-        invalid_mask = pl.lit(False)
-
-        for result in report.results:
-            if not result.passed and result.severity == Severity.ERROR:
-                # Try to reconstruct the failing rows filter
-                # This requires rules to provide enough info
-                pass
-
-        # For now, return all rows in valid (this needs rule-specific logic)
-        return df, pl.DataFrame(), report
+        # The report and the row filter share one compiled plan
+        plan = self.compile(df.schema)
+        invalid_mask, broken = plan.evaluate_mask(df)
+        for index, error in broken.items():
+            self.logger.warning(
+                "Rule left out of row filter",
+                rule=self.rules[index].name,
+                error=str(error),
+            )
+        report = self._validate_frame(df, dataset_name, plan, broken)
+
+        return df.filter(~invalid_mask), df.filter(invalid_mask), report
 
     @classmethod
     def common_rules(
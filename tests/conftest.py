@@ -70,6 +70,28 @@ def test_settings(temp_dir: Path) -> Settings:
     )
 
 
+@pytest.fixture
+def sql_catalog(temp_dir: Path):
+    """Create a local SQLite-backed pyiceberg catalog."""
+    from pyiceberg.catalog.sql import SqlCatalog
+
+    return SqlCatalog(
+        "test",
+        uri=f"sqlite:///{temp_dir}/catalog.db",
+        warehouse=f"file://{temp_dir}/warehouse",
+    )
+
+
+@pytest.fixture
+def iceberg_catalog(test_settings: Settings, sql_catalog):
+    """Create an IcebergCatalog backed by the local SQLite catalog."""
+    from automic_etl.storage.iceberg.catalog import IcebergCatalog
+
+    catalog = IcebergCatalog(test_settings)
+    catalog._catalog = sql_catalog
+    return catalog
+
+
 @pytest.fixture
 def mock_storage_client(monkeypatch):
     """Mock storage client to avoid real cloud calls."""
@@ -130,3 +152,9 @@ def setup_logging(caplog):
     import logging
     caplog.set_level(logging.DEBUG)
     return caplog
+
+
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(tmp_path, monkeypatch):
+    """Keep the default LLM response cache out of the user's home directory."""
+    monkeypatch.setattr("automic_etl.llm.cache.DEFAULT_CACHE_PATH", tmp_path / "llm_cache.db")
@@ -0,0 +1,96 @@
+"""Tests for streaming batch extraction."""
+
+import threading
+from unittest.mock import MagicMock
+
+import polars as pl
+import pytest
+
+from automic_etl.connectors.base import ExtractionResult
+from automic_etl.core.exceptions import ExtractionError
+from automic_etl.extraction import BatchExtractor
+
+
+def make_connector(num_batches: int, rows_per_batch: int = 10) -> MagicMock:
+    """Create a connector yielding a fixed number of batches."""
+    connector = MagicMock()
+
+    def extract_batch(query=None, batch_size=None):
+        for i in range(num_batches):
+            df = pl.DataFrame({"id": range(i * rows_per_batch, (i + 1) * rows_per_batch)})
+            yield ExtractionResult(data=df, row_count=len(df))
+
+    connector.extract_batch.side_effect = extract_batch
+    return connector
+
+
+class TestStreamingExtraction:
+    """Test BatchExtractor.extract_stream."""
+
+    def test_commits_every_n_rows(self, test_settings):
+        """Batches are grouped into commits of at least commit_rows rows."""
+        written: list[int] = []
+
+        def sink(df: pl.DataFrame) -> int:
+            written.append(len(df))
+            return len(df)
+
+        result = BatchExtractor(test_settings).extract_stream(
+            make_connector(5),
+            sink=sink,
+            batch_size=10,
+            commit_rows=20,
+        )
+
+        assert written == [20, 20, 10]
+        assert result.total_rows == 50
+        assert result.batches_processed == 5
+        assert len(result.commits) == 3
+        assert all(m.rows == 10 for m in result.batch_metrics)
+
+    def test_writer_runs_on_calling_thread(self, test_settings):
+        """Extraction is overlapped on a separate thread from the writer."""
+        writer_threads = set()
+
+        def sink(df: pl.DataFrame) -> int:
+            writer_threads.add(threading.current_thread().name)
+            return len(df)
+
+        BatchExtractor(test_settings).extract_stream(
+            make_connector(3), sink=sink, batch_size=10, commit_rows=10
+        )
+
+        assert writer_threads == {threading.current_thread().name}
+
+    def test_sink_failure_stops_extraction(self, test_settings):
+        """A failing sink raises and stops the extractor thread."""
+        def sink(df: pl.DataFrame) -> int:
+            raise RuntimeError("write failed")
+
+        with pytest.raises(ExtractionError):
+            BatchExtractor(test_settings).extract_stream(
+                make_connector(100), sink=sink, batch_size=10, commit_rows=10, queue_size=1
+            )
+
+        assert not any(t.name == "batch-extractor" for t in threading.enumerate())
+
+    def test_transform_failure_discards_buffered_rows(self, test_settings):
+        """Batches buffered before a failed transform are not committed."""
+        committed: list[int] = []
+
+        def transform(df: pl.DataFrame) -> pl.DataFrame:
+            if df["id"][0] == 20:
+                raise ValueError("bad batch")
+            return df
+
+        result = BatchExtractor(test_settings).extract_stream(
+            make_connector(5),
+            sink=lambda df: committed.append(len(df)) or len(df),
+            batch_size=10,
+            transform=transform,
+            commit_rows=100,
+        )
+
+        assert committed == []
+        assert result.total_rows == 0
+        assert len(result.errors) == 1
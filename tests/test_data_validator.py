@@ -0,0 +1,105 @@
+"""Tests for the rule-based data validator."""
+
+import polars as pl
+import pytest
+
+from automic_etl.validation import (
+    CustomSQLRule,
+    DataValidator,
+    InSetRule,
+    NotNullRule,
+    RangeRule,
+    RegexRule,
+    UniqueRule,
+)
+from automic_etl.validation.rules import CustomFunctionRule
+
+
+@pytest.fixture
+def orders() -> pl.DataFrame:
+    """Orders with a duplicate ID, a null, and out-of-range amounts."""
+    return pl.DataFrame({
+        "id": [1, 2, 2, 3, None],
+        "amount": [10.0, -5.0, 20.0, 500.0, 15.0],
+        "status": ["open", "open", "closed", "lost", "open"],
+    })
+
+
+def test_fused_validation_matches_per_rule_results(orders):
+    """Compiled rules are evaluated in one query with the same results."""
+    rules = [
+        NotNullRule("id"),
+        UniqueRule("id"),
+        RangeRule("amount", 0, 100),
+        InSetRule("status", ["open", "closed"]),
+        CustomSQLRule("amount > 400", name="large_amount"),
+        CustomFunctionRule(lambda df: (True, "ok", 0), name="custom"),
+    ]
+
+    report = DataValidator().add_rules(rules).validate(orders)
+
+    assert report.metadata == {"fused_rules": 5, "individual_rules": 1}
+    for rule, result in zip(rules, report.results, strict=True):
+        expected = rule.validate(orders)
+        assert (result.failing_rows, result.failing_values, result.details) == (
+            expected.failing_rows,
+            expected.failing_values,
+            expected.details,
+        )
+    assert [r.failing_rows for r in report.results] == [1, 1, 2, 1, 1, 0]
+
+
+def test_validate_and_filter_splits_failing_rows(orders):
+    """Rows failing any error-level rule go to the invalid frame."""
+    validator = DataValidator().add_rules([
+        NotNullRule("id"),
+        RangeRule("amount", 0, 100),
+    ])
+
+    valid, invalid, report = validator.validate_and_filter(orders)
+
+    assert valid["id"].to_list() == [1, 2]
+    assert invalid["amount"].to_list() == [-5.0, 500.0, 15.0]
+    assert not report.is_valid
+
+
+def test_validate_and_filter_leaves_out_mismatched_rules(orders):
+    """A rule that cannot evaluate on the column type is reported, not fatal."""
+    validator = DataValidator().add_rules([
+        RegexRule("amount", r"^\d+$"),
+        NotNullRule("id"),
+        RangeRule("amount", 0, 100),
+    ])
+
+    valid, invalid, report = validator.validate_and_filter(orders)
+
+    assert valid["id"].to_list() == [1, 2]
+    assert invalid["amount"].to_list() == [-5.0, 500.0, 15.0]
+    assert report.results[0].message.startswith("Rule execution error")
+    assert [r.failing_rows for r in report.results[1:]] == [1, 2]
+    assert report.metadata == {"fused_rules": 2, "individual_rules": 1}
+
+
+def test_chunked_validation_matches_in_memory(orders):
+    """A LazyFrame validated in small chunks gives the in-memory results."""
+    rules = [
+        NotNullRule("id"),
+        UniqueRule("id"),
+        RangeRule("amount", 0, 100),
+        InSetRule("status", ["open", "closed"]),
+        CustomFunctionRule(lambda df: (True, "ok", 0), name="custom"),
+    ]
+    validator = DataValidator(batch_size=2, max_workers=2).add_rules(rules)
+
+    expected = validator.validate(orders)
+    report = validator.validate(orders.lazy())
+
+    assert report.metadata["batches"] == 3
+    assert report.total_rows == 5
+    for result, exp in zip(report.results, expected.results, strict=True):
+        assert (result.passed, result.failing_rows, result.failing_values, result.details) == (
+            exp.passed,
+            exp.failing_rows,
+            exp.failing_values,
+            exp.details,
+        )
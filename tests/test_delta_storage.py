@@ -0,0 +1,112 @@
+"""Tests for Delta Lake reads with filter pushdown."""
+
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from automic_etl.storage.delta import DeltaTableManager, translate_delta_filter
+
+
+@pytest.fixture
+def manager(test_settings):
+    """Create a Delta table manager."""
+    return DeltaTableManager(test_settings)
+
+
+@pytest.fixture
+def table_path(manager, temp_dir):
+    """Create a partitioned Delta table with two versions."""
+    path = str(temp_dir / "orders")
+    manager.create_table(
+        path,
+        pl.DataFrame({
+            "region": ["EU", "EU", "US", "APAC"],
+            "id": [1, 2, 3, 4],
+            "amount": [10.0, 20.0, 30.0, 40.0],
+        }),
+        partition_by=["region"],
+    )
+    manager.append(
+        path,
+        pl.DataFrame({"region": ["EU"], "id": [100], "amount": [5.0]}),
+    )
+    return path
+
+
+class TestDeltaFilterTranslation:
+    """Test splitting filters into pushed-down and residual parts."""
+
+    def test_pushable_and_residual_conjuncts(self):
+        """Comparisons are pushed down, functions stay in Polars."""
+        schema = pa.schema([("region", pa.string()), ("id", pa.int64())])
+
+        translated = translate_delta_filter(
+            "region IN ('EU', 'US') AND id BETWEEN 1 AND 3 AND upper(region) = 'EU'",
+            schema,
+        )
+
+        assert translated.file_filters == [
+            ("region", "in", ["EU", "US"]),
+            ("id", ">=", 1),
+            ("id", "<=", 3),
+        ]
+        assert translated.residual == "(upper(region) = 'EU')"
+
+    def test_incompatible_literal_is_residual(self):
+        """Literals that cannot be cast to the column type are not pushed."""
+        schema = pa.schema([("id", pa.int64())])
+
+        translated = translate_delta_filter("id = 'abc'", schema)
+
+        assert translated.file_filters == []
+        assert translated.residual == "(id = 'abc')"
+
+
+class TestDeltaScan:
+    """Test lazy scans over Delta tables."""
+
+    def test_scan_prunes_files_and_filters_rows(self, manager, table_path):
+        """Only matching files are scanned and results are exact."""
+        lf = manager.scan(table_path, columns=["id"], filter_expr="region = 'EU' AND id > 1")
+
+        assert isinstance(lf, pl.LazyFrame)
+        assert sorted(lf.collect()["id"].to_list()) == [2, 100]
+
+    def test_time_travel_with_residual(self, manager, table_path):
+        """Reads at an older version apply the same filters."""
+        df = manager.read(
+            table_path,
+            filter_expr="region = 'EU' AND amount * 2 > 30",
+            version=0,
+        )
+
+        assert df["id"].to_list() == [2]
+
+    def test_or_binds_looser_than_and(self, manager, table_path):
+        """A top-level OR is filtered as a whole, not split on its AND."""
+        df = manager.read(table_path, filter_expr="id = 1 OR region = 'US' AND amount = 30.0")
+
+        assert sorted(df["id"].to_list()) == [1, 3]
+
+
+class TestDeltaWrites:
+    """Test writes and table statistics."""
+
+    def test_overwrite_replaces_only_filtered_partition(self, manager, table_path):
+        """Partition filters become a replace-where predicate."""
+        manager.overwrite(
+            table_path,
+            pl.DataFrame({"region": ["EU"], "id": [7], "amount": [1.0]}),
+            partition_filters=[("region", "=", "EU")],
+        )
+
+        df = manager.read(table_path).sort("id")
+        assert df["id"].to_list() == [3, 4, 7]
+
+    def test_get_stats_counts_files(self, manager, table_path):
+        """Stats come from the add actions of the current version."""
+        stats = manager.get_stats(table_path)
+
+        assert stats["version"] == 1
+        assert stats["num_files"] == 4
+        assert stats["total_size_bytes"] > 0
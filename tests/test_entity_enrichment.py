@@ -0,0 +1,52 @@
+"""Tests for distinct-value entity enrichment."""
+
+import json
+from unittest.mock import patch
+
+import polars as pl
+
+from automic_etl.core.config import Settings
+from automic_etl.llm.client import LLMResponse
+from automic_etl.llm.entity_extractor import EntityExtractor
+
+
+def fake_complete(prompt, system_prompt, temperature, max_tokens):
+    """Return a PERSON entity for texts mentioning Bob."""
+    entities = [{"type": "PERSON", "value": "Bob", "confidence": 0.9}] if "Bob" in prompt else []
+    return LLMResponse(
+        content=json.dumps({"entities": entities}),
+        model="m",
+        tokens_used=10,
+        finish_reason="end_turn",
+    )
+
+
+def test_extract_from_dataframe_calls_llm_once_per_distinct_text():
+    """Repeated texts share one LLM call and results are joined back to every row."""
+    extractor = EntityExtractor(Settings(llm__provider="anthropic", llm__api_key="test-key"))
+    df = pl.DataFrame({"note": ["call Bob", "closed", "call Bob", None, "call  Bob "]})
+
+    with patch.object(extractor.client, "_complete_anthropic", side_effect=fake_complete) as llm:
+        result = extractor.extract_from_dataframe(df, "note", ["PERSON"], normalize=True)
+
+    assert llm.call_count == 2
+    assert result["PERSON"].to_list() == ["Bob", None, "Bob", None, "Bob"]
+    stats = extractor.last_enrichment_stats
+    assert stats.non_empty_rows == 4
+    assert stats.distinct_values == 2
+    assert stats.dedup_ratio == 0.5
+    assert stats.tokens_saved == 20
+
+
+def test_repeated_extraction_is_served_from_cache():
+    """Extraction runs at temperature 0, so a rerun over the same text costs no tokens."""
+    settings = Settings(llm__provider="anthropic", llm__api_key="test-key")
+
+    with patch(
+        "automic_etl.llm.client.LLMClient._complete_anthropic", side_effect=fake_complete
+    ) as llm:
+        first = EntityExtractor(settings).extract("call Bob", ["PERSON"])
+        second = EntityExtractor(settings).extract("call Bob", ["PERSON"])
+
+    assert llm.call_count == 1
+    assert [e.value for e in first] == [e.value for e in second] == ["Bob"]
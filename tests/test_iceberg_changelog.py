@@ -0,0 +1,56 @@
+"""Tests for append-only Iceberg changelog scans."""
+
+import polars as pl
+import pytest
+
+from automic_etl.storage.iceberg import MergeEngine, schema_from_polars
+from automic_etl.storage.iceberg.changelog import plan_appended_files, read_data_files
+
+
+@pytest.fixture
+def table(sql_catalog):
+    """Create a local Iceberg table with one committed batch."""
+    sql_catalog.create_namespace("bronze")
+
+    first = pl.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+    table = sql_catalog.create_table("bronze.events", schema=schema_from_polars(first))
+    table.append(first.to_arrow())
+    return table
+
+
+class TestChangelog:
+    """Test planning and reading appended data files."""
+
+    def test_reads_only_files_appended_since_checkpoint(self, table):
+        """Rows committed before the checkpoint are not read again."""
+        checkpoint = table.current_snapshot().snapshot_id
+        table.append(pl.DataFrame({"id": [3], "name": ["c"]}).to_arrow())
+        table.append(pl.DataFrame({"id": [4], "name": ["d"]}).to_arrow())
+
+        files, snapshots = plan_appended_files(table, checkpoint)
+        df = read_data_files(table, files)
+
+        assert snapshots == 2
+        assert len(files) == 2
+        assert sorted(df["id"].to_list()) == [3, 4]
+
+    def test_no_new_snapshots(self, table):
+        """A checkpoint at the current snapshot plans nothing."""
+        checkpoint = table.current_snapshot().snapshot_id
+
+        files, snapshots = plan_appended_files(table, checkpoint)
+
+        assert files == []
+        assert snapshots == 0
+        assert read_data_files(table, files, ["id"]).columns == ["id"]
+
+    def test_non_append_history_is_rejected(self, table):
+        """Deletes since the checkpoint require a fallback scan."""
+        checkpoint = table.current_snapshot().snapshot_id
+        MergeEngine(table).delete_where("id = 1")
+
+        assert plan_appended_files(table, checkpoint) is None
+
+    def test_unknown_checkpoint_is_rejected(self, table):
+        """A checkpoint that is not an ancestor cannot be used."""
+        assert plan_appended_files(table, 12345) is None
@@ -0,0 +1,152 @@
+"""Tests for Iceberg filter pushdown translation."""
+
+import polars as pl
+import pytest
+from pyiceberg.expressions import AlwaysTrue, And, EqualTo, GreaterThan
+from pyiceberg.expressions.visitors import bind
+from pyiceberg.io.pyarrow import expression_to_pyarrow
+from pyiceberg.schema import Schema
+from pyiceberg.types import BooleanType, IntegerType, LongType, NestedField, StringType
+
+from automic_etl.storage.iceberg.expressions import split_conjuncts, translate_filter
+
+
+@pytest.fixture
+def schema() -> Schema:
+    """Schema used for binding filter expressions."""
+    return Schema(
+        NestedField(field_id=1, name="id", field_type=LongType(), required=False),
+        NestedField(field_id=2, name="name", field_type=StringType(), required=False),
+        NestedField(field_id=3, name="_scd_is_current", field_type=BooleanType(), required=False),
+    )
+
+
+class TestSplitConjuncts:
+    """Test top-level AND splitting."""
+
+    def test_simple_and(self):
+        """Top-level ANDs split into conjuncts."""
+        assert split_conjuncts("a = 1 AND b = 2") == ["a = 1", "b = 2"]
+
+    def test_nested_and_preserved(self):
+        """ANDs inside parentheses are not split."""
+        assert split_conjuncts("(a = 1 and b = 2) or c = 3") == ["(a = 1 and b = 2) or c = 3"]
+
+    def test_quoted_and_preserved(self):
+        """ANDs inside string literals are not split."""
+        assert split_conjuncts("name = 'salt and pepper' AND id = 1") == [
+            "name = 'salt and pepper'",
+            "id = 1",
+        ]
+
+    def test_between_and_preserved(self):
+        """The AND of a BETWEEN clause is not split."""
+        assert split_conjuncts("id BETWEEN 1 AND 5 AND name = 'x'") == [
+            "id BETWEEN 1 AND 5",
+            "name = 'x'",
+        ]
+
+    def test_top_level_or_not_split(self):
+        """AND binds tighter than OR, so a top-level OR keeps the expression whole."""
+        assert split_conjuncts("a = 1 OR b = 2 AND c = 3") == ["a = 1 OR b = 2 AND c = 3"]
+        assert split_conjuncts("(a = 1 OR b = 2) AND c = 3") == ["(a = 1 OR b = 2)", "c = 3"]
+
+    def test_identifier_containing_and(self):
+        """Identifiers containing 'and' are not treated as keywords."""
+        assert split_conjuncts("brand = 'x' AND android = 1") == ["brand = 'x'", "android = 1"]
+
+
+class TestTranslateFilter:
+    """Test translation into Iceberg row filters."""
+
+    def test_no_filter(self, schema):
+        """An empty filter translates to AlwaysTrue."""
+        translated = translate_filter(None, schema)
+
+        assert translated.row_filter == AlwaysTrue()
+        assert translated.is_fully_pushed
+
+    def test_fully_pushed(self, schema):
+        """Simple comparisons are pushed down entirely."""
+        translated = translate_filter("_scd_is_current = true AND id > 5", schema)
+
+        assert translated.is_fully_pushed
+        assert translated.row_filter == And(
+            EqualTo("_scd_is_current", True),
+            GreaterThan("id", 5),
+        )
+
+    def test_function_falls_back_to_residual(self, schema):
+        """Conjuncts Iceberg cannot parse stay in the Polars residual."""
+        translated = translate_filter("id > 5 AND upper(name) = 'A'", schema)
+
+        assert translated.row_filter == GreaterThan("id", 5)
+        assert translated.residual == "(upper(name) = 'A')"
+        assert translated.residual_columns() == ["name"]
+
+    def test_unknown_column_falls_back_to_residual(self, schema):
+        """Conjuncts that fail to bind stay in the residual."""
+        translated = translate_filter("missing = 1", schema)
+
+        assert translated.row_filter == AlwaysTrue()
+        assert translated.residual == "(missing = 1)"
+
+    def test_mixed_and_or_keeps_precedence(self, schema):
+        """Pushed and residual filters select the same rows as Polars."""
+        df = pl.DataFrame({
+            "id": [1, 2, 3],
+            "name": ["a", "x", "x"],
+            "_scd_is_current": [False, True, False],
+        })
+        expr = "id = 1 OR name = 'x' AND _scd_is_current = true"
+        expected = df.filter(pl.sql_expr(expr))["id"].to_list()
+
+        translated = translate_filter(expr, schema)
+        assert translated.is_fully_pushed
+        bound = bind(schema, translated.row_filter, case_sensitive=True)
+        pushed = df.to_arrow().filter(expression_to_pyarrow(bound))
+        assert pushed["id"].to_pylist() == expected == [1, 2]
+
+        translated = translate_filter("id = 1 OR upper(name) = 'X' AND _scd_is_current", schema)
+        assert translated.row_filter == AlwaysTrue()
+        assert df.filter(pl.sql_expr(translated.residual))["id"].to_list() == [1, 2]
+
+    @pytest.mark.parametrize("expr", [
+        "id > 2.7",
+        "id = 1.5",
+        "id BETWEEN 1.5 AND 3",
+        "id IN (1.5, 2.5)",
+        "NOT id = 2.5",
+        "small < 3000000000",
+        "small > -3000000000",
+    ])
+    def test_lossy_literals_stay_in_residual(self, expr):
+        """Literals that do not fit the column type are filtered by Polars, not rounded."""
+        schema = Schema(
+            NestedField(field_id=1, name="id", field_type=LongType(), required=False),
+            NestedField(field_id=2, name="small", field_type=IntegerType(), required=False),
+        )
+        df = pl.DataFrame(
+            {"id": [1, 2, 3], "small": [1, 2, 3]},
+            schema={"id": pl.Int64, "small": pl.Int32},
+        )
+
+        translated = translate_filter(expr, schema)
+
+        assert translated.row_filter == AlwaysTrue()
+        assert (
+            df.filter(pl.sql_expr(translated.residual))["id"].to_list()
+            == df.filter(pl.sql_expr(expr))["id"].to_list()
+        )
+
+    def test_lossless_literals_are_pushed(self, schema):
+        """Literals that convert exactly, like 3.0 on an integer column, are still pushed."""
+        df = pl.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"], "_scd_is_current": [True] * 3})
+        expr = "id >= 2.0"
+
+        translated = translate_filter(expr, schema)
+
+        assert translated.is_fully_pushed
+        bound = bind(schema, translated.row_filter, case_sensitive=True)
+        pushed = df.to_arrow().filter(expression_to_pyarrow(bound))
+        assert pushed["id"].to_pylist() == df.filter(pl.sql_expr(expr))["id"].to_list() == [2, 3]
@@ -0,0 +1,112 @@
+"""Tests for row-level Iceberg merges."""
+
+import polars as pl
+import pytest
+
+from automic_etl.storage.iceberg import MergeEngine, schema_from_polars
+
+
+@pytest.fixture
+def table(sql_catalog):
+    """Create a local Iceberg table with two data files."""
+    sql_catalog.create_namespace("silver")
+
+    first = pl.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    second = pl.DataFrame({"id": [10, 11, 12], "name": ["x", "y", "z"]})
+
+    table = sql_catalog.create_table("silver.items", schema=schema_from_polars(first))
+    table.append(first.to_arrow())
+    table.append(second.to_arrow())
+    return table
+
+
+def read_sorted(table) -> pl.DataFrame:
+    """Read a table sorted by id."""
+    return pl.from_arrow(table.scan().to_arrow()).sort("id")
+
+
+class TestMergeEngine:
+    """Test MergeEngine merges and deletes."""
+
+    def test_merge_updates_and_inserts(self, table):
+        """Matched rows are replaced and unmatched rows inserted."""
+        source = pl.DataFrame({"id": [2, 99], "name": ["B", "new"]})
+
+        result = MergeEngine(table).merge(source, key_columns=["id"])
+
+        assert result.rows_updated == 1
+        assert result.rows_inserted == 1
+        df = read_sorted(table)
+        assert df["id"].to_list() == [1, 2, 3, 10, 11, 12, 99]
+        assert df.filter(pl.col("id") == 2)["name"].item() == "B"
+
+    def test_merge_rewrites_only_matching_files(self, table):
+        """Files without matching keys are pruned and left untouched."""
+        snapshots_before = len(table.history())
+
+        result = MergeEngine(table).merge(
+            pl.DataFrame({"id": [11], "name": ["Y"]}),
+            key_columns=["id"],
+        )
+
+        assert result.files_scanned == 1
+        assert result.files_rewritten == 1
+        assert len(table.history()) == snapshots_before + 1
+
+    def test_merge_insert_only(self, table):
+        """Matched rows are kept when updates are disabled."""
+        source = pl.DataFrame({"id": [1, 50], "name": ["A", "n"]})
+
+        result = MergeEngine(table).merge(source, key_columns=["id"], when_matched_update=False)
+
+        assert result.rows_updated == 0
+        assert result.rows_inserted == 1
+        assert result.files_rewritten == 0
+        assert read_sorted(table).filter(pl.col("id") == 1)["name"].item() == "a"
+
+    def test_delete_where(self, table):
+        """Rows matching the condition are deleted."""
+        result = MergeEngine(table).delete_where("id >= 11 AND upper(name) = 'Z'")
+
+        assert result.rows_deleted == 1
+        assert read_sorted(table)["id"].to_list() == [1, 2, 3, 10, 11]
+
+    def test_delete_where_keeps_or_precedence(self, table):
+        """AND binds tighter than OR when pruning files for a delete."""
+        result = MergeEngine(table).delete_where("id = 1 OR name = 'c' AND id = 99")
+
+        assert result.rows_deleted == 1
+        assert read_sorted(table)["id"].to_list() == [2, 3, 10, 11, 12]
+
+    def test_delete_where_does_not_prune_with_rounded_literals(self, table):
+        """A literal that does not fit the column type never skips matching files."""
+        result = MergeEngine(table).delete_where("id > 2.7 AND id < 10.5")
+
+        assert result.rows_deleted == 2
+        assert read_sorted(table)["id"].to_list() == [1, 2, 11, 12]
+
+    def test_update_matching_does_not_prune_with_rounded_literals(self, table):
+        """Rows selected by a fractional literal filter are all updated."""
+        result = MergeEngine(table).update_matching(
+            pl.DataFrame({"id": [3, 10]}),
+            key_columns=["id"],
+            updates={"name": pl.lit("hit")},
+            filter_expr="id > 2.7",
+        )
+
+        assert result.rows_updated == 2
+        df = read_sorted(table)
+        assert df.filter(pl.col("name") == "hit")["id"].to_list() == [3, 10]
+        assert MergeEngine(table).read_matching(
+            pl.DataFrame({"id": [2, 3]}), key_columns=["id"], filter_expr="id > 2.7"
+        )["id"].to_list() == [3]
+
+    def test_merge_counts_matched_source_rows(self, table):
+        """rows_updated counts source rows that replaced existing rows."""
+        table.append(pl.DataFrame({"id": [2], "name": ["dup"]}).to_arrow())
+        source = pl.DataFrame({"id": [2, 3], "name": ["B", "C"]})
+
+        result = MergeEngine(table).merge(source, key_columns=["id"])
+
+        assert result.rows_updated == 2
+        assert read_sorted(table).filter(pl.col("id") == 2)["name"].to_list() == ["B"]
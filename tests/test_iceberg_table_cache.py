@@ -0,0 +1,54 @@
+"""Tests for the Iceberg table cache."""
+
+from unittest.mock import MagicMock, patch
+
+from automic_etl.storage.iceberg.cache import TableCache
+
+
+class TestTableCache:
+    """Test LRU and TTL behaviour of the table cache."""
+
+    def test_hit_and_miss_counters(self):
+        """Lookups are counted as hits or misses."""
+        cache = TableCache(max_size=2, ttl_seconds=60)
+        table = MagicMock()
+
+        assert cache.get("bronze.events") is None
+        cache.put("bronze.events", table)
+
+        assert cache.get("bronze.events") is table
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """The cache never grows beyond its maximum size."""
+        cache = TableCache(max_size=2, ttl_seconds=60)
+        cache.put("bronze.a", MagicMock())
+        cache.put("bronze.b", MagicMock())
+        cache.get("bronze.a")
+        cache.put("bronze.c", MagicMock())
+
+        assert cache.get("bronze.b") is None
+        assert cache.get("bronze.a") is not None
+        assert cache.stats.evictions == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Entries older than the TTL are reloaded."""
+        cache = TableCache(max_size=2, ttl_seconds=30)
+        with patch("automic_etl.storage.iceberg.cache.time.monotonic", return_value=100.0):
+            cache.put("bronze.events", MagicMock())
+        with patch("automic_etl.storage.iceberg.cache.time.monotonic", return_value=131.0):
+            assert cache.get("bronze.events") is None
+
+        assert cache.stats.expirations == 1
+
+    def test_invalidate_namespace(self):
+        """Invalidating a namespace only drops its tables."""
+        cache = TableCache()
+        cache.put("bronze.a", MagicMock())
+        cache.put("silver.a", MagicMock())
+
+        cache.invalidate_namespace("bronze")
+
+        assert len(cache) == 1
+        assert cache.get("silver.a") is not None
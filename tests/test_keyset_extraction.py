@@ -0,0 +1,140 @@
+"""Tests for pooled, keyset and range-partitioned database extraction."""
+
+from itertools import pairwise
+
+import polars as pl
+import pytest
+from sqlalchemy import create_engine, text
+
+from automic_etl.connectors.base import (
+    ConnectorConfig,
+    ConnectorType,
+    DatabaseConnector,
+    ExtractionResult,
+    KeyRange,
+)
+from automic_etl.extraction.batch import BatchExtractor
+
+
+class SQLiteConnector(DatabaseConnector):
+    """Minimal database connector over a pooled SQLite engine."""
+
+    def __init__(self, path, rows: int) -> None:
+        super().__init__(ConnectorConfig(name="sqlite", connector_type=ConnectorType.DATABASE))
+        self.queries: list[str] = []
+        self.path = path
+        self.connect()
+        with self._engine.begin() as conn:
+            conn.execute(text("CREATE TABLE events (id INTEGER PRIMARY KEY, name TEXT)"))
+            conn.execute(
+                text("INSERT INTO events VALUES (:id, :name)"),
+                [{"id": i * 3, "name": f"event-{i}"} for i in range(rows)],
+            )
+
+    def connect(self) -> None:
+        self._engine = create_engine(f"sqlite:///{self.path}")
+        self._connected = True
+
+    def disconnect(self) -> None:
+        self._engine.dispose()
+        self._connected = False
+
+    def test_connection(self) -> bool:
+        return True
+
+    def extract(self, query=None, **kwargs) -> ExtractionResult:
+        self.queries.append(query)
+        df = self.read_sql(query)
+        return ExtractionResult(data=df, row_count=len(df))
+
+    def get_tables(self) -> list[str]:
+        return ["events"]
+
+    def get_table_schema(self, table: str) -> dict[str, str]:
+        return {"id": "INTEGER", "name": "TEXT"}
+
+    def get_row_count(self, table: str) -> int:
+        return self.extract(f"SELECT COUNT(*) AS n FROM {table}").data["n"][0]
+
+
+@pytest.fixture
+def connector(temp_dir):
+    """Connector over a table with 25 rows and sparse keys."""
+    return SQLiteConnector(temp_dir / "source.db", rows=25)
+
+
+class TestPooledExtraction:
+    """Test reads through the connector's pooled engine."""
+
+    def test_reads_reuse_pooled_connection(self, connector):
+        """Repeated reads check connections out of one pool."""
+        for _ in range(3):
+            connector.read_sql("SELECT * FROM events")
+
+        assert connector._engine.pool.checkedin() == 1
+
+    def test_query_batches_stream_from_one_cursor(self, connector):
+        """A query is executed once and fetched in batches."""
+        pages = list(connector.extract_batch(query="SELECT * FROM events", batch_size=10))
+
+        assert [p.row_count for p in pages] == [10, 10, 5]
+        assert connector.queries == []
+
+
+class TestKeysetExtraction:
+    """Test seek pagination and range-partitioned reads."""
+
+    def test_pages_seek_on_last_key(self, connector):
+        """Pages follow the last key instead of an offset."""
+        pages = list(connector.extract_keyset("events", "id", batch_size=10, columns=["name"]))
+
+        assert [p.row_count for p in pages] == [10, 10, 5]
+        assert pages[0].data.columns == ["name"]
+        assert pages[0].watermark == 27
+        assert "id > 27" in connector.queries[1]
+        assert not any("OFFSET" in q for q in connector.queries)
+
+    def test_extract_batch_uses_keyset_for_tables(self, connector):
+        """Batch extraction of a keyed table reads every row exactly once."""
+        pages = list(connector.extract_batch(table="events", key_column="id", batch_size=7))
+
+        ids = pl.concat([p.data for p in pages])["id"].to_list()
+        assert ids == [i * 3 for i in range(25)]
+
+    def test_key_ranges_cover_table(self, connector):
+        """Planned ranges are contiguous and include the maximum key."""
+        ranges = connector.plan_key_ranges("events", "id", num_partitions=4)
+
+        assert len(ranges) == 4
+        assert ranges[0].lower == 0
+        assert ranges[-1] == KeyRange(lower=ranges[-1].lower, upper=72, upper_inclusive=True)
+        assert all(a.upper == b.lower for a, b in pairwise(ranges))
+
+    def test_text_histogram_keeps_database_order(self, connector, test_settings):
+        """Text keys split in collation order, not Python string order."""
+        with connector._engine.begin() as conn:
+            conn.execute(text("CREATE TABLE tags (tag TEXT COLLATE NOCASE PRIMARY KEY)"))
+            conn.execute(
+                text("INSERT INTO tags VALUES (:tag)"),
+                [{"tag": tag} for tag in ["A", "b", "C", "d", "e"]],
+            )
+        connector._histogram_bounds = lambda table, key_column: (
+            connector.read_sql("SELECT tag FROM tags ORDER BY tag")["tag"].to_list()
+        )
+
+        ranges = connector.plan_key_ranges("tags", "tag", num_partitions=4)
+        result = BatchExtractor(test_settings).extract_partitioned(
+            connector, "tags", "tag", num_partitions=4, batch_size=2
+        )
+
+        assert [r.lower for r in ranges] == ["A", "b", "C", "d"]
+        assert sorted(result.data["tag"].to_list()) == ["A", "C", "b", "d", "e"]
+
+    def test_partitioned_extraction(self, connector, test_settings):
+        """Concurrent range reads return every row without duplicates."""
+        result = BatchExtractor(test_settings).extract_partitioned(
+            connector, "events", "id", num_partitions=3, batch_size=4
+        )
+
+        assert result.errors == []
+        assert sorted(result.data["id"].to_list()) == [i * 3 for i in range(25)]
@@ -0,0 +1,150 @@
+"""Tests for lineage tracking indexes and stores."""
+
+import gc
+from datetime import timedelta
+
+import polars as pl
+
+from automic_etl.lineage import LineageGraph, LineageTracker, LineageWriter
+from automic_etl.lineage.store import LineageStore
+from automic_etl.lineage.tracker import LineageContext, OperationType
+
+
+def build_tracker(**kwargs) -> tuple[LineageTracker, str]:
+    """raw -> bronze -> silver -> {gold_a, gold_b}, plus a silver <-> audit cycle."""
+    tracker = LineageTracker(**kwargs)
+    tracker.record_read("raw")
+    tracker.record_transform("raw", "bronze", "ingest")
+    tracker.record_transform("bronze", "silver", "clean")
+    first_job = tracker.job_id
+    tracker.start_job("gold")
+    tracker.record_aggregate("silver", "gold_a", group_by=["day"], aggregations={"n": "count"})
+    tracker.record_write("gold_b", sources=["silver"])
+    tracker.record_transform("silver", "audit", "audit")
+    tracker.record_transform("audit", "silver", "restore")
+    return tracker, first_job
+
+
+def test_tracker_traverses_indexed_lineage():
+    """Upstream and downstream follow every path once, nearest first."""
+    tracker, _ = build_tracker()
+
+    assert [a.name for a in tracker.get_upstream("gold_a")] == [
+        "silver", "bronze", "audit", "raw",
+    ]
+    assert [a.name for a in tracker.get_downstream("bronze")] == [
+        "silver", "gold_a", "gold_b", "audit",
+    ]
+    assert tracker.get_downstream("gold_b") == []
+
+
+def test_tracker_queries_events_by_index():
+    """Job, operation and time filters combine like the unindexed queries."""
+    tracker, first_job = build_tracker()
+    cutoff = tracker.events[3].timestamp
+
+    assert len(tracker.get_events(job_id=first_job)) == 3
+    assert [e.operation for e in tracker.get_events(job_id=tracker.job_id)] == [
+        OperationType.AGGREGATE,
+        OperationType.WRITE,
+        OperationType.TRANSFORM,
+        OperationType.TRANSFORM,
+    ]
+    assert len(tracker.get_events(job_id=tracker.job_id, operation=OperationType.TRANSFORM)) == 2
+    assert tracker.get_events(since=cutoff) == [e for e in tracker.events if e.timestamp >= cutoff]
+    assert tracker.get_events(since=cutoff + timedelta(days=1)) == []
+
+    tracker.clear()
+    assert tracker.get_events(job_id=tracker.job_id) == []
+    assert tracker.get_upstream("gold_a") == []
+
+
+def test_sqlite_store_persists_and_traverses(tmp_path):
+    """The SQLite store answers lineage queries across tracker instances."""
+    tracker, first_job = build_tracker(storage_path=str(tmp_path), storage_backend="sqlite")
+    tracker.close()
+
+    reopened = LineageTracker(storage_path=str(tmp_path), storage_backend="sqlite")
+    store = reopened.store
+    assert set(store.get_upstream("gold_a")) == {"silver", "bronze", "audit", "raw"}
+    assert set(store.get_downstream("audit")) == {"silver", "gold_a", "gold_b", "audit"}
+    assert len(store.get_events(job_id=first_job)) == 3
+    assert [e["operation"] for e in store.get_events(operation="write")] == ["write"]
+    store.close()
+
+
+def test_graph_path_and_depth():
+    """Paths are shortest and depth limits count hops from the start."""
+    graph = LineageGraph()
+    tracker, _ = build_tracker()
+    graph.build_from_events(tracker.events)
+
+    path = graph.get_path("asset:raw", "asset:gold_b")
+    assert path[0] == "asset:raw" and path[-1] == "asset:gold_b"
+    assert [node for node in path if node.startswith("asset:")] == [
+        "asset:raw", "asset:bronze", "asset:silver", "asset:gold_b",
+    ]
+    ingest = f"transform:{tracker.events[1].event_id}"
+    assert graph.get_upstream("asset:bronze", depth=0) == [ingest]
+    assert graph.get_upstream("asset:bronze", depth=1) == [ingest, "asset:raw"]
+    assert graph.get_path("asset:gold_b", "asset:raw") is None
+
+
+class RecordingStore(LineageStore):
+    """Store that records the size of each write."""
+
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+        self.closed = False
+
+    def write(self, events) -> None:
+        self.batches.append(len(events))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_writer_batches_events_until_flushed():
+    """Events are written in full batches, and the remainder on flush."""
+    tracker, _ = build_tracker()
+    store = RecordingStore()
+    writer = LineageWriter(store, batch_size=3, flush_interval_seconds=60)
+
+    for event in tracker.events:
+        writer.submit(event)
+    assert writer.flush(timeout=5)
+    assert store.batches == [3, 3, 1]
+
+    writer.close()
+    assert store.closed
+    assert writer.written == len(tracker.events)
+
+
+def test_unreferenced_writer_writes_pending_events_and_closes():
+    """A writer that is garbage collected flushes and releases its store."""
+    tracker, _ = build_tracker()
+    store = RecordingStore()
+    writer = LineageWriter(store, batch_size=100, flush_interval_seconds=60)
+    writer.submit(tracker.events[0])
+
+    del writer
+    gc.collect()
+
+    assert store.batches == [1]
+    assert store.closed
+
+
+def test_context_exit_flushes_parquet_segments(tmp_path):
+    """Events recorded in a lineage context are queryable once it exits."""
+    tracker = LineageTracker(
+        storage_path=str(tmp_path), storage_backend="parquet", async_writes=True
+    )
+    with LineageContext(tracker, "load") as active:
+        active.record_transform("raw", "bronze", "ingest", row_count_in=10)
+        active.record_write("silver", sources=["bronze"])
+
+    events = tracker.store.scan().collect()
+    assert events["operation"].to_list() == ["transform", "write"]
+    assert events["targets"].to_list() == [["bronze"], ["silver"]]
+    assert events.filter(pl.col("row_count_in") == 10).height == 1
+    tracker.close()
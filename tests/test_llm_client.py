@@ -1,12 +1,15 @@
 """Tests for LLM client."""
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from automic_etl.core.config import LLMProvider, Settings
 from automic_etl.core.exceptions import LLMError
-from automic_etl.llm.client import LLMClient, LLMResponse
+from automic_etl.llm.cache import LLMResponseCache
+from automic_etl.llm.client import LLMClient, LLMResponse, RateLimitConfig, RateLimiter
 
 
 @pytest.fixture
@@ -223,3 +226,155 @@ class TestLLMClientOllama:
 
             client = LLMClient(settings)
             assert client.llm_config.provider == LLMProvider.OLLAMA
+
+
+class TestBatchCompletion:
+    """Test concurrent batch completion."""
+
+    def test_batch_preserves_order_and_bounds_concurrency(self, llm_settings):
+        """Responses follow prompt order and never exceed the concurrency window."""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_complete(prompt, system_prompt, temperature, max_tokens):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01 * (int(prompt) % 3))
+            with lock:
+                in_flight -= 1
+            return LLMResponse(content=prompt, model="m", tokens_used=1, finish_reason="end_turn")
+
+        client = LLMClient(llm_settings)
+        with patch.object(client, "_complete_anthropic", side_effect=fake_complete):
+            responses = client.batch_complete([str(i) for i in range(20)], max_concurrency=4)
+
+        assert [r.content for r in responses] == [str(i) for i in range(20)]
+        assert 1 < peak <= 4
+        assert client.get_usage_stats()["total_requests"] == 20
+
+    def test_batch_returns_per_item_errors(self, llm_settings):
+        """Failures are reported in place when return_exceptions is set."""
+        def fake_complete(prompt, system_prompt, temperature, max_tokens):
+            if prompt == "bad":
+                raise ValueError("400 invalid request")
+            return LLMResponse(content=prompt, model="m", tokens_used=1, finish_reason="end_turn")
+
+        client = LLMClient(llm_settings)
+        with patch.object(client, "_complete_anthropic", side_effect=fake_complete):
+            responses = client.batch_complete(["a", "bad", "c"], return_exceptions=True)
+            with pytest.raises(LLMError):
+                client.batch_complete(["a", "bad", "c"])
+
+        assert responses[0].content == "a"
+        assert isinstance(responses[1], LLMError)
+        assert responses[2].content == "c"
+
+    def test_batch_cache_lookups_run_off_the_event_loop(self, llm_settings, temp_dir):
+        """Repeated batch items are cache hits read on worker threads."""
+        cache = LLMResponseCache(temp_dir / "llm.db")
+        client = LLMClient(llm_settings, response_cache=cache)
+        lookup_threads = []
+        original_get = cache.get
+
+        def get(key):
+            lookup_threads.append(threading.current_thread())
+            return original_get(key)
+
+        fake = MagicMock(return_value=LLMResponse(
+            content="x", model="m", tokens_used=1, finish_reason="end_turn",
+        ))
+        with patch.object(client, "_complete_anthropic", fake), patch.object(cache, "get", get):
+            client.batch_complete(["a", "b"], temperature=0)
+            responses = client.batch_complete(["a", "b"], temperature=0)
+
+        assert fake.call_count == 2
+        assert all(r.metadata["cached"] for r in responses)
+        assert threading.main_thread() not in lookup_threads
+
+    def test_rate_limiter_waits_for_capacity(self):
+        """Acquiring past the per-minute limit waits or raises on timeout."""
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=2))
+        limiter.acquire()
+        limiter.acquire()
+
+        allowed, reason, retry_after = limiter.try_acquire()
+        assert not allowed
+        assert 0 < retry_after <= 60
+        with pytest.raises(LLMError):
+            limiter.acquire(timeout=0.1)
+
+
+class TestResponseCache:
+    """Test the persistent response cache."""
+
+    def test_deterministic_calls_are_cached_on_disk(self, llm_settings, temp_dir):
+        """A repeated temperature-0 call is served from disk without tokens."""
+        fake = MagicMock(return_value=LLMResponse(
+            content="cached text", model="m", tokens_used=30, finish_reason="end_turn",
+        ))
+        client = LLMClient(llm_settings, response_cache=LLMResponseCache(temp_dir / "llm.db"))
+
+        with patch.object(client, "_complete_anthropic", fake):
+            first = client.complete(prompt="same prompt", temperature=0)
+            client.complete(prompt="same prompt", temperature=0.5)
+            reopened = LLMClient(llm_settings, response_cache=LLMResponseCache(temp_dir / "llm.db"))
+            second = reopened.complete(prompt="same prompt", temperature=0)
+
+        assert fake.call_count == 2
+        assert first.tokens_used == 30
+        assert second.content == "cached text"
+        assert second.tokens_used == 0
+        assert second.metadata["cached"] is True
+        assert reopened.get_usage_stats()["cache"]["tokens_saved"] == 30
+
+    def test_truncated_and_invalid_json_responses_are_not_cached(self, llm_settings, temp_dir):
+        """Only complete, parseable responses are stored."""
+        cache = LLMResponseCache(temp_dir / "llm.db")
+        client = LLMClient(llm_settings, response_cache=cache)
+        fake = MagicMock(side_effect=[
+            LLMResponse(content="cut", model="m", tokens_used=5, finish_reason="max_tokens"),
+            LLMResponse(content="not json", model="m", tokens_used=5, finish_reason="end_turn"),
+            LLMResponse(content='{"a": 1}', model="m", tokens_used=5, finish_reason="end_turn"),
+        ])
+
+        with patch.object(client, "_complete_anthropic", fake):
+            client.complete(prompt="truncated", temperature=0)
+            with pytest.raises(LLMError):
+                client.complete_json(prompt="json", temperature=0)
+            assert len(cache) == 0
+
+            assert client.complete_json(prompt="json", temperature=0) == ({"a": 1}, 5)
+            assert client.complete_json(prompt="json", temperature=0) == ({"a": 1}, 0)
+
+        assert fake.call_count == 3
+        assert len(cache) == 1
+
+    def test_invalidate_cached_forces_a_new_call(self, llm_settings, temp_dir):
+        """An invalidated entry is fetched from the provider again."""
+        client = LLMClient(llm_settings, response_cache=LLMResponseCache(temp_dir / "llm.db"))
+        fake = MagicMock(return_value=LLMResponse(
+            content="text", model="m", tokens_used=3, finish_reason="end_turn",
+        ))
+
+        with patch.object(client, "_complete_anthropic", fake):
+            client.complete(prompt="p", temperature=0)
+            assert client.invalidate_cached(prompt="p", temperature=0) is True
+            assert client.invalidate_cached(prompt="p", temperature=0) is False
+            client.complete(prompt="p", temperature=0)
+
+        assert fake.call_count == 2
+
+    def test_cache_evicts_least_recently_read(self, temp_dir):
+        """Entries beyond max_entries are evicted oldest-read first."""
+        cache = LLMResponseCache(temp_dir / "llm.db", max_entries=2)
+        cache.put("a", {"content": "a"}, 1)
+        cache.put("b", {"content": "b"}, 1)
+        cache.get("a")
+        cache.put("c", {"content": "c"}, 1)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == {"content": "a"}
@@ -225,3 +225,16 @@ class TestBronzeLayerErrors:
                     df=sample_df,
                     source="",  # Empty source
                 )
+
+
+class TestBronzeLayerReads:
+    """Test incremental reads."""
+
+    def test_read_new_since_at_snapshot(self, bronze_layer):
+        """A pinned snapshot is read instead of the current table state."""
+        bronze_layer.read_new_since("users", datetime(2024, 1, 1), snapshot_id=42)
+
+        kwargs = bronze_layer.table_manager.read_at_snapshot.call_args.kwargs
+        assert kwargs["snapshot_id"] == 42
+        assert "_ingestion_time > '2024-01-01T00:00:00+00:00'" in kwargs["filter_expr"]
+        bronze_layer.table_manager.read.assert_not_called()
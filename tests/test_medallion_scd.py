@@ -0,0 +1,79 @@
+"""Tests for SCD Type 2 tables."""
+
+from datetime import datetime, timezone
+
+import polars as pl
+import pytest
+
+from automic_etl.medallion.scd import SCDType2Manager
+
+FIRST = datetime(2024, 1, 1, tzinfo=timezone.utc)
+SECOND = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def manager(test_settings, iceberg_catalog, sql_catalog):
+    """Create an SCD2 manager over a local catalog."""
+    sql_catalog.create_namespace("silver")
+
+    manager = SCDType2Manager(test_settings, key_buckets=4)
+    manager.table_manager.catalog = iceberg_catalog
+    return manager
+
+
+def read_history(manager) -> pl.DataFrame:
+    """Read every version ordered by key and version."""
+    return manager.table_manager.read("silver", "customers").sort("id", "_scd_version")
+
+
+def test_scd_column_types_and_versions(manager):
+    """Hashes are Int64, validity bounds are UTC, and changes close versions."""
+    manager.apply_scd2(
+        pl.DataFrame({"id": [1, 2], "city": ["Oslo", "Rome"]}),
+        "customers",
+        business_keys=["id"],
+        effective_date=FIRST,
+    )
+    counts = manager.apply_scd2(
+        pl.DataFrame({"id": [1, 2, 3], "city": ["Oslo", "Milan", "Lima"]}),
+        "customers",
+        business_keys=["id"],
+        effective_date=SECOND,
+    )
+
+    assert counts == {"inserted": 1, "updated": 1, "unchanged": 1}
+    df = read_history(manager)
+    assert df.schema["_scd_hash"] == pl.Int64
+    assert df.schema["_scd_effective_to"] == pl.Datetime("us", "UTC")
+    closed = df.filter(~pl.col("_scd_is_current"))
+    assert closed.select("id", "city", "_scd_effective_to").rows() == [(2, "Rome", SECOND)]
+    assert df.filter(pl.col("id") == 2)["_scd_version"].to_list() == [1, 2]
+
+
+def test_naive_effective_to_table_still_updates(manager):
+    """Tables with a timezone-naive effective_to column get UTC wall times."""
+    old = pl.DataFrame({
+        "id": [1],
+        "city": ["Oslo"],
+        "_scd_effective_from": [FIRST],
+        "_scd_effective_to": [None],
+        "_scd_is_current": [True],
+        "_scd_version": [1],
+    }).cast({"_scd_effective_to": pl.Datetime("us")})
+    old = manager._add_hash_column(old, ["city"])
+    catalog = manager.table_manager.catalog.catalog
+    catalog.create_table("silver.customers", schema=old.to_arrow().schema)
+    manager.table_manager.append("silver", "customers", old)
+
+    counts = manager.apply_scd2(
+        pl.DataFrame({"id": [1], "city": ["Bergen"]}),
+        "customers",
+        business_keys=["id"],
+        effective_date=SECOND,
+    )
+
+    assert counts["updated"] == 1
+    df = read_history(manager)
+    assert df.schema["_scd_effective_to"] == pl.Datetime("us")
+    assert df["_scd_effective_to"].to_list() == [SECOND.replace(tzinfo=None), None]
+    assert df["city"].to_list() == ["Oslo", "Bergen"]
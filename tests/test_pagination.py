@@ -0,0 +1,100 @@
+"""Tests for keyset pagination of service list queries."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import MetaData
+
+from automic_etl.db import engine
+from automic_etl.db.models import DataTableModel
+from automic_etl.db.table_service import TableService
+
+
+@pytest.fixture
+def table_service(tmp_path, monkeypatch) -> TableService:
+    """Table service over a fresh SQLite database."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'meta.db'}")
+    monkeypatch.setattr(engine, "_engine", None)
+    monkeypatch.setattr(engine, "_SessionLocal", None)
+    engine.init_db()
+
+    service = TableService()
+    for i in range(25):
+        service.create_table(
+            name=f"table_{i:02d}",
+            layer=["bronze", "silver", "gold"][i % 3],
+            schema_definition={"_metadata": {"created_by": "acme" if i % 5 else "globex"}},
+            tags=["pii"] if i % 2 else ["raw_100%"],
+        )
+    yield service
+    engine.get_engine().dispose()
+
+
+def test_cursor_pages_cover_all_rows_once(table_service):
+    """Following next_cursor visits every row exactly once, newest first."""
+    first = table_service.list_tables_page(page_size=10)
+    assert first.total == 25 and first.pages == 3
+
+    seen = [t.id for t in first.items]
+    cursor = first.next_cursor
+    while cursor:
+        page = table_service.list_tables_page(page_size=10, cursor=cursor)
+        seen.extend(t.id for t in page.items)
+        cursor = page.next_cursor
+
+    assert len(seen) == len(set(seen)) == 25
+    offset = [t.id for p in (1, 2, 3) for t in table_service.list_tables_page(page=p, page_size=10).items]
+    assert seen == offset
+
+
+def test_filters_run_in_the_query(table_service):
+    """Company, layer, tag and search filters narrow rows and the total."""
+    result = table_service.list_tables_page(
+        page_size=100, company_id="acme", layers=["bronze", "gold"]
+    )
+    assert result.total == len(result.items) == 13
+    assert result.next_cursor is None
+    assert all(t.layer != "silver" for t in result.items)
+
+    # Wildcards in the tag are matched literally
+    assert table_service.list_tables_page(tag="raw_100%").total == 13
+    assert table_service.list_tables_page(tag="raw_1").total == 0
+    assert table_service.list_tables_page(layers=[]).total == 0
+    assert table_service.list_tables_page(search="TABLE_1").total == 10
+
+
+def test_invalid_cursor_is_rejected(table_service):
+    """Malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        table_service.list_tables_page(cursor="not-a-cursor")
+
+
+@pytest.mark.parametrize("page, page_size", [(0, 10), (1, 0)])
+def test_page_parameters_below_one_are_rejected(table_service, page, page_size):
+    """Zero pages or page sizes raise ValueError instead of reaching the database."""
+    with pytest.raises(ValueError):
+        table_service.list_tables_page(page=page, page_size=page_size)
+
+
+def test_init_db_backfills_null_sort_columns(tmp_path, monkeypatch):
+    """Rows of older databases without updated_at still appear on cursor pages."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'legacy.db'}")
+    monkeypatch.setattr(engine, "_engine", None)
+    monkeypatch.setattr(engine, "_SessionLocal", None)
+
+    legacy = DataTableModel.__table__.to_metadata(MetaData())
+    legacy.c.updated_at.nullable = True
+    legacy.create(engine.get_engine())
+    with engine.get_engine().begin() as connection:
+        connection.execute(legacy.insert().values(
+            id="legacy", name="old", layer="bronze", created_at=datetime(2024, 1, 1), updated_at=None,
+        ))
+
+    engine.init_db()
+    service = TableService()
+    service.create_table(name="new", layer="bronze")
+
+    first = service.list_tables_page(page_size=1)
+    second = service.list_tables_page(page_size=1, cursor=first.next_cursor)
+    assert [t.id for t in second.items] == ["legacy"]
+    engine.get_engine().dispose()
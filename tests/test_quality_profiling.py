@@ -0,0 +1,88 @@
+"""Tests for data quality profiling."""
+
+import numpy as np
+import polars as pl
+import pytest
+
+from automic_etl.validation import DataQualityChecker
+
+
+@pytest.fixture
+def events() -> pl.DataFrame:
+    """Events with skewed categories, nulls and a numeric measurement."""
+    rng = np.random.default_rng(7)
+    n = 20_000
+    return pl.DataFrame({
+        "id": np.arange(n),
+        "latency": rng.normal(100.0, 15.0, n),
+        "kind": rng.choice(["click", "view", "buy"], n, p=[0.6, 0.3, 0.1]),
+        "note": [None if i % 4 == 0 else f"note-{i % 50}" for i in range(n)],
+    })
+
+
+def test_chunked_profile_approximates_exact_profile(events):
+    """Profiling a LazyFrame in chunks merges sketches into a close report."""
+    checker = DataQualityChecker(batch_size=3_000, max_workers=3)
+
+    exact = checker.profile(events)
+    chunked = checker.profile(events.lazy())
+
+    assert chunked.approximate and not exact.approximate
+    assert chunked.row_count == exact.row_count
+    assert chunked.complete_rows == exact.complete_rows
+    assert chunked.duplicate_rows == exact.duplicate_rows == 0
+
+    for name, expected in exact.column_profiles.items():
+        profile = chunked.column_profiles[name]
+        assert profile.null_count == expected.null_count
+        assert profile.unique_count == pytest.approx(expected.unique_count, rel=0.02)
+        assert profile.min_value == expected.min_value
+        assert profile.max_value == expected.max_value
+
+    latency = chunked.column_profiles["latency"]
+    expected = exact.column_profiles["latency"]
+    assert latency.mean == pytest.approx(expected.mean)
+    assert latency.std == pytest.approx(expected.std)
+    for key, value in expected.percentiles.items():
+        assert latency.percentiles[key] == pytest.approx(value, rel=0.01)
+
+    assert chunked.column_profiles["kind"].top_values == exact.column_profiles["kind"].top_values
+    assert chunked.column_profiles["note"].avg_length == pytest.approx(
+        exact.column_profiles["note"].avg_length
+    )
+
+
+def test_vectorized_profile_matches_series_statistics(events):
+    """Statistics computed in one select match per-Series computations."""
+    report = DataQualityChecker().profile(events)
+
+    latency = events["latency"]
+    profile = report.column_profiles["latency"]
+    assert profile.mean == pytest.approx(latency.mean())
+    assert profile.std == pytest.approx(latency.std())
+    assert profile.percentiles["50%"] == latency.quantile(0.5)
+    lower = latency.mean() - 3 * latency.std()
+    upper = latency.mean() + 3 * latency.std()
+    assert profile.outlier_count == ((latency < lower) | (latency > upper)).sum()
+
+    note = report.column_profiles["note"]
+    assert note.unique_count == events["note"].n_unique()
+    assert note.max_length == 7
+
+    kind_counts = events["kind"].value_counts(sort=True).rows()
+    assert report.column_profiles["kind"].top_values == kind_counts
+    # In-memory top values are exact, even without heavy hitters
+    assert [count for _, count in report.column_profiles["id"].top_values] == [1] * 5
+    assert report.column_profiles["note"].top_values[0] == (None, 5_000)
+    assert report.complete_rows == len(events.drop_nulls())
+
+
+def test_long_columns_sketch_top_values(events):
+    """Past the exact limit, top values come from a sketch and key columns are skipped."""
+    report = DataQualityChecker(exact_top_values_rows=1_000).profile(events)
+
+    kind_counts = events["kind"].value_counts(sort=True).rows()
+    assert [value for value, _ in report.column_profiles["kind"].top_values] == [
+        value for value, _ in kind_counts
+    ]
+    assert report.column_profiles["id"].top_values == []
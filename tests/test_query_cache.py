@@ -0,0 +1,100 @@
+"""Tests for the API query result cache."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import automic_etl
+
+
+def load_query_cache():
+    """Load the cache module on its own; importing the API package needs the auth stack."""
+    path = Path(automic_etl.__file__).parent / "api" / "query_cache.py"
+    spec = importlib.util.spec_from_file_location("automic_etl_query_cache", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+query_cache = load_query_cache()
+
+
+class TestNormalizeSql:
+    """Test cache key normalization."""
+
+    def test_formatting_is_ignored(self):
+        """Whitespace, keyword case and a trailing semicolon do not matter."""
+        assert query_cache.normalize_sql("SELECT *\n  FROM   sales ;") == "select * from sales"
+
+    def test_quoted_text_is_kept(self):
+        """Literals and quoted identifiers keep their case and spacing."""
+        normalized = query_cache.normalize_sql(
+            'SELECT "Region",  `Total` FROM t WHERE name = \'Ann  Lee\''
+        )
+
+        assert normalized == 'select "Region", `Total` from t where name = \'Ann  Lee\''
+        assert query_cache.normalize_sql('SELECT "A" FROM t') != query_cache.normalize_sql(
+            'SELECT "a" FROM t'
+        )
+
+
+class TestQueryResultCache:
+    """Test staleness, expiry and quotas."""
+
+    def make_cache(self, versions, **kwargs):
+        """Create a cache resolving table versions from a dict."""
+        return query_cache.QueryResultCache(version_resolver=versions.get, **kwargs)
+
+    def test_hit_until_table_changes(self):
+        """Entries are served until a table they read gets a new version."""
+        versions = {"silver.sales": "iceberg:1"}
+        cache = self.make_cache(versions)
+        key = cache.make_key("acme", "SELECT * FROM silver.sales")
+
+        cache.put(key, "acme", {"data": [1]}, cache.resolve_versions(["silver.sales"]))
+        assert cache.get(key) == {"data": [1]}
+
+        versions["silver.sales"] = "iceberg:2"
+        assert cache.get(key) is None
+        assert cache.stats.stale == 1
+        assert len(cache) == 0
+
+    def test_commit_during_query_leaves_entry_stale(self):
+        """Versions resolved before the query keep a result from a commit race."""
+        versions = {"silver.sales": "iceberg:1"}
+        cache = self.make_cache(versions)
+        key = cache.make_key("acme", "SELECT * FROM silver.sales")
+
+        table_versions = cache.resolve_versions(["silver.sales"])
+        versions["silver.sales"] = "iceberg:2"
+        cache.put(key, "acme", {"data": [1]}, table_versions)
+
+        assert cache.get(key) is None
+        assert cache.stats.stale == 1
+
+    def test_tenant_quota_evicts_own_entries(self):
+        """A tenant over quota evicts its own oldest entries only."""
+        cache = self.make_cache({}, tenant_max_bytes=40)
+        cache.put("other", "globex", {"data": "x"})
+        cache.put("first", "acme", {"data": "y" * 10})
+        cache.put("second", "acme", {"data": "z" * 10})
+
+        assert cache.get("first") is None
+        assert cache.get("second") is not None
+        assert cache.get("other") is not None
+
+    def test_oversized_results_are_rejected(self):
+        """Results larger than the tenant quota are not cached."""
+        cache = self.make_cache({}, tenant_max_bytes=10)
+
+        assert not cache.put("key", "acme", {"data": "x" * 100})
+        assert cache.stats.rejected == 1
+
+    def test_referenced_tables(self):
+        """FROM and JOIN targets are listed once, in order."""
+        tables = query_cache.referenced_tables(
+            "SELECT * FROM silver.sales s JOIN gold.daily d ON 1=1 JOIN silver.sales x ON 1=1"
+        )
+
+        assert tables == ["silver.sales", "gold.daily"]
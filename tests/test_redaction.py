@@ -0,0 +1,149 @@
+"""Tests for the redaction service."""
+
+import polars as pl
+import pytest
+
+from automic_etl.services.redaction import (
+    EntityPattern,
+    RedactionConfig,
+    RedactionService,
+    RedactionStrategy,
+)
+
+
+@pytest.fixture
+def service():
+    """Service with common PII patterns and custom name terms."""
+    config = RedactionConfig.with_common_patterns().merge(
+        RedactionConfig.with_custom_terms("NAME", ["Alice", "Bob Smith"])
+    )
+    config.log_replacements = False
+    return RedactionService(config)
+
+
+class TestRedaction:
+    """Test single-pass matching and replacement."""
+
+    def test_redacts_all_entities_in_one_pass(self, service):
+        """Regex and literal matches are replaced with positions in the original."""
+        text = "Bob Smith (bob@example.com) called from 555-123-4567."
+
+        result = service.redact(text)
+
+        assert result.redacted_text == "[NAME] ([EMAIL]) called from [PHONE]."
+        assert result.entity_counts == {"NAME": 1, "EMAIL": 1, "PHONE": 1}
+        assert [text[m.start:m.end] for m in result.matches] == [
+            "Bob Smith",
+            "bob@example.com",
+            "555-123-4567",
+        ]
+
+    def test_higher_priority_wins_overlap(self, service):
+        """An overlapping lower-priority match is dropped."""
+        result = service.redact("write to alice@example.com, Alice")
+
+        assert result.redacted_text == "write to [EMAIL], [NAME]"
+
+    def test_literal_terms_respect_word_boundaries(self, service):
+        """Terms inside other words are not redacted."""
+        assert service.redact("Malice and Alice").redacted_text == "Malice and [NAME]"
+
+
+class TestRedactDataFrame:
+    """Test column redaction."""
+
+    def test_vectorized_matches_per_text(self, service):
+        """The vectorized column path agrees with per-text redaction."""
+        texts = ["Alice: 123-45-6789", None, "ip 10.0.0.1 for Bob Smith"]
+        df = pl.DataFrame({"text": texts})
+
+        result, stats = service.redact_dataframe(df, ["text"])
+
+        assert result["text_redacted"].to_list() == [
+            None if t is None else service.redact(t).redacted_text for t in texts
+        ]
+        assert stats["total_redactions"] == 4
+
+    def test_custom_replacer_falls_back_per_text(self):
+        """Replacements computed from the match are applied row by row."""
+        config = RedactionConfig(
+            patterns=[EntityPattern(name="ID", patterns=[r"\d+"], custom_replacer=lambda m: "#" * len(m))],
+            strategy=RedactionStrategy.CUSTOM,
+            log_replacements=False,
+        )
+
+        result, stats = RedactionService(config).redact_dataframe(
+            pl.DataFrame({"text": ["id 42", "id 1234"]}), ["text"]
+        )
+
+        assert result["text_redacted"].to_list() == ["id ##", "id ####"]
+        assert stats["entity_counts"] == {"ID": 2}
+
+    def test_vectorized_does_not_redact_tags(self):
+        """A term matching another entity's tag does not double-redact it."""
+        config = RedactionConfig.with_common_patterns().merge(
+            RedactionConfig.with_custom_terms("CONTACT", ["email", "phone"])
+        )
+        config.log_replacements = False
+        service = RedactionService(config)
+        texts = ["mail a@b.com now", "email or phone me at 555-123-4567"]
+
+        result, stats = service.redact_dataframe(pl.DataFrame({"text": texts}), ["text"])
+
+        expected = [service.redact(t) for t in texts]
+        assert result["text_redacted"].to_list() == [r.redacted_text for r in expected]
+        assert result["text_redacted"][0] == "mail [EMAIL] now"
+        assert stats["total_redactions"] == sum(r.total_redactions for r in expected)
+
+    def test_overlapping_entities_match_per_text(self, service):
+        """Rows where entities overlap are redacted like ``redact``."""
+        texts = ["write to alice@example.com, Alice", "Alice only"]
+
+        result, stats = service.redact_dataframe(pl.DataFrame({"text": texts}), ["text"])
+
+        assert result["text_redacted"].to_list() == [service.redact(t).redacted_text for t in texts]
+        assert stats["entity_counts"] == {"EMAIL": 1, "NAME": 2}
+
+    def test_multi_entity_rows_stay_vectorized(self, service, monkeypatch):
+        """Rows with several overlapping entities never take the per-text path."""
+        texts = ["Alice <alice@example.com> 4111 1111 1111 1111", "Bob Smith, bob@example.com"]
+        expected = [service.redact(t).redacted_text for t in texts]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("per-text path used")
+
+        monkeypatch.setattr(service, "_redact_values", fail)
+        result, _ = service.redact_series(pl.Series("text", texts))
+
+        assert result.to_list() == expected
+
+    def test_suppressed_overlap_counts_match_per_text(self, service):
+        """A lower-priority match hidden by an overlapping one is not counted."""
+        texts = ["555-123-4567 4111 1111 1111 1111 bob@ex.com", "call 555-123-4567"]
+
+        result, counts = service.redact_series(pl.Series("text", texts))
+
+        expected: dict[str, int] = {}
+        for text in texts:
+            for entity, count in service.redact(text).entity_counts.items():
+                expected[entity] = expected.get(entity, 0) + count
+        assert result.to_list() == [service.redact(t).redacted_text for t in texts]
+        assert counts == expected
+
+    def test_lookaround_pattern_only_falls_back_where_it_matches(self):
+        """Patterns Polars cannot run are applied in Python to matching rows."""
+        config = RedactionConfig(
+            patterns=[
+                EntityPattern(name="PRICE", patterns=[r"(?<=\$)\d+"], word_boundary=False),
+                EntityPattern(name="CODE", patterns=["X1"]),
+            ],
+            log_replacements=False,
+        )
+        service = RedactionService(config)
+        texts = ["costs $40 for X1", "code X1", None]
+
+        result, stats = service.redact_dataframe(pl.DataFrame({"text": texts}), ["text"])
+
+        assert [p.name for p in service._python_patterns] == ["PRICE"]
+        assert result["text_redacted"].to_list() == ["costs $[PRICE] for [CODE]", "code [CODE]", None]
+        assert stats["entity_counts"] == {"PRICE": 1, "CODE": 2}
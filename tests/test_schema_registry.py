@@ -0,0 +1,157 @@
+"""Tests for Schema Registry payload decoding."""
+
+import io
+import json
+from types import SimpleNamespace
+
+import pyarrow as pa
+import pytest
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+from automic_etl.connectors.streaming import SchemaRegistryDecoder
+from automic_etl.core.exceptions import ExtractionError
+
+EVENT_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": ["string", "null"]},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+
+def framed(schema_id: int, payload: bytes) -> bytes:
+    """Prefix a payload with the Schema Registry wire-format header."""
+    return b"\x00" + schema_id.to_bytes(4, "big") + payload
+
+
+class FakeRegistry:
+    """Registry that counts schema lookups."""
+
+    def __init__(self, schemas: dict[int, tuple[str, str]]) -> None:
+        self.schemas = schemas
+        self.lookups: list[int] = []
+
+    def get_schema(self, schema_id: int):
+        self.lookups.append(schema_id)
+        schema_type, schema_str = self.schemas[schema_id]
+        return SimpleNamespace(schema_type=schema_type, schema_str=schema_str)
+
+
+def event_message_class():
+    """Build a proto3 Event message class with repeated, enum and map fields."""
+    field = descriptor_pb2.FieldDescriptorProto
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="event.proto", package="test", syntax="proto3"
+    )
+    kind = file_proto.enum_type.add(name="Kind")
+    kind.value.add(name="CLICK", number=0)
+    kind.value.add(name="VIEW", number=1)
+
+    event = file_proto.message_type.add(name="Event")
+    event.field.add(name="id", number=1, type=field.TYPE_INT64, label=field.LABEL_OPTIONAL)
+    event.field.add(name="tags", number=2, type=field.TYPE_STRING, label=field.LABEL_REPEATED)
+    event.field.add(
+        name="kind",
+        number=3,
+        type=field.TYPE_ENUM,
+        type_name=".test.Kind",
+        label=field.LABEL_OPTIONAL,
+    )
+    entry = event.nested_type.add(name="AttrsEntry")
+    entry.options.map_entry = True
+    entry.field.add(name="key", number=1, type=field.TYPE_STRING, label=field.LABEL_OPTIONAL)
+    entry.field.add(name="value", number=2, type=field.TYPE_INT32, label=field.LABEL_OPTIONAL)
+    event.field.add(
+        name="attrs",
+        number=4,
+        type=field.TYPE_MESSAGE,
+        type_name=".test.Event.AttrsEntry",
+        label=field.LABEL_REPEATED,
+    )
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    return message_factory.GetMessageClass(pool.FindMessageTypeByName("test.Event"))
+
+
+def test_json_schema_batches_share_a_stable_schema():
+    """Declared properties keep their types even when a batch lacks them."""
+    registry = FakeRegistry({7: ("JSON", json.dumps(EVENT_JSON_SCHEMA))})
+    decoder = SchemaRegistryDecoder(registry)
+
+    first = decoder.decode([framed(7, b'{"id": 1, "name": "a", "tags": ["x"]}'), None])
+    second = decoder.decode([framed(7, b'{"id": 2}')])
+
+    assert registry.lookups == [7]
+    assert first.schema == second.schema
+    assert first.schema.field("tags").type == pa.list_(pa.string())
+    assert first.to_pylist() == [
+        {"id": 1, "name": "a", "tags": ["x"]},
+        {"id": None, "name": None, "tags": None},
+    ]
+
+
+def test_protobuf_payloads_decode_to_columns():
+    """Protobuf fields map to typed Arrow columns in message order."""
+    Event = event_message_class()
+    registry = FakeRegistry({3: ("PROTOBUF", "")})
+    decoder = SchemaRegistryDecoder(registry, message_type=Event)
+
+    click = Event(id=1, tags=["a", "b"])
+    click.attrs["n"] = 3
+    view = Event(id=2, kind=1)
+    # A zero byte encodes the message-index list of the first message type
+    table = decoder.decode(
+        [framed(3, b"\x00" + message.SerializeToString()) for message in (click, view)]
+    )
+
+    assert table.schema.field("attrs").type == pa.map_(pa.string(), pa.int32())
+    assert table.to_pylist() == [
+        {"id": 1, "tags": ["a", "b"], "kind": "CLICK", "attrs": [("n", 3)]},
+        {"id": 2, "tags": [], "kind": "VIEW", "attrs": []},
+    ]
+
+
+def test_avro_multi_type_unions_decode_to_json_text():
+    """Unions of several non-null types become JSON text columns."""
+    fastavro = pytest.importorskip("fastavro")
+    schema = {
+        "type": "record",
+        "name": "Reading",
+        "fields": [
+            {"name": "id", "type": "long"},
+            {"name": "value", "type": ["null", "string", "double"]},
+            {"name": "history", "type": {"type": "array", "items": ["long", "string"]}},
+        ],
+    }
+    records = [
+        {"id": 1, "value": "high", "history": [1, "x"]},
+        {"id": 2, "value": 2.5, "history": []},
+        {"id": 3, "value": None, "history": ["y"]},
+    ]
+    parsed = fastavro.parse_schema(schema)
+    payloads = []
+    for record in records:
+        buffer = io.BytesIO()
+        fastavro.schemaless_writer(buffer, parsed, record)
+        payloads.append(framed(5, buffer.getvalue()))
+    decoder = SchemaRegistryDecoder(FakeRegistry({5: ("AVRO", json.dumps(schema))}))
+
+    table = decoder.decode(payloads)
+
+    assert table.schema.field("value").type == pa.string()
+    assert table.to_pylist() == [
+        {"id": 1, "value": '"high"', "history": ["1", '"x"']},
+        {"id": 2, "value": "2.5", "history": []},
+        {"id": 3, "value": None, "history": ['"y"']},
+    ]
+    assert decoder.decode_record(payloads[1]) == records[1]
+
+
+def test_unframed_payload_is_rejected():
+    """Payloads without the magic byte and schema ID are not decoded."""
+    decoder = SchemaRegistryDecoder(FakeRegistry({}))
+    with pytest.raises(ExtractionError):
+        decoder.decode([b'{"id": 1}'])
@@ -0,0 +1,210 @@
+"""Tests for micro-batch stream ingestion into bronze."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from confluent_kafka import TopicPartition
+
+from automic_etl.connectors.streaming import KafkaConfig, KafkaConnector, MessageBatch
+from automic_etl.core.exceptions import LoadError
+from automic_etl.extraction.streaming import StreamIngestor
+from automic_etl.medallion.bronze import BronzeLayer
+
+
+class FakeKafka:
+    """In-memory source with Kafka-style offsets per partition."""
+
+    name = "kafka:events"
+
+    def __init__(self, partitions: int = 2, messages: int = 10) -> None:
+        self.log = {
+            str(p): [json.dumps({"id": p * 100 + i, "kind": "click"}).encode() for i in range(messages)]
+            for p in range(partitions)
+        }
+        self.next = dict.fromkeys(self.log, 0)
+        self.committed: list[dict] = []
+
+    def poll_batch(self, max_messages: int, timeout: float) -> MessageBatch:
+        batch = MessageBatch()
+        for partition, values in self.log.items():
+            start = self.next[partition]
+            for offset in range(start, min(start + 3, len(values))):
+                if len(batch) == max_messages:
+                    return batch
+                batch.values.append(values[offset])
+                batch.keys.append(None)
+                batch.partitions.append(partition)
+                batch.offsets.append(offset)
+                batch.timestamps.append(1_700_000_000_000 + offset)
+                batch.positions[partition] = offset + 1
+                self.next[partition] = offset + 1
+        return batch
+
+    def commit_batch(self, batch: MessageBatch) -> None:
+        self.committed.append(dict(batch.positions))
+
+    def seek_positions(self, positions: dict) -> None:
+        self.next.update({p: int(offset) for p, offset in positions.items()})
+
+    def get_lag(self, positions: dict) -> dict:
+        return {p: len(self.log[p]) - int(offset) for p, offset in positions.items()}
+
+
+class FakeKafkaMessage:
+    """JSON message of a partition at an offset."""
+
+    def __init__(self, partition: int, offset: int) -> None:
+        self._partition = partition
+        self._offset = offset
+
+    def error(self):
+        return None
+
+    def partition(self) -> int:
+        return self._partition
+
+    def offset(self) -> int:
+        return self._offset
+
+    def value(self) -> bytes:
+        return json.dumps({"id": self._partition * 100 + self._offset}).encode()
+
+    def key(self):
+        return None
+
+    def timestamp(self) -> tuple[int, int]:
+        return (1, 1_700_000_000_000)
+
+
+class FakeKafkaConsumer:
+    """Group consumer that is rebalanced in the middle of one consume call."""
+
+    def __init__(self, connector: KafkaConnector, rebalance_on: int, messages: int = 10) -> None:
+        self.connector = connector
+        self.rebalance_on = rebalance_on
+        self.messages = messages
+        self.assigned: list[int] = []
+        self.offsets: dict[int, int] = {}
+        self.committed: dict[int, int] = {}
+        self.calls = 0
+
+    def consume(self, num_messages: int, timeout: float) -> list:
+        self.calls += 1
+        partitions = [TopicPartition("events", p) for p in (0, 1)]
+        if self.calls == 1:
+            self.connector._on_assign(self, partitions)
+        out = self._take(1 if self.calls == self.rebalance_on else num_messages)
+        if self.calls == self.rebalance_on:
+            # Eager rebalance: everything is revoked, then handed back
+            self.connector._on_revoke(self, partitions)
+            self.connector._on_assign(self, partitions)
+            out += self._take(num_messages - len(out))
+        return out
+
+    def _take(self, count: int) -> list:
+        out = []
+        for partition in self.assigned:
+            while self.offsets[partition] < self.messages and len(out) < count:
+                out.append(FakeKafkaMessage(partition, self.offsets[partition]))
+                self.offsets[partition] += 1
+        return out
+
+    def assign(self, partitions) -> None:
+        self.assigned = [tp.partition for tp in partitions]
+        for tp in partitions:
+            self.offsets[tp.partition] = (
+                tp.offset if tp.offset >= 0 else self.committed.get(tp.partition, 0)
+            )
+
+    def assignment(self) -> list:
+        return [TopicPartition("events", p) for p in self.assigned]
+
+    def position(self, partitions) -> list:
+        return [TopicPartition("events", tp.partition, self.offsets[tp.partition]) for tp in partitions]
+
+    def commit(self, offsets, asynchronous: bool) -> None:
+        self.committed.update({tp.partition: tp.offset for tp in offsets})
+
+    def get_watermark_offsets(self, partition, timeout: float) -> tuple[int, int]:
+        return (0, self.messages)
+
+
+@pytest.fixture
+def ingestor(test_settings):
+    """Ingestor writing to a bronze layer with a mocked table manager."""
+    test_settings.extraction.streaming.flush_rows = 8
+    test_settings.extraction.streaming.poll_timeout_seconds = 0.0
+    with patch("automic_etl.medallion.bronze.IcebergTableManager"):
+        bronze = BronzeLayer(test_settings)
+    bronze.table_manager.catalog.table_exists.return_value = False
+    bronze.table_manager.append.side_effect = lambda ns, table, df, properties=None: len(df)
+    return StreamIngestor(test_settings, bronze=bronze)
+
+
+def test_micro_batches_commit_positions_with_rows(ingestor):
+    """Each bronze append carries the offsets it was read up to."""
+    source = FakeKafka()
+    result = ingestor.run(source, "events", idle_timeout=0.0)
+
+    appends = ingestor.bronze.table_manager.append.call_args_list
+    assert result.total_rows == 20
+    assert len(appends) == len(result.micro_batches) == 2
+
+    df = appends[0].args[2]
+    assert df.columns[:2] == ["id", "kind"]
+    assert df["_stream_partition"].to_list()[:3] == ["0", "0", "0"]
+    assert df["_stream_offset"].to_list()[:3] == [0, 1, 2]
+
+    stored = json.loads(appends[-1].kwargs["properties"]["automic.source.stream.kafka:events.positions"])
+    assert stored == {"0": 10, "1": 10} == result.positions
+    assert source.committed[-1] == {"0": 10, "1": 10}
+    assert result.lag == {"0": 0, "1": 0}
+
+
+def test_restart_resumes_from_bronze_positions(ingestor):
+    """Positions stored in bronze override the source's own progress."""
+    manager = ingestor.bronze.table_manager
+    manager.catalog.table_exists.return_value = True
+    manager.get_properties.return_value = {
+        "automic.source.stream.kafka:events.positions": json.dumps({"0": 7, "1": 10}),
+    }
+
+    result = ingestor.run(FakeKafka(), "events", idle_timeout=0.0)
+
+    df = manager.append.call_args_list[0].args[2]
+    assert result.total_rows == 3
+    assert df["_stream_offset"].to_list() == [7, 8, 9]
+
+
+def test_failed_bronze_commit_does_not_commit_source(ingestor):
+    """Offsets stay uncommitted when the Iceberg append fails."""
+    ingestor.bronze.table_manager.append.side_effect = RuntimeError("commit conflict")
+    source = FakeKafka()
+
+    with pytest.raises(LoadError):
+        ingestor.run(source, "events", idle_timeout=0.0)
+    assert source.committed == []
+
+
+def test_rebalance_mid_batch_appends_each_message_once(ingestor):
+    """Pending messages of revoked partitions are dropped and read again."""
+    ingestor.config.poll_size = 3
+    connector = KafkaConnector(
+        KafkaConfig(bootstrap_servers="x", topic="events", enable_auto_commit=False)
+    )
+    connector._consumer = FakeKafkaConsumer(connector, rebalance_on=2)
+    connector._connected = True
+
+    result = ingestor.run(connector, "events", idle_timeout=0.0)
+
+    appended = [
+        (partition, offset)
+        for call in ingestor.bronze.table_manager.append.call_args_list
+        for partition, offset in zip(
+            call.args[2]["_stream_partition"], call.args[2]["_stream_offset"], strict=True
+        )
+    ]
+    assert result.total_rows == 20
+    assert sorted(appended) == [(str(p), o) for p in (0, 1) for o in range(10)]
+    assert connector._consumer.committed == {0: 10, 1: 10}
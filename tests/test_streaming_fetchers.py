@@ -0,0 +1,202 @@
+"""Tests for per-shard parallel consumption of streaming connectors."""
+
+import time
+from datetime import datetime, timezone
+
+from confluent_kafka import TopicPartition
+
+from automic_etl.connectors.streaming import (
+    KafkaConfig,
+    KafkaConnector,
+    KinesisConfig,
+    KinesisConnector,
+)
+from automic_etl.connectors.streaming.fetchers import FetcherPool
+
+
+class FakeKinesisClient:
+    """Stream where shard-0 was split into shard-1 and shard-2."""
+
+    class exceptions:
+        class ExpiredIteratorException(Exception):
+            pass
+
+    def __init__(self) -> None:
+        arrival = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.shards = {
+            "shard-0": [f"p{i}" for i in range(5)],
+            "shard-1": [f"a{i}" for i in range(3)],
+            "shard-2": [f"b{i}" for i in range(3)],
+        }
+        self.records = {
+            shard_id: [
+                {
+                    "Data": f'{{"v": "{value}"}}'.encode(),
+                    "PartitionKey": value,
+                    "SequenceNumber": f"{shard_id}-{i:03d}",
+                    "ApproximateArrivalTimestamp": arrival,
+                }
+                for i, value in enumerate(values)
+            ]
+            for shard_id, values in self.shards.items()
+        }
+
+    def list_shards(self, **kwargs):
+        return {
+            "Shards": [
+                {"ShardId": "shard-0"},
+                {"ShardId": "shard-1", "ParentShardId": "shard-0"},
+                {"ShardId": "shard-2", "ParentShardId": "shard-0"},
+            ]
+        }
+
+    def get_shard_iterator(self, ShardId, ShardIteratorType, **kwargs):
+        start = 0
+        if ShardIteratorType == "AFTER_SEQUENCE_NUMBER":
+            start = int(kwargs["StartingSequenceNumber"].rsplit("-", 1)[1]) + 1
+        return {"ShardIterator": f"{ShardId}:{start}"}
+
+    def get_records(self, ShardIterator, Limit):
+        shard_id, start = ShardIterator.split(":")
+        start = int(start)
+        records = self.records[shard_id][start:start + Limit]
+        end = start + len(records)
+        closed = shard_id == "shard-0" and end == len(self.records[shard_id])
+        return {
+            "Records": records,
+            "NextShardIterator": None if closed else f"{shard_id}:{end}",
+            "MillisBehindLatest": 0,
+        }
+
+
+def test_fetcher_pool_does_not_wait_for_idle_fetchers():
+    """Items from a busy fetcher arrive while another fetcher is idle."""
+
+    def idle():
+        while True:
+            time.sleep(0.01)
+            yield None
+
+    pool = FetcherPool(queue_size=2)
+    pool.start("idle", idle())
+    pool.start("busy", iter([[1, 2], [3], [4, 5, 6]]))
+
+    items = []
+    while len(items) < 3:
+        items.extend(pool.get(max_size=10, timeout=1.0, size=len))
+    pool.stop()
+
+    assert items == [[1, 2], [3], [4, 5, 6]]
+    assert pool.finished == {"busy"}
+
+
+def test_parallel_kinesis_reads_children_after_split_parent():
+    """Child shards start once their parent is read to its end."""
+    connector = KinesisConnector(
+        KinesisConfig(
+            stream_name="events",
+            shard_iterator_type="TRIM_HORIZON",
+            parallel_fetch=True,
+            max_records_per_shard=2,
+            idle_time_between_reads_ms=10,
+        )
+    )
+    connector._client = FakeKinesisClient()
+    connector._connected = True
+
+    values, partitions, positions = [], [], {}
+    deadline = time.monotonic() + 10
+    while len(values) < 11 and time.monotonic() < deadline:
+        batch = connector.poll_batch(max_messages=4, timeout=0.1)
+        values.extend(batch.values)
+        partitions.extend(batch.partitions)
+        positions.update(batch.positions)
+    connector.disconnect()
+
+    assert len(values) == 11
+    assert partitions[:5] == ["shard-0"] * 5
+    assert sorted(partitions[5:]) == ["shard-1"] * 3 + ["shard-2"] * 3
+    assert positions == {"shard-0": "shard-0-004", "shard-1": "shard-1-002", "shard-2": "shard-2-002"}
+
+
+class FakeKafkaMessage:
+    """Message of a partition at an offset."""
+
+    def __init__(self, partition: int, offset: int) -> None:
+        self._partition = partition
+        self._offset = offset
+
+    def error(self):
+        return None
+
+    def partition(self) -> int:
+        return self._partition
+
+    def offset(self) -> int:
+        return self._offset
+
+    def value(self) -> bytes:
+        return f"p{self._partition}-{self._offset}".encode()
+
+    def key(self):
+        return None
+
+    def timestamp(self) -> tuple[int, int]:
+        return (1, 0)
+
+
+class FakeGroupConsumer:
+    """Group consumer whose first poll assigns some partitions, then revokes one."""
+
+    def __init__(self, connector: KafkaConnector, rebalances: list) -> None:
+        self.connector = connector
+        self.rebalances = rebalances
+        self.paused: list[int] = []
+
+    def poll(self, timeout):
+        if self.rebalances:
+            kind, partitions = self.rebalances.pop(0)
+            tps = [TopicPartition("events", p) for p in partitions]
+            callback = self.connector._on_assign if kind == "assign" else self.connector._on_revoke
+            callback(self, tps)
+        return None
+
+    def assign(self, partitions) -> None:
+        pass
+
+    def pause(self, partitions) -> None:
+        self.paused.extend(tp.partition for tp in partitions)
+
+
+def test_parallel_kafka_fetches_only_partitions_assigned_to_this_member():
+    """Worker consumers follow the group assignment instead of every partition."""
+    connector = KafkaConnector(KafkaConfig(bootstrap_servers="x", topic="events", parallel_fetch=True))
+    started: list[list[int]] = []
+
+    def partition_messages(offsets):
+        started.append(sorted(offsets))
+        for partition in offsets:
+            yield [FakeKafkaMessage(partition, 0)]
+        while True:
+            time.sleep(0.01)
+            yield None
+
+    connector._partition_messages = partition_messages
+    connector._consumer = FakeGroupConsumer(
+        connector, [("assign", [1, 3]), ("revoke", [1, 3]), ("assign", [3])]
+    )
+    connector._connected = True
+
+    first = connector.poll_batch(max_messages=10, timeout=1.0)
+    deadline = time.monotonic() + 5
+    while len(first.values) < 2 and time.monotonic() < deadline:
+        more = connector.poll_batch(max_messages=10, timeout=0.1)
+        first.values.extend(more.values)
+    connector.poll_batch(max_messages=10, timeout=0.1)
+    connector.poll_batch(max_messages=10, timeout=0.1)
+    connector._stop_fetchers()
+
+    assert sorted(first.values) == [b"p1-0", b"p3-0"]
+    assert connector._consumer.paused == [1, 3, 3]
+    assert started[-1] == [3]
+    assert all(set(partitions) <= {1, 3} for partitions in started)